@@ -60,34 +60,30 @@ def _safe_import(name: str):
         warnings.warn(f"Failed to import {name}: {e}")
         return None
 
-# Core APIs
-audit_api = _safe_import("audit_api")
-autus_api = _safe_import("autus_api")
-edge_api = _safe_import("edge_api")
-efficiency_api = _safe_import("efficiency_api")
-# 삭제됨: engine_api (engine_v2 의존), kernel_api (AUTUSKernel 의존)
-# 삭제됨: distributed_api (engine_v2 의존), final_api (autus_final 의존)
+# 서브모듈은 첫 접근 시 로드 (PEP 562) - 패키지 임포트만으로 전체 API 를 읽지 않음
+_API_MODULES = (
+    # Core APIs
+    "audit_api", "autus_api", "edge_api", "efficiency_api",
+    # 삭제됨: engine_api (engine_v2 의존), kernel_api (AUTUSKernel 의존)
+    # 삭제됨: distributed_api (engine_v2 의존), final_api (autus_final 의존)
 
-# Extended APIs
-flow_api = _safe_import("flow_api")
-keyman_api = _safe_import("keyman_api")
-notification_api = _safe_import("notification_api")
-ontology_api = _safe_import("ontology_api")
-person_score_api = _safe_import("person_score_api")
-scale_api = _safe_import("scale_api")
-strategy_api = _safe_import("strategy_api")
-unified_api = _safe_import("unified_api")
-viewport_api = _safe_import("viewport_api")
-reliance_api = _safe_import("reliance_api")
-collection_api = _safe_import("collection_api")
+    # Extended APIs
+    "flow_api", "keyman_api", "notification_api", "ontology_api",
+    "person_score_api", "scale_api", "strategy_api", "unified_api",
+    "viewport_api", "reliance_api", "collection_api",
 
-# v2.2.0 Sovereign APIs (Injection & Pipeline)
-injection_api = _safe_import("injection_api")
-pipeline_api = _safe_import("pipeline_api")
+    # v2.2.0 Sovereign APIs (Injection & Pipeline)
+    "injection_api", "pipeline_api",
 
-# v3.0.0 AUTUS Unified API (48노드 + 42 아키타입 통합)
-autus_unified_api = _safe_import("autus_unified_api")
+    # v3.0.0 AUTUS Unified API (48노드 + 42 아키타입 통합)
+    "autus_unified_api",
 
-# v4.0.0 K/I Physics & Automation APIs (신규)
-ki_api = _safe_import("ki_api")
-automation_api = _safe_import("automation_api")
+    # v4.0.0 K/I Physics & Automation APIs (신규)
+    "ki_api", "automation_api",
+)
+
+
+def __getattr__(name: str):
+    if name in _API_MODULES:
+        return _safe_import(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -74,12 +74,25 @@ async def connect_system(system_id: str):
 
 @router.post("/webhook/{system_id}")
 async def webhook(system_id: str, request: Request):
-    """범용 Webhook"""
+    """범용 Webhook (재전송 중복은 처리하지 않음)"""
     data = await request.json()
-    transformed = transformer.transform(data, system_id)
+    event_id = request.headers.get("idempotency-key") or request.headers.get("x-event-id")
+    transformed = transformer.transform_once(data, system_id, event_id)
+    if transformed is None:
+        return {
+            "success": True,
+            "duplicate": True,
+            "timestamp": datetime.now().isoformat()
+        }
     transformed["flow_type"] = flow_detector.detect(data)
     return {
         "success": True,
         "processed": transformed,
         "timestamp": datetime.now().isoformat()
     }
+
+
+@router.get("/idempotency")
+async def idempotency_metrics():
+    """중복 제거 적중률"""
+    return transformer.idempotency.stats()
@@ -0,0 +1,167 @@
+# backend/autosync/automaton.py
+# 다중 패턴 매칭 자료구조 (감지기용)
+#
+# 레지스트리 전체 패턴을 한 번 컴파일해 두고, 입력은 한 번만 훑는다.
+#   - AhoCorasick      : 부분 문자열 (쿠키)
+#   - PrefixTrie       : 접두사 (API 키), 레지스트리 순서상 첫 시스템 반환
+#   - DomainSuffixIndex: 도메인 라벨 접미사 (host == 패턴 또는 서브도메인)
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class AhoCorasick:
+    """Aho–Corasick 오토마톤 — 텍스트 1회 순회로 모든 패턴 출현 검출"""
+
+    def __init__(self, patterns: Iterable[Tuple[str, str]]):
+        """patterns: (패턴, 값) 쌍"""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[str, ...]] = [()]
+        for pattern, value in patterns:
+            if pattern:
+                self._insert(pattern, value)
+        self._build()
+
+    def _insert(self, pattern: str, value: str):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        if value not in self._out[state]:
+            self._out[state] = self._out[state] + (value,)
+
+    def _build(self):
+        # BFS 로 실패 링크 계산, 출력은 실패 링크 쪽 출력과 병합
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                fallback = self._goto[f].get(ch, 0)
+                self._fail[nxt] = fallback if fallback != nxt else 0
+                extra = self._out[self._fail[nxt]]
+                if extra:
+                    merged = self._out[nxt] + tuple(v for v in extra if v not in self._out[nxt])
+                    self._out[nxt] = merged
+
+    @property
+    def states(self) -> int:
+        return len(self._goto)
+
+    def search(self, text: str) -> Set[str]:
+        """text 에 출현한 패턴들의 값 집합"""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[str] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class PrefixTrie:
+    """접두사 트라이 — 입력의 접두사인 패턴 중 우선순위가 가장 높은 값"""
+
+    _END = "\0end"
+
+    def __init__(self, patterns: Iterable[Tuple[str, str, int]]):
+        """patterns: (접두사, 값, 우선순위 — 작을수록 우선)"""
+        self._root: Dict = {}
+        for prefix, value, rank in patterns:
+            if not prefix:
+                continue
+            node = self._root
+            for ch in prefix:
+                node = node.setdefault(ch, {})
+            current = node.get(self._END)
+            if current is None or rank < current[0]:
+                node[self._END] = (rank, value)
+
+    def match(self, text: str) -> Optional[str]:
+        best: Optional[Tuple[int, str]] = None
+        node = self._root
+        for ch in text:
+            node = node.get(ch)
+            if node is None:
+                break
+            hit = node.get(self._END)
+            if hit is not None and (best is None or hit[0] < best[0]):
+                best = hit
+        return best[1] if best else None
+
+
+def split_domain(value: str) -> Tuple[str, str]:
+    """'https://Api.Stripe.com:443/v1' → ('api.stripe.com', '/v1')"""
+    value = value.strip().lower()
+    if "://" in value:
+        value = value.split("://", 1)[1]
+    host, sep, path = value.partition("/")
+    host = host.rsplit("@", 1)[-1].split(":", 1)[0].lstrip("*.").rstrip(".")
+    return host, (sep + path) if sep else ""
+
+
+class DomainSuffixIndex:
+    """
+    도메인 라벨 접미사 인덱스
+
+    패턴 'stripe.com' 은 'stripe.com', 'js.stripe.com' 에 매칭되고
+    'notstripe.com', 'stripe.com.evil.io' 에는 매칭되지 않는다.
+    'toss.im/pos' 처럼 경로가 있는 패턴은 host 매칭 + 경로 접두사 확인.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, str]]):
+        self._index: Dict[str, List[Tuple[str, str]]] = {}
+        for pattern, value in patterns:
+            host, path = split_domain(pattern)
+            if host:
+                self._index.setdefault(host, []).append((path, value))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def match(self, domain: str) -> Set[str]:
+        host, path = split_domain(domain)
+        found: Set[str] = set()
+        index = self._index
+        while host:
+            entries = index.get(host)
+            if entries:
+                for prefix, value in entries:
+                    if not prefix or path.startswith(prefix):
+                        found.add(value)
+            dot = host.find(".")
+            if dot < 0:
+                break
+            host = host[dot + 1:]
+        return found
+
+
+class DetectionIndex:
+    """레지스트리 전체 감지 패턴을 컴파일한 인덱스"""
+
+    def __init__(self, systems: Dict[str, Dict]):
+        cookies, domains, api_keys = [], [], []
+        for rank, (sys_id, cfg) in enumerate(systems.items()):
+            detection = cfg.get("detection", {})
+            cookies.extend((p.lower(), sys_id) for p in detection.get("cookies", []))
+            domains.extend((p, sys_id) for p in detection.get("domains", []))
+            api_keys.extend((p, sys_id, rank) for p in detection.get("api_patterns", []))
+
+        self.cookies = AhoCorasick(cookies)
+        self.domains = DomainSuffixIndex(domains)
+        self.api_keys = PrefixTrie(api_keys)
+        self.pattern_count = len(cookies) + len(domains) + len(api_keys)
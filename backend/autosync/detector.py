@@ -3,6 +3,7 @@
 
 from typing import Dict, List, Optional
 from .registry import SaaSRegistry, SystemType
+from .automaton import DetectionIndex
 
 
 class AutoSyncDetector:
@@ -10,48 +11,42 @@ class AutoSyncDetector:
     Zero-Input AutoSync 감지기
     
     쿠키/도메인/API키로 SaaS 자동 감지
+    
+    레지스트리 패턴은 DetectionIndex 로 한 번 컴파일하고 (레지스트리 변경 시 재빌드),
+    입력은 한 번만 훑는다 — 비용이 레지스트리 크기에 무관.
     """
     
-    def __init__(self):
-        self.registry = SaaSRegistry
+    def __init__(self, registry=SaaSRegistry):
+        self.registry = registry
         self.detected: List[str] = []
+        self._index: Optional[DetectionIndex] = None
+        self._index_key = None
+    
+    @property
+    def index(self) -> DetectionIndex:
+        """컴파일된 감지 인덱스 (레지스트리가 바뀌면 재빌드)"""
+        systems = self.registry.SYSTEMS
+        key = (id(systems), len(systems), getattr(self.registry, "version", 0))
+        if self._index is None or key != self._index_key:
+            self._index = DetectionIndex(systems)
+            self._index_key = key
+        return self._index
     
     def detect_from_cookies(self, cookies: str) -> List[str]:
-        """쿠키에서 SaaS 감지"""
-        detected = []
-        cookies_lower = cookies.lower()
-        
-        for sys_id, cfg in self.registry.SYSTEMS.items():
-            patterns = cfg.get("detection", {}).get("cookies", [])
-            for p in patterns:
-                if p.lower() in cookies_lower:
-                    detected.append(sys_id)
-                    break
-        
-        return list(set(detected))
+        """쿠키에서 SaaS 감지 (대소문자 무시 부분 문자열)"""
+        return list(self.index.cookies.search(cookies.lower()))
     
     def detect_from_domains(self, domains: List[str]) -> List[str]:
-        """도메인에서 SaaS 감지"""
-        detected = []
-        
-        for sys_id, cfg in self.registry.SYSTEMS.items():
-            patterns = cfg.get("detection", {}).get("domains", [])
-            for d in domains:
-                for p in patterns:
-                    if p in d:
-                        detected.append(sys_id)
-                        break
-        
-        return list(set(detected))
+        """도메인에서 SaaS 감지 (패턴 도메인 또는 그 서브도메인)"""
+        detected = set()
+        match = self.index.domains.match
+        for d in domains:
+            detected.update(match(d))
+        return list(detected)
     
     def detect_from_api_key(self, key: str) -> Optional[str]:
-        """API 키 패턴으로 감지"""
-        for sys_id, cfg in self.registry.SYSTEMS.items():
-            patterns = cfg.get("detection", {}).get("api_patterns", [])
-            for p in patterns:
-                if key.startswith(p):
-                    return sys_id
-        return None
+        """API 키 패턴으로 감지 (접두사, 레지스트리 순서상 첫 시스템)"""
+        return self.index.api_keys.match(key)
     
     def detect_all(
         self,
@@ -100,3 +95,102 @@ class AutoSyncDetector:
 
 # 글로벌 인스턴스
 detector = AutoSyncDetector()
+
+
+# ─────────────────────────────────────────
+# 벤치마크
+# ─────────────────────────────────────────
+
+class _SyntheticRegistry:
+    """합성 레지스트리 (벤치마크용)"""
+
+    def __init__(self, n: int):
+        self.version = 0
+        self.SYSTEMS = {
+            f"saas{i}": {
+                "name": f"SaaS {i}",
+                "type": SystemType.CRM,
+                "detection": {
+                    "cookies": [f"_s{i}_sid", f"s{i}tk"],
+                    "domains": [f"saas{i}.com", f"api.saas{i}.io"],
+                    "api_patterns": [f"s{i}_live_", f"s{i}_test_"],
+                },
+            }
+            for i in range(n)
+        }
+
+
+def _linear_detect(systems: Dict, cookies: str, domains: List[str], key: str):
+    """기존 방식: 시스템 x 패턴 전수 비교"""
+    cookies_lower = cookies.lower()
+    found = set()
+    for sys_id, cfg in systems.items():
+        for p in cfg.get("detection", {}).get("cookies", []):
+            if p.lower() in cookies_lower:
+                found.add(sys_id)
+                break
+    for sys_id, cfg in systems.items():
+        patterns = cfg.get("detection", {}).get("domains", [])
+        for d in domains:
+            for p in patterns:
+                if p in d:
+                    found.add(sys_id)
+                    break
+    for sys_id, cfg in systems.items():
+        if any(key.startswith(p) for p in cfg.get("detection", {}).get("api_patterns", [])):
+            found.add(sys_id)
+            break
+    return found
+
+
+def _benchmark(n_systems: int = 2000, requests: int = 500) -> Dict:
+    """n_systems 개 레지스트리에서 요청당 감지 시간 (쿠키 ~40개, 도메인 20개, API 키 1개)"""
+    import random
+    import time
+
+    rnd = random.Random(7)
+    registry = _SyntheticRegistry(n_systems)
+    inputs = []
+    for _ in range(requests):
+        hits = rnd.sample(range(n_systems), 5)
+        cookie_names = [f"_s{i}_sid" for i in hits] + [f"c{rnd.randrange(10**6)}" for _ in range(35)]
+        rnd.shuffle(cookie_names)
+        cookies = "; ".join(f"{c}={rnd.randrange(10**12):x}" for c in cookie_names)
+        domains = [f"app.saas{hits[0]}.com"] + [f"cdn{rnd.randrange(10**6)}.net" for _ in range(19)]
+        inputs.append((cookies, domains, f"s{hits[1]}_live_{rnd.randrange(10**9)}"))
+
+    detector = AutoSyncDetector(registry)
+    start = time.perf_counter()
+    index = detector.index
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for cookies, domains, key in inputs:
+        detector.detect_all(cookies=cookies, domains=domains, api_key=key)
+    indexed_ms = (time.perf_counter() - start) * 1000 / requests
+
+    start = time.perf_counter()
+    for cookies, domains, key in inputs:
+        _linear_detect(registry.SYSTEMS, cookies, domains, key)
+    linear_ms = (time.perf_counter() - start) * 1000 / requests
+
+    return {
+        "systems": n_systems,
+        "patterns": index.pattern_count,
+        "automaton_states": index.cookies.states,
+        "build_ms": round(build_ms, 2),
+        "indexed_ms_per_request": round(indexed_ms, 4),
+        "linear_ms_per_request": round(linear_ms, 4),
+        "speedup": round(linear_ms / indexed_ms, 1) if indexed_ms else None,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="AutoSyncDetector 벤치마크")
+    parser.add_argument("--systems", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+    print(json.dumps(_benchmark(args.systems, args.requests), indent=2))
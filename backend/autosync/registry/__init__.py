@@ -41,6 +41,7 @@ class SaaSRegistry:
     """SaaS 레지스트리 접근자"""
     
     SYSTEMS = ALL_SYSTEMS
+    version = 0  # register() 마다 증가 (감지 인덱스 재빌드 트리거)
     
     @classmethod
     def get_all(cls) -> Dict:
@@ -58,3 +59,9 @@ class SaaSRegistry:
     @classmethod
     def get_system(cls, system_id: str) -> Optional[Dict]:
         return cls.SYSTEMS.get(system_id)
+    
+    @classmethod
+    def register(cls, system_id: str, config: Dict):
+        """시스템 추가/갱신"""
+        cls.SYSTEMS[system_id] = config
+        cls.version += 1
@@ -1,87 +1,280 @@
 # backend/autosync/transformer.py
 # Universal Transformer (간소화)
 
-from typing import Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
 from .registry import SaaSRegistry
+from core.idempotency import IdempotencyGuard, event_key, get_idempotency_guard
 
 
-class UniversalTransformer:
-    """모든 SaaS → {node_id, value, timestamp}"""
-    
-    FORBIDDEN = {"name", "email", "phone", "address", "description", "note"}
-    
-    def transform(self, data: Dict, system_id: Optional[str] = None) -> Dict:
-        mapping = SaaSRegistry.get_mapping(system_id) if system_id else None
-        
-        if not mapping:
-            return self._generic(data)
-        
-        return {
-            "node_id": self._get_id(data, mapping.get("node_id", [])),
-            "value": self._get_value(data, mapping.get("value", [])),
-            "timestamp": self._get_time(data, mapping.get("timestamp", [])),
-            "source": system_id or "unknown"
-        }
-    
-    def _get_nested(self, data: Dict, path: str) -> Any:
-        for p in path.split("."):
-            data = data.get(p) if isinstance(data, dict) else None
+# ─────────────────────────────────────────
+# 컴파일된 필드 추출기
+# ─────────────────────────────────────────
+
+# 매핑 경로가 모두 비었을 때 확인하는 최상위 키
+ID_FALLBACK = ("id", "customer_id", "user_id", "member_id")
+VALUE_FALLBACK = ("amount", "total", "total_price", "totalAmount")
+TIME_FALLBACK = ("created_at", "timestamp", "date")
+
+Getter = Callable[[Dict], Any]
+Columns = Dict[str, Sequence[Any]]
+
+
+def _compile_getter(path: Tuple[str, ...]) -> Getter:
+    """점 경로 튜플 → 조회 함수 (단일 키는 dict.get 한 번)"""
+    if len(path) == 1:
+        key = path[0]
+        return lambda data: data.get(key)
+
+    def get(data):
+        for part in path:
+            data = data.get(part) if isinstance(data, dict) else None
             if data is None:
                 return None
         return data
-    
-    def _get_id(self, data: Dict, paths) -> str:
-        paths = [paths] if isinstance(paths, str) else paths
-        for p in paths:
-            v = self._get_nested(data, p)
+    return get
+
+
+def _to_float(v: Any) -> Optional[float]:
+    """숫자/숫자 문자열 → float, 변환 불가면 None"""
+    t = type(v)
+    if t is float:
+        return v
+    if t is int or t is bool:
+        return float(v)
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return None
+
+
+def _split_paths(spec) -> Tuple[Tuple[Tuple[str, ...], ...], float]:
+    """
+    매핑 스펙 → (경로 튜플들, 제수)
+
+    ["customer.id", "id"]   → 경로 2개
+    ["amount", 100]         → 경로 1개, 제수 100 (마지막 숫자 원소)
+    """
+    spec = [spec] if isinstance(spec, str) else list(spec or [])
+    divisor = 1.0
+    if spec and isinstance(spec[-1], (int, float)) and not isinstance(spec[-1], bool):
+        divisor = float(spec.pop())
+    paths = tuple(tuple(p.split(".")) for p in spec if isinstance(p, str) and p)
+    return paths, divisor
+
+
+class CompiledExtractor:
+    """
+    시스템 매핑 1개를 컴파일한 추출기
+
+    SaaSRegistry.get_mapping 결과를 한 번만 해석해 경로 튜플 / 조회 함수 / 제수를
+    미리 계산해 두고, 레코드마다 split 이나 예외 처리 없이 추출한다.
+    """
+
+    __slots__ = ("source", "id_paths", "value_paths", "time_paths", "divisor",
+                 "_id_getters", "_value_getters", "_time_getters")
+
+    def __init__(self, mapping: Optional[Dict], source: str = "unknown"):
+        mapping = mapping or {}
+        self.source = source
+        self.id_paths, _ = _split_paths(mapping.get("node_id", []))
+        self.value_paths, self.divisor = _split_paths(mapping.get("value", []))
+        self.time_paths, _ = _split_paths(mapping.get("timestamp", []))
+        # node_id 폴백도 "첫 truthy 값" 규칙이 같으므로 한 체인으로 합침
+        self._id_getters = tuple(_compile_getter(p) for p in self.id_paths) + tuple(
+            _compile_getter((k,)) for k in ID_FALLBACK
+        )
+        self._value_getters = tuple(_compile_getter(p) for p in self.value_paths)
+        self._time_getters = tuple(_compile_getter(p) for p in self.time_paths)
+
+    # ─────────────────────────────────────────
+    # 레코드 단위
+    # ─────────────────────────────────────────
+
+    def __call__(self, data: Dict) -> Dict:
+        return {
+            "node_id": self.node_id(data),
+            "value": self.value(data),
+            "timestamp": self.timestamp(data),
+            "source": self.source,
+        }
+
+    def node_id(self, data: Dict) -> str:
+        for get in self._id_getters:
+            v = get(data)
             if v:
                 return str(v)
-        for k in ["id", "customer_id", "user_id", "member_id"]:
-            if k in data and data[k]:
-                return str(data[k])
         return f"anon_{id(data)}"
-    
-    def _get_value(self, data: Dict, cfg) -> float:
-        if isinstance(cfg, list) and len(cfg) >= 2:
-            path, div = cfg[0], cfg[1]
-        else:
-            path = cfg[0] if isinstance(cfg, list) else cfg
-            div = 1
-        
-        v = self._get_nested(data, path) if path else None
-        if v:
-            try:
-                return float(v) / div
-            except:
-                pass
-        
-        for k in ["amount", "total", "total_price", "totalAmount"]:
+
+    def value(self, data: Dict) -> float:
+        div = self.divisor
+        for get in self._value_getters:
+            v = get(data)
+            if v:
+                f = _to_float(v)
+                if f is not None:
+                    return f / div
+        # 폴백 키는 값이 0 이어도 존재하면 사용
+        for k in VALUE_FALLBACK:
             if k in data:
-                try:
-                    return float(data[k]) / div
-                except:
-                    pass
+                f = _to_float(data[k])
+                if f is not None:
+                    return f / div
         return 0.0
-    
-    def _get_time(self, data: Dict, paths) -> str:
-        paths = [paths] if isinstance(paths, str) else paths
-        for p in paths:
-            v = self._get_nested(data, p)
+
+    def timestamp(self, data: Dict) -> str:
+        for get in self._time_getters:
+            v = get(data)
             if v:
                 return str(v)
-        for k in ["created_at", "timestamp", "date"]:
+        for k in TIME_FALLBACK:
             if k in data:
                 return str(data[k])
         return datetime.now().isoformat()
+
+    # ─────────────────────────────────────────
+    # 컬럼 단위 (Arrow 스타일 {컬럼명: 값 리스트})
+    # ─────────────────────────────────────────
+
+    @staticmethod
+    def _column(columns: Columns, path: Tuple[str, ...]) -> Optional[Sequence[Any]]:
+        """경로 → 컬럼. "a.b" 평탄화 컬럼 우선, 없으면 "a" 컬럼의 중첩 dict 에서 조회"""
+        name = ".".join(path)
+        if name in columns:
+            return columns[name]
+        if len(path) > 1 and path[0] in columns:
+            get = _compile_getter(path[1:])
+            return [get(v) if isinstance(v, dict) else None for v in columns[path[0]]]
+        return None
+
+    def columns(self, columns: Columns) -> Dict[str, List[Any]]:
+        """
+        컬럼 배치 변환 → {"node_id": [...], "value": [...], "timestamp": [...], "source": [...]}
+
+        우선순위 순서대로 컬럼을 한 번씩 훑으며 아직 채워지지 않은 행만 채운다.
+        null (None) 은 해당 키가 없는 것으로 본다.
+        """
+        n = len(next(iter(columns.values()), ()))
+        div = self.divisor
+
+        ids: List[Optional[str]] = [None] * n
+        for path in self.id_paths + tuple((k,) for k in ID_FALLBACK):
+            col = self._column(columns, path)
+            if col is None:
+                continue
+            for i, v in enumerate(col):
+                if ids[i] is None and v:
+                    ids[i] = str(v)
+        base = id(columns)
+        ids = [v if v is not None else f"anon_{base}_{i}" for i, v in enumerate(ids)]
+
+        values: List[Optional[float]] = [None] * n
+        for path, truthy in [(p, True) for p in self.value_paths] + [((k,), False) for k in VALUE_FALLBACK]:
+            col = self._column(columns, path)
+            if col is None:
+                continue
+            for i, v in enumerate(col):
+                if values[i] is None and v is not None and (v or not truthy):
+                    f = _to_float(v)
+                    if f is not None:
+                        values[i] = f / div
+        values = [v if v is not None else 0.0 for v in values]
+
+        times: List[Optional[str]] = [None] * n
+        for path, truthy in [(p, True) for p in self.time_paths] + [((k,), False) for k in TIME_FALLBACK]:
+            col = self._column(columns, path)
+            if col is None:
+                continue
+            for i, v in enumerate(col):
+                if times[i] is None and v is not None and (v or not truthy):
+                    times[i] = str(v)
+        if None in times:
+            now = datetime.now().isoformat()
+            times = [v if v is not None else now for v in times]
+
+        return {"node_id": ids, "value": values, "timestamp": times, "source": [self.source] * n}
+
+
+class UniversalTransformer:
+    """모든 SaaS → {node_id, value, timestamp}"""
     
-    def _generic(self, data: Dict) -> Dict:
-        return {
-            "node_id": self._get_id(data, []),
-            "value": self._get_value(data, []),
-            "timestamp": self._get_time(data, []),
-            "source": "unknown"
-        }
+    FORBIDDEN = {"name", "email", "phone", "address", "description", "note"}
+    
+    def __init__(self, idempotency: Optional[IdempotencyGuard] = None):
+        self._idempotency = idempotency
+        self._extractors: Dict[Optional[str], CompiledExtractor] = {}
+        self._registry_version = SaaSRegistry.version
+    
+    def extractor(self, system_id: Optional[str] = None) -> CompiledExtractor:
+        """시스템별 컴파일된 추출기 (최초 1회 빌드 후 캐시, register() 시 무효화)"""
+        if self._registry_version != SaaSRegistry.version:
+            self._extractors.clear()
+            self._registry_version = SaaSRegistry.version
+        ext = self._extractors.get(system_id)
+        if ext is None:
+            mapping = SaaSRegistry.get_mapping(system_id) if system_id else None
+            if not mapping:
+                # 미등록 id 는 URL 에서 그대로 오므로 id 별로 캐시하지 않고 범용 추출기 1개 공유
+                return self._generic()
+            ext = self._extractors[system_id] = CompiledExtractor(mapping, system_id)
+        return ext
+    
+    def _generic(self) -> CompiledExtractor:
+        ext = self._extractors.get(None)
+        if ext is None:
+            ext = self._extractors[None] = CompiledExtractor(None, "unknown")
+        return ext
+    
+    def invalidate(self, system_id: Optional[str] = None):
+        """레지스트리 매핑 변경 시 캐시 무효화 (None = 전체)"""
+        if system_id is None:
+            self._extractors.clear()
+        else:
+            self._extractors.pop(system_id, None)
+    
+    def transform(self, data: Dict, system_id: Optional[str] = None) -> Dict:
+        return self.extractor(system_id)(data)
+    
+    def transform_batch(
+        self,
+        records: Union[Sequence[Dict], Columns, Any],
+        system_id: Optional[str] = None,
+    ) -> Union[List[Dict], Dict[str, List[Any]]]:
+        """
+        배치 변환
+        
+        - 레코드 리스트 → 결과 dict 리스트
+        - 컬럼 dict ({"customer": [...], "amount": [...]}) 또는 pyarrow Table
+          → 결과 컬럼 dict
+        """
+        ext = self.extractor(system_id)
+        if hasattr(records, "to_pydict"):
+            records = records.to_pydict()
+        if isinstance(records, dict):
+            return ext.columns(records)
+        return list(map(ext, records))
+    
+    @property
+    def idempotency(self) -> IdempotencyGuard:
+        if self._idempotency is None:
+            self._idempotency = get_idempotency_guard("autosync")
+        return self._idempotency
+    
+    def transform_once(self, data: Dict, system_id: Optional[str] = None,
+                       event_id: Optional[str] = None) -> Optional[Dict]:
+        """
+        중복 제거 변환: 시간 창 안에 이미 본 이벤트면 None
+        
+        키: system_id + event_id (없으면 payload 해시)
+        """
+        key = event_key(system_id or "unknown", event_id, data)
+        if not self.idempotency.claim(key):
+            return None
+        try:
+            return self.transform(data, system_id)
+        except Exception:
+            self.idempotency.release(key)
+            raise
 
 
 class FlowTypeDetector:
@@ -104,3 +297,77 @@ class FlowTypeDetector:
 
 transformer = UniversalTransformer()
 flow_detector = FlowTypeDetector()
+
+
+# ─────────────────────────────────────────
+# 벤치마크
+# ─────────────────────────────────────────
+
+def _synthetic_payloads(n: int) -> Dict[str, List[Dict]]:
+    """Stripe / Shopify 형태의 합성 payload (절반씩)"""
+    half = n // 2
+    stripe = [
+        {
+            "id": f"pi_{i}",
+            "object": "payment_intent",
+            "customer": f"cus_{i % 5000}",
+            "amount": 1000 + i % 9000,
+            "currency": "usd",
+            "created": 1700000000 + i,
+            "metadata": {"order": str(i)},
+        }
+        for i in range(half)
+    ]
+    shopify = [
+        {
+            "id": 820982911946154500 + i,
+            "customer": {"id": 115310627314723950 + i % 5000, "state": "enabled"},
+            "total_price": f"{10 + i % 500}.95",
+            "currency": "KRW",
+            "created_at": "2026-01-02T00:00:00-05:00",
+            "line_items": [{"id": i, "quantity": 1}],
+        }
+        for i in range(n - half)
+    ]
+    return {"stripe": stripe, "shopify": shopify}
+
+
+def _to_columns(records: List[Dict]) -> Columns:
+    keys = records[0].keys() if records else ()
+    return {k: [r.get(k) for r in records] for k in keys}
+
+
+def _benchmark(n: int = 1_000_000) -> Dict[str, Dict[str, float]]:
+    """레코드 단위 / 리스트 배치 / 컬럼 배치 처리량 (records/s)"""
+    import time
+
+    t = UniversalTransformer()
+    payloads = _synthetic_payloads(n)
+    columns = {sys_id: _to_columns(recs) for sys_id, recs in payloads.items()}
+    results: Dict[str, Dict[str, float]] = {}
+
+    def rate(fn) -> float:
+        start = time.perf_counter()
+        fn()
+        return round(n / (time.perf_counter() - start))
+
+    results["transform"] = {"records_per_sec": rate(
+        lambda: [t.transform(r, sys_id) for sys_id, recs in payloads.items() for r in recs]
+    )}
+    results["transform_batch(list)"] = {"records_per_sec": rate(
+        lambda: [t.transform_batch(recs, sys_id) for sys_id, recs in payloads.items()]
+    )}
+    results["transform_batch(columns)"] = {"records_per_sec": rate(
+        lambda: [t.transform_batch(cols, sys_id) for sys_id, cols in columns.items()]
+    )}
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="UniversalTransformer 벤치마크")
+    parser.add_argument("--records", type=int, default=1_000_000)
+    args = parser.parse_args()
+    print(json.dumps(_benchmark(args.records), indent=2, ensure_ascii=False))
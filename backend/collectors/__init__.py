@@ -40,6 +40,9 @@ from .gmail_collector import (
     OAuthTokens,
     CollectedData,
     NodeContribution,
+    AsyncRateLimiter,
+    request_with_backoff,
+    gather_bounded,
 )
 
 from .calendar_collector import (
@@ -68,5 +71,8 @@ __all__ = [
     
     # 유틸리티
     "CalendarAnalyzer",
+    "AsyncRateLimiter",
+    "request_with_backoff",
+    "gather_bounded",
     "SlackRealtimeListener",
 ]
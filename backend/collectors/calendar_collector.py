@@ -6,7 +6,7 @@
 #
 # ═══════════════════════════════════════════════════════════════════════════════
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
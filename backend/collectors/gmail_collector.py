@@ -14,10 +14,14 @@ from enum import Enum
 import asyncio
 import aiohttp
 import json
+import time
+import random
 import base64
 import hashlib
 from urllib.parse import urlencode, parse_qs
 
+from integrations.http_pool import get_http_session
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # 공통 타입 정의
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -73,6 +77,98 @@ class NodeContribution:
     confidence: float = 0.8
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# 레이트 리밋 / 재시도
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class AsyncRateLimiter:
+    """
+    토큰 버킷 레이트 리미터 (비용 단위)
+    
+    rate: 초당 충전 단위, burst: 버킷 용량.
+    acquire(cost) 는 단위가 충분해질 때까지 대기.
+    """
+    
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    async def acquire(self, cost: float = 1.0):
+        cost = min(cost, self.capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= cost:
+                    self._tokens -= cost
+                    return
+                await asyncio.sleep((cost - self._tokens) / self.rate)
+    
+    def penalize(self, seconds: float):
+        """429 수신 시 버킷을 비워 다른 요청도 함께 물러나게 함"""
+        self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+def _retry_after_seconds(error: aiohttp.ClientResponseError) -> Optional[float]:
+    headers = error.headers or {}
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+async def request_with_backoff(
+    call,
+    max_retries: int = 5,
+    base_delay: float = 0.5,
+    max_delay: float = 32.0,
+    limiter: Optional[AsyncRateLimiter] = None,
+):
+    """
+    429/5xx 지수 백오프 재시도 (Retry-After 우선, full jitter)
+    
+    call: 인자 없는 코루틴 함수
+    """
+    attempt = 0
+    while True:
+        try:
+            return await call()
+        except aiohttp.ClientResponseError as e:
+            if e.status not in RETRYABLE_STATUSES or attempt >= max_retries:
+                raise
+            delay = _retry_after_seconds(e)
+            if delay is None:
+                delay = random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+            if limiter is not None and e.status == 429:
+                limiter.penalize(delay)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+
+async def gather_bounded(coros_or_factories, limit: int) -> List[Any]:
+    """세마포어로 동시 실행 수를 제한한 gather (입력 순서 유지)"""
+    semaphore = asyncio.Semaphore(max(1, limit))
+    
+    async def run(factory):
+        async with semaphore:
+            return await factory()
+    
+    return await asyncio.gather(*(run(f) for f in coros_or_factories))
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # 기본 수집기 클래스
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -85,13 +181,15 @@ class BaseCollector(ABC):
         client_id: str,
         client_secret: str,
         redirect_uri: str,
-        tokens: Optional[OAuthTokens] = None
+        tokens: Optional[OAuthTokens] = None,
+        session: Optional[aiohttp.ClientSession] = None,
     ):
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
         self.tokens = tokens
-        self._session: Optional[aiohttp.ClientSession] = None
+        # 주입된 세션 (없으면 공용 커넥션 풀 세션) - 어느 쪽이든 수집기가 닫지 않음
+        self._session: Optional[aiohttp.ClientSession] = session
     
     @property
     @abstractmethod
@@ -153,69 +251,69 @@ class BaseCollector(ABC):
     
     async def exchange_code(self, code: str) -> OAuthTokens:
         """인증 코드 → 토큰 교환"""
-        async with aiohttp.ClientSession() as session:
-            data = {
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-                "code": code,
-                "redirect_uri": self.redirect_uri,
-                "grant_type": "authorization_code",
-            }
+        session = await self._get_session()
+        data = {
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "code": code,
+            "redirect_uri": self.redirect_uri,
+            "grant_type": "authorization_code",
+        }
+        
+        async with session.post(self.token_url, data=data) as response:
+            if response.status != 200:
+                error = await response.text()
+                raise Exception(f"Token exchange failed: {error}")
             
-            async with session.post(self.token_url, data=data) as response:
-                if response.status != 200:
-                    error = await response.text()
-                    raise Exception(f"Token exchange failed: {error}")
-                
-                result = await response.json()
-                
-                expires_at = None
-                if "expires_in" in result:
-                    expires_at = datetime.now() + timedelta(seconds=result["expires_in"])
-                
-                self.tokens = OAuthTokens(
-                    access_token=result["access_token"],
-                    refresh_token=result.get("refresh_token"),
-                    expires_at=expires_at,
-                    token_type=result.get("token_type", "Bearer"),
-                    scope=result.get("scope"),
-                )
-                
-                return self.tokens
+            result = await response.json()
+            
+            expires_at = None
+            if "expires_in" in result:
+                expires_at = datetime.now() + timedelta(seconds=result["expires_in"])
+            
+            self.tokens = OAuthTokens(
+                access_token=result["access_token"],
+                refresh_token=result.get("refresh_token"),
+                expires_at=expires_at,
+                token_type=result.get("token_type", "Bearer"),
+                scope=result.get("scope"),
+            )
+            
+            return self.tokens
     
     async def refresh_access_token(self) -> OAuthTokens:
         """토큰 갱신"""
         if not self.tokens or not self.tokens.refresh_token:
             raise Exception("No refresh token available")
         
-        async with aiohttp.ClientSession() as session:
-            data = {
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-                "refresh_token": self.tokens.refresh_token,
-                "grant_type": "refresh_token",
-            }
+        session = await self._get_session()
+        data = {
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "refresh_token": self.tokens.refresh_token,
+            "grant_type": "refresh_token",
+        }
+        
+        async with session.post(self.token_url, data=data) as response:
+            if response.status != 200:
+                error = await response.text()
+                raise Exception(f"Token refresh failed: {error}")
             
-            async with session.post(self.token_url, data=data) as response:
-                if response.status != 200:
-                    error = await response.text()
-                    raise Exception(f"Token refresh failed: {error}")
-                
-                result = await response.json()
-                
-                expires_at = None
-                if "expires_in" in result:
-                    expires_at = datetime.now() + timedelta(seconds=result["expires_in"])
-                
-                self.tokens = OAuthTokens(
-                    access_token=result["access_token"],
-                    refresh_token=result.get("refresh_token", self.tokens.refresh_token),
-                    expires_at=expires_at,
-                    token_type=result.get("token_type", "Bearer"),
-                    scope=result.get("scope"),
-                )
-                
-                return self.tokens
+            result = await response.json()
+            
+            expires_at = None
+            if "expires_in" in result:
+                expires_at = datetime.now() + timedelta(seconds=result["expires_in"])
+            
+            self.tokens = OAuthTokens(
+                access_token=result["access_token"],
+                refresh_token=result.get("refresh_token", self.tokens.refresh_token),
+                expires_at=expires_at,
+                token_type=result.get("token_type", "Bearer"),
+                scope=result.get("scope"),
+            )
+            
+            return self.tokens
     
     async def ensure_valid_token(self) -> str:
         """유효한 토큰 보장"""
@@ -233,7 +331,7 @@ class BaseCollector(ABC):
     
     async def _get_session(self) -> aiohttp.ClientSession:
         if not self._session or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            self._session = await get_http_session()
         return self._session
     
     async def _api_request(
@@ -294,9 +392,8 @@ class BaseCollector(ABC):
         )
     
     async def close(self):
-        """세션 정리"""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """세션 참조 해제 (공용 풀 세션은 앱 lifespan 이 정리)"""
+        self._session = None
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -325,6 +422,40 @@ class GmailCollector(BaseCollector):
     
     GMAIL_API_BASE = "https://gmail.googleapis.com/gmail/v1"
     
+    # 동시성 / 쿼터 (Gmail 사용자당 250 quota units/sec)
+    MAX_CONCURRENCY = 10
+    MAX_MESSAGES = 500
+    QUOTA_UNITS_PER_SECOND = 250
+    QUOTA_COST = {
+        "messages.list": 5,
+        "messages.get": 5,
+        "threads.list": 10,
+        "threads.get": 10,
+        "history.list": 2,
+        "getProfile": 1,
+    }
+    
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        redirect_uri: str,
+        tokens: Optional[OAuthTokens] = None,
+        max_concurrency: Optional[int] = None,
+        max_messages: Optional[int] = None,
+        history_id: Optional[str] = None,
+        pending_message_ids: Optional[List[str]] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
+        super().__init__(client_id, client_secret, redirect_uri, tokens, session)
+        self.max_concurrency = max_concurrency or self.MAX_CONCURRENCY
+        self.max_messages = max_messages or self.MAX_MESSAGES
+        # 증분 동기화 기준점 - 저장했다가 다음 수집 시 전달
+        self.history_id = history_id
+        # max_messages 초과로 이번에 못 가져온 메시지 - history_id 와 함께 저장/전달
+        self.pending_message_ids: List[str] = list(pending_message_ids or [])
+        self._quota = AsyncRateLimiter(self.QUOTA_UNITS_PER_SECOND)
+    
     @property
     def source_type(self) -> DataSourceType:
         return DataSourceType.GMAIL
@@ -348,10 +479,41 @@ class GmailCollector(BaseCollector):
     # 데이터 수집
     # ─────────────────────────────────────────────────────────────────────────
     
+    async def _gmail_request(self, op: str, url: str, **kwargs) -> Dict[str, Any]:
+        """쿼터 차감 + 429 백오프가 적용된 Gmail API 호출"""
+        async def call():
+            await self._quota.acquire(self.QUOTA_COST.get(op, 5))
+            return await self._api_request("GET", url, **kwargs)
+        return await request_with_backoff(call, limiter=self._quota)
+    
     async def fetch_data(self, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
-        """Gmail 이메일 수집"""
+        """
+        Gmail 이메일 수집
+        
+        history_id 가 있으면 그 이후 추가된 메시지만 (history.list),
+        없거나 만료(404)되면 전체 목록 조회. 상세 조회는 동시 실행.
+        """
+        if self.history_id:
+            try:
+                return await self._fetch_incremental()
+            except aiohttp.ClientResponseError as e:
+                if e.status != 404:
+                    raise
+                # startHistoryId 만료 → 전체 동기화
+                self.history_id = None
+        
+        return await self._fetch_full(since)
+    
+    async def _current_history_id(self) -> Optional[str]:
+        profile = await self._gmail_request("getProfile", f"{self.GMAIL_API_BASE}/users/me/profile")
+        return profile.get("historyId")
+    
+    async def _fetch_full(self, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
         messages = []
         
+        # 목록 조회 전 historyId 확보 → 이후 변경분은 다음 증분 동기화에서 수집
+        history_id = await self._current_history_id()
+        
         # 쿼리 구성
         query_parts = []
         if since:
@@ -362,9 +524,9 @@ class GmailCollector(BaseCollector):
         
         # 메시지 목록 가져오기 (페이지네이션)
         page_token = None
-        max_results = 100
+        max_results = 500
         total_fetched = 0
-        max_total = 500  # 최대 500개
+        max_total = self.max_messages
         
         while total_fetched < max_total:
             params = {"maxResults": min(max_results, max_total - total_fetched)}
@@ -374,17 +536,13 @@ class GmailCollector(BaseCollector):
                 params["pageToken"] = page_token
             
             url = f"{self.GMAIL_API_BASE}/users/me/messages"
-            result = await self._api_request("GET", url, params=params)
+            result = await self._gmail_request("messages.list", url, params=params)
             
             message_ids = result.get("messages", [])
             if not message_ids:
                 break
             
-            # 각 메시지 상세 가져오기 (배치로 최적화 가능)
-            for msg_ref in message_ids:
-                msg_detail = await self._get_message_detail(msg_ref["id"])
-                if msg_detail:
-                    messages.append(msg_detail)
+            messages.extend(await self._get_message_details([m["id"] for m in message_ids]))
             
             total_fetched += len(message_ids)
             page_token = result.get("nextPageToken")
@@ -392,15 +550,62 @@ class GmailCollector(BaseCollector):
             if not page_token:
                 break
         
+        if history_id:
+            self.history_id = history_id
+        return messages
+    
+    async def _fetch_incremental(self) -> List[Dict[str, Any]]:
+        """
+        history.list 로 history_id 이후 추가된 메시지만 수집
+        
+        ID 목록은 끝까지 페이지네이션한 뒤 history_id 를 전진시키고,
+        max_messages 를 넘는 ID 는 pending_message_ids 로 남겨 다음 수집에서 먼저 처리.
+        """
+        message_ids: List[str] = list(self.pending_message_ids)
+        seen = set(message_ids)
+        latest = self.history_id
+        page_token = None
+        
+        while True:
+            params = {"startHistoryId": self.history_id, "historyTypes": "messageAdded"}
+            if page_token:
+                params["pageToken"] = page_token
+            
+            url = f"{self.GMAIL_API_BASE}/users/me/history"
+            result = await self._gmail_request("history.list", url, params=params)
+            
+            for record in result.get("history", []):
+                for added in record.get("messagesAdded", []):
+                    msg_id = added.get("message", {}).get("id")
+                    if msg_id and msg_id not in seen:
+                        seen.add(msg_id)
+                        message_ids.append(msg_id)
+            latest = result.get("historyId", latest)
+            
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                break
+        
+        messages = await self._get_message_details(message_ids[:self.max_messages])
+        self.pending_message_ids = message_ids[self.max_messages:]
+        self.history_id = latest
         return messages
     
+    async def _get_message_details(self, message_ids: List[str]) -> List[Dict[str, Any]]:
+        """메시지 상세 동시 조회 (max_concurrency 제한, 순서 유지)"""
+        details = await gather_bounded(
+            [lambda mid=mid: self._get_message_detail(mid) for mid in message_ids],
+            self.max_concurrency,
+        )
+        return [d for d in details if d]
+    
     async def _get_message_detail(self, message_id: str) -> Optional[Dict[str, Any]]:
         """개별 메시지 상세 조회"""
         url = f"{self.GMAIL_API_BASE}/users/me/messages/{message_id}"
         params = {"format": "metadata", "metadataHeaders": ["From", "To", "Subject", "Date"]}
         
         try:
-            result = await self._api_request("GET", url, params=params)
+            result = await self._gmail_request("messages.get", url, params=params)
             
             # 헤더 파싱
             headers = {}
@@ -434,12 +639,13 @@ class GmailCollector(BaseCollector):
             params["q"] = query
         
         url = f"{self.GMAIL_API_BASE}/users/me/threads"
-        result = await self._api_request("GET", url, params=params)
+        result = await self._gmail_request("threads.list", url, params=params)
         
-        for thread_ref in result.get("threads", []):
-            thread_detail = await self._get_thread_detail(thread_ref["id"])
-            if thread_detail:
-                threads.append(thread_detail)
+        details = await gather_bounded(
+            [lambda tid=t["id"]: self._get_thread_detail(tid) for t in result.get("threads", [])],
+            self.max_concurrency,
+        )
+        threads.extend(d for d in details if d)
         
         return threads
     
@@ -449,7 +655,7 @@ class GmailCollector(BaseCollector):
         params = {"format": "metadata"}
         
         try:
-            result = await self._api_request("GET", url, params=params)
+            result = await self._gmail_request("threads.get", url, params=params)
             
             messages = result.get("messages", [])
             
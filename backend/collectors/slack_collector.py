@@ -6,18 +6,140 @@
 #
 # ═══════════════════════════════════════════════════════════════════════════════
 
-from typing import Dict, List, Any, Optional, Set
+import asyncio
+import json
+import os
+import aiohttp
+from typing import AsyncIterator, Dict, List, Any, Optional, Set
 from datetime import datetime, timedelta
 from collections import defaultdict
 
 from .gmail_collector import (
+    AsyncRateLimiter,
     BaseCollector, 
+    CollectedData,
     DataSourceType, 
     NodeContribution,
-    OAuthTokens
+    OAuthTokens,
+    request_with_backoff,
 )
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# Slack 레이트 리밋 티어 (메서드별, 워크스페이스 단위)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# 티어별 분당 허용 호출 수
+SLACK_TIER_RATES = {1: 1, 2: 20, 3: 50, 4: 100}
+
+SLACK_METHOD_TIERS = {
+    "users.list": 2,
+    "conversations.list": 2,
+    "conversations.history": 3,
+    "conversations.replies": 3,
+    "reactions.list": 2,
+}
+
+
+class SlackActivity:
+    """
+    메시지 스트림 증분 집계
+    
+    메시지 목록을 메모리에 쌓지 않고 add() 로 하나씩 받아
+    노드/슬롯 매핑에 필요한 카운터만 유지.
+    """
+    
+    def __init__(
+        self,
+        my_user_id: Optional[str] = None,
+        users: Optional[Dict[str, Dict]] = None,
+        channels: Optional[List[Dict]] = None,
+    ):
+        self.my_user_id = my_user_id
+        self.users = users or {}
+        self.channels = channels or []
+        
+        self.total_messages = 0
+        self.sent_count = 0
+        self.mention_count = 0
+        self.reaction_given = 0
+        self.reaction_received = 0
+        self.active_channels: Set[Any] = set()
+        self.interacted_users: Set[str] = set()
+        self.user_interactions: Dict[str, Dict] = {}
+    
+    @classmethod
+    def from_data(cls, slack_data: Dict[str, Any], my_user_id: Optional[str] = None) -> "SlackActivity":
+        activity = cls(my_user_id, slack_data.get("users", {}), slack_data.get("channels", []))
+        for msg in slack_data.get("messages", []):
+            activity.add(msg)
+        return activity
+    
+    def add(self, msg: Dict[str, Any]):
+        my_user_id = self.my_user_id
+        user_id = msg.get("user")
+        text = msg.get("text", "")
+        mentioned = bool(my_user_id) and f"<@{my_user_id}>" in text
+        
+        self.total_messages += 1
+        self.active_channels.add(msg.get("channel_id"))
+        if mentioned:
+            self.mention_count += 1
+        
+        if user_id == my_user_id:
+            self.sent_count += 1
+            reactions = msg.get("reactions", [])
+            self.reaction_given += len(reactions)
+            self.reaction_received += sum(r.get("count", 0) for r in reactions)
+        
+        if not user_id or user_id == my_user_id:
+            return
+        
+        self.interacted_users.add(user_id)
+        
+        # 사용자별 상호작용
+        interaction = self.user_interactions.get(user_id)
+        if interaction is None:
+            user_info = self.users.get(user_id, {})
+            interaction = self.user_interactions[user_id] = {
+                "user_id": user_id,
+                "name": user_info.get("real_name", user_info.get("name", "")),
+                "email": user_info.get("profile", {}).get("email", ""),
+                "is_bot": user_info.get("is_bot", False),
+                "message_count": 0,
+                "mention_count": 0,
+                "reaction_count": 0,
+                "last_interaction": None,
+                "channels": set(),
+            }
+        
+        interaction["message_count"] += 1
+        
+        channel_id = msg.get("channel_id")
+        if channel_id:
+            interaction["channels"].add(channel_id)
+        
+        if mentioned:
+            interaction["mention_count"] += 1
+        
+        for reaction in msg.get("reactions", []):
+            if my_user_id in reaction.get("users", []):
+                interaction["reaction_count"] += 1
+        
+        ts = msg.get("ts")
+        if ts:
+            try:
+                msg_time = datetime.fromtimestamp(float(ts))
+                last = interaction["last_interaction"]
+                interaction["last_interaction"] = msg_time if not last else max(last, msg_time)
+            except (TypeError, ValueError, OverflowError, OSError):
+                pass
+    
+    @property
+    def received_count(self) -> int:
+        return self.total_messages - self.sent_count
+
+
 class SlackCollector(BaseCollector):
     """
     Slack 데이터 수집기
@@ -43,6 +165,35 @@ class SlackCollector(BaseCollector):
     
     SLACK_API_BASE = "https://slack.com/api"
     
+    # 채널 병렬 수집 / 페이지 크기
+    MAX_CONCURRENCY = 8
+    HISTORY_PAGE_SIZE = 200
+    LIST_PAGE_SIZE = 200
+    STREAM_QUEUE_SIZE = 1000
+    
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        redirect_uri: str,
+        tokens: Optional[OAuthTokens] = None,
+        max_concurrency: Optional[int] = None,
+        watermarks: Optional[Dict[str, str]] = None,
+        watermark_path: Optional[str] = None,
+        tier_rates: Optional[Dict[int, float]] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
+        super().__init__(client_id, client_secret, redirect_uri, tokens, session)
+        self.max_concurrency = max_concurrency or self.MAX_CONCURRENCY
+        
+        # 채널별 latest_ts 워터마크 (증분 수집 기준)
+        self.watermark_path = watermark_path
+        self.watermarks: Dict[str, str] = self._load_watermarks(watermark_path)
+        self.watermarks.update(watermarks or {})
+        
+        self._tier_rates = {**SLACK_TIER_RATES, **(tier_rates or {})}
+        self._limiters: Dict[str, AsyncRateLimiter] = {}
+    
     @property
     def source_type(self) -> DataSourceType:
         return DataSourceType.SLACK
@@ -88,67 +239,116 @@ class SlackCollector(BaseCollector):
     
     async def exchange_code(self, code: str) -> OAuthTokens:
         """Slack 토큰 교환 (형식이 다름)"""
-        import aiohttp
-        
-        async with aiohttp.ClientSession() as session:
-            data = {
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-                "code": code,
-                "redirect_uri": self.redirect_uri,
-            }
-            
-            async with session.post(self.token_url, data=data) as response:
-                result = await response.json()
-                
-                if not result.get("ok"):
-                    raise Exception(f"Slack auth failed: {result.get('error')}")
-                
-                # Slack은 authed_user.access_token 또는 access_token
-                access_token = result.get("access_token")
-                if not access_token:
-                    authed_user = result.get("authed_user", {})
-                    access_token = authed_user.get("access_token")
-                
-                self.tokens = OAuthTokens(
-                    access_token=access_token,
-                    refresh_token=result.get("refresh_token"),
-                    token_type="Bearer",
-                    scope=result.get("scope"),
-                )
-                
-                # 팀 정보 저장
-                self._team_id = result.get("team", {}).get("id")
-                self._user_id = result.get("authed_user", {}).get("id")
-                
-                return self.tokens
-    
-    async def _slack_api(self, method: str, **params) -> Dict[str, Any]:
-        """Slack API 호출"""
-        token = await self.ensure_valid_token()
-        
         session = await self._get_session()
-        url = f"{self.SLACK_API_BASE}/{method}"
-        headers = {"Authorization": f"Bearer {token}"}
+        data = {
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "code": code,
+            "redirect_uri": self.redirect_uri,
+        }
         
-        async with session.get(url, headers=headers, params=params) as response:
+        async with session.post(self.token_url, data=data) as response:
             result = await response.json()
             
             if not result.get("ok"):
-                error = result.get("error", "Unknown error")
-                if error == "token_expired":
-                    await self.refresh_access_token()
-                    return await self._slack_api(method, **params)
-                raise Exception(f"Slack API error: {error}")
+                raise Exception(f"Slack auth failed: {result.get('error')}")
+            
+            # Slack은 authed_user.access_token 또는 access_token
+            access_token = result.get("access_token")
+            if not access_token:
+                authed_user = result.get("authed_user", {})
+                access_token = authed_user.get("access_token")
+            
+            self.tokens = OAuthTokens(
+                access_token=access_token,
+                refresh_token=result.get("refresh_token"),
+                token_type="Bearer",
+                scope=result.get("scope"),
+            )
+            
+            # 팀 정보 저장
+            self._team_id = result.get("team", {}).get("id")
+            self._user_id = result.get("authed_user", {}).get("id")
             
-            return result
+            return self.tokens
+    
+    def _limiter(self, method: str) -> AsyncRateLimiter:
+        """메서드별 티어 리미터 (분당 호출 수, 1분치 버스트 허용)"""
+        limiter = self._limiters.get(method)
+        if limiter is None:
+            per_minute = self._tier_rates[SLACK_METHOD_TIERS.get(method, 3)]
+            limiter = self._limiters[method] = AsyncRateLimiter(per_minute / 60, burst=per_minute)
+        return limiter
+    
+    async def _slack_api(self, method: str, **params) -> Dict[str, Any]:
+        """Slack API 호출 (티어 레이트 리밋 + 429 Retry-After 백오프)"""
+        limiter = self._limiter(method)
+        url = f"{self.SLACK_API_BASE}/{method}"
+        
+        async def call():
+            await limiter.acquire()
+            token = await self.ensure_valid_token()
+            session = await self._get_session()
+            headers = {"Authorization": f"Bearer {token}"}
+            async with session.get(url, headers=headers, params=params) as response:
+                if response.status == 429:
+                    response.raise_for_status()
+                return await response.json()
+        
+        result = await request_with_backoff(call, limiter=limiter)
+        
+        if not result.get("ok"):
+            error = result.get("error", "Unknown error")
+            if error == "token_expired":
+                await self.refresh_access_token()
+                return await self._slack_api(method, **params)
+            raise Exception(f"Slack API error: {error}")
+        
+        return result
+    
+    async def _paginate(self, method: str, key: str, **params) -> AsyncIterator[Dict[str, Any]]:
+        """next_cursor 를 끝까지 따라가며 항목 단위로 yield"""
+        cursor = None
+        while True:
+            if cursor:
+                params["cursor"] = cursor
+            result = await self._slack_api(method, **params)
+            for item in result.get(key, []):
+                yield item
+            cursor = result.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+    
+    # ─────────────────────────────────────────────────────────────────────────
+    # 워터마크
+    # ─────────────────────────────────────────────────────────────────────────
+    
+    @staticmethod
+    def _load_watermarks(path: Optional[str]) -> Dict[str, str]:
+        if not path or not os.path.exists(path):
+            return {}
+        try:
+            with open(path) as f:
+                return dict(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"Failed to load Slack watermarks: {e}")
+            return {}
+    
+    def save_watermarks(self):
+        """워터마크를 watermark_path 에 원자적으로 저장"""
+        if not self.watermark_path:
+            return
+        tmp_path = f"{self.watermark_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.watermarks, f)
+        os.replace(tmp_path, self.watermark_path)
     
     # ─────────────────────────────────────────────────────────────────────────
     # 데이터 수집
     # ─────────────────────────────────────────────────────────────────────────
     
     async def fetch_data(self, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
-        """Slack 데이터 수집"""
+        """Slack 데이터 수집 (전체 채널/DM, 모든 페이지)"""
         data = {
             "channels": [],
             "messages": [],
@@ -156,78 +356,160 @@ class SlackCollector(BaseCollector):
             "reactions": [],
         }
         
-        # 기본: 최근 7일
-        if not since:
-            since = datetime.now() - timedelta(days=7)
-        
-        oldest = str(since.timestamp())
-        
-        # 1. 사용자 목록
         users = await self._get_users()
         data["users"] = {u["id"]: u for u in users}
+        data["channels"] = await self._get_channels()
+        dm_channels = await self._get_dm_channels()
         
-        # 2. 채널 목록
-        channels = await self._get_channels()
-        data["channels"] = channels
-        
-        # 3. 각 채널의 메시지
-        for channel in channels[:20]:  # 상위 20개 채널만
-            try:
-                messages = await self._get_channel_messages(
-                    channel["id"], 
-                    oldest=oldest,
-                    limit=100
-                )
-                
-                for msg in messages:
-                    msg["channel_id"] = channel["id"]
-                    msg["channel_name"] = channel.get("name", "")
-                    data["messages"].append(msg)
-            except Exception as e:
-                print(f"Failed to get messages for {channel['id']}: {e}")
+        async for msg in self.iter_messages(since, data["channels"], dm_channels):
+            data["messages"].append(msg)
         
-        # 4. DM 채널
+        return [data]  # 단일 객체로 반환
+    
+    async def collect(self, since: Optional[datetime] = None) -> CollectedData:
+        """
+        스트리밍 수집
+        
+        메시지를 리스트로 모으지 않고 SlackActivity 에 바로 흘려
+        대규모 워크스페이스에서도 메모리가 사용자 수에만 비례.
+        """
+        users = {u["id"]: u for u in await self._get_users()}
+        channels = await self._get_channels()
         dm_channels = await self._get_dm_channels()
-        for dm in dm_channels[:10]:  # 상위 10개 DM만
+        
+        activity = SlackActivity(getattr(self, "_user_id", None), users, channels)
+        async for msg in self.iter_messages(since, channels, dm_channels):
+            activity.add(msg)
+        
+        node_mappings: Dict[str, float] = {}
+        for contrib in self._activity_to_nodes(activity):
+            node_mappings[contrib.node_id] = node_mappings.get(contrib.node_id, 0) + contrib.value * contrib.weight
+        
+        return CollectedData(
+            source=self.source_type,
+            raw_data={
+                "count": activity.total_messages,
+                "channels": len(channels),
+                "dm_channels": len(dm_channels),
+                "users": len(users),
+            },
+            node_mappings=node_mappings,
+            slot_mappings=self._activity_to_slots(activity),
+            metadata={
+                "since": since.isoformat() if since else None,
+                "collected_count": activity.total_messages,
+                "watermarks": len(self.watermarks),
+            }
+        )
+    
+    async def iter_messages(
+        self,
+        since: Optional[datetime] = None,
+        channels: Optional[List[Dict[str, Any]]] = None,
+        dm_channels: Optional[List[Dict[str, Any]]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        채널 병렬 메시지 스트림
+        
+        채널마다 커서를 끝까지 따라가며 max_concurrency 개 채널을 동시에 읽음.
+        채널별 oldest = max(since, 워터마크) 이므로 다음 실행은 새 메시지만 수집.
+        스트림을 끝까지 소비하면 채널별 latest_ts 를 self.watermarks 에 반영 후 저장.
+        """
+        # 기본: 최근 7일
+        if not since:
+            since = datetime.now() - timedelta(days=7)
+        since_ts = since.timestamp()
+        
+        if channels is None:
+            channels = await self._get_channels()
+        if dm_channels is None:
+            dm_channels = await self._get_dm_channels()
+        
+        targets = [(c, None) for c in channels] + [(dm, "dm") for dm in dm_channels]
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.STREAM_QUEUE_SIZE)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        done = object()
+        
+        async def read_channel(channel: Dict[str, Any], channel_type: Optional[str]):
+            channel_id = channel["id"]
+            watermark = self.watermarks.get(channel_id)
+            oldest = since_ts
+            if watermark and float(watermark) > oldest:
+                oldest = float(watermark)
+            latest_ts = watermark
+            
             try:
-                messages = await self._get_channel_messages(
-                    dm["id"],
-                    oldest=oldest,
-                    limit=50
-                )
-                
-                for msg in messages:
-                    msg["channel_id"] = dm["id"]
-                    msg["channel_type"] = "dm"
-                    msg["dm_user"] = dm.get("user")
-                    data["messages"].append(msg)
+                async with semaphore:
+                    async for msg in self._iter_channel_messages(channel_id, oldest=f"{oldest:.6f}"):
+                        msg["channel_id"] = channel_id
+                        if channel_type == "dm":
+                            msg["channel_type"] = "dm"
+                            msg["dm_user"] = channel.get("user")
+                        else:
+                            msg["channel_name"] = channel.get("name", "")
+                        ts = msg.get("ts")
+                        if ts and (latest_ts is None or float(ts) > float(latest_ts)):
+                            latest_ts = ts
+                        await queue.put(msg)
+                # 채널을 끝까지 읽은 경우에만 워터마크 전진
+                if latest_ts:
+                    advanced[channel_id] = latest_ts
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                print(f"Failed to get DM messages: {e}")
-        
-        return [data]  # 단일 객체로 반환
+                print(f"Failed to get messages for {channel_id}: {e}")
+            await queue.put(done)
+        
+        advanced: Dict[str, str] = {}
+        tasks = [asyncio.ensure_future(read_channel(c, t)) for c, t in targets]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await queue.get()
+                if item is done:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # 스트림을 끝까지 소비한 경우에만 워터마크 확정
+        self.watermarks.update(advanced)
+        self.save_watermarks()
     
     async def _get_users(self) -> List[Dict[str, Any]]:
         """사용자 목록"""
-        result = await self._slack_api("users.list", limit=200)
-        return result.get("members", [])
+        return [u async for u in self._paginate("users.list", "members", limit=self.LIST_PAGE_SIZE)]
     
     async def _get_channels(self) -> List[Dict[str, Any]]:
         """채널 목록"""
-        result = await self._slack_api(
-            "conversations.list",
+        return [c async for c in self._paginate(
+            "conversations.list", "channels",
             types="public_channel,private_channel",
-            limit=100
-        )
-        return result.get("channels", [])
+            limit=self.LIST_PAGE_SIZE,
+        )]
     
     async def _get_dm_channels(self) -> List[Dict[str, Any]]:
         """DM 채널 목록"""
-        result = await self._slack_api(
-            "conversations.list",
+        return [c async for c in self._paginate(
+            "conversations.list", "channels",
             types="im",
-            limit=50
-        )
-        return result.get("channels", [])
+            limit=self.LIST_PAGE_SIZE,
+        )]
+    
+    async def _iter_channel_messages(
+        self,
+        channel_id: str,
+        oldest: str = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """채널 메시지 전체 페이지 스트림"""
+        params = {"channel": channel_id, "limit": self.HISTORY_PAGE_SIZE}
+        if oldest:
+            params["oldest"] = oldest
+        async for msg in self._paginate("conversations.history", "messages", **params):
+            yield msg
     
     async def _get_channel_messages(
         self, 
@@ -235,7 +517,7 @@ class SlackCollector(BaseCollector):
         oldest: str = None,
         limit: int = 100
     ) -> List[Dict[str, Any]]:
-        """채널 메시지 조회"""
+        """채널 메시지 조회 (단일 페이지)"""
         params = {"channel": channel_id, "limit": limit}
         if oldest:
             params["oldest"] = oldest
@@ -249,57 +531,29 @@ class SlackCollector(BaseCollector):
     
     def map_to_nodes(self, data: List[Dict[str, Any]]) -> List[NodeContribution]:
         """Slack 데이터 → 48노드 매핑"""
-        contributions = []
-        
         if not data or not data[0]:
-            return contributions
+            return []
         
-        slack_data = data[0]
-        messages = slack_data.get("messages", [])
-        users = slack_data.get("users", {})
-        channels = slack_data.get("channels", [])
+        activity = SlackActivity.from_data(data[0], getattr(self, "_user_id", None))
+        return self._activity_to_nodes(activity)
+    
+    def _activity_to_nodes(self, activity: SlackActivity) -> List[NodeContribution]:
+        """집계 결과 → 48노드 기여도"""
+        contributions = []
         
-        if not messages:
+        if not activity.total_messages:
             return contributions
         
-        # 분석
-        my_user_id = getattr(self, "_user_id", None)
-        
-        # 메시지 분류
-        sent_count = sum(1 for m in messages if m.get("user") == my_user_id)
-        received_count = len(messages) - sent_count
-        total_messages = len(messages)
-        
-        # 참여 채널 수
-        active_channels = set(m.get("channel_id") for m in messages)
-        
-        # 멘션 분석
-        mention_count = sum(
-            1 for m in messages 
-            if my_user_id and f"<@{my_user_id}>" in m.get("text", "")
-        )
-        
-        # 리액션 분석
-        reaction_given = sum(
-            len(m.get("reactions", [])) 
-            for m in messages 
-            if m.get("user") == my_user_id
-        )
-        reaction_received = sum(
-            sum(r.get("count", 0) for r in m.get("reactions", []))
-            for m in messages
-            if m.get("user") == my_user_id
-        )
-        
-        # 응답 시간 분석 (스레드 기반)
-        thread_messages = [m for m in messages if m.get("thread_ts")]
-        
-        # 상호작용 사용자 수
-        interacted_users = set()
-        for m in messages:
-            user = m.get("user")
-            if user and user != my_user_id:
-                interacted_users.add(user)
+        users = activity.users
+        channels = activity.channels
+        sent_count = activity.sent_count
+        received_count = activity.received_count
+        total_messages = activity.total_messages
+        active_channels = activity.active_channels
+        mention_count = activity.mention_count
+        reaction_given = activity.reaction_given
+        reaction_received = activity.reaction_received
+        interacted_users = activity.interacted_users
         
         # 1. NET_A: 팀 네트워크 크기
         team_size = len([u for u in users.values() if not u.get("is_bot")])
@@ -412,65 +666,16 @@ class SlackCollector(BaseCollector):
         if not data or not data[0]:
             return {"candidates": [], "total_users": 0}
         
-        slack_data = data[0]
-        messages = slack_data.get("messages", [])
-        users = slack_data.get("users", {})
-        
-        my_user_id = getattr(self, "_user_id", None)
-        
-        # 사용자별 상호작용 집계
-        user_interactions: Dict[str, Dict] = {}
-        
-        for msg in messages:
-            user_id = msg.get("user")
-            if not user_id or user_id == my_user_id:
-                continue
-            
-            if user_id not in user_interactions:
-                user_info = users.get(user_id, {})
-                user_interactions[user_id] = {
-                    "user_id": user_id,
-                    "name": user_info.get("real_name", user_info.get("name", "")),
-                    "email": user_info.get("profile", {}).get("email", ""),
-                    "is_bot": user_info.get("is_bot", False),
-                    "message_count": 0,
-                    "mention_count": 0,
-                    "reaction_count": 0,
-                    "last_interaction": None,
-                    "channels": set(),
-                }
-            
-            user_interactions[user_id]["message_count"] += 1
-            
-            # 채널 추적
-            channel_id = msg.get("channel_id")
-            if channel_id:
-                user_interactions[user_id]["channels"].add(channel_id)
-            
-            # 멘션 체크
-            text = msg.get("text", "")
-            if my_user_id and f"<@{my_user_id}>" in text:
-                user_interactions[user_id]["mention_count"] += 1
-            
-            # 리액션 체크
-            for reaction in msg.get("reactions", []):
-                if my_user_id in reaction.get("users", []):
-                    user_interactions[user_id]["reaction_count"] += 1
-            
-            # 마지막 상호작용
-            ts = msg.get("ts")
-            if ts:
-                try:
-                    msg_time = datetime.fromtimestamp(float(ts))
-                    if not user_interactions[user_id]["last_interaction"]:
-                        user_interactions[user_id]["last_interaction"] = msg_time
-                    else:
-                        user_interactions[user_id]["last_interaction"] = max(
-                            user_interactions[user_id]["last_interaction"],
-                            msg_time
-                        )
-                except:
-                    pass
+        activity = SlackActivity.from_data(data[0], getattr(self, "_user_id", None))
+        return self._activity_to_slots(activity)
+    
+    def _activity_to_slots(self, activity: SlackActivity) -> Dict[str, Any]:
+        """집계 결과 → 슬롯 후보"""
+        # 사용자별 상호작용 (원본 보존을 위해 복사)
+        user_interactions: Dict[str, Dict] = {
+            user_id: {**data, "channels": set(data["channels"])}
+            for user_id, data in activity.user_interactions.items()
+        }
         
         # 점수 계산
         for user_id, data in user_interactions.items():
@@ -331,6 +331,7 @@ class DeltaMessageType(Enum):
     MOTION = 0x01
     STATE_SYNC = 0x02
     HEARTBEAT = 0x03
+    KI_BATCH = 0x04
 
 
 class BinaryDeltaStream:
@@ -368,6 +369,66 @@ class BinaryDeltaStream:
         
         return header + values
     
+    def encode_ki_batch(
+        self,
+        k_updates: List[tuple],
+        i_updates: List[tuple],
+        sequence: Optional[int] = None,
+    ) -> bytes:
+        """
+        K/I 배치 인코딩
+        
+        k_updates: (node_id, k_after, delta_k)
+        i_updates: (node_a, node_b, i_after, delta_i)
+        sequence: 외부 순번 (버스 토픽 seq — 같은 배치를 여러 번 인코딩해도 동일). 없으면 자체 카운터
+        헤더 (13 bytes): type(1) + seq(4) + k 개수(4) + i 개수(4)
+        (개수는 uint32 — 대규모 그래프에서 65,535 개 초과 배치도 한 프레임)
+        id 는 길이(1) + UTF-8, 값은 float32
+        """
+        import struct
+        
+        if sequence is None:
+            self._sequence += 1
+            sequence = self._sequence
+        
+        def _id(value: str) -> bytes:
+            raw = str(value).encode("utf-8")[:255]
+            return bytes((len(raw),)) + raw
+        
+        parts = [struct.pack(">BIII", DeltaMessageType.KI_BATCH.value, sequence,
+                             len(k_updates), len(i_updates))]
+        for node_id, k_after, delta_k in k_updates:
+            parts.append(_id(node_id) + struct.pack(">ff", k_after, delta_k))
+        for node_a, node_b, i_after, delta_i in i_updates:
+            parts.append(_id(node_a) + _id(node_b) + struct.pack(">ff", i_after, delta_i))
+        return b"".join(parts)
+    
+    def _decode_ki_batch(self, data: bytes) -> dict:
+        import struct
+        
+        _, seq, k_count, i_count = struct.unpack(">BIII", data[:13])
+        pos = 13
+        
+        def _id() -> str:
+            nonlocal pos
+            size = data[pos]
+            value = data[pos + 1:pos + 1 + size].decode("utf-8", errors="replace")
+            pos += 1 + size
+            return value
+        
+        k, i = [], []
+        for _ in range(k_count):
+            node_id = _id()
+            k_after, delta_k = struct.unpack(">ff", data[pos:pos + 8])
+            pos += 8
+            k.append({"node_id": node_id, "k_after": k_after, "delta_k": delta_k})
+        for _ in range(i_count):
+            node_a, node_b = _id(), _id()
+            i_after, delta_i = struct.unpack(">ff", data[pos:pos + 8])
+            pos += 8
+            i.append({"node_a": node_a, "node_b": node_b, "i_after": i_after, "delta_i": delta_i})
+        return {"type": "KI_BATCH", "sequence": seq, "k": k, "i": i}
+    
     def decode(self, data: bytes) -> dict:
         """디코딩"""
         import struct
@@ -391,6 +452,8 @@ class BinaryDeltaStream:
                 "sequence": seq,
                 "state": list(state),
             }
+        elif msg_type == DeltaMessageType.KI_BATCH.value:
+            return self._decode_ki_batch(data)
         
         return {"type": "UNKNOWN"}
     
@@ -0,0 +1,469 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+
+                    AUTUS Fan-out Hub (실시간 브로드캐스트)
+
+    클라이언트마다 bounded 송신 큐 + writer 태스크를 두어
+    느린 클라이언트 하나가 다른 구독자/생산자를 막지 않게 한다.
+
+    - 메시지는 발행 시 한 번만 직렬화 (str → send_text, bytes → send_bytes 는 호출 측 send)
+    - publish() 는 큐 적재만 하는 O(클라이언트 수) 동기 연산 (await 없음)
+    - TickConflator: 키별 최신값만 남겨 tick 마다 배치 1회 발행
+    - 큐가 가득 찬 느린 클라이언트 정책:
+        drop_oldest : 가장 오래된 프레임 폐기
+        conflate    : 같은 conflate 키의 대기 프레임을 최신으로 교체
+        disconnect  : 연결 종료 (클라이언트가 재접속 후 스냅샷 수신)
+
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+
+class SlowConsumerPolicy(str, Enum):
+    DROP_OLDEST = "drop_oldest"
+    CONFLATE = "conflate"
+    DISCONNECT = "disconnect"
+
+
+DEFAULT_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", "256"))
+DEFAULT_POLICY = SlowConsumerPolicy(os.getenv("WS_SLOW_CONSUMER_POLICY", SlowConsumerPolicy.DROP_OLDEST.value))
+DEFAULT_SEND_TIMEOUT = float(os.getenv("WS_SEND_TIMEOUT", "10"))
+
+
+Frame = Union[str, bytes]
+
+
+def dumps_default(message: Any) -> str:
+    return json.dumps(message, default=str)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 클라이언트 채널
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class ClientChannel:
+    """
+    클라이언트 1개의 송신 큐 + writer 태스크
+
+    프레임은 (conflate 키, 직렬화된 문자열). 키가 None 이면 conflate 대상 아님.
+    """
+
+    def __init__(
+        self,
+        key: Hashable,
+        send: Callable[[Frame], Awaitable[Any]],
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+        policy: SlowConsumerPolicy = DEFAULT_POLICY,
+        send_timeout: Optional[float] = DEFAULT_SEND_TIMEOUT,
+        on_close: Optional[Callable[["ClientChannel", str], None]] = None,
+    ):
+        self.key = key
+        self.maxsize = max(1, maxsize)
+        self.policy = SlowConsumerPolicy(policy)
+        self.send_timeout = send_timeout
+        self._send = send
+        self._on_close = on_close
+        self._frames: Deque[Tuple[Optional[Hashable], Frame]] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.closed = False
+        self.close_reason: Optional[str] = None
+
+        # 메트릭
+        self.sent = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.max_depth = 0
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._writer())
+
+    @property
+    def depth(self) -> int:
+        return len(self._frames)
+
+    def offer(self, frame: Frame, conflate_key: Optional[Hashable] = None) -> bool:
+        """프레임 적재 (논블로킹). 연결이 닫혀 있거나 끊기면 False"""
+        if self.closed:
+            return False
+        frames = self._frames
+
+        if conflate_key is not None and self.policy == SlowConsumerPolicy.CONFLATE:
+            # 아직 안 나간 같은 키의 프레임을 최신 값으로 교체 (순서 유지)
+            for i, (k, _) in enumerate(frames):
+                if k == conflate_key:
+                    frames[i] = (conflate_key, frame)
+                    self.conflated += 1
+                    return True
+
+        if len(frames) >= self.maxsize:
+            if self.policy == SlowConsumerPolicy.DISCONNECT:
+                self.close("slow_consumer")
+                return False
+            frames.popleft()
+            self.dropped += 1
+
+        frames.append((conflate_key, frame))
+        if len(frames) > self.max_depth:
+            self.max_depth = len(frames)
+        self._wakeup.set()
+        return True
+
+    async def _writer(self):
+        frames = self._frames
+        loop = asyncio.get_running_loop()
+        try:
+            while not self.closed:
+                if not frames:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                _, frame = frames.popleft()
+                # 전송 타임아웃은 타이머로 감시 (wait_for 는 전송마다 태스크를 만든다)
+                watchdog = loop.call_later(self.send_timeout, self.close, "send_timeout") \
+                    if self.send_timeout else None
+                try:
+                    await self._send(frame)
+                finally:
+                    if watchdog is not None:
+                        watchdog.cancel()
+                self.sent += 1
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            self.close("send_error")
+
+    def close(self, reason: str = "closed"):
+        """큐 비우고 writer 중지. on_close 는 최초 1회만 호출"""
+        if self.closed:
+            return
+        self.closed = True
+        self.close_reason = reason
+        self._frames.clear()
+        self._wakeup.set()
+        task, current = self._task, None
+        try:
+            current = asyncio.current_task()
+        except RuntimeError:
+            pass
+        if task is not None and task is not current and not task.done():
+            task.cancel()
+        if self._on_close:
+            self._on_close(self, reason)
+
+    async def flush(self, timeout: float = 5.0) -> bool:
+        """대기 프레임이 모두 나갈 때까지 (테스트/종료용)"""
+        deadline = time.monotonic() + timeout
+        while self._frames and not self.closed:
+            if time.monotonic() > deadline:
+                return False
+            await asyncio.sleep(0.005)
+        return True
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Fan-out Hub
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class FanoutHub:
+    """
+    연결 관리자용 브로드캐스트 계층
+
+    사용:
+        hub = FanoutHub(on_evict=lambda key, reason: ...)
+        hub.add(client_id, websocket.send_text)
+        hub.publish({"type": "k_update", ...}, conflate_key=("k", node_id))
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+        policy: SlowConsumerPolicy = DEFAULT_POLICY,
+        send_timeout: Optional[float] = DEFAULT_SEND_TIMEOUT,
+        dumps: Callable[[Any], str] = dumps_default,
+        on_evict: Optional[Callable[[Hashable, str], None]] = None,
+    ):
+        self.maxsize = maxsize
+        self.policy = SlowConsumerPolicy(policy)
+        self.send_timeout = send_timeout
+        self.dumps = dumps
+        self.on_evict = on_evict
+        self.channels: Dict[Hashable, ClientChannel] = {}
+
+        self.published = 0
+        self.evicted: Dict[str, int] = {}
+        self._closed_sent = 0
+        self._closed_dropped = 0
+        self._closed_conflated = 0
+
+    def __len__(self) -> int:
+        return len(self.channels)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.channels
+
+    def add(self, key: Hashable, send: Callable[[Frame], Awaitable[Any]]) -> ClientChannel:
+        """클라이언트 등록 + writer 시작 (이벤트 루프 안에서 호출)"""
+        self.remove(key)
+        channel = ClientChannel(
+            key, send, self.maxsize, self.policy, self.send_timeout, on_close=self._channel_closed
+        )
+        self.channels[key] = channel
+        channel.start()
+        return channel
+
+    def remove(self, key: Hashable) -> bool:
+        channel = self.channels.get(key)
+        if channel is None:
+            return False
+        channel.close("removed")
+        return True
+
+    def _channel_closed(self, channel: ClientChannel, reason: str):
+        if self.channels.get(channel.key) is channel:
+            del self.channels[channel.key]
+        self._closed_sent += channel.sent
+        self._closed_dropped += channel.dropped
+        self._closed_conflated += channel.conflated
+        if reason != "removed":
+            self.evicted[reason] = self.evicted.get(reason, 0) + 1
+            if self.on_evict:
+                self.on_evict(channel.key, reason)
+
+    def publish(
+        self,
+        message: Any,
+        keys: Optional[Iterable[Hashable]] = None,
+        conflate_key: Optional[Hashable] = None,
+    ) -> int:
+        """
+        직렬화 1회 후 대상 클라이언트 큐에 적재. 적재된 클라이언트 수 반환
+
+        keys: 대상 클라이언트 (None 이면 전체)
+        """
+        if not self.channels:
+            return 0
+        frame = message if isinstance(message, (str, bytes)) else self.dumps(message)
+        self.published += 1
+        channels = self.channels
+        if keys is None:
+            targets = list(channels.values())
+        else:
+            targets = [channels[k] for k in keys if k in channels]
+        delivered = 0
+        for channel in targets:
+            if channel.offer(frame, conflate_key):
+                delivered += 1
+        return delivered
+
+    def send_to(self, key: Hashable, message: Any) -> bool:
+        """개별 전송 (브로드캐스트와 같은 큐 → 순서 보장)"""
+        channel = self.channels.get(key)
+        if channel is None:
+            return False
+        return channel.offer(message if isinstance(message, (str, bytes)) else self.dumps(message))
+
+    async def flush(self, timeout: float = 5.0) -> bool:
+        results = await asyncio.gather(*(c.flush(timeout) for c in list(self.channels.values())))
+        return all(results)
+
+    def close(self):
+        for key in list(self.channels):
+            self.remove(key)
+
+    def stats(self) -> Dict[str, Any]:
+        channels = list(self.channels.values())
+        return {
+            "clients": len(channels),
+            "policy": self.policy.value,
+            "queue_size": self.maxsize,
+            "published": self.published,
+            "sent": self._closed_sent + sum(c.sent for c in channels),
+            "dropped": self._closed_dropped + sum(c.dropped for c in channels),
+            "conflated": self._closed_conflated + sum(c.conflated for c in channels),
+            "evicted": dict(self.evicted),
+            "queued": sum(c.depth for c in channels),
+            "max_queue_depth": max((c.max_depth for c in channels), default=0),
+        }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Tick Conflation
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TickConflator:
+    """
+    키별 최신값 conflation + tick 배치 발행
+
+    offer(key, value) 는 대기 dict 갱신만 하고, tick 첫 갱신 시 타이머를 건다.
+    tick 이 끝나면 {key: value} 배치 1개로 emit — 같은 tick 안에서 덮인 값은 보내지 않는다.
+    merge(old, new) 로 덮어쓰기 대신 병합 가능 (예: 최초 before 값 유지).
+    """
+
+    def __init__(
+        self,
+        tick: float,
+        emit: Callable[[Dict[Hashable, Any]], Any],
+        merge: Optional[Callable[[Any, Any], Any]] = None,
+    ):
+        self.tick = tick
+        self.emit = emit
+        self.merge = merge
+        self.pending: Dict[Hashable, Any] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        self.offered = 0
+        self.superseded = 0
+        self.batches = 0
+
+    def offer(self, key: Hashable, value: Any):
+        self.offered += 1
+        pending = self.pending
+        if key in pending:
+            self.superseded += 1
+            if self.merge is not None:
+                value = self.merge(pending[key], value)
+        pending[key] = value
+        if self._timer is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # 이벤트 루프 밖 (스크립트/테스트) → 즉시 발행
+                self.flush()
+                return
+            self._timer = loop.call_later(self.tick, self.flush)
+
+    def flush(self) -> int:
+        """대기 배치 즉시 발행, 발행한 항목 수 반환"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self.pending:
+            return 0
+        batch, self.pending = self.pending, {}
+        self.batches += 1
+        self.emit(batch)
+        return len(batch)
+
+    def close(self):
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "tick_ms": round(self.tick * 1000, 1),
+            "offered": self.offered,
+            "superseded": self.superseded,
+            "batches": self.batches,
+            "pending": len(self.pending),
+        }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 부하 테스트
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class _SimulatedClient:
+    """send_text 만 있는 가짜 WebSocket (slow 면 전송마다 지연)"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.received = 0
+        self.last: Optional[str] = None
+
+    async def send_text(self, data: str):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.received += 1
+        self.last = data
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def run_fanout_load_test(
+    clients: int = 5000,
+    slow_clients: int = 50,
+    messages: int = 50,
+    slow_delay: float = 0.05,
+    interval: float = 0.002,
+    policy: SlowConsumerPolicy = SlowConsumerPolicy.DROP_OLDEST,
+    queue_size: int = 16,
+) -> Dict[str, Any]:
+    """
+    클라이언트 N개(일부는 느림)에 메시지 M개 발행 → 생산자 지연 측정
+
+    baseline_* 는 기존 방식(클라이언트별 순차 await)의 첫 메시지 1회 지연.
+    """
+    hub = FanoutHub(maxsize=queue_size, policy=policy, send_timeout=None)
+    sims = [_SimulatedClient(slow_delay if i < slow_clients else 0.0) for i in range(clients)]
+    for i, sim in enumerate(sims):
+        hub.add(i, sim.send_text)
+
+    payload = {"type": "k_update", "data": {"node_id": "User_A", "k_after": 0.5, "pad": "x" * 200}}
+
+    # 기존 방식: 순차 await (느린 클라이언트 지연이 누적)
+    baseline_sims = [_SimulatedClient(slow_delay if i < slow_clients else 0.0) for i in range(clients)]
+    start = time.perf_counter()
+    frame = dumps_default(payload)
+    for sim in baseline_sims:
+        await sim.send_text(frame)
+    baseline_ms = (time.perf_counter() - start) * 1000
+
+    latencies = []
+    for seq in range(messages):
+        message = dict(payload, seq=seq)
+        start = time.perf_counter()
+        hub.publish(message, conflate_key=("k", "User_A"))
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(interval)
+
+    fast = sims[slow_clients:]
+    await asyncio.gather(*(hub.channels[i].flush(10) for i in range(slow_clients, clients) if i in hub.channels))
+    stats = hub.stats()
+    hub.close()
+
+    return {
+        "clients": clients,
+        "slow_clients": slow_clients,
+        "messages": messages,
+        "policy": SlowConsumerPolicy(policy).value,
+        "publish_p50_ms": round(_percentile(latencies, 0.5), 3),
+        "publish_p99_ms": round(_percentile(latencies, 0.99), 3),
+        "publish_max_ms": round(max(latencies), 3),
+        "baseline_sequential_ms": round(baseline_ms, 1),
+        "fast_min_received": min(s.received for s in fast) if fast else 0,
+        "slow_max_received": max((s.received for s in sims[:slow_clients]), default=0),
+        "dropped": stats["dropped"],
+        "conflated": stats["conflated"],
+        "evicted": stats["evicted"],
+        "max_queue_depth": stats["max_queue_depth"],
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="WebSocket fan-out 부하 테스트")
+    parser.add_argument("--clients", type=int, default=5000)
+    parser.add_argument("--slow", type=int, default=50)
+    parser.add_argument("--messages", type=int, default=50)
+    parser.add_argument("--policy", default="drop_oldest", choices=[p.value for p in SlowConsumerPolicy])
+    args = parser.parse_args()
+
+    report = asyncio.run(run_fanout_load_test(
+        clients=args.clients, slow_clients=args.slow, messages=args.messages,
+        policy=SlowConsumerPolicy(args.policy),
+    ))
+    print(json.dumps(report, indent=2, ensure_ascii=False))
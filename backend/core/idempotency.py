@@ -0,0 +1,518 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+🔁 AUTUS - Idempotency / Dedup Layer
+═══════════════════════════════════════════════════════════════════════════════
+
+웹훅 재전송 / AutoSync 중복 이벤트를 그래프 쓰기 전에 걸러내는 계층
+
+  • 키: 공급자 이벤트 id (Stripe evt_…, Shopify X-Shopify-Webhook-Id …)
+        없으면 정규화된 payload 의 SHA-256
+  • 시간 창: 키는 window 초 동안만 기억 (기본 72시간 = Stripe 재시도 기간)
+  • 저장소: 메모리 / SQLite / Redis (SET NX EX)
+  • 블룸 필터: 단일 프로세스 저장소 (memory, sqlite) 에서
+    "확실히 처음 보는" 키는 저장소 조회 없이 통과시키고 쓰기는 모아서 반영.
+    공유 저장소 (Redis, 여러 프로세스가 쓰는 SQLite) 는 항상 원자적 claim.
+
+사용법:
+  guard = get_idempotency_guard("stripe")
+  key = event_key("stripe", data.get("id"), data)
+  if not guard.claim(key):
+      return {"duplicate": True}
+  try:
+      ...  # 그래프 쓰기
+  except Exception:
+      guard.release(key)   # 재전송이 다시 처리될 수 있게
+      raise
+
+환경변수:
+  IDEMPOTENCY_BACKEND         memory | sqlite | redis (기본 sqlite)
+  IDEMPOTENCY_DB_PATH         SQLite 경로 (기본 data/idempotency.db)
+  IDEMPOTENCY_SHARED          SQLite 를 여러 프로세스가 공유하면 true
+  IDEMPOTENCY_WINDOW_SECONDS  기억 시간 (기본 259200)
+  IDEMPOTENCY_BLOOM_CAPACITY  블룸 세대당 용량 (기본 1000000)
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_SECONDS = int(os.getenv("IDEMPOTENCY_WINDOW_SECONDS", str(72 * 3600)))
+DEFAULT_BLOOM_CAPACITY = int(os.getenv("IDEMPOTENCY_BLOOM_CAPACITY", "1000000"))
+DEFAULT_DB_PATH = "data/idempotency.db"
+
+# 블룸 경로에서 쓰기를 모아 반영하는 단위
+FLUSH_SIZE = 256
+FLUSH_INTERVAL = 1.0
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 📌 키
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def content_hash(data: Any) -> str:
+    """정규화 JSON (키 정렬, 공백 제거) 의 SHA-256 — 필드 순서/공백 차이에 무관"""
+    if isinstance(data, (bytes, bytearray)):
+        try:
+            data = json.loads(data)
+        except ValueError:
+            return hashlib.sha256(data).hexdigest()
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def event_key(provider: str, event_id: Optional[Any] = None, data: Any = None) -> str:
+    """provider:event_id, 이벤트 id 가 없으면 provider:sha256:<payload 해시>"""
+    if event_id not in (None, ""):
+        return f"{provider}:{event_id}"
+    return f"{provider}:sha256:{content_hash(data)}"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 📌 블룸 필터
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class BloomFilter:
+    """고정 크기 블룸 필터 (blake2b 이중 해싱)"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class RotatingBloomFilter:
+    """
+    시간 창 블룸 필터 (현재 + 이전 세대)
+
+    현재 세대가 window 초를 넘기거나 용량을 채우면 이전 세대를 버리고 교체.
+    시간 기준 회전만 있으면 키는 최소 window 초 동안 양성으로 남는다.
+    용량 기준 회전으로 버린 세대에는 window 가 지나지 않은 키가 있을 수 있으므로
+    그 세대의 마지막 기록 + window 까지는 음성을 신뢰하지 않는다 (authoritative=False).
+    """
+
+    def __init__(self, capacity: int, window: float, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.window = window
+        self.error_rate = error_rate
+        self.current = BloomFilter(capacity, error_rate)
+        self.previous: Optional[BloomFilter] = None
+        self.started = time.time()
+        self.previous_ended = 0.0
+        # 이 시각 전까지는 음성 = "처음 보는 키" 가 보장되지 않음
+        self.reliable_after = 0.0
+        self.rotations = 0
+
+    def _maybe_rotate(self):
+        now = time.time()
+        if now - self.started >= self.window or self.current.count >= self.capacity:
+            if self.previous is not None:
+                # 버리는 세대의 키는 previous_ended 까지 기록됨
+                self.reliable_after = max(self.reliable_after, self.previous_ended + self.window)
+            self.previous = self.current
+            self.previous_ended = now
+            self.current = BloomFilter(self.capacity, self.error_rate)
+            self.started = now
+            self.rotations += 1
+
+    @property
+    def authoritative(self) -> bool:
+        """음성 결과를 저장소 조회 없이 믿어도 되는지"""
+        return time.time() >= self.reliable_after
+
+    def add(self, key: str):
+        self._maybe_rotate()
+        self.current.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        self._maybe_rotate()
+        return key in self.current or (self.previous is not None and key in self.previous)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 📌 저장소
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class IdempotencyBackend:
+    """키 → 만료 시각 저장소 인터페이스"""
+
+    # 여러 프로세스가 같은 저장소를 보는지 (True 면 블룸 우회 없이 항상 claim)
+    shared = False
+
+    def claim(self, key: str, ttl: float) -> bool:
+        """키가 없거나 만료됐으면 기록하고 True, 살아있으면 False (원자적)"""
+        raise NotImplementedError
+
+    def add_many(self, keys: Iterable[str], ttl: float):
+        """조회 없이 기록 (블룸 음성 경로의 지연 쓰기)"""
+        for key in keys:
+            self.claim(key, ttl)
+
+    def release(self, key: str):
+        raise NotImplementedError
+
+    def live_keys(self) -> List[str]:
+        """만료되지 않은 키 (블룸 워밍용)"""
+        return []
+
+    def purge(self) -> int:
+        return 0
+
+
+class MemoryIdempotencyBackend(IdempotencyBackend):
+    """인메모리 (개발/테스트용, max_entries 초과 시 오래된 키부터 축출)"""
+
+    def __init__(self, max_entries: int = 1_000_000):
+        self.max_entries = max_entries
+        self._keys: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _put(self, key: str, expires: float):
+        self._keys[key] = expires
+        self._keys.move_to_end(key)
+        while len(self._keys) > self.max_entries:
+            self._keys.popitem(last=False)
+
+    def claim(self, key: str, ttl: float) -> bool:
+        now = time.time()
+        with self._lock:
+            expires = self._keys.get(key)
+            if expires is not None and expires > now:
+                return False
+            self._put(key, now + ttl)
+            return True
+
+    def add_many(self, keys: Iterable[str], ttl: float):
+        expires = time.time() + ttl
+        with self._lock:
+            for key in keys:
+                self._put(key, expires)
+
+    def release(self, key: str):
+        with self._lock:
+            self._keys.pop(key, None)
+
+    def live_keys(self) -> List[str]:
+        now = time.time()
+        with self._lock:
+            return [k for k, exp in self._keys.items() if exp > now]
+
+    def purge(self) -> int:
+        # 같은 ttl 로 삽입되므로 앞쪽이 먼저 만료
+        now = time.time()
+        removed = 0
+        with self._lock:
+            while self._keys:
+                key, expires = next(iter(self._keys.items()))
+                if expires > now:
+                    break
+                self._keys.popitem(last=False)
+                removed += 1
+        return removed
+
+
+class SQLiteIdempotencyBackend(IdempotencyBackend):
+    """SQLite (WAL) — 재시작 후에도 시간 창 유지"""
+
+    PURGE_EVERY = 10000
+
+    def __init__(self, path: Optional[str] = None, shared: Optional[bool] = None):
+        self.path = path or os.getenv("IDEMPOTENCY_DB_PATH", DEFAULT_DB_PATH)
+        if shared is None:
+            shared = os.getenv("IDEMPOTENCY_SHARED", "false").lower() == "true"
+        self.shared = shared
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS idempotency_keys (
+                key TEXT PRIMARY KEY,
+                expires_at REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_idempotency_expires ON idempotency_keys (expires_at)")
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def claim(self, key: str, ttl: float) -> bool:
+        now = time.time()
+        with self._lock:
+            # 만료된 키는 덮어쓰고, 살아있는 키는 그대로 (rowcount 0)
+            cur = self.conn.execute(
+                "INSERT INTO idempotency_keys (key, expires_at) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET expires_at = excluded.expires_at "
+                "WHERE idempotency_keys.expires_at <= ?",
+                (key, now + ttl, now),
+            )
+            claimed = cur.rowcount == 1
+            self._writes += 1
+        if self._writes % self.PURGE_EVERY == 0:
+            self.purge()
+        return claimed
+
+    def add_many(self, keys: Iterable[str], ttl: float):
+        expires = time.time() + ttl
+        rows = [(key, expires) for key in keys]
+        if not rows:
+            return
+        with self._lock:
+            self.conn.execute("BEGIN")
+            self.conn.executemany("INSERT OR REPLACE INTO idempotency_keys (key, expires_at) VALUES (?, ?)", rows)
+            self.conn.execute("COMMIT")
+            self._writes += len(rows)
+
+    def release(self, key: str):
+        with self._lock:
+            self.conn.execute("DELETE FROM idempotency_keys WHERE key = ?", (key,))
+
+    def live_keys(self) -> List[str]:
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT key FROM idempotency_keys WHERE expires_at > ?", (time.time(),)
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def purge(self) -> int:
+        with self._lock:
+            return self.conn.execute(
+                "DELETE FROM idempotency_keys WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class RedisIdempotencyBackend(IdempotencyBackend):
+    """Redis SET NX EX — 여러 인스턴스가 공유, 만료는 Redis 가 처리"""
+
+    shared = True
+
+    def __init__(self, client=None, url: Optional[str] = None, prefix: str = "autus:idem:"):
+        if client is None:
+            import redis
+            client = redis.from_url(url or os.environ.get("REDIS_URL", "redis://localhost:6379"))
+        self.client = client
+        self.prefix = prefix
+
+    def claim(self, key: str, ttl: float) -> bool:
+        return bool(self.client.set(self.prefix + key, 1, nx=True, ex=max(1, int(ttl))))
+
+    def add_many(self, keys: Iterable[str], ttl: float):
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.set(self.prefix + key, 1, ex=max(1, int(ttl)))
+        pipe.execute()
+
+    def release(self, key: str):
+        self.client.delete(self.prefix + key)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 📌 Guard
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class IdempotencyGuard:
+    """
+    네임스페이스별 중복 판정 + 적중률 메트릭
+
+    단일 프로세스 저장소:
+      블룸 음성 → 저장소 조회 없이 통과, 쓰기는 _pending 에 모아 FLUSH_SIZE/FLUSH_INTERVAL 마다 반영
+      블룸 양성 → _pending 또는 저장소 claim 으로 확인 (오탐이면 통과)
+      용량 기준 회전 직후 window 동안 (bloom.authoritative=False) 은 음성도 저장소 claim
+    공유 저장소: 항상 저장소 claim
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        backend: IdempotencyBackend,
+        window: float = DEFAULT_WINDOW_SECONDS,
+        bloom_capacity: int = DEFAULT_BLOOM_CAPACITY,
+        bloom: Optional[RotatingBloomFilter] = None,
+    ):
+        self.namespace = namespace
+        self.backend = backend
+        self.window = window
+        self.use_bloom = not backend.shared
+        self.bloom = bloom
+        if self.use_bloom and self.bloom is None:
+            self.bloom = RotatingBloomFilter(bloom_capacity, window)
+            for key in backend.live_keys():
+                self.bloom.add(key)
+        self._pending: Dict[str, float] = {}
+        self._last_flush = time.time()
+        self._lock = threading.RLock()
+
+        self.checks = 0
+        self.duplicates = 0
+        self.bloom_negatives = 0
+        self.bloom_false_positives = 0
+        self.bloom_unreliable = 0
+        self.released = 0
+        self.errors = 0
+
+    def _key(self, key: str) -> str:
+        return key if key.startswith(self.namespace + ":") else f"{self.namespace}:{key}"
+
+    def claim(self, key: str) -> bool:
+        """처음 보는 키면 기록 후 True, 시간 창 안의 중복이면 False"""
+        key = self._key(key)
+        with self._lock:
+            self.checks += 1
+            try:
+                if self.use_bloom:
+                    first = self._claim_local(key)
+                else:
+                    first = self.backend.claim(key, self.window)
+            except Exception as e:
+                # 저장소 장애 시 이벤트를 잃지 않도록 통과 (중복 가능성 감수)
+                self.errors += 1
+                logger.warning(f"⚠️ idempotency backend 오류 ({self.namespace}): {e}")
+                return True
+            if not first:
+                self.duplicates += 1
+            return first
+
+    def _claim_local(self, key: str) -> bool:
+        positive = key in self.bloom
+        if not positive:
+            self.bloom.add(key)
+            if self.bloom.authoritative:
+                self.bloom_negatives += 1
+                self._pending[key] = time.time()
+                self._maybe_flush()
+                return True
+            self.bloom_unreliable += 1
+        if key in self._pending:
+            return False
+        first = self.backend.claim(key, self.window)
+        if first and positive:
+            self.bloom_false_positives += 1
+        return first
+
+    def _maybe_flush(self):
+        if len(self._pending) >= FLUSH_SIZE or time.time() - self._last_flush >= FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        """블룸 경로에서 모아둔 키를 저장소에 반영"""
+        with self._lock:
+            if self._pending:
+                self.backend.add_many(list(self._pending), self.window)
+                self._pending.clear()
+            self._last_flush = time.time()
+
+    def release(self, key: str):
+        """처리 실패 시 키 해제 (공급자 재전송이 다시 처리되도록)"""
+        key = self._key(key)
+        with self._lock:
+            self._pending.pop(key, None)
+            try:
+                self.backend.release(key)
+            except Exception as e:
+                logger.warning(f"⚠️ idempotency release 실패 ({self.namespace}): {e}")
+            self.released += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "namespace": self.namespace,
+            "backend": type(self.backend).__name__,
+            "window_seconds": self.window,
+            "checks": self.checks,
+            "duplicates": self.duplicates,
+            "hit_rate": round(self.duplicates / self.checks, 4) if self.checks else 0.0,
+            "bloom": self.use_bloom,
+            "bloom_negatives": self.bloom_negatives,
+            "bloom_false_positives": self.bloom_false_positives,
+            "bloom_unreliable": self.bloom_unreliable,
+            "pending_writes": len(self._pending),
+            "released": self.released,
+            "errors": self.errors,
+        }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 📌 Factory
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_backend: Optional[IdempotencyBackend] = None
+_guards: Dict[str, IdempotencyGuard] = {}
+_factory_lock = threading.Lock()
+
+
+def get_idempotency_backend() -> IdempotencyBackend:
+    """IDEMPOTENCY_BACKEND 설정에 따른 공용 저장소 (Redis 실패 시 SQLite 폴백)"""
+    global _backend
+    if _backend is None:
+        kind = os.getenv("IDEMPOTENCY_BACKEND", "sqlite").lower()
+        if kind == "redis":
+            try:
+                backend = RedisIdempotencyBackend()
+                backend.client.ping()
+                _backend = backend
+            except Exception as e:
+                logger.warning(f"⚠️ Redis 미연결 - SQLite idempotency 로 폴백: {e}")
+                _backend = SQLiteIdempotencyBackend()
+        elif kind == "memory":
+            _backend = MemoryIdempotencyBackend()
+        else:
+            _backend = SQLiteIdempotencyBackend()
+    return _backend
+
+
+def get_idempotency_guard(namespace: str) -> IdempotencyGuard:
+    """네임스페이스별 Guard 싱글톤 (저장소 공유)"""
+    with _factory_lock:
+        guard = _guards.get(namespace)
+        if guard is None:
+            guard = IdempotencyGuard(namespace, get_idempotency_backend())
+            _guards[namespace] = guard
+        return guard
+
+
+def idempotency_stats() -> Dict[str, Any]:
+    """전체 네임스페이스 메트릭"""
+    guards = list(_guards.values())
+    checks = sum(g.checks for g in guards)
+    duplicates = sum(g.duplicates for g in guards)
+    return {
+        "checks": checks,
+        "duplicates": duplicates,
+        "hit_rate": round(duplicates / checks, 4) if checks else 0.0,
+        "namespaces": {g.namespace: g.stats() for g in guards},
+    }
+
+
+def flush_idempotency():
+    """종료 시 지연 쓰기 반영"""
+    for guard in list(_guards.values()):
+        guard.flush()
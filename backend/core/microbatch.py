@@ -0,0 +1,207 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+
+                    AUTUS Micro-Batcher (동적 배치 추론)
+
+    동시에 들어온 요청을 최대 max_wait_ms 또는 max_batch 개까지 모아
+    배치 함수 1회 호출로 처리하고 결과를 요청별로 돌려준다.
+
+    - 배치 함수는 전용 스레드 풀에서 실행 (이벤트 루프 비차단)
+    - 워커가 모두 바쁘면 대기열이 계속 쌓이고, 워커가 비는 즉시 다음 배치 발송
+      → 부하가 클수록 배치가 자연스럽게 커진다 (dynamic batching)
+    - max_wait_ms=0: 한가할 때는 즉시 단건 실행 (저동시성 지연 최소),
+      바쁠 때만 배치가 형성됨
+    - 배치 함수 예외는 해당 배치의 모든 요청에 전파
+
+    사용법:
+        batcher = MicroBatcher(model.predict_batch, max_batch=32, max_wait_ms=5)
+        result = await batcher.submit(x)
+
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+BatchFn = Callable[[List[Any]], Sequence[Any]]
+
+
+class MicroBatcher:
+    """
+    비동기 마이크로 배처
+
+    Args:
+        fn: 입력 리스트 → 같은 길이의 결과 리스트 (스레드에서 호출)
+        max_batch: 배치 최대 크기
+        max_wait_ms: 첫 요청 이후 배치를 채우려 기다리는 최대 시간
+        workers: 배치 함수를 실행할 전용 스레드 수 (동시 배치 수)
+    """
+
+    def __init__(
+        self,
+        fn: BatchFn,
+        max_batch: int = 32,
+        max_wait_ms: float = 5.0,
+        workers: int = 1,
+        name: str = "microbatch",
+    ):
+        self.fn = fn
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.workers = max(1, workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=name)
+        self._pending: List[Tuple[Any, asyncio.Future, float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight = 0
+        self._closed = False
+
+        self.batches = 0
+        self.items = 0
+        self.max_batch_seen = 0
+        self.errors = 0
+        self._wait_total = 0.0
+
+    async def submit(self, item: Any) -> Any:
+        """요청 1건 제출 → 배치 처리 후 해당 결과"""
+        if self._closed:
+            raise RuntimeError("MicroBatcher is closed")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future, time.perf_counter()))
+
+        if len(self._pending) >= self.max_batch:
+            self._dispatch(loop)
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._dispatch, loop)
+        return await future
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # 워커가 모두 바쁘면 대기 → 완료 콜백에서 더 큰 배치로 발송
+        while self._pending and self._inflight < self.workers:
+            batch = self._pending[:self.max_batch]
+            del self._pending[:self.max_batch]
+            batch = [entry for entry in batch if not entry[1].cancelled()]
+            if not batch:
+                continue
+            now = time.perf_counter()
+            self._wait_total += sum(now - queued for _, _, queued in batch)
+            self._inflight += 1
+            task = loop.run_in_executor(self._executor, self._run, [item for item, _, _ in batch])
+            task.add_done_callback(lambda t, b=batch: self._scatter(loop, t, b))
+
+    def _run(self, items: List[Any]) -> Sequence[Any]:
+        results = self.fn(items)
+        if len(results) != len(items):
+            raise ValueError(f"batch fn returned {len(results)} results for {len(items)} items")
+        return results
+
+    def _scatter(self, loop: asyncio.AbstractEventLoop, task: "asyncio.Future", batch: List[Tuple[Any, asyncio.Future, float]]):
+        self._inflight -= 1
+        self.batches += 1
+        self.items += len(batch)
+        self.max_batch_seen = max(self.max_batch_seen, len(batch))
+
+        error = task.exception()
+        if error is not None:
+            self.errors += 1
+        for i, (_, future, _) in enumerate(batch):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(task.result()[i])
+
+        if self._pending and not self._closed:
+            self._dispatch(loop)
+
+    def close(self):
+        self._closed = True
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for _, future, _ in self._pending:
+            if not future.done():
+                future.set_exception(RuntimeError("MicroBatcher is closed"))
+        self._pending.clear()
+        self._executor.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch": round(self.items / self.batches, 2) if self.batches else 0,
+            "max_batch_seen": self.max_batch_seen,
+            "avg_queue_wait_ms": round(self._wait_total / self.items * 1000, 3) if self.items else 0,
+            "pending": len(self._pending),
+            "inflight": self._inflight,
+            "errors": self.errors,
+            "max_batch": self.max_batch,
+            "max_wait_ms": self.max_wait * 1000,
+            "workers": self.workers,
+        }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 벤치마크
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def _drive(batcher: MicroBatcher, make_item: Callable[[int], Any], concurrency: int, requests: int):
+    latencies: List[float] = []
+    counter = iter(range(requests))
+
+    async def client():
+        for n in counter:
+            start = time.perf_counter()
+            await batcher.submit(make_item(n))
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - start
+
+
+async def run_batching_benchmark(
+    fn: BatchFn,
+    make_item: Callable[[int], Any],
+    concurrency_levels: Sequence[int] = (1, 4, 16, 64, 256),
+    requests: int = 512,
+    max_batch: int = 32,
+    max_wait_ms: float = 5.0,
+    workers: int = 1,
+) -> List[Dict[str, Any]]:
+    """
+    동시성 수준별 처리량 / 지연: 배치(max_batch) vs 요청별 단건(max_batch=1)
+
+    클라이언트 `concurrency` 개가 닫힌 루프로 총 `requests` 건을 보낸다.
+    """
+    report = []
+    for concurrency in concurrency_levels:
+        row: Dict[str, Any] = {"concurrency": concurrency, "requests": requests}
+        for label, size, wait in (("single", 1, 0.0), ("batched", max_batch, max_wait_ms)):
+            batcher = MicroBatcher(fn, max_batch=size, max_wait_ms=wait, workers=workers)
+            latencies, elapsed = await _drive(batcher, make_item, concurrency, requests)
+            stats = batcher.stats()
+            batcher.close()
+            row[label] = {
+                "throughput_rps": round(requests / elapsed, 1),
+                "p50_ms": round(_percentile(latencies, 0.5), 3),
+                "p99_ms": round(_percentile(latencies, 0.99), 3),
+                "avg_batch": stats["avg_batch"],
+            }
+        row["speedup"] = round(row["batched"]["throughput_rps"] / row["single"]["throughput_rps"], 2)
+        report.append(row)
+    return report
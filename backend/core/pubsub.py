@@ -0,0 +1,376 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+📡 AUTUS - Pub/Sub Bus (워커 간 브로드캐스트)
+═══════════════════════════════════════════════════════════════════════════════
+
+연결 관리자의 broadcast 를 워커 프로세스 경계 너머로 전달하는 백본
+
+  • 발행 워커는 버스에 한 번 publish → 모든 워커의 구독 핸들러가
+    자기 프로세스의 소켓에만 전달
+  • 토픽별 순번(seq): 클라이언트/워커가 누락(gap) 감지
+  • 구현: 프로세스 내 (기본, 단일 워커) / Redis PUBLISH + PSUBSCRIBE
+
+사용법:
+  bus = get_pubsub_bus()
+  bus.subscribe("ws.gravity", manager.deliver)      # 워커마다 1회
+  await bus.publish("ws.gravity", {"type": "gravity_state", ...})
+  # → 모든 워커에서 manager.deliver(Envelope(topic, seq, origin, payload)) 호출
+  bus.publish_nowait(...)   # 동기 컨텍스트 (타이머 콜백 등)
+
+환경변수:
+  PUBSUB_BACKEND   memory | redis (기본 memory)
+  PUBSUB_PREFIX    Redis 채널/키 접두사 (기본 autus:bus:)
+  REDIS_URL        Redis 주소
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREFIX = os.getenv("PUBSUB_PREFIX", "autus:bus:")
+
+
+@dataclass
+class Envelope:
+    """버스 메시지"""
+    topic: str
+    seq: int
+    origin: str      # 발행 워커 id
+    payload: Any
+
+
+Handler = Callable[[Envelope], Union[None, Awaitable[None]]]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 📌 Base
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class PubSubBus:
+    """버스 인터페이스 + 로컬 디스패치 / 누락 감지 공통부"""
+
+    kind = "base"
+
+    def __init__(self, worker_id: Optional[str] = None):
+        self.worker_id = worker_id or f"{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._last_seq: Dict[str, int] = {}
+
+        self._tasks: set = set()
+
+        self.published = 0
+        self.delivered = 0
+        self.gaps = 0
+        self.errors = 0
+
+    def subscribe(self, topic: str, handler: Handler) -> Callable[[], None]:
+        """토픽 핸들러 등록 (이 워커에서만 호출됨). 해제 함수 반환"""
+        self._handlers.setdefault(topic, []).append(handler)
+
+        def _unsubscribe():
+            handlers = self._handlers.get(topic, [])
+            if handler in handlers:
+                handlers.remove(handler)
+
+        return _unsubscribe
+
+    async def publish(self, topic: str, payload: Any) -> int:
+        """발행, 부여된 seq 반환"""
+        raise NotImplementedError
+
+    def publish_nowait(self, topic: str, payload: Any):
+        """동기 컨텍스트용 발행 (백그라운드 태스크)"""
+        task = asyncio.get_running_loop().create_task(self.publish(topic, payload))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+    def _track(self, envelope: Envelope):
+        last = self._last_seq.get(envelope.topic)
+        if last is not None and envelope.seq > last + 1:
+            self.gaps += envelope.seq - last - 1
+            logger.warning(
+                f"[PubSub] {envelope.topic} gap: {last} → {envelope.seq}"
+            )
+        if last is None or envelope.seq > last:
+            self._last_seq[envelope.topic] = envelope.seq
+
+    async def _dispatch(self, envelope: Envelope):
+        self._track(envelope)
+        for handler in list(self._handlers.get(envelope.topic, ())):
+            try:
+                result = handler(envelope)
+                if inspect.isawaitable(result):
+                    await result
+                self.delivered += 1
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"[PubSub] handler error on {envelope.topic}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.kind,
+            "worker_id": self.worker_id,
+            "topics": sorted(t for t, h in self._handlers.items() if h),
+            "published": self.published,
+            "delivered": self.delivered,
+            "gaps": self.gaps,
+            "errors": self.errors,
+            "last_seq": dict(self._last_seq),
+        }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 📌 In-process
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class InProcessPubSubBus(PubSubBus):
+    """단일 프로세스용: publish 가 곧바로 로컬 핸들러 호출 (기존 동작과 동일)"""
+
+    kind = "memory"
+
+    def __init__(self, worker_id: Optional[str] = None):
+        super().__init__(worker_id)
+        self._seq: Dict[str, int] = {}
+
+    def _next(self, topic: str, payload: Any) -> Envelope:
+        seq = self._seq.get(topic, 0) + 1
+        self._seq[topic] = seq
+        self.published += 1
+        return Envelope(topic, seq, self.worker_id, payload)
+
+    async def publish(self, topic: str, payload: Any) -> int:
+        envelope = self._next(topic, payload)
+        await self._dispatch(envelope)
+        return envelope.seq
+
+    def publish_nowait(self, topic: str, payload: Any):
+        """동기 핸들러는 즉시 호출, 코루틴 핸들러만 태스크로"""
+        envelope = self._next(topic, payload)
+        self._track(envelope)
+        for handler in list(self._handlers.get(topic, ())):
+            try:
+                result = handler(envelope)
+                if inspect.isawaitable(result):
+                    task = asyncio.ensure_future(result)
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                self.delivered += 1
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"[PubSub] handler error on {topic}: {e}")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 📌 Redis
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# INCR 과 PUBLISH 를 원자적으로 → 모든 구독자가 seq 순서대로 받는다
+_PUBLISH_LUA = """
+local seq = redis.call('INCR', KEYS[1])
+redis.call('PUBLISH', KEYS[2], seq .. '|' .. ARGV[1])
+return seq
+"""
+
+
+class RedisPubSubBus(PubSubBus):
+    """
+    Redis PUBLISH / PSUBSCRIBE 버스
+
+    채널: {prefix}{topic}, 순번 키: {prefix}seq:{topic}
+    메시지: "seq|origin|json". 스크립팅이 없는 서버(fakeredis 등)는 INCR + PUBLISH 로
+    폴백 — 이 경우 동시 발행 워커 간 seq 순서가 뒤바뀔 수 있다 (누락으로 세지 않음).
+    Redis 장애 시 발행은 로컬 워커에만 전달 (fail-open).
+    """
+
+    kind = "redis"
+
+    def __init__(
+        self,
+        client=None,
+        url: Optional[str] = None,
+        prefix: str = DEFAULT_PREFIX,
+        worker_id: Optional[str] = None,
+    ):
+        super().__init__(worker_id)
+        if client is None:
+            import redis.asyncio as aioredis
+            client = aioredis.from_url(url or os.environ.get("REDIS_URL", "redis://localhost:6379"))
+        self.client = client
+        self.prefix = prefix
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        self._scripting: Optional[bool] = None
+        self._local_seq: Dict[str, int] = {}
+        self._start_lock: Optional[asyncio.Lock] = None
+        self.fallbacks = 0
+
+    def subscribe(self, topic: str, handler: Handler) -> Callable[[], None]:
+        """핸들러 등록 + 리스너 즉시 시작 (구독만 하고 발행하지 않는 워커도 수신).
+        이벤트 루프 밖(임포트 시점 등)에서는 앱 lifespan 의 start() 가 담당"""
+        unsubscribe = super().subscribe(topic, handler)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return unsubscribe
+        if not self._listening():
+            task = loop.create_task(self._start_quietly())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return unsubscribe
+
+    def _listening(self) -> bool:
+        return self._listener is not None and not self._listener.done()
+
+    async def start(self):
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._listening():
+                return
+            self._pubsub = self.client.pubsub()
+            await self._pubsub.psubscribe(f"{self.prefix}*")
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    async def _start_quietly(self):
+        try:
+            await self.start()
+        except Exception as e:
+            # 다음 publish 에서 재시도
+            self.errors += 1
+            logger.warning(f"[PubSub] Redis subscribe failed: {e}")
+
+    async def _listen(self):
+        prefix_len = len(self.prefix)
+        while True:
+            try:
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"[PubSub] Redis listen error: {e}")
+                await asyncio.sleep(1.0)
+                continue
+            if not message or message.get("type") != "pmessage":
+                continue
+            channel = message["channel"]
+            if isinstance(channel, bytes):
+                channel = channel.decode()
+            topic = channel[prefix_len:]
+            if topic.startswith("seq:"):
+                continue
+            data = message["data"]
+            if isinstance(data, bytes):
+                data = data.decode()
+            try:
+                seq, origin, body = data.split("|", 2)
+                envelope = Envelope(topic, int(seq), origin, json.loads(body))
+            except (ValueError, TypeError) as e:
+                self.errors += 1
+                logger.warning(f"[PubSub] malformed message on {topic}: {e}")
+                continue
+            await self._dispatch(envelope)
+
+    async def publish(self, topic: str, payload: Any) -> int:
+        body = f"{self.worker_id}|{json.dumps(payload, default=str, ensure_ascii=False)}"
+        seq_key, channel = f"{self.prefix}seq:{topic}", f"{self.prefix}{topic}"
+        try:
+            if not self._listening():
+                await self.start()
+            seq = await self._publish(seq_key, channel, body)
+        except Exception as e:
+            # Redis 장애 → 이 워커 소켓에는 전달
+            self.fallbacks += 1
+            logger.warning(f"[PubSub] Redis publish failed, delivering locally: {e}")
+            seq = self._local_seq.get(topic, 0) + 1
+            self._local_seq[topic] = seq
+            await self._dispatch(Envelope(topic, seq, self.worker_id, payload))
+            return seq
+        self.published += 1
+        return seq
+
+    async def _publish(self, seq_key: str, channel: str, body: str) -> int:
+        if self._scripting is not False:
+            try:
+                seq = await self.client.eval(_PUBLISH_LUA, 2, seq_key, channel, body)
+                self._scripting = True
+                return int(seq)
+            except Exception as e:
+                if self._scripting or "unknown command" not in str(e).lower():
+                    raise
+                self._scripting = False
+        seq = int(await self.client.incr(seq_key))
+        await self.client.publish(channel, f"{seq}|{body}")
+        return seq
+
+    async def close(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.punsubscribe()
+                await self._pubsub.aclose()
+            except Exception:
+                pass
+            self._pubsub = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **super().stats(),
+            "listening": self._listening(),
+            "fallbacks": self.fallbacks,
+            "atomic_seq": bool(self._scripting),
+        }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 📌 Factory
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_bus: Optional[PubSubBus] = None
+
+
+def get_pubsub_bus() -> PubSubBus:
+    """PUBSUB_BACKEND 설정에 따른 공용 버스 (Redis 클라이언트 생성 실패 시 프로세스 내 버스)"""
+    global _bus
+    if _bus is None:
+        kind = os.getenv("PUBSUB_BACKEND", "memory").lower()
+        if kind == "redis":
+            try:
+                _bus = RedisPubSubBus()
+            except Exception as e:
+                logger.warning(f"⚠️ Redis 버스 생성 실패 - 프로세스 내 버스로 폴백: {e}")
+                _bus = InProcessPubSubBus()
+        else:
+            _bus = InProcessPubSubBus()
+    return _bus
+
+
+def set_pubsub_bus(bus: Optional[PubSubBus]):
+    """버스 교체 (테스트 / 앱 초기화용)"""
+    global _bus
+    _bus = bus
+
+
+async def close_pubsub_bus():
+    global _bus
+    if _bus is not None:
+        await _bus.close()
@@ -10,10 +10,74 @@
 이 설계로 1000만 사용자 = 5GB DB로 충분
 """
 
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Union
+from contextlib import contextmanager
 from datetime import datetime
 from dataclasses import dataclass, asdict
+import io
+import os
 import json
+import math
+import struct
+
+# 배치 저장 기본 크기 (배치당 1 트랜잭션)
+DEFAULT_BATCH_SIZE = 1000
+
+# SQLite IN (...) 바인딩 변수 제한 대응
+SQLITE_IN_CHUNK = 500
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 📌 Packed 바이너리 포맷
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+#   [magic "US" 2B][version 1B][dtype 1B ('f' | 'd')]
+#   [36 x float32/float64, NODE_IDS 순서, 누락 노드 = NaN]
+#   [updated_at UTF-8 (나머지 바이트)]
+#
+#   float64: 4 + 288 + ~26 = ~318 bytes (JSON ~570 bytes)
+#   float32: 4 + 144 + ~26 = ~174 bytes
+
+NODE_IDS = tuple(f"n{i:02d}" for i in range(1, 37))
+_NODE_INDEX = {node_id: i for i, node_id in enumerate(NODE_IDS)}
+
+PACKED_MAGIC = b"US"
+PACKED_VERSION = 1
+_PACKED_HEADER = struct.Struct("<2sBc")
+_PACKED_BODY = {
+    b"f": struct.Struct(f"<{len(NODE_IDS)}f"),
+    b"d": struct.Struct(f"<{len(NODE_IDS)}d"),
+}
+
+
+def pack_nodes(nodes: Dict[str, float], dtype: str = "d") -> bytes:
+    """36 노드 값 → 고정 레이아웃 바이트 (NODE_IDS 밖의 키는 ValueError)"""
+    code = dtype.encode()
+    body = _PACKED_BODY.get(code)
+    if body is None:
+        raise ValueError(f"Unsupported dtype: {dtype}")
+    values = [math.nan] * len(NODE_IDS)
+    for node_id, value in nodes.items():
+        idx = _NODE_INDEX.get(node_id)
+        if idx is None:
+            raise ValueError(f"Unknown node id for packed format: {node_id}")
+        values[idx] = value
+    return _PACKED_HEADER.pack(PACKED_MAGIC, PACKED_VERSION, code) + body.pack(*values)
+
+
+def unpack_nodes(data: bytes) -> tuple:
+    """바이트 → (nodes, 나머지 바이트)"""
+    magic, version, code = _PACKED_HEADER.unpack_from(data)
+    if magic != PACKED_MAGIC or version != PACKED_VERSION:
+        raise ValueError(f"Unsupported packed format: {magic!r} v{version}")
+    body = _PACKED_BODY[code]
+    values = body.unpack_from(data, _PACKED_HEADER.size)
+    nodes = {
+        node_id: value
+        for node_id, value in zip(NODE_IDS, values)
+        if value == value  # NaN = 누락
+    }
+    return nodes, data[_PACKED_HEADER.size + body.size:]
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 📌 사용자 변수 (User Variables)
@@ -37,11 +101,36 @@ class UserState:
     def from_json(cls, data: str) -> 'UserState':
         return cls(**json.loads(data))
     
+    def to_packed(self, dtype: str = "d") -> bytes:
+        """바이너리 직렬화 (user_id 는 저장소 키로 별도 보관)"""
+        return pack_nodes(self.nodes, dtype) + self.updated_at.encode()
+    
+    @classmethod
+    def from_packed(cls, user_id: str, data: bytes) -> 'UserState':
+        nodes, rest = unpack_nodes(data)
+        return cls(user_id=user_id, nodes=nodes, updated_at=rest.decode())
+    
     @property
     def size_bytes(self) -> int:
         return len(self.to_json())
 
 
+def _encode_nodes(nodes: Dict[str, float], packed: bool, dtype: str) -> Union[str, bytes]:
+    """저장용 노드 인코딩 - packed 불가(비표준 노드 ID)면 JSON 폴백"""
+    if packed:
+        try:
+            return pack_nodes(nodes, dtype)
+        except ValueError:
+            pass
+    return json.dumps(nodes, separators=(',', ':'))
+
+
+def _decode_nodes(data: Union[str, bytes]) -> Dict[str, float]:
+    if isinstance(data, (bytes, memoryview)):
+        return unpack_nodes(bytes(data))[0]
+    return json.loads(data)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # 📌 Storage Interface
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -52,9 +141,22 @@ class UserStorage:
     def save(self, state: UserState) -> bool:
         raise NotImplementedError
     
+    def save_many(self, states: Iterable[UserState]) -> int:
+        """여러 사용자 저장 - 기본 구현은 save 반복, 저장 건수 반환"""
+        return sum(1 for state in states if self.save(state))
+    
     def load(self, user_id: str) -> Optional[UserState]:
         raise NotImplementedError
     
+    def load_many(self, user_ids: Iterable[str]) -> Dict[str, UserState]:
+        """여러 사용자 조회 - 없는 ID 는 결과에서 제외"""
+        result = {}
+        for user_id in user_ids:
+            state = self.load(user_id)
+            if state is not None:
+                result[user_id] = state
+        return result
+    
     def delete(self, user_id: str) -> bool:
         raise NotImplementedError
     
@@ -67,18 +169,49 @@ class UserStorage:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class MemoryUserStorage(UserStorage):
-    """인메모리 저장소"""
+    """인메모리 저장소 (packed=True 면 바이너리 포맷 보관)"""
     
-    def __init__(self):
-        self._store: Dict[str, str] = {}
+    def __init__(self, packed: bool = False, dtype: str = "d"):
+        self.packed = packed
+        self.dtype = dtype
+        self._store: Dict[str, Union[str, bytes]] = {}
     
     def save(self, state: UserState) -> bool:
+        if self.packed:
+            try:
+                self._store[state.user_id] = state.to_packed(self.dtype)
+                return True
+            except ValueError:
+                pass
         self._store[state.user_id] = state.to_json()
         return True
     
+    def save_many(self, states: Iterable[UserState]) -> int:
+        saved = 0
+        for state in states:
+            self.save(state)
+            saved += 1
+        return saved
+    
     def load(self, user_id: str) -> Optional[UserState]:
         data = self._store.get(user_id)
-        return UserState.from_json(data) if data else None
+        if not data:
+            return None
+        if isinstance(data, bytes):
+            return UserState.from_packed(user_id, data)
+        return UserState.from_json(data)
+    
+    def load_many(self, user_ids: Iterable[str]) -> Dict[str, UserState]:
+        store = self._store
+        result = {}
+        for user_id in user_ids:
+            data = store.get(user_id)
+            if data:
+                result[user_id] = (
+                    UserState.from_packed(user_id, data)
+                    if isinstance(data, bytes) else UserState.from_json(data)
+                )
+        return result
     
     def delete(self, user_id: str) -> bool:
         if user_id in self._store:
@@ -99,11 +232,28 @@ class MemoryUserStorage(UserStorage):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class SQLiteUserStorage(UserStorage):
-    """SQLite 저장소 - 로컬 배포용"""
-    
-    def __init__(self, db_path: str = "autus_users.db"):
+    """
+    SQLite 저장소 - 로컬 배포용
+    
+    - WAL 모드 + synchronous=NORMAL
+    - packed=True 면 nodes 컬럼에 BLOB 저장 (기존 JSON 행도 그대로 읽음)
+    - save_many / load_many: executemany / IN (...) 일괄 처리
+    """
+    
+    def __init__(
+        self,
+        db_path: str = "autus_users.db",
+        packed: bool = False,
+        dtype: str = "d",
+        wal: bool = True,
+    ):
         import sqlite3
+        self.packed = packed
+        self.dtype = dtype
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        if wal:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
         self._init_table()
     
     def _init_table(self):
@@ -116,14 +266,38 @@ class SQLiteUserStorage(UserStorage):
         """)
         self.conn.commit()
     
+    def _row(self, state: UserState) -> tuple:
+        return (state.user_id, _encode_nodes(state.nodes, self.packed, self.dtype), state.updated_at)
+    
     def save(self, state: UserState) -> bool:
         self.conn.execute(
             "INSERT OR REPLACE INTO users (user_id, nodes, updated_at) VALUES (?, ?, ?)",
-            (state.user_id, json.dumps(state.nodes), state.updated_at)
+            self._row(state)
         )
         self.conn.commit()
         return True
     
+    def save_many(self, states: Iterable[UserState], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """배치당 1 트랜잭션 executemany"""
+        saved = 0
+        batch: List[tuple] = []
+        for state in states:
+            batch.append(self._row(state))
+            if len(batch) >= batch_size:
+                saved += self._write_batch(batch)
+                batch = []
+        if batch:
+            saved += self._write_batch(batch)
+        return saved
+    
+    def _write_batch(self, rows: List[tuple]) -> int:
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO users (user_id, nodes, updated_at) VALUES (?, ?, ?)",
+                rows
+            )
+        return len(rows)
+    
     def load(self, user_id: str) -> Optional[UserState]:
         cur = self.conn.execute(
             "SELECT user_id, nodes, updated_at FROM users WHERE user_id = ?",
@@ -133,11 +307,29 @@ class SQLiteUserStorage(UserStorage):
         if row:
             return UserState(
                 user_id=row[0],
-                nodes=json.loads(row[1]),
+                nodes=_decode_nodes(row[1]),
                 updated_at=row[2]
             )
         return None
     
+    def load_many(self, user_ids: Iterable[str]) -> Dict[str, UserState]:
+        ids = list(user_ids)
+        result = {}
+        for i in range(0, len(ids), SQLITE_IN_CHUNK):
+            chunk = ids[i:i + SQLITE_IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            cur = self.conn.execute(
+                f"SELECT user_id, nodes, updated_at FROM users WHERE user_id IN ({placeholders})",
+                chunk
+            )
+            for user_id, nodes, updated_at in cur:
+                result[user_id] = UserState(
+                    user_id=user_id,
+                    nodes=_decode_nodes(nodes),
+                    updated_at=updated_at
+                )
+        return result
+    
     def delete(self, user_id: str) -> bool:
         self.conn.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
         self.conn.commit()
@@ -146,6 +338,11 @@ class SQLiteUserStorage(UserStorage):
     def count(self) -> int:
         cur = self.conn.execute("SELECT COUNT(*) FROM users")
         return cur.fetchone()[0]
+    
+    @property
+    def total_size_bytes(self) -> int:
+        cur = self.conn.execute("SELECT COALESCE(SUM(LENGTH(CAST(nodes AS BLOB))), 0) FROM users")
+        return cur.fetchone()[0]
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -153,20 +350,51 @@ class SQLiteUserStorage(UserStorage):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class PostgresUserStorage(UserStorage):
-    """PostgreSQL 저장소 - 프로덕션용"""
-    
-    def __init__(self, connection_string: str):
+    """
+    PostgreSQL 저장소 - 프로덕션용
+    
+    - ThreadedConnectionPool 기반 (스레드별 커넥션 대여/반납)
+    - save_many: 배치당 1 트랜잭션, 다중 행 upsert 또는 COPY → 스테이징 테이블
+    """
+    
+    def __init__(
+        self,
+        connection_string: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        min_connections: int = 1,
+        max_connections: int = 10,
+    ):
+        self.batch_size = max(1, batch_size)
+        self.pool = None
         try:
-            import psycopg2
-            self.conn = psycopg2.connect(connection_string)
+            from psycopg2.pool import ThreadedConnectionPool
+            self.pool = ThreadedConnectionPool(min_connections, max_connections, connection_string)
             self._init_table()
             self.available = True
         except ImportError:
             self.available = False
             print("⚠️ psycopg2 미설치")
     
+    @contextmanager
+    def _connection(self):
+        """풀에서 커넥션 대여 - 블록 종료 시 commit, 예외 시 rollback"""
+        conn = self.pool.getconn()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.pool.putconn(conn)
+    
+    def close(self):
+        if self.pool is not None:
+            self.pool.closeall()
+            self.pool = None
+    
     def _init_table(self):
-        with self.conn.cursor() as cur:
+        with self._connection() as conn, conn.cursor() as cur:
             cur.execute("""
                 CREATE TABLE IF NOT EXISTS users (
                     user_id TEXT PRIMARY KEY,
@@ -179,31 +407,98 @@ class PostgresUserStorage(UserStorage):
                 CREATE INDEX IF NOT EXISTS idx_users_nodes 
                 ON users USING GIN (nodes)
             """)
-        self.conn.commit()
     
     def save(self, state: UserState) -> bool:
         if not self.available:
             return False
-        with self.conn.cursor() as cur:
+        with self._connection() as conn, conn.cursor() as cur:
             cur.execute("""
                 INSERT INTO users (user_id, nodes, updated_at) 
                 VALUES (%s, %s, %s)
                 ON CONFLICT (user_id) 
-                DO UPDATE SET nodes = %s, updated_at = %s
+                DO UPDATE SET nodes = EXCLUDED.nodes, updated_at = EXCLUDED.updated_at
             """, (
                 state.user_id, 
                 json.dumps(state.nodes),
                 state.updated_at,
-                json.dumps(state.nodes),
-                state.updated_at
             ))
-        self.conn.commit()
         return True
     
+    def save_many(
+        self,
+        states: Iterable[UserState],
+        batch_size: Optional[int] = None,
+        use_copy: bool = False,
+    ) -> int:
+        """
+        배치 저장 (배치당 1 트랜잭션)
+        
+        Args:
+            states: 저장할 사용자 상태들
+            batch_size: 배치 크기 (기본 self.batch_size)
+            use_copy: True 면 COPY → 임시 스테이징 테이블 → upsert
+        """
+        if not self.available:
+            return 0
+        size = max(1, batch_size or self.batch_size)
+        write = self._copy_batch if use_copy else self._upsert_batch
+        saved = 0
+        batch: List[UserState] = []
+        for state in states:
+            batch.append(state)
+            if len(batch) >= size:
+                saved += write(batch)
+                batch = []
+        if batch:
+            saved += write(batch)
+        return saved
+    
+    @staticmethod
+    def _dedupe(batch: List[UserState]) -> List[UserState]:
+        # 한 upsert 문 안에서 같은 키를 두 번 갱신할 수 없으므로 마지막 값만 유지
+        return list({state.user_id: state for state in batch}.values())
+    
+    def _upsert_batch(self, batch: List[UserState]) -> int:
+        from psycopg2.extras import execute_values
+        rows = [(s.user_id, json.dumps(s.nodes), s.updated_at) for s in self._dedupe(batch)]
+        with self._connection() as conn, conn.cursor() as cur:
+            execute_values(cur, """
+                INSERT INTO users (user_id, nodes, updated_at) VALUES %s
+                ON CONFLICT (user_id)
+                DO UPDATE SET nodes = EXCLUDED.nodes, updated_at = EXCLUDED.updated_at
+            """, rows, page_size=len(rows))
+        return len(rows)
+    
+    def _copy_batch(self, batch: List[UserState]) -> int:
+        states = self._dedupe(batch)
+        buf = io.StringIO()
+        for s in states:
+            # COPY text 포맷: 탭 구분, 역슬래시 이스케이프
+            nodes = json.dumps(s.nodes).replace("\\", "\\\\")
+            user_id = s.user_id.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+            buf.write(f"{user_id}\t{nodes}\t{s.updated_at}\n")
+        buf.seek(0)
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS users_stage
+                (LIKE users INCLUDING DEFAULTS) ON COMMIT DELETE ROWS
+            """)
+            cur.copy_expert(
+                "COPY users_stage (user_id, nodes, updated_at) FROM STDIN",
+                buf,
+            )
+            cur.execute("""
+                INSERT INTO users (user_id, nodes, updated_at)
+                SELECT user_id, nodes, updated_at FROM users_stage
+                ON CONFLICT (user_id)
+                DO UPDATE SET nodes = EXCLUDED.nodes, updated_at = EXCLUDED.updated_at
+            """)
+        return len(states)
+    
     def load(self, user_id: str) -> Optional[UserState]:
         if not self.available:
             return None
-        with self.conn.cursor() as cur:
+        with self._connection() as conn, conn.cursor() as cur:
             cur.execute(
                 "SELECT user_id, nodes, updated_at FROM users WHERE user_id = %s",
                 (user_id,)
@@ -220,15 +515,14 @@ class PostgresUserStorage(UserStorage):
     def delete(self, user_id: str) -> bool:
         if not self.available:
             return False
-        with self.conn.cursor() as cur:
+        with self._connection() as conn, conn.cursor() as cur:
             cur.execute("DELETE FROM users WHERE user_id = %s", (user_id,))
-        self.conn.commit()
         return True
     
     def count(self) -> int:
         if not self.available:
             return 0
-        with self.conn.cursor() as cur:
+        with self._connection() as conn, conn.cursor() as cur:
             cur.execute("SELECT COUNT(*) FROM users")
             return cur.fetchone()[0]
 
@@ -240,11 +534,18 @@ class PostgresUserStorage(UserStorage):
 def create_storage(storage_type: str = "memory", **kwargs) -> UserStorage:
     """저장소 팩토리"""
     if storage_type == "memory":
-        return MemoryUserStorage()
+        return MemoryUserStorage(packed=kwargs.get("packed", False))
     elif storage_type == "sqlite":
-        return SQLiteUserStorage(kwargs.get("db_path", "autus_users.db"))
+        return SQLiteUserStorage(
+            kwargs.get("db_path", "autus_users.db"),
+            packed=kwargs.get("packed", False),
+        )
     elif storage_type == "postgres":
-        return PostgresUserStorage(kwargs["connection_string"])
+        return PostgresUserStorage(
+            kwargs["connection_string"],
+            batch_size=kwargs.get("batch_size", DEFAULT_BATCH_SIZE),
+            max_connections=kwargs.get("max_connections", 10),
+        )
     else:
         raise ValueError(f"Unknown storage type: {storage_type}")
 
@@ -253,7 +554,78 @@ def create_storage(storage_type: str = "memory", **kwargs) -> UserStorage:
 # 📌 테스트
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def _benchmark_postgres(connection_string: str, n: int = 10000, batch_size: int = DEFAULT_BATCH_SIZE):
+    """PostgreSQL 저장 벤치마크: 단건 save vs save_many(upsert / COPY)"""
+    import time
+    
+    storage = PostgresUserStorage(connection_string, batch_size=batch_size)
+    if not storage.available:
+        return
+    
+    nodes = {f"n{i:02d}": float(i * 1000) for i in range(1, 37)}
+    states = [UserState(user_id=f"bench_user_{i}", nodes=nodes.copy()) for i in range(n)]
+    
+    print(f"\n🐘 PostgreSQL ({n:,}명, batch={batch_size})")
+    
+    single_n = min(n, 1000)
+    start = time.time()
+    for state in states[:single_n]:
+        storage.save(state)
+    elapsed = time.time() - start
+    print(f"✓ save (단건 x{single_n:,}): {single_n/elapsed:,.0f} rows/sec")
+    
+    for label, use_copy in (("save_many (upsert)", False), ("save_many (COPY)", True)):
+        start = time.time()
+        storage.save_many(states, use_copy=use_copy)
+        elapsed = time.time() - start
+        print(f"✓ {label}: {n/elapsed:,.0f} rows/sec")
+    
+    with storage._connection() as conn, conn.cursor() as cur:
+        cur.execute("DELETE FROM users WHERE user_id LIKE 'bench_user_%'")
+    storage.close()
+
+
+def _benchmark_formats(n: int = 10000):
+    """JSON vs packed 포맷: 저장/조회 QPS 와 사용자당 바이트"""
+    import tempfile
+    import time
+    
+    nodes = {node_id: float(i * 1000) + 0.5 for i, node_id in enumerate(NODE_IDS, 1)}
+    states = [UserState(user_id=f"user_{i}", nodes=dict(nodes)) for i in range(n)]
+    ids = [s.user_id for s in states]
+    
+    print(f"\n📦 JSON vs Packed ({n:,}명)")
+    print(f"{'storage':<22}{'save QPS':>12}{'load QPS':>12}{'load_many QPS':>15}{'bytes/user':>12}")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, factory in (
+            ("memory/json", lambda: MemoryUserStorage()),
+            ("memory/packed", lambda: MemoryUserStorage(packed=True)),
+            ("memory/packed-f32", lambda: MemoryUserStorage(packed=True, dtype="f")),
+            ("sqlite/json", lambda: SQLiteUserStorage(os.path.join(tmp, "json.db"))),
+            ("sqlite/packed", lambda: SQLiteUserStorage(os.path.join(tmp, "packed.db"), packed=True)),
+        ):
+            storage = factory()
+            
+            start = time.time()
+            storage.save_many(states)
+            save_qps = n / (time.time() - start)
+            
+            start = time.time()
+            for user_id in ids:
+                storage.load(user_id)
+            load_qps = n / (time.time() - start)
+            
+            start = time.time()
+            storage.load_many(ids)
+            load_many_qps = n / (time.time() - start)
+            
+            per_user = storage.total_size_bytes / n
+            print(f"{label:<22}{save_qps:>12,.0f}{load_qps:>12,.0f}{load_many_qps:>15,.0f}{per_user:>12,.0f}")
+
+
 if __name__ == "__main__":
+    import sys
     import time
     
     print("=" * 60)
@@ -286,4 +658,12 @@ if __name__ == "__main__":
     print(f"✓ 10,000명 조회: {elapsed:.2f}초")
     print(f"✓ QPS: {10000/elapsed:,.0f}")
     
+    _benchmark_formats()
+    
+    # PostgreSQL 모드: python storage.py --postgres postgresql://localhost/autus
+    if "--postgres" in sys.argv:
+        idx = sys.argv.index("--postgres")
+        dsn = sys.argv[idx + 1] if len(sys.argv) > idx + 1 else os.environ.get("DATABASE_URL", "")
+        _benchmark_postgres(dsn)
+    
     print("=" * 60)
@@ -11,7 +11,7 @@ AUTUS PostgreSQL Client - 관계형 데이터베이스 연동
 """
 
 import os
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 from datetime import datetime
 
 # SQLAlchemy는 옵션 (설치되지 않아도 동작)
@@ -33,16 +33,38 @@ except ImportError:
 
 # 환경 변수
 DATABASE_URL = os.getenv("DATABASE_URL", "")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_BULK_BATCH_SIZE = int(os.getenv("DB_BULK_BATCH_SIZE", "1000"))
+
+
+def _create_pooled_engine(database_url: str):
+    """커넥션 풀 엔진 생성 (sqlite 등 풀 옵션 미지원 드라이버는 기본값)"""
+    if database_url.startswith("sqlite"):
+        return create_engine(database_url, echo=False)
+    return create_engine(
+        database_url,
+        echo=False,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
+
 
 # SQLAlchemy 설정
+if SQLALCHEMY_AVAILABLE:
+    Base = declarative_base()
+else:
+    Base = object
+
 if SQLALCHEMY_AVAILABLE and DATABASE_URL:
-    engine = create_engine(DATABASE_URL, echo=False)
+    engine = _create_pooled_engine(DATABASE_URL)
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    Base = declarative_base()
 else:
     engine = None
     SessionLocal = None
-    Base = object
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -210,7 +232,11 @@ class PostgresClient:
         
         if SQLALCHEMY_AVAILABLE:
             try:
-                self.engine = create_engine(self.database_url, echo=False)
+                # 같은 URL 이면 모듈 엔진(풀) 공유
+                if engine is not None and self.database_url == DATABASE_URL:
+                    self.engine = engine
+                else:
+                    self.engine = _create_pooled_engine(self.database_url)
                 self.SessionLocal = sessionmaker(
                     autocommit=False,
                     autoflush=False,
@@ -247,6 +273,82 @@ class PostgresClient:
             print(f"⚠️ 테이블 생성 실패: {e}")
             return False
     
+    # ═══════════════════════════════════════════════════════════════
+    # Bulk Upsert (배치당 1 트랜잭션, 다중 행 INSERT ... ON CONFLICT)
+    # ═══════════════════════════════════════════════════════════════
+    
+    @staticmethod
+    def _column_default(column: Any) -> Any:
+        default = column.default
+        if default is None:
+            return None
+        if default.is_callable:
+            return default.arg(None)
+        return default.arg
+    
+    def _normalize_rows(self, table: Any, rows: List[Dict]) -> List[Dict]:
+        """모든 행이 같은 키 집합을 갖도록 컬럼 기본값 채움"""
+        columns = table.__table__.columns
+        keys = [c.name for c in columns if any(c.name in row for row in rows)]
+        normalized = []
+        for row in rows:
+            item = {}
+            for key in keys:
+                item[key] = row[key] if key in row else self._column_default(columns[key])
+            normalized.append(item)
+        # 한 문장 안에서 같은 PK 를 두 번 갱신할 수 없으므로 마지막 값만 유지
+        return list({item["id"]: item for item in normalized}.values())
+    
+    def _upsert_statement(self, table: Any, keys: List[str]) -> Any:
+        dialect = self.engine.dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            return None
+        stmt = insert(table.__table__)
+        update_cols = {k: stmt.excluded[k] for k in keys if k not in ("id", "created_at")}
+        return stmt.on_conflict_do_update(index_elements=["id"], set_=update_cols)
+    
+    def _bulk_upsert(
+        self,
+        table: Any,
+        rows: Iterable[Dict],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """배치 upsert - 저장된 행 수 반환"""
+        if not self.is_connected:
+            return 0
+        
+        size = max(1, batch_size or DB_BULK_BATCH_SIZE)
+        rows = list(rows)
+        saved = 0
+        for i in range(0, len(rows), size):
+            batch = self._normalize_rows(table, rows[i:i + size])
+            if not batch:
+                continue
+            stmt = self._upsert_statement(table, list(batch[0].keys()))
+            try:
+                if stmt is not None:
+                    with self.engine.begin() as conn:
+                        conn.execute(stmt, batch)
+                else:
+                    session = self.get_session()
+                    try:
+                        for item in batch:
+                            session.merge(table(**item))
+                        session.commit()
+                    except Exception:
+                        session.rollback()
+                        raise
+                    finally:
+                        session.close()
+                saved += len(batch)
+            except Exception as e:
+                print(f"⚠️ {table.__tablename__} 배치 저장 실패: {e}")
+        return saved
+    
     # ═══════════════════════════════════════════════════════════════
     # Person CRUD
     # ═══════════════════════════════════════════════════════════════
@@ -269,6 +371,14 @@ class PostgresClient:
         finally:
             session.close()
     
+    def bulk_create_persons(
+        self,
+        persons: Iterable[Dict],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """Person 배치 생성/갱신"""
+        return self._bulk_upsert(PersonTable, persons, batch_size)
+    
     def get_person(self, person_id: str) -> Optional[Dict]:
         """Person 조회"""
         if not self.is_connected:
@@ -356,6 +466,14 @@ class PostgresClient:
         finally:
             session.close()
     
+    def bulk_create_flows(
+        self,
+        flows: Iterable[Dict],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """Flow 배치 생성/갱신"""
+        return self._bulk_upsert(FlowTable, flows, batch_size)
+    
     def get_flows(
         self,
         source_id: str = None,
@@ -412,15 +530,7 @@ class PostgresClient:
         
         session = self.get_session()
         try:
-            # bounds 처리
-            bounds = node_data.pop("bounds", None)
-            if bounds and len(bounds) == 4:
-                node_data["bounds_sw_lat"] = bounds[0]
-                node_data["bounds_sw_lng"] = bounds[1]
-                node_data["bounds_ne_lat"] = bounds[2]
-                node_data["bounds_ne_lng"] = bounds[3]
-            
-            node = ScaleNodeTable(**node_data)
+            node = ScaleNodeTable(**self._flatten_bounds(node_data))
             session.merge(node)
             session.commit()
             return True
@@ -431,6 +541,30 @@ class PostgresClient:
         finally:
             session.close()
     
+    @staticmethod
+    def _flatten_bounds(node_data: Dict) -> Dict:
+        """bounds [sw_lat, sw_lng, ne_lat, ne_lng] → 개별 컬럼"""
+        node_data = dict(node_data)
+        bounds = node_data.pop("bounds", None)
+        if bounds and len(bounds) == 4:
+            node_data["bounds_sw_lat"] = bounds[0]
+            node_data["bounds_sw_lng"] = bounds[1]
+            node_data["bounds_ne_lat"] = bounds[2]
+            node_data["bounds_ne_lng"] = bounds[3]
+        return node_data
+    
+    def bulk_create_scale_nodes(
+        self,
+        nodes: Iterable[Dict],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """ScaleNode 배치 생성/갱신"""
+        return self._bulk_upsert(
+            ScaleNodeTable,
+            (self._flatten_bounds(n) for n in nodes),
+            batch_size,
+        )
+    
     def get_scale_nodes_by_level(self, level: str, limit: int = 100) -> List[Dict]:
         """레벨별 ScaleNode 조회"""
         if not self.is_connected:
@@ -14,12 +14,19 @@ TypeDB Query Optimization with Redis Caching Layer
 
 import os
 import json
+import time
+import heapq
+import queue
+import fnmatch
 import hashlib
 import asyncio
 import logging
-from typing import Optional, Dict, List, Any, Callable
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, Dict, List, Any, Callable, Sequence
+from dataclasses import dataclass
 from functools import wraps
 
 logger = logging.getLogger(__name__)
@@ -36,6 +43,18 @@ REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379")
 CACHE_TTL_SHORT = 10      # 실시간 대시보드 (자주 변경)
 CACHE_TTL_MEDIUM = 60     # 일반 조회
 CACHE_TTL_LONG = 300      # 정적 데이터 (스키마, 레퍼런스)
+CACHE_STALE_TTL = 30      # 만료 후 stale 서빙 허용 시간 (stale-while-revalidate)
+
+# TypeDB 드라이버 호출 (동기) 은 이벤트 루프 밖 전용 스레드풀에서 실행
+TYPEDB_MAX_WORKERS = int(os.environ.get("TYPEDB_MAX_WORKERS", "8"))
+TYPEDB_SESSION_POOL_SIZE = int(os.environ.get("TYPEDB_SESSION_POOL_SIZE", "4"))
+
+# 캐시 키 / 무효화
+CACHE_KEY_PREFIX = "autus:typedb:"
+CACHE_GEN_PREFIX = "autus:gen:typedb:"   # 태그별 generation 카운터 (캐시 키와 분리)
+CACHE_GLOBAL_TAG = "*"                   # 모든 TypeDB 캐시에 섞이는 전역 generation
+CACHE_SCAN_BATCH = 500                   # SCAN/UNLINK 배치 크기
+INMEMORY_CACHE_MAX_ENTRIES = int(os.environ.get("INMEMORY_CACHE_MAX_ENTRIES", "10000"))
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Redis Client (Optional)
@@ -60,30 +79,91 @@ async def get_redis():
 
 
 class InMemoryCache:
-    """Redis 미연결 시 인메모리 폴백"""
+    """
+    Redis 미연결 시 인메모리 폴백
     
-    def __init__(self):
-        self._cache: Dict[str, tuple] = {}  # key -> (value, expires_at)
+    - 크기 제한: max_entries 초과 시 LRU 순으로 축출
+    - 만료 힙: set 시점마다 힙 top 부터 만료 항목 정리 (읽히지 않은 항목도 회수)
+    - incr 카운터는 축출 대상이 아님 (generation 카운터 보존)
+    """
     
-    async def get(self, key: str) -> Optional[str]:
-        if key in self._cache:
-            value, expires_at = self._cache[key]
-            if datetime.now() < expires_at:
-                return value
+    def __init__(self, max_entries: int = INMEMORY_CACHE_MAX_ENTRIES):
+        self.max_entries = max(1, max_entries)
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (value, expires_at)
+        self._expiry_heap: List[tuple] = []  # (expires_at, key), lazy deletion
+        self._counters: Dict[str, int] = {}
+        self.evictions = 0
+        self.expirations = 0
+    
+    def __len__(self) -> int:
+        return len(self._cache)
+    
+    def _purge_expired(self, now: float):
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            if entry is not None and entry[1] == expires_at:
+                del self._cache[key]
+                self.expirations += 1
+        # 덮어쓰기/삭제로 죽은 힙 항목이 쌓이면 재구성
+        if len(heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [(exp, key) for key, (_, exp) in self._cache.items()]
+            heapq.heapify(self._expiry_heap)
+    
+    def _get(self, key: str) -> Optional[str]:
+        if key in self._counters:
+            return str(self._counters[key])
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
             del self._cache[key]
-        return None
+            self.expirations += 1
+            return None
+        self._cache.move_to_end(key)
+        return value
+    
+    async def get(self, key: str) -> Optional[str]:
+        return self._get(key)
+    
+    async def mget(self, keys: Sequence[str]) -> List[Optional[str]]:
+        return [self._get(k) for k in keys]
     
     async def set(self, key: str, value: str, ex: int = 60):
-        expires_at = datetime.now() + timedelta(seconds=ex)
+        now = time.monotonic()
+        self._purge_expired(now)
+        expires_at = now + ex
         self._cache[key] = (value, expires_at)
+        self._cache.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+            self.evictions += 1
+    
+    async def incr(self, key: str, amount: int = 1) -> int:
+        value = self._counters.get(key, 0) + amount
+        self._counters[key] = value
+        return value
     
-    async def delete(self, key: str):
-        self._cache.pop(key, None)
+    async def delete(self, *keys: str) -> int:
+        deleted = 0
+        for key in keys:
+            if self._cache.pop(key, None) is not None or self._counters.pop(key, None) is not None:
+                deleted += 1
+        return deleted
+    
+    async def unlink(self, *keys: str) -> int:
+        return await self.delete(*keys)
     
     async def keys(self, pattern: str) -> List[str]:
-        # Simple pattern matching for "autus:*"
-        prefix = pattern.replace("*", "")
-        return [k for k in self._cache.keys() if k.startswith(prefix)]
+        return [k for k in self._cache.keys() if fnmatch.fnmatchcase(k, pattern)]
+    
+    async def scan_iter(self, match: Optional[str] = None, count: Optional[int] = None):
+        for key in list(self._cache.keys()):
+            if match is None or fnmatch.fnmatchcase(key, match):
+                yield key
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -98,22 +178,120 @@ class TypeDBQueryResult:
     execution_time_ms: float
     from_cache: bool = False
     cache_key: Optional[str] = None
+    stale: bool = False
+
+
+class TypeDBSessionPool:
+    """
+    TypeDB 세션 풀 (스레드 안전)
+    
+    세션은 필요할 때 최대 size 개까지 생성하고, 사용 후 반납해 재사용.
+    모든 메서드는 executor 스레드에서 호출된다 (블로킹).
+    """
+    
+    def __init__(self, driver: Any, database: str, size: int = TYPEDB_SESSION_POOL_SIZE):
+        self._driver = driver
+        self._database = database
+        self._size = max(1, size)
+        self._idle: "queue.Queue[Any]" = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+    
+    def _open_session(self) -> Any:
+        from typedb.driver import SessionType
+        return self._driver.session(self._database, SessionType.DATA)
+    
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None):
+        """세션 대여 (풀이 가득 차면 반납될 때까지 대기)"""
+        session = None
+        try:
+            session = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self._size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                try:
+                    session = self._open_session()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                session = self._idle.get(timeout=timeout)
+        
+        try:
+            yield session
+        finally:
+            is_open = getattr(session, "is_open", None)
+            if callable(is_open) and not is_open():
+                with self._lock:
+                    self._created -= 1
+            else:
+                self._idle.put(session)
+    
+    def close(self):
+        """유휴 세션 모두 종료"""
+        while True:
+            try:
+                session = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                session.close()
+            except Exception:
+                pass
+            with self._lock:
+                self._created -= 1
 
 
 class TypeDBCacheClient:
-    """TypeDB + Redis 캐싱 클라이언트"""
+    """
+    TypeDB + Redis 캐싱 클라이언트
+    
+    - 드라이버 호출은 bounded ThreadPoolExecutor + 세션 풀에서 실행 (루프 비차단)
+    - 동일 캐시 키 동시 요청은 하나의 TypeDB 쿼리로 병합 (single-flight)
+    - 만료된 항목은 stale_ttl 동안 즉시 반환하고 백그라운드에서 1회만 갱신
+    """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: int = TYPEDB_MAX_WORKERS,
+        pool_size: int = TYPEDB_SESSION_POOL_SIZE,
+        stale_ttl: int = CACHE_STALE_TTL,
+    ):
         self._client = None
-        self._session = None
+        self._pool: Optional[TypeDBSessionPool] = None
         self._connected = False
+        self._max_workers = max(1, max_workers)
+        self._pool_size = pool_size
+        self.stale_ttl = stale_ttl
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._inflight: Dict[str, asyncio.Task] = {}
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="typedb",
+            )
+        return self._executor
+    
+    async def _run_blocking(self, func: Callable, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), func, *args)
+    
+    def _connect_sync(self):
+        from typedb.driver import TypeDB
+        self._client = TypeDB.core_driver(TYPEDB_ADDRESS)
+        self._pool = TypeDBSessionPool(self._client, TYPEDB_DATABASE, self._pool_size)
     
     async def connect(self) -> bool:
         """TypeDB 연결"""
         try:
-            from typedb.driver import TypeDB, SessionType, TransactionType
-            self._client = TypeDB.core_driver(TYPEDB_ADDRESS)
-            self._session = self._client.session(TYPEDB_DATABASE, SessionType.DATA)
+            await self._run_blocking(self._connect_sync)
             self._connected = True
             logger.info(f"✅ TypeDB 연결: {TYPEDB_ADDRESS}/{TYPEDB_DATABASE}")
             return True
@@ -126,16 +304,110 @@ class TypeDBCacheClient:
     
     async def close(self):
         """연결 종료"""
-        if self._session:
-            self._session.close()
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+        if self._pool:
+            self._pool.close()
+            self._pool = None
         if self._client:
             self._client.close()
+            self._client = None
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         self._connected = False
     
-    def _generate_cache_key(self, query: str, params: Optional[Dict] = None) -> str:
-        """쿼리 기반 캐시 키 생성"""
-        key_data = f"{query}:{json.dumps(params or {}, sort_keys=True)}"
-        return f"autus:typedb:{hashlib.md5(key_data.encode()).hexdigest()[:16]}"
+    def _generate_cache_key(
+        self,
+        query: str,
+        params: Optional[Dict] = None,
+        generation: str = "",
+    ) -> str:
+        """쿼리 기반 캐시 키 생성 (태그 generation 포함)"""
+        key_data = f"{query}:{json.dumps(params or {}, sort_keys=True)}:{generation}"
+        return f"{CACHE_KEY_PREFIX}{hashlib.md5(key_data.encode()).hexdigest()[:16]}"
+    
+    @staticmethod
+    def _generation_key(tag: str) -> str:
+        return f"{CACHE_GEN_PREFIX}{tag}"
+    
+    async def _current_generation(self, redis: Any, tags: Sequence[str]) -> str:
+        """전역 + 태그별 generation 을 한 번의 MGET 으로 조회"""
+        all_tags = [CACHE_GLOBAL_TAG, *sorted(set(tags))]
+        values = await redis.mget([self._generation_key(t) for t in all_tags])
+        return ",".join(f"{t}={v or 0}" for t, v in zip(all_tags, values))
+    
+    @staticmethod
+    def _render_query(query: str, params: Optional[Dict] = None) -> str:
+        """파라미터 치환 (간단한 구현)"""
+        final_query = query
+        if params:
+            for k, v in params.items():
+                final_query = final_query.replace(f"${k}", str(v))
+        return final_query
+    
+    def _run_query_sync(self, final_query: str) -> List[Dict[str, Any]]:
+        """executor 스레드에서 실행: 세션 대여 → READ 트랜잭션 → 결과 소진"""
+        from typedb.driver import TransactionType
+        with self._pool.acquire() as session:
+            with session.transaction(TransactionType.READ) as tx:
+                return [self._convert_result(r) for r in tx.query.fetch(final_query)]
+    
+    async def _query_typedb(self, query: str, params: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """TypeDB 쿼리 실행 (스레드풀)"""
+        if not self._connected:
+            await self.connect()
+        if not self._connected:
+            return []
+        try:
+            return await self._run_blocking(self._run_query_sync, self._render_query(query, params))
+        except Exception as e:
+            logger.error(f"TypeDB 쿼리 오류: {e}")
+            return []
+    
+    async def _load_and_store(
+        self,
+        cache_key: str,
+        query: str,
+        params: Optional[Dict],
+        cache_ttl: int,
+    ) -> List[Dict[str, Any]]:
+        results = await self._query_typedb(query, params)
+        if results:
+            entry = {"data": results, "expires_at": time.time() + cache_ttl}
+            redis = await get_redis()
+            await redis.set(cache_key, json.dumps(entry), ex=cache_ttl + self.stale_ttl)
+        return results
+    
+    def _start_load(
+        self,
+        cache_key: str,
+        query: str,
+        params: Optional[Dict],
+        cache_ttl: int,
+    ) -> asyncio.Task:
+        """캐시 키당 최대 1개의 로드 태스크 (single-flight)"""
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._load_and_store(cache_key, query, params, cache_ttl))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda t, k=cache_key: self._on_load_done(k, t))
+        return task
+    
+    def _on_load_done(self, cache_key: str, task: asyncio.Task):
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"TypeDB 캐시 로드 실패 ({cache_key}): {task.exception()}")
+    
+    @staticmethod
+    def _decode_entry(cached: str) -> tuple:
+        """캐시 엔트리 → (data, expires_at). 구 포맷(list)은 항상 fresh 취급"""
+        entry = json.loads(cached)
+        if isinstance(entry, dict) and "data" in entry:
+            return entry["data"], entry.get("expires_at", float("inf"))
+        return entry, float("inf")
     
     async def fetch(
         self,
@@ -143,6 +415,7 @@ class TypeDBCacheClient:
         params: Optional[Dict] = None,
         cache_ttl: int = CACHE_TTL_MEDIUM,
         skip_cache: bool = False,
+        tags: Sequence[str] = (),
     ) -> TypeDBQueryResult:
         """
         최적화된 TypeDB Fetch 쿼리 실행
@@ -152,52 +425,37 @@ class TypeDBCacheClient:
             params: 쿼리 파라미터
             cache_ttl: 캐시 TTL (초)
             skip_cache: 캐시 건너뛰기
+            tags: 무효화 태그 (invalidate_tags 로 O(1) 무효화)
         """
-        import time
         start = time.time()
         
-        cache_key = self._generate_cache_key(query, params)
-        
-        # 1. 캐시 확인
+        # 1. 캐시 확인 (만료된 항목은 stale 반환 + 백그라운드 갱신)
         if not skip_cache:
             redis = await get_redis()
+            generation = await self._current_generation(redis, tags)
+            cache_key = self._generate_cache_key(query, params, generation)
             cached = await redis.get(cache_key)
             if cached:
-                data = json.loads(cached)
+                data, expires_at = self._decode_entry(cached)
+                stale = time.time() >= expires_at
+                if stale:
+                    self._start_load(cache_key, query, params, cache_ttl)
                 return TypeDBQueryResult(
                     data=data,
                     count=len(data),
                     execution_time_ms=(time.time() - start) * 1000,
                     from_cache=True,
                     cache_key=cache_key,
+                    stale=stale,
                 )
-        
-        # 2. TypeDB 쿼리 실행
-        if not self._connected:
-            await self.connect()
-        
-        results = []
-        
-        if self._connected and self._session:
-            try:
-                from typedb.driver import TransactionType
-                with self._session.transaction(TransactionType.READ) as tx:
-                    # 파라미터 치환 (간단한 구현)
-                    final_query = query
-                    if params:
-                        for k, v in params.items():
-                            final_query = final_query.replace(f"${k}", str(v))
-                    
-                    iterator = tx.query.fetch(final_query)
-                    for result in iterator:
-                        results.append(self._convert_result(result))
-            except Exception as e:
-                logger.error(f"TypeDB 쿼리 오류: {e}")
-        
-        # 3. 캐시 저장
-        if results and not skip_cache:
-            redis = await get_redis()
-            await redis.set(cache_key, json.dumps(results), ex=cache_ttl)
+            
+            # 2. 캐시 미스: 동일 키 요청은 하나의 쿼리로 병합
+            results = await asyncio.shield(
+                self._start_load(cache_key, query, params, cache_ttl)
+            )
+        else:
+            cache_key = None
+            results = await self._query_typedb(query, params)
         
         execution_time = (time.time() - start) * 1000
         
@@ -227,13 +485,36 @@ class TypeDBCacheClient:
             return value.as_boolean()
         return str(value)
     
-    async def invalidate_cache(self, pattern: str = "autus:typedb:*"):
-        """캐시 무효화"""
+    async def invalidate_tags(self, *tags: str):
+        """태그 무효화: generation 카운터 증가 (O(1), 이전 키는 TTL/LRU 로 소멸)"""
         redis = await get_redis()
-        keys = await redis.keys(pattern)
-        for key in keys:
-            await redis.delete(key)
-        logger.info(f"캐시 무효화: {len(keys)}개 키 삭제")
+        for tag in tags:
+            await redis.incr(self._generation_key(tag))
+        logger.info(f"캐시 무효화: 태그 {list(tags)}")
+    
+    async def invalidate_cache(self, pattern: str = f"{CACHE_KEY_PREFIX}*") -> int:
+        """
+        캐시 무효화
+        
+        기본 패턴(전체)은 전역 generation 증가로 O(1) 처리.
+        그 외 패턴은 KEYS 대신 SCAN + UNLINK 배치 삭제.
+        """
+        redis = await get_redis()
+        if pattern == f"{CACHE_KEY_PREFIX}*":
+            await self.invalidate_tags(CACHE_GLOBAL_TAG)
+            return 0
+        
+        deleted = 0
+        batch: List[str] = []
+        async for key in redis.scan_iter(match=pattern, count=CACHE_SCAN_BATCH):
+            batch.append(key)
+            if len(batch) >= CACHE_SCAN_BATCH:
+                deleted += await redis.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += await redis.unlink(*batch)
+        logger.info(f"캐시 무효화: {deleted}개 키 삭제")
+        return deleted
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -375,7 +656,7 @@ async def fetch_deletion_candidates(limit: int = 100) -> List[Dict]:
     """삭제 대상 업무 조회"""
     client = await get_typedb_client()
     query = OptimizedQueries.DELETION_CANDIDATES.replace("limit 100", f"limit {limit}")
-    result = await client.fetch(query, cache_ttl=CACHE_TTL_SHORT)
+    result = await client.fetch(query, cache_ttl=CACHE_TTL_SHORT, tags=("task",))
     return result.data
 
 
@@ -383,7 +664,7 @@ async def fetch_high_risk_tasks(limit: int = 50) -> List[Dict]:
     """고위험 업무 조회"""
     client = await get_typedb_client()
     query = OptimizedQueries.HIGH_RISK_TASKS.replace("limit 50", f"limit {limit}")
-    result = await client.fetch(query, cache_ttl=CACHE_TTL_SHORT)
+    result = await client.fetch(query, cache_ttl=CACHE_TTL_SHORT, tags=("task",))
     return result.data
 
 
@@ -393,7 +674,7 @@ async def fetch_hierarchy(parent_level: str, parent_code: str) -> List[Dict]:
     query = OptimizedQueries.HIERARCHY_TREE.replace(
         "$parent_level", parent_level
     ).replace("$parent_code", parent_code)
-    result = await client.fetch(query, cache_ttl=CACHE_TTL_MEDIUM)
+    result = await client.fetch(query, cache_ttl=CACHE_TTL_MEDIUM, tags=("task", "hierarchy"))
     return result.data
 
 
@@ -403,6 +684,7 @@ async def fetch_dashboard_summary() -> Dict[str, Any]:
     result = await client.fetch(
         OptimizedQueries.DASHBOARD_SUMMARY,
         cache_ttl=CACHE_TTL_SHORT,
+        tags=("task",),
     )
     
     # 통계 계산
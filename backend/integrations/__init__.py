@@ -11,9 +11,19 @@ from integrations.oauth_manager import (
     get_oauth_manager,
 )
 
+from integrations.http_pool import (
+    HTTPPoolConfig,
+    HTTPSessionPool,
+    get_http_pool,
+    get_http_session,
+    close_http_pool,
+)
+
 from integrations.data_hub import (
     DataType,
     UnifiedData,
+    SyncDelta,
+    UserDataIndex,
     DataHub,
     get_data_hub,
 )
@@ -25,9 +35,18 @@ __all__ = [
     "OAuthManager",
     "get_oauth_manager",
     
+    # HTTP 커넥션 풀
+    "HTTPPoolConfig",
+    "HTTPSessionPool",
+    "get_http_pool",
+    "get_http_session",
+    "close_http_pool",
+    
     # Data
     "DataType",
     "UnifiedData",
+    "SyncDelta",
+    "UserDataIndex",
     "DataHub",
     "get_data_hub",
 ]
@@ -6,14 +6,21 @@ AUTUS Auto-Sync Engine v14.0
 기능:
 - 주기적 자동 동기화
 - 변경 감지 (델타 싱크)
-- 우선순위 큐
+- 우선순위 큐 (next_sync 최소 힙, 다음 작업 시각까지 대기)
+- 전역 워커 수 / 서비스별 동시성·속도 제한
+- 지터로 동시 만료 분산
 - 실패 재시도
 """
 
 import asyncio
+import heapq
 import logging
+import os
+import random
+import time
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import json
@@ -69,6 +76,51 @@ SYNC_INTERVALS = {
     OAuthProvider.NAVER: timedelta(minutes=30),
 }
 
+# 서비스별 (동시 실행 수, 초당 시작 수)
+PROVIDER_SYNC_LIMITS: Dict[OAuthProvider, Tuple[int, float]] = {
+    OAuthProvider.GOOGLE: (20, 20.0),
+    OAuthProvider.MICROSOFT: (20, 20.0),
+    OAuthProvider.SLACK: (10, 5.0),
+    OAuthProvider.NOTION: (5, 3.0),
+    OAuthProvider.GITHUB: (10, 10.0),
+    OAuthProvider.STRIPE: (10, 25.0),
+    OAuthProvider.SHOPIFY: (5, 2.0),
+    OAuthProvider.KAKAO: (5, 5.0),
+    OAuthProvider.NAVER: (5, 5.0),
+}
+DEFAULT_PROVIDER_LIMIT: Tuple[int, float] = (10, 10.0)
+
+# 전역 동시 실행 수 / 지터 비율
+AUTO_SYNC_MAX_WORKERS = int(os.getenv("AUTO_SYNC_MAX_WORKERS", "50"))
+AUTO_SYNC_JITTER = float(os.getenv("AUTO_SYNC_JITTER", "0.1"))
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _ts(dt: datetime) -> float:
+    """naive UTC datetime → epoch 초"""
+    return (dt - _EPOCH).total_seconds()
+
+
+class _TokenBucket:
+    """비차단 토큰 버킷 (서비스별 시작 속도 제한)"""
+    
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+    
+    def try_acquire(self) -> float:
+        """토큰 1개 차감 → 0, 부족하면 필요한 대기 초"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
 # ============================================
 # Auto-Sync Engine
 # ============================================
@@ -80,9 +132,21 @@ class AutoSyncEngine:
     - 백그라운드에서 주기적으로 데이터 동기화
     - 우선순위 기반 스케줄링
     - 실패 시 자동 재시도
+    
+    스케줄링:
+        _heap   : (next_sync, priority, seq, job, stamp) 최소 힙.
+                  job.next_sync 가 바뀌거나 해제되면 기존 항목은 꺼낼 때 버림.
+        _ready  : 만료됐지만 서비스 한도 때문에 대기 중인 작업 (서비스별 우선순위 힙)
+        루프는 가장 이른 next_sync (또는 속도 제한 해제 시각)까지 잠들고,
+        작업 완료/등록 시 깨어남. 전체 작업을 주기적으로 스캔하지 않음.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        provider_limits: Optional[Dict[OAuthProvider, Tuple[int, float]]] = None,
+        jitter: Optional[float] = None,
+    ):
         self.data_hub = get_data_hub()
         self.oauth = get_oauth_manager()
         self.jobs: Dict[str, Dict[OAuthProvider, SyncJob]] = {}  # user_id -> provider -> job
@@ -90,6 +154,56 @@ class AutoSyncEngine:
         self.running = False
         self._task: Optional[asyncio.Task] = None
         self.callbacks: List[Callable] = []
+        
+        self.max_workers = max_workers or AUTO_SYNC_MAX_WORKERS
+        self.provider_limits = {**PROVIDER_SYNC_LIMITS, **(provider_limits or {})}
+        self.jitter = AUTO_SYNC_JITTER if jitter is None else jitter
+        
+        self._heap: List[tuple] = []
+        self._ready: Dict[OAuthProvider, List[tuple]] = defaultdict(list)
+        self._seq = 0
+        self._inflight_total = 0
+        self._inflight: Dict[OAuthProvider, int] = defaultdict(int)
+        self._buckets: Dict[OAuthProvider, _TokenBucket] = {}
+        self._workers: set = set()
+        self._wakeup: Optional[asyncio.Event] = None
+    
+    # ─────────────────────────────────────────
+    # 스케줄 관리
+    # ─────────────────────────────────────────
+    
+    def _limit(self, provider: OAuthProvider) -> Tuple[int, float]:
+        return self.provider_limits.get(provider, DEFAULT_PROVIDER_LIMIT)
+    
+    def _bucket(self, provider: OAuthProvider) -> _TokenBucket:
+        bucket = self._buckets.get(provider)
+        if bucket is None:
+            bucket = self._buckets[provider] = _TokenBucket(self._limit(provider)[1])
+        return bucket
+    
+    def _jittered(self, delay: timedelta) -> timedelta:
+        """±jitter 비율로 간격 분산 (동시 만료 방지)"""
+        if not self.jitter:
+            return delay
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+    
+    def _is_current(self, job: SyncJob, stamp: Optional[datetime]) -> bool:
+        return job.next_sync == stamp and self.jobs.get(job.user_id, {}).get(job.provider) is job
+    
+    def _notify(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+    
+    def schedule_job(self, job: SyncJob):
+        """작업을 job.next_sync 기준으로 힙에 등록 (기존 항목은 자동 무효화)"""
+        if job.next_sync is None:
+            return
+        self.jobs.setdefault(job.user_id, {})[job.provider] = job
+        self._seq += 1
+        entry = (_ts(job.next_sync), job.priority.value, self._seq, job, job.next_sync)
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            self._notify()
     
     def register_user(self, user_id: str) -> int:
         """사용자의 모든 연결된 서비스를 동기화 대상으로 등록"""
@@ -102,18 +216,18 @@ class AutoSyncEngine:
         for provider in providers:
             if provider not in self.jobs[user_id]:
                 interval = SYNC_INTERVALS.get(provider, timedelta(minutes=30))
-                self.jobs[user_id][provider] = SyncJob(
+                self.schedule_job(SyncJob(
                     user_id=user_id,
                     provider=provider,
-                    next_sync=datetime.utcnow() + interval
-                )
+                    next_sync=datetime.utcnow() + self._jittered(interval)
+                ))
                 count += 1
         
         logger.info(f"Registered {count} sync jobs for user {user_id}")
         return count
     
     def unregister_user(self, user_id: str, provider: OAuthProvider = None):
-        """동기화 대상에서 제거"""
+        """동기화 대상에서 제거 (힙 항목은 꺼낼 때 버려짐)"""
         if user_id not in self.jobs:
             return
         
@@ -132,51 +246,114 @@ class AutoSyncEngine:
             return
         
         self.running = True
+        self._wakeup = asyncio.Event()
         self._task = asyncio.create_task(self._run_loop())
         logger.info("Auto-sync engine started")
     
     async def stop(self):
         """동기화 중지"""
         self.running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        tasks = [t for t in [self._task, *self._workers] if t]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers.clear()
         logger.info("Auto-sync engine stopped")
     
     async def _run_loop(self):
-        """메인 동기화 루프"""
+        """메인 동기화 루프 - 다음 만료 시각까지 대기"""
         while self.running:
             try:
-                await self._process_jobs()
-                await asyncio.sleep(30)  # 30초마다 체크
+                self._wakeup.clear()
+                timeout = self._dispatch()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Sync loop error: {e}")
                 await asyncio.sleep(60)
     
-    async def _process_jobs(self):
-        """대기 중인 작업 처리"""
-        now = datetime.utcnow()
-        pending_jobs = []
+    def _dispatch(self) -> Optional[float]:
+        """
+        만료 작업을 한도 내에서 시작하고 다음 대기 시간(초)을 반환
         
-        # 실행 대상 작업 수집
-        for user_id, providers in self.jobs.items():
-            for provider, job in providers.items():
-                if job.next_sync and job.next_sync <= now:
-                    pending_jobs.append(job)
+        None 이면 새 작업 등록/완료까지 무기한 대기.
+        """
+        now = _ts(datetime.utcnow())
         
-        # 우선순위 정렬
-        pending_jobs.sort(key=lambda j: j.priority.value)
+        # 1. 만료 작업 → 서비스별 ready 힙
+        while self._heap and self._heap[0][0] <= now:
+            due, priority, seq, job, stamp = heapq.heappop(self._heap)
+            if self._is_current(job, stamp):
+                heapq.heappush(self._ready[job.provider], (priority, due, seq, job, stamp))
         
-        # 병렬 실행 (최대 5개)
-        batch_size = 5
-        for i in range(0, len(pending_jobs), batch_size):
-            batch = pending_jobs[i:i + batch_size]
-            await asyncio.gather(*[self._execute_job(job) for job in batch])
+        # 2. 실행 중 작업이 가장 적은 서비스부터 하나씩 시작
+        #    (느린 서비스가 전역 슬롯을 점점 독점하는 head-of-line 블로킹 방지)
+        wait: Optional[float] = None
+        throttled = set()
+        while self._inflight_total < self.max_workers:
+            candidate = None
+            for provider in list(self._ready):
+                ready = self._ready[provider]
+                while ready and not self._is_current(ready[0][3], ready[0][4]):
+                    heapq.heappop(ready)
+                if not ready:
+                    del self._ready[provider]
+                    continue
+                if provider in throttled or self._inflight[provider] >= self._limit(provider)[0]:
+                    continue
+                key = (self._inflight[provider], ready[0][0])
+                if candidate is None or key < candidate[0]:
+                    candidate = (key, provider)
+            if candidate is None:
+                break
+            
+            provider = candidate[1]
+            delay = self._bucket(provider).try_acquire()
+            if delay > 0:
+                throttled.add(provider)
+                wait = delay if wait is None else min(wait, delay)
+                continue
+            self._start_worker(heapq.heappop(self._ready[provider])[3])
+        
+        # 3. 다음 만료 시각
+        if self._heap:
+            delay = max(0.0, self._heap[0][0] - now)
+            wait = delay if wait is None else min(wait, delay)
+        return wait
+    
+    def _start_worker(self, job: SyncJob):
+        self._inflight_total += 1
+        self._inflight[job.provider] += 1
+        task = asyncio.ensure_future(self._run_job(job))
+        self._workers.add(task)
+        task.add_done_callback(self._workers.discard)
+    
+    async def _run_job(self, job: SyncJob):
+        try:
+            await self._execute_job(job)
+        finally:
+            self._inflight_total -= 1
+            self._inflight[job.provider] -= 1
+            # 실행 중 여부와 무관 — stop() 중 취소되거나 수동 실행된 작업도 다음 start() 에 이어서 실행
+            if self.jobs.get(job.user_id, {}).get(job.provider) is job:
+                self.schedule_job(job)
+            self._notify()
+    
+    async def _process_jobs(self):
+        """대기 중인 만료 작업을 모두 실행하고 완료까지 대기 (수동 실행용)"""
+        self._wakeup = self._wakeup or asyncio.Event()
+        while True:
+            timeout = self._dispatch()
+            if not self._workers and not self._ready:
+                return
+            if self._workers:
+                await asyncio.wait(set(self._workers), return_when=asyncio.FIRST_COMPLETED)
+            elif timeout:
+                await asyncio.sleep(timeout)
     
     async def _execute_job(self, job: SyncJob) -> SyncResult:
         """단일 작업 실행"""
@@ -199,7 +376,7 @@ class AutoSyncEngine:
             # 다음 동기화 시간 설정
             interval = SYNC_INTERVALS.get(job.provider, timedelta(minutes=30))
             job.last_sync = datetime.utcnow()
-            job.next_sync = job.last_sync + interval
+            job.next_sync = job.last_sync + self._jittered(interval)
             job.retry_count = 0
             job.error = None
             
@@ -223,10 +400,10 @@ class AutoSyncEngine:
             if job.retry_count < job.max_retries:
                 # 지수 백오프
                 delay = timedelta(minutes=2 ** job.retry_count)
-                job.next_sync = datetime.utcnow() + delay
+                job.next_sync = datetime.utcnow() + self._jittered(delay)
             else:
                 # 최대 재시도 초과 - 1시간 후 재시도
-                job.next_sync = datetime.utcnow() + timedelta(hours=1)
+                job.next_sync = datetime.utcnow() + self._jittered(timedelta(hours=1))
             
             logger.error(f"Sync failed for {job.provider.value}: {e}")
         
@@ -262,6 +439,7 @@ class AutoSyncEngine:
         for job in jobs_to_run:
             result = await self._execute_job(job)
             results.append(result)
+            self.schedule_job(job)  # 새 next_sync 로 재등록
         
         return results
     
@@ -289,6 +467,14 @@ class AutoSyncEngine:
             "running": self.running,
             "total_users": len(self.jobs),
             "total_jobs": total_jobs,
+            "scheduler": {
+                "heap_size": len(self._heap),
+                "next_due": datetime.utcfromtimestamp(self._heap[0][0]).isoformat() if self._heap else None,
+                "ready": {p.value: len(r) for p, r in self._ready.items()},
+                "in_flight": self._inflight_total,
+                "in_flight_by_provider": {p.value: n for p, n in self._inflight.items() if n},
+                "max_workers": self.max_workers,
+            },
             "recent_results": [
                 {
                     "user_id": r.user_id,
@@ -330,6 +516,128 @@ class AutoSyncEngine:
         }
 
 
+# ============================================
+# 시뮬레이션 벤치마크
+# ============================================
+
+class _SimulatedHub:
+    """지연만 흉내내는 DataHub 대역 (서비스별 동시 실행 최대치 기록)"""
+    
+    def __init__(self, min_ms: float = 0.5, max_ms: float = 3.0, slow: Optional[OAuthProvider] = None):
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+        self.slow = slow
+        self.active: Dict[OAuthProvider, int] = defaultdict(int)
+        self.peak: Dict[OAuthProvider, int] = defaultdict(int)
+    
+    async def collect_by_provider(self, user_id: str, provider: OAuthProvider) -> list:
+        self.active[provider] += 1
+        self.peak[provider] = max(self.peak[provider], self.active[provider])
+        try:
+            delay = random.uniform(self.min_ms, self.max_ms) / 1000
+            if provider == self.slow:
+                delay *= 20
+            await asyncio.sleep(delay)
+            return []
+        finally:
+            self.active[provider] -= 1
+
+
+def _legacy_throughput(jobs: List[SyncJob], hub: "_SimulatedHub") -> float:
+    """기존 방식 (우선순위 정렬 후 5개씩 lock-step gather) 처리량 (jobs/s)"""
+    async def run():
+        pending = sorted(jobs, key=lambda j: j.priority.value)
+        for i in range(0, len(pending), 5):
+            await asyncio.gather(*[hub.collect_by_provider(j.user_id, j.provider) for j in pending[i:i + 5]])
+    
+    t0 = time.perf_counter()
+    asyncio.run(run())
+    return len(jobs) / (time.perf_counter() - t0)
+
+
+def _benchmark(
+    n_jobs: int = 100_000,
+    workers: int = 200,
+    spread_s: float = 2.0,
+    slow_provider: Optional[OAuthProvider] = None,
+    legacy_sample: int = 5_000,
+) -> Dict[str, Any]:
+    """
+    합성 작업 n_jobs 개를 spread_s 초에 걸쳐 만료시키고 스케줄러 처리량/지연 측정
+    
+    비교용으로 기존 방식의 1회 스캔 비용과 5개 lock-step 배치 처리량(legacy_sample 개)도 측정.
+    slow_provider 를 주면 해당 서비스만 20배 느리게 해 다른 서비스 지연이 영향받지 않는지 확인.
+    """
+    logging.getLogger(__name__).setLevel(logging.WARNING)
+    providers = list(SYNC_INTERVALS)
+    limits = {p: (max(4, workers // len(providers)), 1e6) for p in providers}
+    engine = AutoSyncEngine(max_workers=workers, provider_limits=limits, jitter=0.1)
+    engine.data_hub = hub = _SimulatedHub(slow=slow_provider)
+    
+    lags: List[float] = []
+    lags_by_provider: Dict[OAuthProvider, List[float]] = defaultdict(list)
+    execute = engine._execute_job
+    
+    async def timed_execute(job: SyncJob):
+        lag = _ts(datetime.utcnow()) - _ts(job.next_sync)
+        lags.append(lag)
+        lags_by_provider[job.provider].append(lag)
+        return await execute(job)
+    
+    engine._execute_job = timed_execute
+    
+    start = datetime.utcnow()
+    t0 = time.perf_counter()
+    for i in range(n_jobs):
+        engine.schedule_job(SyncJob(
+            user_id=f"user_{i // len(providers)}",
+            provider=providers[i % len(providers)],
+            priority=random.choice(list(SyncPriority)),
+            next_sync=start + timedelta(seconds=random.uniform(0, spread_s)),
+        ))
+    schedule_ms = (time.perf_counter() - t0) * 1000
+    
+    # 기존 방식: 30초마다 모든 작업 스캔 + 정렬
+    t0 = time.perf_counter()
+    now = start + timedelta(seconds=spread_s)
+    pending = [j for providers_ in engine.jobs.values() for j in providers_.values() if j.next_sync <= now]
+    pending.sort(key=lambda j: j.priority.value)
+    legacy_scan_ms = (time.perf_counter() - t0) * 1000
+    
+    async def run():
+        await engine.start()
+        while len(lags) < n_jobs:
+            await asyncio.sleep(0.05)
+        await engine.stop()
+    
+    t0 = time.perf_counter()
+    asyncio.run(run())
+    elapsed = time.perf_counter() - t0
+    
+    def pct(values: List[float], q: float) -> Optional[float]:
+        values = sorted(values)
+        return round(values[min(len(values) - 1, int(q * len(values)))] * 1000, 2) if values else None
+    
+    sample = [j for providers_ in engine.jobs.values() for j in providers_.values()][:legacy_sample]
+    legacy_jobs_per_s = _legacy_throughput(sample, _SimulatedHub(slow=slow_provider)) if sample else None
+    
+    return {
+        "jobs": n_jobs,
+        "executed": len(lags),
+        "workers": workers,
+        "schedule_ms": round(schedule_ms, 1),
+        "legacy_scan_ms": round(legacy_scan_ms, 1),
+        "elapsed_s": round(elapsed, 2),
+        "jobs_per_s": round(len(lags) / elapsed, 1),
+        "legacy_jobs_per_s": round(legacy_jobs_per_s, 1) if legacy_jobs_per_s else None,
+        "lag_p50_ms": pct(lags, 0.5),
+        "lag_p99_ms": pct(lags, 0.99),
+        "lag_p50_ms_by_provider": {p.value: pct(lags_by_provider[p], 0.5) for p in providers},
+        "peak_concurrency": {p.value: hub.peak[p] for p in providers},
+        "provider_caps": {p.value: limits[p][0] for p in providers},
+    }
+
+
 # ============================================
 # Singleton
 # ============================================
@@ -341,3 +649,19 @@ def get_sync_engine() -> AutoSyncEngine:
     if _sync_engine is None:
         _sync_engine = AutoSyncEngine()
     return _sync_engine
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="AutoSyncEngine 스케줄러 시뮬레이션")
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=200)
+    parser.add_argument("--spread", type=float, default=2.0, help="만료 시각 분산 구간 (초)")
+    parser.add_argument("--slow-provider", choices=[p.value for p in OAuthProvider], default=None,
+                        help="20배 느린 서비스 (격리 확인용)")
+    parser.add_argument("--legacy-sample", type=int, default=5_000, help="기존 방식 처리량 측정 작업 수")
+    args = parser.parse_args()
+    
+    slow = OAuthProvider(args.slow_provider) if args.slow_provider else None
+    print(json.dumps(_benchmark(args.jobs, args.workers, args.spread, slow, args.legacy_sample), indent=2))
@@ -16,8 +16,9 @@ AUTUS Data Hub v14.0
 import asyncio
 import aiohttp
 import logging
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set, Tuple, Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -27,6 +28,7 @@ from integrations.oauth_manager import (
     OAuthToken,
     get_oauth_manager
 )
+from integrations.http_pool import HTTPSessionPool, get_http_pool
 
 logger = logging.getLogger(__name__)
 
@@ -55,57 +57,287 @@ class UnifiedData:
     metadata: Dict[str, Any] = field(default_factory=dict)
     timestamp: datetime = field(default_factory=datetime.utcnow)
     raw: Dict[str, Any] = field(default_factory=dict)
+    
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        """병합 키 (source, type, id)"""
+        return (self.source.value, self.type.value, self.id)
+
+
+@dataclass
+class SyncDelta:
+    """동기화 결과 변경분"""
+    added: List[UnifiedData] = field(default_factory=list)
+    updated: List[UnifiedData] = field(default_factory=list)
+    removed: List[Tuple[str, str, str]] = field(default_factory=list)
+    unchanged: int = 0
+    
+    @property
+    def changed(self) -> int:
+        return len(self.added) + len(self.updated) + len(self.removed)
+    
+    def extend(self, other: "SyncDelta"):
+        self.added.extend(other.added)
+        self.updated.extend(other.updated)
+        self.removed.extend(other.removed)
+        self.unchanged += other.unchanged
+    
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "added": len(self.added),
+            "updated": len(self.updated),
+            "removed": len(self.removed),
+            "unchanged": self.unchanged,
+        }
+
+# ============================================
+# 사용자 데이터 인덱스
+# ============================================
+
+def _bigrams(text: str) -> Set[str]:
+    """소문자 문자 bigram (한글 등 공백 없는 텍스트도 부분 문자열 검색 가능)"""
+    text = text.lower()
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class UserDataIndex:
+    """
+    사용자별 통합 데이터 저장소 + 인덱스
+    
+    - items   : (source, type, id) → UnifiedData, id 기준 병합
+    - by_type / by_source : 타입/서비스별 키 집합
+    - postings: bigram → 키 집합 (title, content 역색인, 변경 시 증분 갱신)
+    
+    search() 는 질의 bigram 교집합으로 후보를 좁힌 뒤 실제 부분 문자열로 검증하므로
+    기존 substring 검색과 결과가 같다.
+    """
+    
+    def __init__(self):
+        self.items: Dict[Tuple[str, str, str], UnifiedData] = {}
+        self.by_type: Dict[DataType, Set[Tuple[str, str, str]]] = defaultdict(set)
+        self.by_source: Dict[OAuthProvider, Set[Tuple[str, str, str]]] = defaultdict(set)
+        self.postings: Dict[str, Set[Tuple[str, str, str]]] = defaultdict(set)
+        self._order: Dict[Tuple[str, str, str], int] = {}
+        self._seq = 0
+    
+    def __len__(self) -> int:
+        return len(self.items)
+    
+    @staticmethod
+    def _grams(item: UnifiedData) -> Set[str]:
+        return _bigrams(item.title) | _bigrams(item.content)
+    
+    @staticmethod
+    def _same(a: UnifiedData, b: UnifiedData) -> bool:
+        # timestamp 는 수집 시각이 기본값이라 비교에서 제외
+        return (a.title, a.content, a.metadata) == (b.title, b.content, b.metadata)
+    
+    def upsert(self, item: UnifiedData) -> Optional[str]:
+        """병합 → "added" / "updated" / None(변경 없음)"""
+        key = item.key
+        old = self.items.get(key)
+        if old is not None:
+            if self._same(old, item):
+                return None
+            old_grams, new_grams = self._grams(old), self._grams(item)
+            for gram in old_grams - new_grams:
+                self._unpost(gram, key)
+            for gram in new_grams - old_grams:
+                self.postings[gram].add(key)
+            self.items[key] = item
+            return "updated"
+        
+        self.items[key] = item
+        self._seq += 1
+        self._order[key] = self._seq
+        self.by_type[item.type].add(key)
+        self.by_source[item.source].add(key)
+        for gram in self._grams(item):
+            self.postings[gram].add(key)
+        return "added"
+    
+    def remove(self, key: Tuple[str, str, str]) -> bool:
+        item = self.items.pop(key, None)
+        if item is None:
+            return False
+        self._order.pop(key, None)
+        self.by_type[item.type].discard(key)
+        self.by_source[item.source].discard(key)
+        for gram in self._grams(item):
+            self._unpost(gram, key)
+        return True
+    
+    def _unpost(self, gram: str, key):
+        keys = self.postings.get(gram)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.postings[gram]
+    
+    def merge(self, items: Iterable[UnifiedData], removed: Iterable[Tuple[str, str, str]] = ()) -> SyncDelta:
+        delta = SyncDelta()
+        for item in items:
+            status = self.upsert(item)
+            if status == "added":
+                delta.added.append(item)
+            elif status == "updated":
+                delta.updated.append(item)
+            else:
+                delta.unchanged += 1
+        for key in removed:
+            if self.remove(key):
+                delta.removed.append(key)
+        return delta
+    
+    def keys_for(self, source: OAuthProvider, data_type: DataType) -> Set[Tuple[str, str, str]]:
+        return self.by_source.get(source, set()) & self.by_type.get(data_type, set())
+    
+    def _ordered(self, keys: Iterable[Tuple[str, str, str]]) -> List[UnifiedData]:
+        return [self.items[k] for k in sorted(keys, key=self._order.__getitem__)]
+    
+    def all(self) -> List[UnifiedData]:
+        return list(self.items.values())
+    
+    def of_type(self, data_type: DataType) -> List[UnifiedData]:
+        return self._ordered(self.by_type.get(data_type, ()))
+    
+    def of_source(self, source: OAuthProvider) -> List[UnifiedData]:
+        return self._ordered(self.by_source.get(source, ()))
+    
+    def search(self, query: str, data_type: DataType = None) -> List[UnifiedData]:
+        query_lower = query.lower()
+        grams = sorted(_bigrams(query_lower), key=lambda g: len(self.postings.get(g, ())))
+        
+        if grams and len(query_lower) >= 2:
+            candidates = set(self.postings.get(grams[0], ()))
+            for gram in grams[1:]:
+                if not candidates:
+                    break
+                candidates &= self.postings.get(gram, set())
+        else:
+            # 빈 문자열/1글자 질의는 색인으로 좁힐 수 없음
+            candidates = set(self.items)
+        
+        if data_type:
+            candidates &= self.by_type.get(data_type, set())
+        
+        return [
+            d for d in self._ordered(candidates)
+            if query_lower in d.title.lower() or query_lower in d.content.lower()
+        ]
 
 # ============================================
 # 개별 Collector
 # ============================================
 
 class BaseCollector:
-    """기본 수집기"""
+    """
+    기본 수집기
+    
+    증분 동기화:
+        sync_token      : 이전 수집이 남긴 워터마크 (None 이면 전체 수집)
+        next_sync_token : collect() 후 다음 수집에 넘길 워터마크
+        removed_ids     : 서비스에서 삭제/취소된 항목 id
+        in_window()     : 전체 수집이 실제로 조회한 범위 안의 항목인지
+                          (범위 안인데 결과에 없을 때만 삭제로 간주)
+        window_floor    : 조회 개수 제한에 걸렸을 때 결과의 가장 오래된 값
+                          (None 이면 전체 범위 조회)
+    """
+    
+    SOURCE: OAuthProvider = None
+    DATA_TYPE: DataType = None
     
-    def __init__(self, token: OAuthToken):
+    def __init__(
+        self,
+        token: OAuthToken,
+        session: Optional[aiohttp.ClientSession] = None,
+        sync_token: Optional[Dict[str, Any]] = None,
+    ):
         self.token = token
+        self.session = session  # None이면 공용 풀 세션 사용
+        self.sync_token = sync_token
+        self.next_sync_token: Optional[Dict[str, Any]] = sync_token
+        self.removed_ids: List[str] = []
+        self.window_floor: Any = None
         self.headers = {
             "Authorization": f"{token.token_type} {token.access_token}",
             "Accept": "application/json"
         }
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = await get_http_pool().session()
+        return self.session
+    
     async def _get(self, url: str, params: Dict = None) -> Dict:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=self.headers, params=params) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                else:
-                    logger.error(f"GET {url} failed: {resp.status}")
-                    return {}
+        session = await self._get_session()
+        async with session.get(url, headers=self.headers, params=params) as resp:
+            if resp.status == 200:
+                return await resp.json()
+            else:
+                logger.error(f"GET {url} failed: {resp.status}")
+                return {}
     
     async def collect(self) -> List[UnifiedData]:
         raise NotImplementedError
+    
+    def _window_key(self, item: UnifiedData) -> Any:
+        """window_floor 와 비교할 항목 값 (수집기별 정렬 기준)"""
+        return None
+    
+    def in_window(self, item: UnifiedData) -> bool:
+        if self.window_floor is None:
+            return True
+        key = self._window_key(item)
+        return key is not None and key >= self.window_floor
 
 
 class GmailCollector(BaseCollector):
-    """Gmail 수집기"""
+    """Gmail 수집기 (sync_token: historyId)"""
     
     BASE_URL = "https://gmail.googleapis.com/gmail/v1"
+    SOURCE = OAuthProvider.GOOGLE
+    DATA_TYPE = DataType.EMAIL
     
     async def collect(self, max_results: int = 50) -> List[UnifiedData]:
-        """최근 이메일 수집"""
-        # 메시지 목록
+        """최근 이메일 수집 (historyId 이후 추가분만)"""
         url = f"{self.BASE_URL}/users/me/messages"
-        result = await self._get(url, {"maxResults": max_results})
+        profile = await self._get(f"{self.BASE_URL}/users/me/profile")
+        
+        message_ids = None
+        if self.sync_token and self.sync_token.get("history_id"):
+            history = await self._get(f"{self.BASE_URL}/users/me/history", {
+                "startHistoryId": self.sync_token["history_id"],
+                "historyTypes": "messageAdded",
+            })
+            # 만료된 historyId (404 → {}) 는 전체 수집으로 대체
+            if history:
+                message_ids = []
+                for record in history.get("history", []):
+                    for added in record.get("messagesAdded", []):
+                        msg_id = added.get("message", {}).get("id")
+                        if msg_id and msg_id not in message_ids:
+                            message_ids.append(msg_id)
+        
+        if message_ids is None:
+            # 메시지 목록
+            result = await self._get(url, {"maxResults": max_results})
+            message_ids = [m["id"] for m in result.get("messages", [])]
         
-        messages = result.get("messages", [])
         data = []
+        self._requested = set(message_ids[:20])
         
-        for msg in messages[:20]:  # 상세 조회는 20개만
-            detail = await self._get(f"{url}/{msg['id']}")
+        for msg_id in message_ids[:20]:  # 상세 조회는 20개만
+            detail = await self._get(f"{url}/{msg_id}")
             if not detail:
                 continue
             
             headers = {h["name"]: h["value"] for h in detail.get("payload", {}).get("headers", [])}
             
             data.append(UnifiedData(
-                id=msg["id"],
+                id=msg_id,
                 type=DataType.EMAIL,
                 source=OAuthProvider.GOOGLE,
                 title=headers.get("Subject", "(제목 없음)"),
@@ -119,32 +351,48 @@ class GmailCollector(BaseCollector):
                 raw=detail
             ))
         
+        if profile.get("historyId"):
+            self.next_sync_token = {"history_id": profile["historyId"]}
         return data
+    
+    def in_window(self, item: UnifiedData) -> bool:
+        # 상세 조회를 요청한 메시지만 (목록/상세 개수 제한 밖은 삭제 판단 불가)
+        return item.id in getattr(self, "_requested", ())
 
 
 class GoogleCalendarCollector(BaseCollector):
-    """Google Calendar 수집기"""
+    """Google Calendar 수집기 (sync_token: updatedMin)"""
     
     BASE_URL = "https://www.googleapis.com/calendar/v3"
+    SOURCE = OAuthProvider.GOOGLE
+    DATA_TYPE = DataType.CALENDAR
     
     async def collect(self, days_ahead: int = 30) -> List[UnifiedData]:
-        """다가오는 일정 수집"""
+        """다가오는 일정 수집 (이전 수집 이후 변경된 일정만, 취소 일정은 removed_ids)"""
         now = datetime.utcnow()
         time_min = now.isoformat() + "Z"
         time_max = (now + timedelta(days=days_ahead)).isoformat() + "Z"
         
-        url = f"{self.BASE_URL}/calendars/primary/events"
-        result = await self._get(url, {
+        params = {
             "timeMin": time_min,
             "timeMax": time_max,
-            "singleEvents": True,
+            "singleEvents": "true",
             "orderBy": "startTime"
-        })
+        }
+        if self.sync_token and self.sync_token.get("updated_min"):
+            params["updatedMin"] = self.sync_token["updated_min"]
+            params["showDeleted"] = "true"
+        
+        url = f"{self.BASE_URL}/calendars/primary/events"
+        result = await self._get(url, params)
         
         events = result.get("items", [])
         data = []
         
         for event in events:
+            if event.get("status") == "cancelled":
+                self.removed_ids.append(event["id"])
+                continue
             start = event.get("start", {})
             data.append(UnifiedData(
                 id=event["id"],
@@ -162,35 +410,52 @@ class GoogleCalendarCollector(BaseCollector):
                 raw=event
             ))
         
+        if result:
+            self.next_sync_token = {"updated_min": time_min}
         return data
 
 
 class SlackCollector(BaseCollector):
-    """Slack 수집기"""
+    """Slack 수집기 (sync_token: 채널별 마지막 ts)"""
     
     BASE_URL = "https://slack.com/api"
+    SOURCE = OAuthProvider.SLACK
+    DATA_TYPE = DataType.MESSAGE
     
     async def collect(self, limit: int = 100) -> List[UnifiedData]:
-        """최근 메시지 수집"""
+        """최근 메시지 수집 (채널별 워터마크 이후만)"""
         # 채널 목록
         channels_result = await self._get(f"{self.BASE_URL}/conversations.list")
         channels = channels_result.get("channels", [])
         
+        watermarks = dict((self.sync_token or {}).get("channels", {}))
         data = []
+        per_channel = 20
+        # 채널 id → 조회 범위의 가장 오래된 ts (None 이면 채널 전체)
+        self._windows: Dict[str, Optional[float]] = {}
         
         for channel in channels[:5]:  # 5개 채널만
+            params = {"channel": channel["id"], "limit": per_channel}
+            if watermarks.get(channel["id"]):
+                params["oldest"] = watermarks[channel["id"]]
+            
             # 채널 히스토리
-            history = await self._get(
-                f"{self.BASE_URL}/conversations.history",
-                {"channel": channel["id"], "limit": 20}
-            )
+            history = await self._get(f"{self.BASE_URL}/conversations.history", params)
+            messages = history.get("messages", [])
+            timestamps = [float(m["ts"]) for m in messages if m.get("ts")]
+            truncated = len(messages) >= per_channel or history.get("has_more")
+            self._windows[channel["id"]] = min(timestamps) if truncated and timestamps else None
             
-            for msg in history.get("messages", []):
+            for msg in messages:
+                ts = msg.get("ts", "")
+                if ts and float(ts) > float(watermarks.get(channel["id"]) or 0):
+                    watermarks[channel["id"]] = ts
+                
                 if msg.get("subtype"):  # 시스템 메시지 제외
                     continue
                 
                 data.append(UnifiedData(
-                    id=msg.get("ts", ""),
+                    id=f"{channel['id']}:{ts}",  # ts 는 채널 내에서만 유일
                     type=DataType.MESSAGE,
                     source=OAuthProvider.SLACK,
                     title=f"#{channel['name']}",
@@ -199,41 +464,71 @@ class SlackCollector(BaseCollector):
                         "channel": channel["name"],
                         "channel_id": channel["id"],
                         "user": msg.get("user"),
+                        "ts": ts,
                         "reactions": msg.get("reactions", []),
                     },
-                    timestamp=datetime.fromtimestamp(float(msg.get("ts", 0))),
+                    timestamp=datetime.fromtimestamp(float(ts or 0)),
                     raw=msg
                 ))
         
+        self.next_sync_token = {"channels": watermarks}
         return data
+    
+    def in_window(self, item: UnifiedData) -> bool:
+        windows = getattr(self, "_windows", {})
+        channel_id = item.metadata.get("channel_id")
+        if channel_id not in windows:
+            return False  # 이번에 조회하지 않은 채널
+        floor = windows[channel_id]
+        return floor is None or float(item.metadata.get("ts") or 0) >= floor
 
 
 class NotionCollector(BaseCollector):
-    """Notion 수집기"""
+    """Notion 수집기 (sync_token: last_edited_time)"""
     
     BASE_URL = "https://api.notion.com/v1"
+    SOURCE = OAuthProvider.NOTION
+    DATA_TYPE = DataType.DOCUMENT
     
-    def __init__(self, token: OAuthToken):
-        super().__init__(token)
+    def __init__(
+        self,
+        token: OAuthToken,
+        session: Optional[aiohttp.ClientSession] = None,
+        sync_token: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(token, session, sync_token)
         self.headers["Notion-Version"] = "2022-06-28"
     
     async def collect(self) -> List[UnifiedData]:
-        """페이지/데이터베이스 목록"""
+        """페이지/데이터베이스 목록 (최근 수정순, 워터마크 이후 수정분만)"""
         url = f"{self.BASE_URL}/search"
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                headers=self.headers,
-                json={"page_size": 50}
-            ) as resp:
-                if resp.status != 200:
-                    return []
-                result = await resp.json()
-        
+        session = await self._get_session()
+        async with session.post(
+            url,
+            headers=self.headers,
+            json={
+                "page_size": 50,
+                "sort": {"direction": "descending", "timestamp": "last_edited_time"},
+            }
+        ) as resp:
+            if resp.status != 200:
+                return []
+            result = await resp.json()
+        
+        since = (self.sync_token or {}).get("last_edited_time") or ""
+        latest = since
         data = []
         
-        for item in result.get("results", []):
+        results = result.get("results", [])
+        if result.get("has_more") or len(results) >= 50:
+            self.window_floor = min((r.get("last_edited_time") or "" for r in results), default=None)
+        
+        for item in results:
+            edited = item.get("last_edited_time") or ""
+            latest = max(latest, edited)
+            if since and edited and edited <= since:
+                continue
             if item["object"] == "page":
                 title_prop = item.get("properties", {}).get("title", {})
                 title_list = title_prop.get("title", [])
@@ -252,16 +547,23 @@ class NotionCollector(BaseCollector):
                     raw=item
                 ))
         
+        if latest:
+            self.next_sync_token = {"last_edited_time": latest}
         return data
+    
+    def _window_key(self, item: UnifiedData) -> Any:
+        return item.metadata.get("last_edited_time")
 
 
 class GitHubCollector(BaseCollector):
-    """GitHub 수집기"""
+    """GitHub 수집기 (sync_token: 마지막 이벤트 created_at)"""
     
     BASE_URL = "https://api.github.com"
+    SOURCE = OAuthProvider.GITHUB
+    DATA_TYPE = DataType.CODE
     
     async def collect(self) -> List[UnifiedData]:
-        """최근 활동 수집"""
+        """최근 활동 수집 (워터마크 이후 이벤트만)"""
         # 사용자 정보
         user = await self._get(f"{self.BASE_URL}/user")
         username = user.get("login", "")
@@ -269,9 +571,18 @@ class GitHubCollector(BaseCollector):
         # 이벤트
         events = await self._get(f"{self.BASE_URL}/users/{username}/events")
         
+        since = (self.sync_token or {}).get("created_at") or ""
+        latest = since
         data = []
         
+        if len(events) > 30:
+            self.window_floor = min(e.get("created_at") or "" for e in events[:30])
+        
         for event in events[:30]:
+            created = event.get("created_at") or ""
+            latest = max(latest, created)
+            if since and created <= since:
+                continue
             data.append(UnifiedData(
                 id=event["id"],
                 type=DataType.CODE,
@@ -286,21 +597,38 @@ class GitHubCollector(BaseCollector):
                 raw=event
             ))
         
+        if latest:
+            self.next_sync_token = {"created_at": latest}
         return data
+    
+    def _window_key(self, item: UnifiedData) -> Any:
+        return item.raw.get("created_at")
 
 
 class StripeCollector(BaseCollector):
-    """Stripe 수집기"""
+    """Stripe 수집기 (sync_token: 마지막 created)"""
     
     BASE_URL = "https://api.stripe.com/v1"
+    SOURCE = OAuthProvider.STRIPE
+    DATA_TYPE = DataType.TRANSACTION
     
     async def collect(self) -> List[UnifiedData]:
-        """결제 내역 수집"""
-        result = await self._get(f"{self.BASE_URL}/charges", {"limit": 50})
-        
+        """결제 내역 수집 (워터마크 이후 생성분만)"""
+        params = {"limit": 50}
+        since = (self.sync_token or {}).get("created")
+        if since:
+            params["created[gt]"] = since
+        result = await self._get(f"{self.BASE_URL}/charges", params)
+        
+        latest = since or 0
         data = []
         
-        for charge in result.get("data", []):
+        charges = result.get("data", [])
+        if result.get("has_more"):
+            self.window_floor = min((c["created"] for c in charges), default=None)
+        
+        for charge in charges:
+            latest = max(latest, charge["created"])
             data.append(UnifiedData(
                 id=charge["id"],
                 type=DataType.TRANSACTION,
@@ -318,7 +646,12 @@ class StripeCollector(BaseCollector):
                 raw=charge
             ))
         
+        if latest:
+            self.next_sync_token = {"created": latest}
         return data
+    
+    def _window_key(self, item: UnifiedData) -> Any:
+        return item.raw.get("created")
 
 
 # ============================================
@@ -330,6 +663,11 @@ class DataHub:
     AUTUS 통합 데이터 허브
     
     모든 연동 서비스에서 데이터를 수집하고 통합 형식으로 제공
+    
+    증분 동기화:
+        수집기별 sync_token 을 보관해 새/변경 항목만 받아 (source, type, id) 로 병합.
+        FULL_SYNC_INTERVAL 마다 전체 수집으로 삭제/누락 항목을 정리.
+        타입별 조회와 검색은 UserDataIndex 의 인덱스를 사용.
     """
     
     COLLECTORS = {
@@ -340,78 +678,148 @@ class DataHub:
         OAuthProvider.STRIPE: [StripeCollector],
     }
     
-    def __init__(self, oauth_manager: OAuthManager):
+    FULL_SYNC_INTERVAL = timedelta(hours=6)
+    
+    def __init__(self, oauth_manager: OAuthManager, http_pool: Optional[HTTPSessionPool] = None):
         self.oauth = oauth_manager
-        self.cache: Dict[str, List[UnifiedData]] = {}  # user_id -> data
+        self.http_pool = http_pool or get_http_pool()
+        self.indexes: Dict[str, UserDataIndex] = {}  # user_id -> index
         self.last_sync: Dict[str, datetime] = {}
+        self.last_delta: Dict[str, SyncDelta] = {}
+        # user_id -> collector 이름 -> sync_token / 마지막 전체 수집 시각
+        self.sync_tokens: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+        self.last_full_sync: Dict[str, Dict[str, datetime]] = defaultdict(dict)
+    
+    @property
+    def cache(self) -> Dict[str, List[UnifiedData]]:
+        """user_id -> 전체 데이터 (하위 호환)"""
+        return {user_id: index.all() for user_id, index in self.indexes.items()}
+    
+    def _index(self, user_id: str) -> UserDataIndex:
+        index = self.indexes.get(user_id)
+        if index is None:
+            index = self.indexes[user_id] = UserDataIndex()
+        return index
+    
+    def _needs_full_sync(self, user_id: str, name: str) -> bool:
+        last = self.last_full_sync[user_id].get(name)
+        return last is None or datetime.utcnow() - last >= self.FULL_SYNC_INTERVAL
     
-    async def collect_all(self, user_id: str) -> List[UnifiedData]:
-        """모든 연동 서비스에서 데이터 수집"""
-        providers = self.oauth.get_connected_providers(user_id)
+    async def _sync_collector(
+        self,
+        user_id: str,
+        collector_class,
+        token: OAuthToken,
+        session: aiohttp.ClientSession,
+        full: bool,
+    ) -> SyncDelta:
+        """수집기 하나를 sync_token 기준으로 실행하고 결과를 병합"""
+        name = collector_class.__name__
+        full = full or self._needs_full_sync(user_id, name)
+        sync_token = None if full else self.sync_tokens[user_id].get(name)
+        
+        collector = collector_class(token, session=session, sync_token=sync_token)
+        items = await collector.collect()
+        
+        index = self._index(user_id)
+        source, data_type = collector_class.SOURCE, collector_class.DATA_TYPE
+        removed = [(source.value, data_type.value, item_id) for item_id in collector.removed_ids]
+        if full and source and data_type:
+            # 조회 범위 안인데 전체 수집에 없는 항목 = 삭제됨 (개수 제한 밖은 유지)
+            fetched = {item.key for item in items}
+            removed.extend(
+                key for key in index.keys_for(source, data_type) - fetched
+                if collector.in_window(index.items[key])
+            )
+        
+        delta = index.merge(items, removed)
         
-        all_data = []
+        if collector.next_sync_token is not None:
+            self.sync_tokens[user_id][name] = collector.next_sync_token
+        if full:
+            self.last_full_sync[user_id][name] = datetime.utcnow()
+        return delta
+    
+    async def sync(
+        self,
+        user_id: str,
+        providers: Optional[List[OAuthProvider]] = None,
+        full: bool = False,
+    ) -> SyncDelta:
+        """
+        증분 동기화 → 변경분
+        
+        providers 가 None 이면 연결된 모든 서비스. full=True 면 sync_token 무시.
+        """
+        if providers is None:
+            providers = self.oauth.get_connected_providers(user_id)
+        
+        session = await self.http_pool.session()
         tasks = []
+        labels = []
         
         for provider in providers:
             if provider in self.COLLECTORS:
                 token = await self.oauth.get_token(user_id, provider)
                 if token:
                     for collector_class in self.COLLECTORS[provider]:
-                        collector = collector_class(token)
-                        tasks.append(collector.collect())
+                        tasks.append(self._sync_collector(user_id, collector_class, token, session, full))
+                        labels.append(provider)
         
         # 병렬 수집
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        for result in results:
-            if isinstance(result, list):
-                all_data.extend(result)
+        delta = SyncDelta()
+        for provider, result in zip(labels, results):
+            if isinstance(result, SyncDelta):
+                delta.extend(result)
             elif isinstance(result, Exception):
-                logger.error(f"Collection error: {result}")
+                logger.error(f"Collection error for {provider.value}: {result}")
         
-        # 캐시 저장
-        self.cache[user_id] = all_data
+        self._index(user_id)
         self.last_sync[user_id] = datetime.utcnow()
-        
-        return all_data
+        self.last_delta[user_id] = delta
+        return delta
+    
+    async def collect_all(self, user_id: str, full: bool = False) -> List[UnifiedData]:
+        """모든 연동 서비스에서 데이터 동기화 후 전체 데이터 반환"""
+        await self.sync(user_id, full=full)
+        return self.get_cached(user_id)
     
     async def collect_by_provider(
         self, 
         user_id: str, 
-        provider: OAuthProvider
+        provider: OAuthProvider,
+        full: bool = False,
     ) -> List[UnifiedData]:
-        """특정 서비스에서만 데이터 수집"""
-        token = await self.oauth.get_token(user_id, provider)
-        if not token:
-            return []
-        
+        """특정 서비스만 동기화 → 해당 서비스 데이터"""
         if provider not in self.COLLECTORS:
             return []
         
-        all_data = []
-        
-        for collector_class in self.COLLECTORS[provider]:
-            collector = collector_class(token)
-            try:
-                data = await collector.collect()
-                all_data.extend(data)
-            except Exception as e:
-                logger.error(f"Collection error for {provider}: {e}")
+        token = await self.oauth.get_token(user_id, provider)
+        if not token:
+            return []
         
-        return all_data
+        await self.sync(user_id, [provider], full=full)
+        return self._index(user_id).of_source(provider)
     
     async def collect_by_type(
         self, 
         user_id: str, 
-        data_type: DataType
+        data_type: DataType,
+        refresh: bool = False,
     ) -> List[UnifiedData]:
-        """특정 타입의 데이터만 수집"""
-        all_data = await self.collect_all(user_id)
-        return [d for d in all_data if d.type == data_type]
+        """특정 타입의 데이터 (타입 인덱스, 아직 동기화 전이거나 refresh=True 면 먼저 동기화)"""
+        if refresh or user_id not in self.last_sync:
+            await self.sync(user_id)
+        return self._index(user_id).of_type(data_type)
     
-    def get_cached(self, user_id: str) -> List[UnifiedData]:
+    def get_cached(self, user_id: str, data_type: DataType = None) -> List[UnifiedData]:
         """캐시된 데이터 반환"""
-        return self.cache.get(user_id, [])
+        index = self.indexes.get(user_id)
+        if index is None:
+            return []
+        return index.of_type(data_type) if data_type else index.all()
     
     def search(
         self, 
@@ -419,34 +827,26 @@ class DataHub:
         query: str,
         data_type: DataType = None
     ) -> List[UnifiedData]:
-        """데이터 검색"""
-        data = self.cache.get(user_id, [])
-        
-        if data_type:
-            data = [d for d in data if d.type == data_type]
-        
-        query_lower = query.lower()
-        return [
-            d for d in data 
-            if query_lower in d.title.lower() or query_lower in d.content.lower()
-        ]
+        """데이터 검색 (bigram 역색인)"""
+        index = self.indexes.get(user_id)
+        if index is None:
+            return []
+        return index.search(query, data_type)
     
     def get_summary(self, user_id: str) -> Dict[str, Any]:
         """데이터 요약"""
-        data = self.cache.get(user_id, [])
-        
-        by_type = {}
-        by_source = {}
+        index = self.indexes.get(user_id) or UserDataIndex()
         
-        for d in data:
-            by_type[d.type.value] = by_type.get(d.type.value, 0) + 1
-            by_source[d.source.value] = by_source.get(d.source.value, 0) + 1
+        by_type = {t.value: len(keys) for t, keys in index.by_type.items() if keys}
+        by_source = {s.value: len(keys) for s, keys in index.by_source.items() if keys}
+        delta = self.last_delta.get(user_id)
         
         return {
-            "total": len(data),
+            "total": len(index),
             "by_type": by_type,
             "by_source": by_source,
             "last_sync": self.last_sync.get(user_id),
+            "last_delta": delta.to_dict() if delta else None,
         }
 
 
@@ -0,0 +1,233 @@
+"""
+AUTUS HTTP Session Pool
+========================
+프로세스 공용 aiohttp 세션 / 커넥션 풀
+
+- 호스트별 keep-alive 커넥션 재사용 (요청마다 TCP+TLS 핸드셰이크 제거)
+- DNS 캐시
+- 환경변수로 한도 설정
+- TraceConfig 기반 사용률 메트릭
+
+세션은 이벤트 루프에 묶이므로 루프별로 하나씩 생성.
+앱 lifespan 종료 시 close_http_pool() 로 정리.
+
+환경변수:
+    HTTP_POOL_LIMIT            전체 동시 커넥션 (기본 100)
+    HTTP_POOL_LIMIT_PER_HOST   호스트별 동시 커넥션 (기본 20)
+    HTTP_KEEPALIVE_TIMEOUT     유휴 커넥션 유지 초 (기본 30)
+    HTTP_DNS_CACHE_TTL         DNS 캐시 초 (기본 300)
+    HTTP_CONNECT_TIMEOUT       연결 타임아웃 초 (기본 10)
+    HTTP_TOTAL_TIMEOUT         요청 전체 타임아웃 초 (기본 60)
+"""
+
+import asyncio
+import logging
+import os
+import weakref
+from collections import Counter
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================
+# 설정
+# ============================================
+
+@dataclass
+class HTTPPoolConfig:
+    """커넥션 풀 설정"""
+    limit: int = 100
+    limit_per_host: int = 20
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int = 300
+    connect_timeout: float = 10.0
+    total_timeout: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> "HTTPPoolConfig":
+        return cls(
+            limit=int(os.getenv("HTTP_POOL_LIMIT", "100")),
+            limit_per_host=int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "20")),
+            keepalive_timeout=float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30")),
+            dns_cache_ttl=int(os.getenv("HTTP_DNS_CACHE_TTL", "300")),
+            connect_timeout=float(os.getenv("HTTP_CONNECT_TIMEOUT", "10")),
+            total_timeout=float(os.getenv("HTTP_TOTAL_TIMEOUT", "60")),
+        )
+
+
+@dataclass
+class HTTPPoolStats:
+    """누적 카운터"""
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    queued: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+    by_host: Counter = field(default_factory=Counter)
+
+
+# ============================================
+# 세션 풀
+# ============================================
+
+class HTTPSessionPool:
+    """
+    공용 aiohttp 세션 풀
+
+    사용:
+        pool = get_http_pool()
+        session = await pool.session()
+        async with session.get(url) as resp:
+            ...
+
+    세션은 풀이 소유하므로 호출 측에서 닫지 않는다.
+    """
+
+    def __init__(self, config: Optional[HTTPPoolConfig] = None):
+        self.config = config or HTTPPoolConfig.from_env()
+        self.stats = HTTPPoolStats()
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    # ─────────────────────────────────────────
+    # 세션
+    # ─────────────────────────────────────────
+
+    async def session(self) -> aiohttp.ClientSession:
+        """현재 이벤트 루프의 공용 세션 (없으면 생성)"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = self._create_session()
+            self._sessions[loop] = session
+        return session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        cfg = self.config
+        connector = aiohttp.TCPConnector(
+            limit=cfg.limit,
+            limit_per_host=cfg.limit_per_host,
+            keepalive_timeout=cfg.keepalive_timeout,
+            ttl_dns_cache=cfg.dns_cache_ttl,
+            use_dns_cache=True,
+        )
+        timeout = aiohttp.ClientTimeout(total=cfg.total_timeout, connect=cfg.connect_timeout)
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            trace_configs=[self._trace_config()],
+        )
+
+    async def close(self):
+        """현재 루프의 세션 정리 (lifespan 종료 시)"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.pop(loop, None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    # ─────────────────────────────────────────
+    # 메트릭
+    # ─────────────────────────────────────────
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        stats = self.stats
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            stats.requests += 1
+            stats.in_flight += 1
+            stats.by_host[urlsplit(str(params.url)).netloc] += 1
+
+        async def on_request_end(session, ctx, params):
+            stats.in_flight -= 1
+
+        async def on_request_exception(session, ctx, params):
+            stats.in_flight -= 1
+            stats.errors += 1
+
+        async def on_connection_create_end(session, ctx, params):
+            stats.connections_created += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            stats.connections_reused += 1
+
+        async def on_connection_queued_start(session, ctx, params):
+            stats.queued += 1
+
+        async def on_dns_cache_hit(session, ctx, params):
+            stats.dns_cache_hits += 1
+
+        async def on_dns_cache_miss(session, ctx, params):
+            stats.dns_cache_misses += 1
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_end)
+        trace.on_request_exception.append(on_request_exception)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace.on_connection_queued_start.append(on_connection_queued_start)
+        trace.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace
+
+    def metrics(self) -> Dict[str, Any]:
+        """풀 사용률 메트릭"""
+        stats = self.stats
+        active = idle = 0
+        for session in list(self._sessions.values()):
+            if session.closed:
+                continue
+            connector = session.connector
+            active += len(getattr(connector, "_acquired", ()))
+            idle += sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+
+        opened = stats.connections_created + stats.connections_reused
+        return {
+            "config": asdict(self.config),
+            "sessions": sum(1 for s in self._sessions.values() if not s.closed),
+            "active_connections": active,
+            "idle_connections": idle,
+            "utilization": round(active / self.config.limit, 4) if self.config.limit else 0.0,
+            "requests": stats.requests,
+            "errors": stats.errors,
+            "in_flight": stats.in_flight,
+            "connections_created": stats.connections_created,
+            "connections_reused": stats.connections_reused,
+            "reuse_ratio": round(stats.connections_reused / opened, 4) if opened else 0.0,
+            "queued": stats.queued,
+            "dns_cache_hits": stats.dns_cache_hits,
+            "dns_cache_misses": stats.dns_cache_misses,
+            "by_host": dict(stats.by_host.most_common(20)),
+        }
+
+
+# ============================================
+# Singleton
+# ============================================
+
+_http_pool: Optional[HTTPSessionPool] = None
+
+def get_http_pool() -> HTTPSessionPool:
+    global _http_pool
+    if _http_pool is None:
+        _http_pool = HTTPSessionPool()
+    return _http_pool
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """공용 세션 (현재 이벤트 루프)"""
+    return await get_http_pool().session()
+
+
+async def close_http_pool():
+    if _http_pool is not None:
+        await _http_pool.close()
@@ -26,6 +26,8 @@ import aiohttp
 import json
 from urllib.parse import urlencode
 
+from integrations.http_pool import HTTPSessionPool, get_http_pool
+
 logger = logging.getLogger(__name__)
 
 # ============================================
@@ -202,10 +204,15 @@ OAUTH_CONFIGS: Dict[OAuthProvider, Dict] = {
 class OAuthManager:
     """통합 OAuth 관리자"""
     
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = "http://localhost:8000", http_pool: Optional[HTTPSessionPool] = None):
         self.base_url = base_url
+        self.http_pool = http_pool or get_http_pool()
         self.tokens: Dict[str, Dict[OAuthProvider, OAuthToken]] = {}  # user_id -> provider -> token
         self.states: Dict[str, Dict] = {}  # state -> {user_id, provider}
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """공용 커넥션 풀 세션"""
+        return await self.http_pool.session()
         
     def _get_config(self, provider: OAuthProvider) -> Dict:
         """Provider 설정 가져오기"""
@@ -290,18 +297,18 @@ class OAuthManager:
         
         headers = {"Accept": "application/json"}
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                config["token_url"],
-                data=data,
-                headers=headers
-            ) as resp:
-                if resp.status != 200:
-                    text = await resp.text()
-                    logger.error(f"Token exchange failed: {text}")
-                    return None
+        session = await self._get_session()
+        async with session.post(
+            config["token_url"],
+            data=data,
+            headers=headers
+        ) as resp:
+            if resp.status != 200:
+                text = await resp.text()
+                logger.error(f"Token exchange failed: {text}")
+                return None
                 
-                result = await resp.json()
+            result = await resp.json()
         
         # Token 저장
         expires_in = result.get("expires_in", 3600)
@@ -346,15 +353,15 @@ class OAuthManager:
             "grant_type": "refresh_token",
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                config["token_url"],
-                data=data,
-                headers={"Accept": "application/json"}
-            ) as resp:
-                if resp.status != 200:
-                    return None
-                result = await resp.json()
+        session = await self._get_session()
+        async with session.post(
+            config["token_url"],
+            data=data,
+            headers={"Accept": "application/json"}
+        ) as resp:
+            if resp.status != 200:
+                return None
+            result = await resp.json()
         
         expires_in = result.get("expires_in", 3600)
         new_token = OAuthToken(
@@ -14,6 +14,9 @@
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
+import time
+_IMPORT_START = time.perf_counter()
+
 # .env 파일 로드 (최우선)
 from dotenv import load_dotenv
 load_dotenv()
@@ -27,7 +30,6 @@ from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List, Dict, Any, Union
 import os
 import sys
-import time
 import warnings
 import asyncio
 import logging
@@ -169,6 +171,10 @@ async def lifespan(app: FastAPI):
     await init_db()
     await init_redis()
     
+    # 공용 HTTP 커넥션 풀 (수집기 / OAuth 호출이 공유, 종료 시 정리)
+    from integrations.http_pool import get_http_pool
+    app.state.http_pool = get_http_pool()
+    
     # K/I WebSocket 하트비트
     try:
         from websocket import ki_heartbeat_task, init_ki_demo_data
@@ -178,6 +184,17 @@ async def lifespan(app: FastAPI):
     except ImportError:
         pass
     
+    # 워커 간 Pub/Sub 버스: 구독만 하는 워커도 수신하도록 시작 시 리스너 가동
+    from core.pubsub import get_pubsub_bus
+    try:
+        await get_pubsub_bus().start()
+    except Exception as e:
+        logger.warning(f"⚠️ Pub/Sub 버스 시작 실패 - 첫 발행 시 재시도: {e}")
+    
+    # 남은 라우터 백그라운드 warm-up
+    if LAZY_ROUTERS and ROUTER_WARMUP:
+        asyncio.create_task(router_registry.warm_up(ROUTER_WARMUP_DELAY))
+    
     logger.info(f"""
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                           AUTUS API v{VERSION}                                  ║
@@ -201,6 +218,10 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("🛑 AUTUS 서버 종료...")
+    from integrations.http_pool import close_http_pool
+    await close_http_pool()
+    from core.pubsub import close_pubsub_bus
+    await close_pubsub_bus()
     if db_pool:
         await db_pool.close()
     if redis_client:
@@ -246,304 +267,29 @@ app.add_middleware(GZipMiddleware, minimum_size=500)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# 안전한 라우터 등록
+# 라우터 등록 (지연 로드)
 # ═══════════════════════════════════════════════════════════════════════════════
+#
+# 라우터는 routers/registry.py 에 (모듈, prefix) 로 선언.
+# AUTUS_LAZY_ROUTERS=true (기본): prefix 첫 요청 시 임포트, 서버 준비 후 백그라운드 warm-up
+# AUTUS_LAZY_ROUTERS=false: 기존처럼 임포트 시점에 전부 등록
 
-def _include_router_safe(app, module, name: str):
-    """안전한 라우터 등록"""
-    if module and hasattr(module, 'router'):
-        app.include_router(module.router)
-        logger.info(f"  ✅ {name}")
-    else:
-        logger.debug(f"  ⏭️ {name} (미사용)")
-
-logger.info("📦 라우터 등록 시작...")
-
-# ─────────────────────────────────────────────────────────────
-# Core Routers (v1.x ~ v3.x)
-# ─────────────────────────────────────────────────────────────
-
-# Auth
-try:
-    from auth import router as auth_router
-    app.include_router(auth_router)
-    logger.info("  ✅ auth_router")
-except ImportError:
-    pass
-
-# API Modules
-try:
-    from api import (
-        audit_api, autus_api, edge_api, efficiency_api,
-        flow_api, keyman_api, notification_api, ontology_api,
-        person_score_api, scale_api, strategy_api, unified_api,
-        viewport_api, reliance_api, collection_api,
-    )
-    _include_router_safe(app, audit_api, "audit_api")
-    _include_router_safe(app, autus_api, "autus_api")
-    _include_router_safe(app, edge_api, "edge_api")
-    _include_router_safe(app, efficiency_api, "efficiency_api")
-    _include_router_safe(app, flow_api, "flow_api")
-    _include_router_safe(app, keyman_api, "keyman_api")
-    _include_router_safe(app, notification_api, "notification_api")
-    _include_router_safe(app, ontology_api, "ontology_api")
-    _include_router_safe(app, person_score_api, "person_score_api")
-    _include_router_safe(app, scale_api, "scale_api")
-    _include_router_safe(app, strategy_api, "strategy_api")
-    _include_router_safe(app, unified_api, "unified_api")
-    _include_router_safe(app, viewport_api, "viewport_api")
-    _include_router_safe(app, reliance_api, "reliance_api")
-    _include_router_safe(app, collection_api, "collection_api")
-except ImportError as e:
-    logger.warning(f"  ⚠️ API 모듈 로드 실패: {e}")
-
-# Extended APIs
-for api_name in ["sovereign_api", "injection_api", "pipeline_api", "autus_unified_api"]:
-    try:
-        module = __import__(f"api.{api_name}", fromlist=[api_name])
-        _include_router_safe(app, module, api_name)
-    except ImportError:
-        pass
-
-# ─────────────────────────────────────────────────────────────
-# AUTUS 2.0 Views API (11개 뷰)
-# ─────────────────────────────────────────────────────────────
-try:
-    from routers import views_api
-    app.include_router(views_api.router)
-    logger.info("  ✅ Views API (11개 뷰) 등록 완료")
-except ImportError as e:
-    logger.warning(f"  ⚠️ Views API 로드 실패: {e}")
-
-# ─────────────────────────────────────────────────────────────
-# K/I Physics Routers (v4.x)
-# ─────────────────────────────────────────────────────────────
-
-# v4.0 K/I API (기본)
-try:
-    from api import ki_api, automation_api
-    _include_router_safe(app, ki_api, "ki_api (v4.0)")
-    _include_router_safe(app, automation_api, "automation_api")
-except ImportError:
-    pass
-
-# v4.1 K/I Router (통합 - autus_api_integration)
-try:
-    from routers.ki_router import router as ki_router_v2
-    app.include_router(ki_router_v2)
-    logger.info("  ✅ ki_router (v4.1)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ ki_router: {e}")
-
-# v4.2 OAuth Router (autus_oauth_collectors)
-try:
-    from routers.oauth_router import router as oauth_router
-    app.include_router(oauth_router)
-    logger.info("  ✅ oauth_router (v4.2)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ oauth_router: {e}")
-
-# v4.3 Task Router (570개 업무 K/I/r 개인화)
-try:
-    from routers.task_router import router as task_router
-    app.include_router(task_router)
-    logger.info("  ✅ task_router (v4.3 - 570 Tasks)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ task_router: {e}")
-
-
-# v5.0 Task 570 Router (8그룹 570개 업무 + K/I/Ω 물리 엔진)
-try:
-    from routers.task_570_router import router as task_570_router
-    app.include_router(task_570_router)
-    # 570개 업무 사전 로드
-    from routers.task_570_router import load_570_tasks
-    loaded = load_570_tasks()
-    logger.info(f"  ✅ task_570_router (v5.0 - {loaded}개 업무 로드)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ task_570_router: {e}")
-
-
-# v6.0 Turnkey Router (산업별 턴키 솔루션)
-try:
-    from routers.turnkey_router import router as turnkey_router
-    app.include_router(turnkey_router)
-    logger.info("  ✅ turnkey_router (v6.0 - 산업별 턴키 솔루션)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ turnkey_router: {e}")
-
-# ─────────────────────────────────────────────────────────────
-# LangGraph Integration (v7.0 - TypeDB + Pinecone + GRPO)
-# ─────────────────────────────────────────────────────────────
-try:
-    from routers.langgraph_router import router as langgraph_router
-    app.include_router(langgraph_router)
-    logger.info("  ✅ langgraph_router (v7.0 - TypeDB + Pinecone + GRPO)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ langgraph_router: {e}")
-
-# ─────────────────────────────────────────────────────────────
-# v8.0 Self-Setup Router (AUTUS가 스스로 환경 구성)
-# ─────────────────────────────────────────────────────────────
-try:
-    from routers.setup_router import router as setup_router
-    app.include_router(setup_router)
-    logger.info("  ✅ setup_router (v8.0 - Self-Building System)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ setup_router: {e}")
-
-# ─────────────────────────────────────────────────────────────
-# v9.0 Task 1000 Generator (30모듈 × 1,000개 업무 자동 생성)
-# ─────────────────────────────────────────────────────────────
-try:
-    from routers.task_1000_router import router as task_1000_router
-    app.include_router(task_1000_router)
-    logger.info("  ✅ task_1000_router (30모듈 × 1,000 Tasks)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ task_1000_router: {e}")
-
-# ─────────────────────────────────────────────────────────────
-# v10.0 Self-Running Engine (AUTUS 자율 실행)
-# ─────────────────────────────────────────────────────────────
-try:
-    from routers.self_running_router import router as self_running_router
-    app.include_router(self_running_router)
-    logger.info("  ✅ self_running_router (v10.0 - 자율 실행 엔진)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ self_running_router: {e}")
-
-# ─────────────────────────────────────────────────────────────
-# v11.0 Real-time Streaming (SSE + Chain of Thought)
-# ─────────────────────────────────────────────────────────────
-try:
-    from routers.stream_router import router as stream_router
-    app.include_router(stream_router)
-    logger.info("  ✅ stream_router (v11.0 - 실시간 스트리밍)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ stream_router: {e}")
-
-# ─────────────────────────────────────────────────────────────
-# v12.0 Self-Evolution Feedback (자가발전 피드백 시스템)
-# ─────────────────────────────────────────────────────────────
-try:
-    from routers.feedback_router import router as feedback_router
-    app.include_router(feedback_router)
-    logger.info("  ✅ feedback_router (v12.0 - 자가발전 피드백)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ feedback_router: {e}")
-
-# ─────────────────────────────────────────────────────────────
-# v13.0 Kernel - The Stealth Standard (EP10)
-# ─────────────────────────────────────────────────────────────
-try:
-    from routers.kernel_router import router as kernel_router
-    app.include_router(kernel_router)
-    logger.info("  ✅ kernel_router (v13.0 - ABL-R + Smart Router + Proof Pack)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ kernel_router: {e}")
-
-
-# ─────────────────────────────────────────────────────────────
-# v14.0 Auto-Provisioning (외부 서비스 자동 설정)
-# ─────────────────────────────────────────────────────────────
-try:
-    from routers.provision_router import router as provision_router
-    app.include_router(provision_router)
-    logger.info("  ✅ provision_router (v14.0 - 외부 서비스 자동 설정)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ provision_router: {e}")
-
-# ─────────────────────────────────────────────────────────────
-# v14.0 Full Integration Hub (OAuth + Data Collection)
-# ─────────────────────────────────────────────────────────────
-try:
-    from routers.integration_router import router as integration_router
-    app.include_router(integration_router)
-    logger.info("  ✅ integration_router (v14.0 - OAuth 풀 연동)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ integration_router: {e}")
-
-# ─────────────────────────────────────────────────────────────
-# v14.0 Auto-Sync & AI Analysis
-# ─────────────────────────────────────────────────────────────
-try:
-    from routers.sync_router import router as sync_router
-    app.include_router(sync_router)
-    logger.info("  ✅ sync_router (v14.0 - 자동 동기화 + AI 분석)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ sync_router: {e}")
-
-# ─────────────────────────────────────────────────────────────
-# v15.0 Core Physics & Monitoring (핵심 기능 활성화)
-# ─────────────────────────────────────────────────────────────
-try:
-    from routers.v_router import router as v_router
-    app.include_router(v_router)
-    logger.info("  ✅ v_router (v15.0 - V 공식 계산 엔진)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ v_router: {e}")
-
-try:
-    from routers.monitoring_router import router as monitoring_router
-    app.include_router(monitoring_router)
-    logger.info("  ✅ monitoring_router (v15.0 - 시스템 모니터링)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ monitoring_router: {e}")
+from routers.registry import LazyRouterRegistry, LazyRouterMiddleware, declare_autus_routers
 
-try:
-    from routers.typedb_router import router as typedb_router
-    app.include_router(typedb_router)
-    logger.info("  ✅ typedb_router (v15.0 - TypeDB 통합)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ typedb_router: {e}")
-
-try:
-    from routers.automation_router import router as automation_router
-    app.include_router(automation_router)
-    logger.info("  ✅ automation_router (v15.0 - 업무 자동화)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ automation_router: {e}")
-
-# ─────────────────────────────────────────────────────────────
-# Extended API Modules (추가 API 모듈)
-# ─────────────────────────────────────────────────────────────
-for api_name in ["solution_api", "modules_api", "readonly_api"]:
-    try:
-        module = __import__(f"api.{api_name}", fromlist=[api_name])
-        _include_router_safe(app, module, api_name)
-    except ImportError:
-        pass
+LAZY_ROUTERS = os.getenv("AUTUS_LAZY_ROUTERS", "true").lower() == "true"
+ROUTER_WARMUP = os.getenv("AUTUS_ROUTER_WARMUP", "true").lower() == "true"
+ROUTER_WARMUP_DELAY = float(os.getenv("AUTUS_ROUTER_WARMUP_DELAY", "1.0"))
 
+router_registry = declare_autus_routers(LazyRouterRegistry())
+router_registry.attach(app)
 
-# Portal API (Frontend 연동)
-try:
-    from api.portal_api import router as portal_router
-    app.include_router(portal_router)
-    logger.info("  ✅ portal_api (Frontend Portal)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ portal_api: {e}")
-
-# UI Connectivity API (Component Spec)
-try:
-    from api.ui_connectivity_api import router as ui_connectivity_router
-    app.include_router(ui_connectivity_router)
-    logger.info("  ✅ ui_connectivity_api (UI Component Spec)")
-except ImportError as e:
-    logger.debug(f"  ⏭️ ui_connectivity_api: {e}")
-
-# ─────────────────────────────────────────────────────────────
-# WebSocket Routers
-# ─────────────────────────────────────────────────────────────
-
-try:
-    from websocket import ki_ws_router, ki_http_router
-    app.include_router(ki_ws_router)
-    app.include_router(ki_http_router)
-    logger.info("  ✅ ki_websocket")
-except ImportError:
-    pass
-
-logger.info("📦 라우터 등록 완료!")
+if LAZY_ROUTERS:
+    app.add_middleware(LazyRouterMiddleware, registry=router_registry)
+    logger.info(f"📦 라우터 {len(router_registry.entries)}개 지연 등록 (첫 요청 시 로드)")
+else:
+    logger.info("📦 라우터 등록 시작...")
+    router_registry.load_all()
+    logger.info("📦 라우터 등록 완료!")
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -833,9 +579,29 @@ async def metrics():
             "log_size_bytes": info.get("log_size_bytes", 0)
         }
     
+    from integrations.http_pool import get_http_pool
+    result["http_pool"] = get_http_pool().metrics()
+    
     return result
 
 
+@app.get("/metrics/http-pool", tags=["System"])
+async def http_pool_metrics():
+    """공용 HTTP 커넥션 풀 사용률 (keep-alive 재사용률, 활성/유휴 커넥션, 호스트별 요청 수)"""
+    from integrations.http_pool import get_http_pool
+    return get_http_pool().metrics()
+
+
+@app.get("/startup/profile", tags=["System"])
+async def startup_profile():
+    """콜드 스타트 프로파일 (main 임포트 시간 + 라우터 모듈별 임포트 시간)"""
+    return {
+        "main_import_ms": round(MAIN_IMPORT_MS, 2),
+        "lazy_routers": LAZY_ROUTERS,
+        **router_registry.profile(),
+    }
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Reference Endpoints
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -917,6 +683,10 @@ async def global_exception_handler(request, exc):
     )
 
 
+# main 모듈 임포트 소요 시간 (/startup/profile)
+MAIN_IMPORT_MS = (time.perf_counter() - _IMPORT_START) * 1000
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Main
 # ═══════════════════════════════════════════════════════════════════════════════
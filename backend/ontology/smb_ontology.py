@@ -10,13 +10,13 @@ Palantir Foundry 스타일 객체 모델링
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Iterable, Tuple, Union
 from enum import Enum
 from datetime import datetime
 from collections import defaultdict
+import bisect
 import json
 import uuid
-import statistics
 
 
 # ============================================================
@@ -81,6 +81,10 @@ class RelationType(Enum):
 # ============================================================
 # 2. 스키마 정의
 # ============================================================
+#
+# indexes:    {속성: "hash" | "sorted"} — 보조 인덱스 (동등 / 범위 조회)
+# aggregates: [(group_by, 집계 필드)] — 증분 유지 group-by 집계
+#             group_by 는 속성명, 속성명 튜플, 또는 None (전체 1그룹)
 
 OBJECT_SCHEMAS = {
     # 교육
@@ -89,7 +93,9 @@ OBJECT_SCHEMAS = {
         "physics": PhysicsMapping.STAKEHOLDER,
         "required": ["enrollment_date", "status"],
         "optional": ["attendance_rate", "performance_score", "monthly_fee", "payment_status"],
-        "description": "학생 객체"
+        "description": "학생 객체",
+        "indexes": {"status": "hash", "payment_status": "hash"},
+        "aggregates": [(("status", "payment_status"), "monthly_fee"), ("status", "attendance_rate")]
     },
     ObjectType.INSTRUCTOR: {
         "industry": Industry.EDUCATION,
@@ -119,21 +125,25 @@ OBJECT_SCHEMAS = {
         "physics": PhysicsMapping.FINANCIAL_HEALTH,
         "required": ["order_time", "total"],
         "optional": ["table_id", "item_count", "items", "discount", "payment_method", "status"],
-        "description": "주문 객체"
+        "description": "주문 객체",
+        "indexes": {"table_id": "hash", "status": "hash", "total": "sorted"},
+        "aggregates": [(None, "total"), ("payment_method", "total")]
     },
     ObjectType.TABLE: {
         "industry": Industry.RESTAURANT,
         "physics": PhysicsMapping.CONTROL_ENV,
         "required": ["number", "capacity"],
         "optional": ["status", "daily_turnover", "avg_spend"],
-        "description": "테이블 객체"
+        "description": "테이블 객체",
+        "aggregates": [(None, "daily_turnover")]
     },
     ObjectType.INVENTORY: {
         "industry": Industry.RESTAURANT,
         "physics": PhysicsMapping.CAPITAL_RISK,
         "required": ["name", "quantity"],
         "optional": ["unit", "unit_cost", "reorder_point", "daily_usage", "expiry_date"],
-        "description": "재고 객체"
+        "description": "재고 객체",
+        "indexes": {"quantity": "sorted"}
     },
     
     # 사우나
@@ -142,21 +152,25 @@ OBJECT_SCHEMAS = {
         "physics": PhysicsMapping.CONTROL_ENV,
         "required": ["name", "type"],
         "optional": ["capacity", "utilization_rate", "status", "maintenance_date"],
-        "description": "시설 객체"
+        "description": "시설 객체",
+        "aggregates": [(None, "utilization_rate")]
     },
     ObjectType.BOOKING: {
         "industry": Industry.SAUNA,
         "physics": PhysicsMapping.FINANCIAL_HEALTH,
         "required": ["booking_time", "guest_count"],
         "optional": ["package", "total", "status", "duration_hours"],
-        "description": "예약 객체"
+        "description": "예약 객체",
+        "indexes": {"status": "hash"},
+        "aggregates": [(None, "total"), (None, "guest_count")]
     },
     ObjectType.UTILITY: {
         "industry": Industry.SAUNA,
         "physics": PhysicsMapping.CAPITAL_RISK,
         "required": ["type", "amount"],
         "optional": ["period_start", "period_end", "unit_price"],
-        "description": "유틸리티 비용 객체"
+        "description": "유틸리티 비용 객체",
+        "aggregates": [("type", "amount")]
     },
     
     # 공통
@@ -165,7 +179,8 @@ OBJECT_SCHEMAS = {
         "physics": PhysicsMapping.FINANCIAL_HEALTH,
         "required": ["amount", "payment_date"],
         "optional": ["method", "status", "reference_id"],
-        "description": "결제 객체"
+        "description": "결제 객체",
+        "indexes": {"status": "hash"}
     },
     ObjectType.CUSTOMER: {
         "industry": None,
@@ -228,7 +243,213 @@ class Relationship:
 
 
 # ============================================================
-# 4. Ontology 엔진
+# 4. 보조 인덱스 / 증분 집계
+# ============================================================
+
+def _sort_key(value: Any) -> Optional[Tuple[int, Any]]:
+    """정렬 인덱스 키 (숫자 < 문자열), 정렬 불가 값은 None"""
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return None if value != value else (0, value)  # NaN 제외
+    if isinstance(value, str):
+        return (1, value)
+    return None
+
+
+class HashIndex:
+    """속성 동등 조회 인덱스: 값 → 객체 id (삽입 순서 유지 set)"""
+    
+    kind = "hash"
+    
+    def __init__(self, prop: str):
+        self.prop = prop
+        self.postings: Dict[Any, Dict[str, None]] = {}
+        self.unhashable: Dict[str, None] = {}  # list/dict 값 → 항상 후보
+    
+    def add(self, obj_id: str, value: Any):
+        try:
+            self.postings.setdefault(value, {})[obj_id] = None
+        except TypeError:
+            self.unhashable[obj_id] = None
+    
+    def remove(self, obj_id: str, value: Any):
+        try:
+            posting = self.postings.get(value)
+        except TypeError:
+            self.unhashable.pop(obj_id, None)
+            return
+        if posting is not None:
+            posting.pop(obj_id, None)
+            if not posting:
+                del self.postings[value]
+    
+    def lookup(self, value: Any) -> List[str]:
+        try:
+            ids = list(self.postings.get(value, ()))
+        except TypeError:
+            ids = []
+        return ids + list(self.unhashable) if self.unhashable else ids
+
+
+class SortedIndex:
+    """속성 범위 조회 인덱스: (정렬키, 객체 id) 정렬 리스트"""
+    
+    kind = "sorted"
+    
+    def __init__(self, prop: str):
+        self.prop = prop
+        self.entries: List[Tuple[Tuple[int, Any], str]] = []
+        self.unsortable: Dict[str, None] = {}
+    
+    def add(self, obj_id: str, value: Any):
+        key = _sort_key(value)
+        if key is None:
+            self.unsortable[obj_id] = None
+        else:
+            bisect.insort(self.entries, (key, obj_id))
+    
+    def remove(self, obj_id: str, value: Any):
+        key = _sort_key(value)
+        if key is None:
+            self.unsortable.pop(obj_id, None)
+            return
+        i = bisect.bisect_left(self.entries, (key, obj_id))
+        if i < len(self.entries) and self.entries[i] == (key, obj_id):
+            del self.entries[i]
+    
+    def range(self, lo: Any = None, hi: Any = None) -> List[str]:
+        """lo <= 값 <= hi (None = 무한), 숫자/문자열 각각 자기 타입끼리만 비교"""
+        rank = 1 if isinstance(lo if lo is not None else hi, str) else 0
+        start = bisect.bisect_left(self.entries, ((rank, lo),)) if lo is not None \
+            else bisect.bisect_left(self.entries, ((rank,),))
+        end = bisect.bisect_right(self.entries, ((rank, hi), "\U0010ffff")) if hi is not None \
+            else bisect.bisect_left(self.entries, ((rank + 1,),))
+        return [obj_id for _, obj_id in self.entries[start:end]]
+    
+    def lookup(self, value: Any) -> List[str]:
+        if _sort_key(value) is None:
+            # None 등 정렬 불가 값은 인덱스로 답할 수 없음 → 전체 후보
+            return [obj_id for _, obj_id in self.entries] + list(self.unsortable)
+        # bool 등 정렬 불가 값도 == 로 일치할 수 있으므로 후보에 포함
+        return self.range(value, value) + list(self.unsortable)
+
+
+GroupBy = Union[None, str, Tuple[str, ...]]
+
+
+class _Group:
+    """그룹 1개의 누적 상태"""
+    __slots__ = ("rows", "count", "sum", "values")
+    
+    def __init__(self):
+        self.rows = 0      # 그룹 내 객체 수 (값 없는 객체 포함)
+        self.count = 0     # 숫자 값 개수
+        self.sum = 0
+        self.values: List[float] = []  # 정렬 유지 (min/max 삭제 대응)
+
+
+class GroupAggregate:
+    """
+    증분 group-by 집계 (sum/count/avg/min/max)
+    
+    create/update/delete 시 해당 객체 기여분만 더하고 빼므로
+    조회 비용은 O(그룹 수).
+    """
+    
+    FUNCS = ("sum", "avg", "count", "max", "min")
+    
+    def __init__(self, group_by: GroupBy, field: str):
+        self.group_by = group_by
+        self.field = field
+        self.groups: Dict[Any, _Group] = {}
+    
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        if self.group_by is None:
+            return (self.field,)
+        if isinstance(self.group_by, str):
+            return (self.group_by, self.field)
+        return tuple(self.group_by) + (self.field,)
+    
+    def key_of(self, props: Dict[str, Any]) -> Any:
+        if self.group_by is None:
+            return "*"
+        if isinstance(self.group_by, str):
+            key = props.get(self.group_by, "unknown")
+        else:
+            key = tuple(props.get(g, "unknown") for g in self.group_by)
+        try:
+            hash(key)
+        except TypeError:
+            key = repr(key)
+        return key
+    
+    def value_of(self, props: Dict[str, Any]) -> Optional[float]:
+        value = props.get(self.field)
+        if value is None:
+            return None
+        if type(value) in (int, float):
+            return value
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return None
+    
+    def add(self, props: Dict[str, Any]):
+        key = self.key_of(props)
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = _Group()
+        group.rows += 1
+        value = self.value_of(props)
+        if value is not None:
+            group.count += 1
+            group.sum += value
+            bisect.insort(group.values, value)
+    
+    def remove(self, props: Dict[str, Any]):
+        key = self.key_of(props)
+        group = self.groups.get(key)
+        if group is None:
+            return
+        group.rows -= 1
+        value = self.value_of(props)
+        if value is not None:
+            group.count -= 1
+            group.sum -= value
+            i = bisect.bisect_left(group.values, value)
+            if i < len(group.values) and group.values[i] == value:
+                del group.values[i]
+        if group.rows <= 0:
+            del self.groups[key]
+    
+    def result(self, agg_func: str = "sum") -> Dict[Any, Any]:
+        """값이 하나 이상인 그룹만 (기존 aggregate 와 동일)"""
+        if agg_func not in self.FUNCS:
+            return {}
+        out = {}
+        for key, g in self.groups.items():
+            if not g.count:
+                continue
+            if agg_func == "sum":
+                out[key] = g.sum
+            elif agg_func == "avg":
+                out[key] = g.sum / g.count
+            elif agg_func == "count":
+                out[key] = g.count
+            elif agg_func == "max":
+                out[key] = g.values[-1]
+            elif agg_func == "min":
+                out[key] = g.values[0]
+        return out
+    
+    def group(self, key: Any = "*") -> _Group:
+        return self.groups.get(key) or _Group()
+
+
+# ============================================================
+# 5. Ontology 엔진
 # ============================================================
 
 class OntologyEngine:
@@ -245,9 +466,64 @@ class OntologyEngine:
         self.objects: Dict[str, CoreObject] = {}
         self.relationships: Dict[str, Relationship] = {}
         
-        # 인덱스
-        self._type_index: Dict[ObjectType, List[str]] = defaultdict(list)
+        # 인덱스 (dict 를 삽입 순서 유지 set 으로 사용 → O(1) 삭제)
+        self._type_index: Dict[ObjectType, Dict[str, None]] = defaultdict(dict)
         self._relation_index: Dict[str, List[str]] = defaultdict(list)
+        self._seq: Dict[str, int] = {}
+        self._next_seq = 0
+        
+        # 보조 인덱스 / 증분 집계 (스키마 선언분 + create_index / aggregate 로 추가)
+        self._prop_indexes: Dict[ObjectType, Dict[str, Union[HashIndex, SortedIndex]]] = defaultdict(dict)
+        self._aggregates: Dict[ObjectType, Dict[Tuple[GroupBy, str], GroupAggregate]] = defaultdict(dict)
+        for object_type, schema in OBJECT_SCHEMAS.items():
+            for prop, kind in schema.get("indexes", {}).items():
+                self.create_index(object_type, prop, kind)
+            for group_by, agg_field in schema.get("aggregates", []):
+                self.create_aggregate(object_type, group_by, agg_field)
+    
+    # ─────────────────────────────────────────
+    # 인덱스 / 집계 선언
+    # ─────────────────────────────────────────
+    
+    def create_index(self, object_type: ObjectType, prop: str, kind: str = "hash"):
+        """보조 인덱스 선언 (기존 객체로 즉시 빌드)"""
+        if kind not in ("hash", "sorted"):
+            raise ValueError(f"Unknown index kind: {kind}")
+        index = HashIndex(prop) if kind == "hash" else SortedIndex(prop)
+        for obj_id in self._type_index.get(object_type, ()):
+            index.add(obj_id, self.objects[obj_id].properties.get(prop))
+        self._prop_indexes[object_type][prop] = index
+        return index
+    
+    def create_aggregate(self, object_type: ObjectType, group_by: GroupBy, agg_field: str) -> GroupAggregate:
+        """증분 집계 선언 (이미 있으면 그대로 반환)"""
+        if isinstance(group_by, list):
+            group_by = tuple(group_by)
+        key = (group_by, agg_field)
+        agg = self._aggregates[object_type].get(key)
+        if agg is None:
+            agg = GroupAggregate(group_by, agg_field)
+            for obj_id in self._type_index.get(object_type, ()):
+                agg.add(self.objects[obj_id].properties)
+            self._aggregates[object_type][key] = agg
+        return agg
+    
+    def _index_add(self, obj: CoreObject):
+        for prop, index in self._prop_indexes.get(obj.object_type, {}).items():
+            index.add(obj.id, obj.properties.get(prop))
+        for agg in self._aggregates.get(obj.object_type, {}).values():
+            agg.add(obj.properties)
+    
+    def _index_remove(self, obj: CoreObject, props: Dict[str, Any] = None):
+        props = obj.properties if props is None else props
+        for prop, index in self._prop_indexes.get(obj.object_type, {}).items():
+            index.remove(obj.id, props.get(prop))
+        for agg in self._aggregates.get(obj.object_type, {}).values():
+            agg.remove(props)
+    
+    # ─────────────────────────────────────────
+    # 객체 CRUD
+    # ─────────────────────────────────────────
     
     def create_object(
         self,
@@ -258,6 +534,10 @@ class OntologyEngine:
         """객체 생성"""
         obj_id = object_id or f"{object_type.value}_{uuid.uuid4().hex[:8]}"
         
+        # 같은 id 재생성 시 기존 기여분 제거
+        if obj_id in self.objects:
+            self.delete_object(obj_id)
+        
         # 스키마 검증
         schema = OBJECT_SCHEMAS.get(object_type, {})
         required = schema.get("required", [])
@@ -279,7 +559,10 @@ class OntologyEngine:
         
         # 저장
         self.objects[obj_id] = obj
-        self._type_index[object_type].append(obj_id)
+        self._type_index[object_type][obj_id] = None
+        self._seq[obj_id] = self._next_seq
+        self._next_seq += 1
+        self._index_add(obj)
         
         return obj
     
@@ -288,10 +571,16 @@ class OntologyEngine:
         return self.objects.get(object_id)
     
     def update_object(self, object_id: str, properties: Dict[str, Any]) -> Optional[CoreObject]:
-        """객체 업데이트"""
+        """
+        객체 업데이트
+        
+        인덱스/집계는 이 경로로만 갱신된다 (obj.properties 를 직접 수정하지 말 것).
+        """
         obj = self.objects.get(object_id)
         if obj:
+            old = dict(obj.properties)
             obj.update(properties)
+            self._reindex(obj, old, properties.keys())
             # Physics 재계산
             schema = OBJECT_SCHEMAS.get(obj.object_type, {})
             physics = schema.get("physics")
@@ -299,12 +588,26 @@ class OntologyEngine:
                 obj.physics_values[physics.value] = self._calculate_physics_value(obj)
         return obj
     
+    def _reindex(self, obj: CoreObject, old: Dict[str, Any], changed: Iterable[str]):
+        """변경된 속성에 걸린 인덱스/집계만 이전 값 제거 → 새 값 추가"""
+        changed = set(changed)
+        for prop, index in self._prop_indexes.get(obj.object_type, {}).items():
+            if prop in changed:
+                index.remove(obj.id, old.get(prop))
+                index.add(obj.id, obj.properties.get(prop))
+        for agg in self._aggregates.get(obj.object_type, {}).values():
+            if changed.intersection(agg.fields):
+                agg.remove(old)
+                agg.add(obj.properties)
+    
     def delete_object(self, object_id: str) -> bool:
         """객체 삭제"""
         obj = self.objects.get(object_id)
         if obj:
             del self.objects[object_id]
-            self._type_index[obj.object_type].remove(object_id)
+            self._type_index[obj.object_type].pop(object_id, None)
+            self._seq.pop(object_id, None)
+            self._index_remove(obj)
             return True
         return False
     
@@ -338,32 +641,70 @@ class OntologyEngine:
         self,
         object_type: ObjectType = None,
         filters: Dict[str, Any] = None,
-        limit: int = 100
+        limit: Optional[int] = 100
     ) -> List[CoreObject]:
-        """쿼리"""
-        results = []
+        """
+        쿼리 (limit=None 이면 전체)
         
+        타입 + 동등 필터에 보조 인덱스가 있으면 가장 작은 posting 만 후보로 검증.
+        결과 순서는 생성 순서.
+        """
         # 타입 필터
         if object_type:
-            obj_ids = self._type_index.get(object_type, [])
-            candidates = [self.objects[oid] for oid in obj_ids if oid in self.objects]
+            candidate_ids: Iterable[str] = self._type_index.get(object_type, {})
+            indexes = self._prop_indexes.get(object_type, {})
+            if filters:
+                postings = [
+                    indexes[key].lookup(value)
+                    for key, value in filters.items() if key in indexes
+                ]
+                if postings:
+                    best = min(postings, key=len)
+                    candidate_ids = sorted(best, key=self._seq.__getitem__)
+            candidates = [self.objects[oid] for oid in candidate_ids if oid in self.objects]
         else:
             candidates = list(self.objects.values())
         
         # 속성 필터
         if filters:
-            for obj in candidates:
-                match = True
-                for key, value in filters.items():
-                    if obj.properties.get(key) != value:
-                        match = False
-                        break
-                if match:
-                    results.append(obj)
+            items = list(filters.items())
+            results = [
+                obj for obj in candidates
+                if all(obj.properties.get(key) == value for key, value in items)
+            ]
         else:
             results = candidates
         
-        return results[:limit]
+        return results if limit is None else results[:limit]
+    
+    def range_query(
+        self,
+        object_type: ObjectType,
+        prop: str,
+        lo: Any = None,
+        hi: Any = None,
+        limit: Optional[int] = None
+    ) -> List[CoreObject]:
+        """lo <= prop <= hi 범위 조회 (sorted 인덱스 없으면 스캔), 값 오름차순"""
+        index = self._prop_indexes.get(object_type, {}).get(prop)
+        if isinstance(index, SortedIndex):
+            ids = index.range(lo, hi)
+            results = [self.objects[oid] for oid in ids]
+        else:
+            matched = []
+            for oid in self._type_index.get(object_type, {}):
+                obj = self.objects[oid]
+                key = _sort_key(obj.properties.get(prop))
+                if key is None:
+                    continue
+                bound = _sort_key(lo if lo is not None else hi)
+                if bound is not None and key[0] != bound[0]:
+                    continue
+                value = key[1]
+                if (lo is None or value >= lo) and (hi is None or value <= hi):
+                    matched.append((key, oid))
+            results = [self.objects[oid] for _, oid in sorted(matched)]
+        return results if limit is None else results[:limit]
     
     def aggregate(
         self,
@@ -372,35 +713,13 @@ class OntologyEngine:
         agg_field: str,
         agg_func: str = "sum"
     ) -> Dict[str, Any]:
-        """집계"""
-        objects = self.query(object_type=object_type)
+        """
+        집계 (전체 객체 대상)
         
-        groups = defaultdict(list)
-        for obj in objects:
-            key = obj.properties.get(group_by, "unknown")
-            value = obj.properties.get(agg_field)
-            if value is not None:
-                try:
-                    groups[key].append(float(value))
-                except (ValueError, TypeError):
-                    pass
-        
-        result = {}
-        for key, values in groups.items():
-            if not values:
-                continue
-            if agg_func == "sum":
-                result[key] = sum(values)
-            elif agg_func == "avg":
-                result[key] = statistics.mean(values)
-            elif agg_func == "count":
-                result[key] = len(values)
-            elif agg_func == "max":
-                result[key] = max(values)
-            elif agg_func == "min":
-                result[key] = min(values)
-        
-        return result
+        (group_by, agg_field) 조합은 첫 호출 시 증분 집계로 등록되고,
+        이후 호출은 O(그룹 수).
+        """
+        return self.create_aggregate(object_type, group_by, agg_field).result(agg_func)
     
     def calculate_kpis(self, industry: Industry) -> Dict[str, Any]:
         """업종별 KPI 계산"""
@@ -412,78 +731,69 @@ class OntologyEngine:
             return self._calculate_sauna_kpis()
         return {}
     
+    def _count(self, object_type: ObjectType) -> int:
+        return len(self._type_index.get(object_type, ()))
+    
     def _calculate_education_kpis(self) -> Dict[str, Any]:
         """교육 KPI"""
-        students = self.query(object_type=ObjectType.STUDENT)
-        courses = self.query(object_type=ObjectType.COURSE)
+        by_status = self.create_aggregate(ObjectType.STUDENT, "status", "attendance_rate")
+        fees = self.create_aggregate(ObjectType.STUDENT, ("status", "payment_status"), "monthly_fee")
         
-        active_students = [s for s in students if s.properties.get("status") == "active"]
+        active = by_status.group("active")
+        total_revenue = fees.group(("active", "paid")).sum
         
-        total_revenue = sum(
-            s.properties.get("monthly_fee", 0) 
-            for s in active_students 
-            if s.properties.get("payment_status") == "paid"
-        )
-        
-        avg_attendance = statistics.mean([
-            s.properties.get("attendance_rate", 0) 
-            for s in active_students
-        ]) if active_students else 0
+        # 출석률 없는 학생은 0 으로 평균
+        avg_attendance = active.sum / active.rows if active.rows else 0
         
         return {
-            "total_students": len(students),
-            "active_students": len(active_students),
+            "total_students": self._count(ObjectType.STUDENT),
+            "active_students": active.rows,
             "monthly_revenue": total_revenue,
             "avg_attendance": round(avg_attendance, 1),
-            "course_count": len(courses)
+            "course_count": self._count(ObjectType.COURSE)
         }
     
     def _calculate_restaurant_kpis(self) -> Dict[str, Any]:
         """음식점 KPI"""
-        orders = self.query(object_type=ObjectType.ORDER)
-        menus = self.query(object_type=ObjectType.MENU)
-        tables = self.query(object_type=ObjectType.TABLE)
+        totals = self.create_aggregate(ObjectType.ORDER, None, "total").group()
+        turnover = self.create_aggregate(ObjectType.TABLE, None, "daily_turnover").group()
         
-        total_sales = sum(o.properties.get("total", 0) for o in orders)
-        order_count = len(orders)
+        total_sales = totals.sum
+        order_count = self._count(ObjectType.ORDER)
         avg_order = total_sales / order_count if order_count > 0 else 0
         
         # 테이블 회전율
-        avg_turnover = statistics.mean([
-            t.properties.get("daily_turnover", 0) for t in tables
-        ]) if tables else 0
+        table_count = self._count(ObjectType.TABLE)
+        avg_turnover = turnover.sum / table_count if table_count else 0
         
         return {
             "total_sales": total_sales,
             "order_count": order_count,
             "avg_order_value": round(avg_order),
-            "menu_count": len(menus),
-            "table_count": len(tables),
+            "menu_count": self._count(ObjectType.MENU),
+            "table_count": table_count,
             "avg_turnover": round(avg_turnover, 1)
         }
     
     def _calculate_sauna_kpis(self) -> Dict[str, Any]:
         """사우나 KPI"""
-        bookings = self.query(object_type=ObjectType.BOOKING)
-        facilities = self.query(object_type=ObjectType.FACILITY)
-        utilities = self.query(object_type=ObjectType.UTILITY)
-        
-        total_revenue = sum(b.properties.get("total", 0) for b in bookings)
-        total_guests = sum(b.properties.get("guest_count", 0) for b in bookings)
-        
-        avg_utilization = statistics.mean([
-            f.properties.get("utilization_rate", 0) for f in facilities
-        ]) if facilities else 0
+        revenue = self.create_aggregate(ObjectType.BOOKING, None, "total").group()
+        guests = self.create_aggregate(ObjectType.BOOKING, None, "guest_count").group()
+        utilization = self.create_aggregate(ObjectType.FACILITY, None, "utilization_rate").group()
+        utility_cost = sum(
+            g.sum for g in self.create_aggregate(ObjectType.UTILITY, "type", "amount").groups.values()
+        )
         
-        total_utility_cost = sum(u.properties.get("amount", 0) for u in utilities)
+        facility_count = self._count(ObjectType.FACILITY)
+        avg_utilization = utilization.sum / facility_count if facility_count else 0
         
         return {
-            "total_revenue": total_revenue,
-            "total_guests": total_guests,
-            "booking_count": len(bookings),
+            "total_revenue": revenue.sum,
+            "total_guests": guests.sum,
+            "booking_count": self._count(ObjectType.BOOKING),
             "avg_utilization": round(avg_utilization, 1),
-            "facility_count": len(facilities),
-            "utility_cost": total_utility_cost
+            "facility_count": facility_count,
+            "utility_cost": utility_cost
         }
     
     def _calculate_physics_value(self, obj: CoreObject) -> float:
@@ -508,9 +818,7 @@ class OntologyEngine:
     
     def summary(self) -> Dict[str, Any]:
         """요약"""
-        by_type = defaultdict(int)
-        for obj in self.objects.values():
-            by_type[obj.object_type.value] += 1
+        by_type = {t.value: len(ids) for t, ids in self._type_index.items() if ids}
         
         return {
             "total_objects": len(self.objects),
@@ -17,14 +17,15 @@ AUTUS 적용:
 - 모든 초기 조건 (타입, 상수, 지수, 네트워크)을 반영
 - 결정론적 미래 V 계산
 - 불확정성 구간으로 양자역학 존중 (±10~20%)
+- 네트워크 Relations: 13×145 사전 계산 테이블 (그래프 생성 없음)
+- summon_many: 수천 명의 결정을 한 번에 계산
 
 ═══════════════════════════════════════════════════════════════════════════════
 """
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Sequence
 from enum import Enum
 import math
-import random
 from datetime import datetime
 
 
@@ -97,6 +98,55 @@ class ExponentialGrowth:
         return self.apply_to_relations(base_s)
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# 1-12-144 Relations 테이블
+# ═══════════════════════════════════════════════════════════════════════════════
+
+CORE_MAX = 12
+EXTENDED_MAX = 144
+
+
+def _relations_closed_form(core_12: int, extended_144: int) -> float:
+    """
+    build_graph() 그래프의 nx.average_degree_connectivity(G)[1] / 144 닫힌 형태
+    
+    확장 e 명을 핵심 c 명에게 라운드로빈 배분 → 핵심 i 의 확장 수 k_i ∈ {q, q+1}
+    (q, r = divmod(e, c)). 차수 1 노드의 평균 이웃 차수:
+    - 확장 노드: 이웃 = 핵심 i (차수 1 + k_i)
+    - 확장이 없는 핵심 멤버 (q == 0): 이웃 = 자신 (차수 c)
+    - c == 1 이면 자신도 차수 1: 이웃 = 핵심 1 (차수 1 + e)
+    차수 1 노드가 없으면 (c == 0) 밀도 fallback
+    """
+    c, e = core_12, extended_144
+    if c <= 0:
+        return min(1.0, e / (CORE_MAX + EXTENDED_MAX) * 0.5)
+    
+    q, r = divmod(e, c)
+    total = r * (q + 1) * (q + 2) + (c - r) * q * (q + 1)
+    count = e
+    if q == 0:
+        total += (c - r) * c
+        count += c - r
+    if c == 1:
+        total += 1 + e
+        count += 1
+    return total / count / 144
+
+
+# RELATIONS_TABLE[core_12][extended_144]
+RELATIONS_TABLE: List[List[float]] = [
+    [_relations_closed_form(c, e) for e in range(EXTENDED_MAX + 1)]
+    for c in range(CORE_MAX + 1)
+]
+
+
+def network_relations(core_12: int, extended_144: int) -> float:
+    """(핵심, 확장) 연결 수 → Relations (범위 밖은 0~12 / 0~144 로 절단)"""
+    c = max(0, min(CORE_MAX, int(core_12)))
+    e = max(0, min(EXTENDED_MAX, int(extended_144)))
+    return RELATIONS_TABLE[c][e]
+
+
 @dataclass
 class Network1_12_144:
     """1-12-144 네트워크 구조"""
@@ -119,12 +169,10 @@ class Network1_12_144:
         for i in range(1, self.core_12 + 1):
             G.add_edge(0, i)
         
-        # 확장 144명 (핵심 12명 중 랜덤 연결)
+        # 확장 144명 (핵심 멤버에 라운드로빈 배분 — RELATIONS_TABLE 과 동일한 구조)
         if self.core_12 > 0:
-            for i in range(self.core_12 + 1, self.core_12 + self.extended_144 + 1):
-                # 랜덤으로 핵심 멤버에 연결
-                random_core = random.randint(1, max(1, self.core_12))
-                G.add_edge(random_core, i)
+            for n, i in enumerate(range(self.core_12 + 1, self.core_12 + self.extended_144 + 1)):
+                G.add_edge(1 + n % self.core_12, i)
         
         self._graph = G
         return G
@@ -133,23 +181,10 @@ class Network1_12_144:
         """
         네트워크 밀도 기반 Relations 계산 (v2.3)
         
+        사전 계산 테이블 조회 (그래프 생성 없음, 결정론적).
         실제 AUTUS에서는 Ledger 상호작용 데이터로 대체 가능
         """
-        if NETWORKX_AVAILABLE and self._graph is None:
-            self.build_graph()
-        
-        if NETWORKX_AVAILABLE and self._graph is not None:
-            try:
-                connectivity = nx.average_degree_connectivity(self._graph)
-                if 1 in connectivity:
-                    return connectivity[1] / 144
-            except:
-                pass
-        
-        # Fallback: 간단한 밀도 계산
-        total_connections = self.core_12 + self.extended_144
-        max_connections = 12 + 144
-        return min(1.0, total_connections / max_connections * 0.5)
+        return network_relations(self.core_12, self.extended_144)
     
     def calculate_synergy(self) -> float:
         """[Legacy] Synergy 계산 → calculate_relations"""
@@ -195,7 +230,7 @@ class DemonPrediction:
         return {
             "V": round(self.V, 2),
             "V_range": [round(self.V_lower, 2), round(self.V_upper, 2)],
-            "uncertainty": f"±{round((self.V_upper - self.V_lower) / 2 / self.V * 100, 1)}%",
+            "uncertainty": f"±{round((self.V_upper - self.V_lower) / 2 / self.V * 100, 1)}%" if self.V else "N/A",
             "adjusted_relations": round(self.adjusted_relations, 4),
             "adjusted_s": round(self.adjusted_relations, 4),  # Legacy
             "type_factor": self.type_factor,
@@ -404,6 +439,27 @@ class LaplaceDemon:
 # 편의 함수
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def _user_type(user_type: str) -> UserType:
+    try:
+        return UserType(user_type)
+    except ValueError:
+        return UserType.BALANCED
+
+
+def _to_decisions(decisions: Optional[List[Dict]]) -> List[Decision]:
+    """결정 변환 (v2.3 + Legacy 지원), 비어 있으면 기본 결정"""
+    decision_list = [
+        Decision(
+            motions=d.get("motions", d.get("M", 0)),
+            threats=d.get("threats", d.get("T", 0)),
+            t=d.get("t", 12),
+            label=d.get("label", f"Decision {i+1}")
+        )
+        for i, d in enumerate(decisions or [])
+    ]
+    return decision_list or [Decision(motions=100, threats=40, t=12, label="기본 결정")]
+
+
 def summon_demon(
     user_type: str = "balanced",
     age: int = 30,
@@ -428,34 +484,16 @@ def summon_demon(
             ]
         )
     """
-    # 타입 변환
-    try:
-        user_type_enum = UserType(user_type)
-    except ValueError:
-        user_type_enum = UserType.BALANCED
-    
     # 악마 생성
     demon = LaplaceDemon(
-        user_type=user_type_enum,
+        user_type=_user_type(user_type),
         constants=Constants(age=age, location_factor=location_factor),
         exponential=ExponentialGrowth(growth_rate=growth_rate),
         network=Network1_12_144(core_12=core_12, extended_144=extended_144),
         uncertainty=uncertainty
     )
     
-    # 결정 변환 (v2.3 + Legacy 지원)
-    decision_list = [
-        Decision(
-            motions=d.get("motions", d.get("M", 0)),
-            threats=d.get("threats", d.get("T", 0)),
-            t=d.get("t", 12),
-            label=d.get("label", f"Decision {i+1}")
-        )
-        for i, d in enumerate(decisions or [])
-    ]
-    
-    if not decision_list:
-        decision_list = [Decision(motions=100, threats=40, t=12, label="기본 결정")]
+    decision_list = _to_decisions(decisions)
     
     # 예측
     predictions = demon.summon(decision_list)
@@ -474,6 +512,81 @@ def summon_demon(
     }
 
 
+def summon_many(
+    profiles: Sequence[Dict[str, Any]],
+    uncertainty: float = 0.15,
+    base: float = 1.0
+) -> List[List[Dict[str, Any]]]:
+    """
+    여러 사용자의 결정을 한 번에 예측 (벌크 소환)
+    
+    profiles 의 각 항목은 summon_demon 과 같은 키
+    (user_type, age, location_factor, growth_rate, core_12, extended_144,
+    decisions, uncertainty) — 누락 키는 summon_demon 기본값.
+    모든 결정을 평탄화해 V 를 식 1회로 계산 (LaplaceDemon.summon 과 같은 결과).
+    
+    Returns:
+        사용자별 예측 리스트 (DemonPrediction.to_dict 형식)
+    """
+    interaction_exp = ExponentialGrowth().interaction_exponent
+    
+    decisions: List[Decision] = []
+    owners: List[int] = []
+    motions, threats, months = [], [], []
+    relations, scale, spread = [], [], []
+    factors = []
+    
+    for n, profile in enumerate(profiles):
+        type_factor = TYPE_MULTIPLIERS[_user_type(profile.get("user_type", "balanced"))]
+        constant_adj = Constants(
+            age=profile.get("age", 30),
+            location_factor=profile.get("location_factor", 0.8)
+        ).calculate_adjustment()
+        exponential = ExponentialGrowth(growth_rate=profile.get("growth_rate", 0.05))
+        adjusted_relations = min(1.0, exponential.apply_to_relations(
+            network_relations(profile.get("core_12", 5), profile.get("extended_144", 20))
+        ))
+        user_uncertainty = profile.get("uncertainty", uncertainty)
+        factors.append((adjusted_relations, type_factor, constant_adj))
+        
+        for decision in _to_decisions(profile.get("decisions")):
+            decisions.append(decision)
+            owners.append(n)
+            motions.append(decision.motions)
+            threats.append(decision.threats)
+            months.append(decision.t)
+            relations.append(adjusted_relations)
+            scale.append(base * type_factor * constant_adj)
+            spread.append(user_uncertainty)
+    
+    if NUMPY_AVAILABLE:
+        V = (
+            (np.asarray(motions, dtype=float) - np.asarray(threats, dtype=float))
+            * (1 + interaction_exp * np.asarray(relations)) ** np.asarray(months, dtype=float)
+            * np.asarray(scale)
+        ).tolist()
+    else:
+        V = [
+            (m - t) * (1 + interaction_exp * r) ** month * k
+            for m, t, r, month, k in zip(motions, threats, relations, months, scale)
+        ]
+    
+    results: List[List[Dict[str, Any]]] = [[] for _ in profiles]
+    for decision, owner, v, u in zip(decisions, owners, V, spread):
+        adjusted_relations, type_factor, constant_adj = factors[owner]
+        results[owner].append(DemonPrediction(
+            V=v,
+            V_lower=v * (1 - u),
+            V_upper=v * (1 + u),
+            adjusted_relations=adjusted_relations,
+            type_factor=type_factor,
+            constant_adj=constant_adj,
+            decision=decision
+        ).to_dict())
+    
+    return results
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # 테스트
 # ═══════════════════════════════════════════════════════════════════════════════
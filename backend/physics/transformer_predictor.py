@@ -18,6 +18,13 @@ Transformer 기반 V 공식 장기 예측:
 from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple, Any
 import math
+import os
+
+# 동시 예측 요청 마이크로 배칭
+INFER_MAX_BATCH = int(os.getenv("V_INFER_MAX_BATCH", "32"))
+INFER_MAX_WAIT_MS = float(os.getenv("V_INFER_MAX_WAIT_MS", "5"))
+INFER_WORKERS = int(os.getenv("V_INFER_WORKERS", "1"))         # 추론 전용 스레드 수
+INFER_TORCH_THREADS = int(os.getenv("V_INFER_TORCH_THREADS", "0"))  # torch intra-op 스레드 (0 = 기본값)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 의존성 체크
@@ -353,7 +360,8 @@ class VTransformerPredictor:
     """
     V 예측용 Transformer Wrapper
     
-    AUTUS 통합용
+    AUTUS 통합용. API 경로는 predict_async → MicroBatcher 로 동시 요청을
+    한 텐서로 묶어 forward 1회 (전용 스레드, inference_mode).
     """
     
     def __init__(
@@ -369,6 +377,7 @@ class VTransformerPredictor:
         self.input_dim = input_dim
         self.model = None
         self.trained = False
+        self._batcher = None  # core.microbatch.MicroBatcher (첫 predict_async 때 생성)
         
         if TORCH_AVAILABLE:
             if model_type == "patchtst":
@@ -393,51 +402,150 @@ class VTransformerPredictor:
         X: List[List[List[float]]],  # (samples, seq_len, features)
         y: List[List[List[float]]],  # (samples, pred_len, features)
         epochs: int = 100,
-        lr: float = 0.001
+        lr: float = 0.001,
+        batch_size: int = 32,
+        val_fraction: float = 0.2,
+        patience: int = 10,
     ) -> Dict[str, Any]:
-        """Transformer 학습"""
+        """Transformer 학습 (미니배치, 시간순 holdout 조기 종료)"""
         
         if not TORCH_AVAILABLE:
             return {"error": "PyTorch 미설치"}
         
-        X_tensor = torch.tensor(X, dtype=torch.float32)
-        y_tensor = torch.tensor(y, dtype=torch.float32)
-        
-        optimizer = torch.optim.Adam(self.model.parameters(), lr=lr)
-        criterion = nn.MSELoss()
+        from .v_training import fit_model, holdout_loaders, sample_dataset
         
-        self.model.train()
-        losses = []
-        
-        for epoch in range(epochs):
-            optimizer.zero_grad()
-            pred = self.model(X_tensor)
-            loss = criterion(pred, y_tensor)
-            loss.backward()
-            optimizer.step()
-            losses.append(loss.item())
+        dataset = sample_dataset(X, y)
+        train_loader, val_loader = holdout_loaders(dataset, batch_size, val_fraction)
+        result = fit_model(
+            self.model, lambda model, batch: model(batch), train_loader, val_loader,
+            epochs=epochs, lr=lr, patience=patience,
+        )
         
         self.trained = True
         
         return {
             "model_type": self.model_type,
-            "final_loss": round(losses[-1], 6),
-            "epochs": epochs,
+            "final_loss": result["train_loss"],
+            "val_loss": result["val_loss"],
+            "epochs": result["epochs_run"],
+            "best_epoch": result["best_epoch"],
+            "stopped_early": result["stopped_early"],
             "samples": len(X)
         }
     
+    @property
+    def checkpoint_name(self) -> str:
+        return f"v_transformer_{self.model_type}"
+    
+    def save(self, store=None) -> int:
+        """체크포인트 저장 (state_dict + 모델 구성 메타데이터)"""
+        from .v_training import get_checkpoint_store
+        
+        store = store or get_checkpoint_store()
+        return store.save(self.checkpoint_name, {
+            "model_type": self.model_type,
+            "seq_len": self.seq_len,
+            "pred_len": self.pred_len,
+            "input_dim": self.input_dim,
+        }, self.model.state_dict())
+    
+    @classmethod
+    def from_checkpoint(cls, model_type: str, store=None) -> Optional["VTransformerPredictor"]:
+        """최신 체크포인트로 예측기 구성 (없으면 None)"""
+        if not TORCH_AVAILABLE:
+            return None
+        from .v_training import get_checkpoint_store
+        
+        store = store or get_checkpoint_store()
+        loaded = store.load(f"v_transformer_{model_type}")
+        if loaded is None:
+            return None
+        meta, state = loaded
+        predictor = cls(
+            model_type=model_type,
+            seq_len=meta["seq_len"],
+            pred_len=meta["pred_len"],
+            input_dim=meta["input_dim"],
+        )
+        predictor.model.load_state_dict(state)
+        predictor.model.eval()
+        predictor.trained = True
+        return predictor
+    
     def predict(self, X: List[List[float]]) -> Dict[str, Any]:
         """미래 V 예측"""
+        return self.predict_batch([X])[0]
+    
+    def predict_batch(self, sequences: List[List[List[float]]]) -> List[Dict[str, Any]]:
+        """
+        여러 시퀀스 일괄 예측 (길이가 같은 시퀀스끼리 한 텐서로 forward 1회)
         
+        형태가 잘못된 항목은 그 항목만 {"error": ...}. 그룹 forward 가 실패하면
+        그룹 안에서 건별로 재시도해 한 요청이 마이크로 배치 전체를 깨지 않게 함.
+        """
         if not TORCH_AVAILABLE or not self.trained:
-            return {"error": "학습 필요 또는 PyTorch 미설치"}
+            return [{"error": "학습 필요 또는 PyTorch 미설치"} for _ in sequences]
         
-        self.model.eval()
-        with torch.no_grad():
-            X_tensor = torch.tensor([X], dtype=torch.float32)
-            pred = self.model(X_tensor)
-            pred = pred.squeeze(0).numpy().tolist()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(sequences)
+        groups: Dict[int, List[int]] = {}
+        for i, seq in enumerate(sequences):
+            error = self._shape_error(seq)
+            if error:
+                results[i] = {"error": error}
+            else:
+                groups.setdefault(len(seq), []).append(i)
         
+        self.model.eval()
+        with torch.inference_mode():
+            for positions in groups.values():
+                try:
+                    preds = self._forward([sequences[i] for i in positions])
+                except Exception:
+                    for i in positions:
+                        try:
+                            results[i] = self._format(self._forward([sequences[i]])[0])
+                        except Exception as e:
+                            results[i] = {"error": f"예측 실패: {e}"}
+                    continue
+                for i, pred in zip(positions, preds):
+                    results[i] = self._format(pred)
+        return results
+    
+    def _forward(self, sequences: List[List[List[float]]]) -> List[List[List[float]]]:
+        X_tensor = torch.tensor(sequences, dtype=torch.float32)
+        return self.model(X_tensor).tolist()
+    
+    def _shape_error(self, seq: Any) -> Optional[str]:
+        """(seq_len, input_dim) 형태 검증 — vanilla 는 길이 자유, PatchTST 는 seq_len 고정"""
+        if not isinstance(seq, (list, tuple)) or not seq:
+            return "입력 형태 오류: 빈 시퀀스"
+        if any(not isinstance(step, (list, tuple)) or len(step) != self.input_dim for step in seq):
+            return f"입력 형태 오류: 각 시점은 {self.input_dim}개 특성 필요"
+        if self.model_type == "patchtst" and len(seq) != self.seq_len:
+            return f"입력 형태 오류: 시퀀스 길이 {self.seq_len} 필요 (입력 {len(seq)})"
+        return None
+    
+    async def predict_async(self, X: List[List[float]]) -> Dict[str, Any]:
+        """동시 요청 마이크로 배칭 예측 (API 경로)"""
+        return await self.batcher.submit(X)
+    
+    @property
+    def batcher(self):
+        if self._batcher is None:
+            from core.microbatch import MicroBatcher
+            
+            if TORCH_AVAILABLE and INFER_TORCH_THREADS > 0:
+                torch.set_num_threads(INFER_TORCH_THREADS)
+            self._batcher = MicroBatcher(
+                self.predict_batch,
+                max_batch=INFER_MAX_BATCH,
+                max_wait_ms=INFER_MAX_WAIT_MS,
+                workers=INFER_WORKERS,
+                name="v-transformer",
+            )
+        return self._batcher
+    
+    def _format(self, pred: List[List[float]]) -> Dict[str, Any]:
         # V만 추출 (첫 번째 채널 또는 계산)
         v_predictions = []
         for step in pred:
@@ -467,10 +575,49 @@ def get_transformer_predictor(model_type: str = "patchtst") -> VTransformerPredi
     """Transformer 예측기 싱글톤"""
     global _transformer_predictor
     if _transformer_predictor is None or _transformer_predictor.model_type != model_type:
-        _transformer_predictor = VTransformerPredictor(model_type=model_type)
+        if _transformer_predictor is not None and _transformer_predictor._batcher is not None:
+            _transformer_predictor._batcher.close()
+        # 최신 체크포인트가 있으면 파일 로드, 없으면 미학습 모델
+        try:
+            _transformer_predictor = VTransformerPredictor.from_checkpoint(model_type)
+        except Exception as e:
+            print(f"⚠️ Transformer 체크포인트 로드 실패 - 학습 필요: {e}")
+            _transformer_predictor = None
+        if _transformer_predictor is None:
+            _transformer_predictor = VTransformerPredictor(model_type=model_type)
     return _transformer_predictor
 
 
+def benchmark_batched_inference(
+    model_type: str = "patchtst",
+    concurrency_levels: Tuple[int, ...] = (1, 2, 4, 8, 16, 32, 64, 128, 256),
+    requests: int = 512,
+    max_batch: int = INFER_MAX_BATCH,
+    max_wait_ms: float = INFER_MAX_WAIT_MS,
+) -> List[Dict[str, Any]]:
+    """CPU 처리량 / 지연: 동시성 1–256, 단건 forward vs 마이크로 배치"""
+    import asyncio
+    import random
+    from core.microbatch import run_batching_benchmark
+    
+    predictor = VTransformerPredictor(model_type=model_type)
+    predictor.trained = True  # 가중치 값은 처리량과 무관
+    rng = random.Random(0)
+    samples = [
+        [[rng.uniform(0, 100), rng.uniform(0, 50), rng.uniform(0, 1), rng.uniform(0, 1)] for _ in range(predictor.seq_len)]
+        for _ in range(64)
+    ]
+    return asyncio.run(run_batching_benchmark(
+        predictor.predict_batch,
+        lambda n: samples[n % len(samples)],
+        concurrency_levels=concurrency_levels,
+        requests=requests,
+        max_batch=max_batch,
+        max_wait_ms=max_wait_ms,
+        workers=INFER_WORKERS,
+    ))
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # 테스트
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -499,5 +646,15 @@ if __name__ == "__main__":
         print(f"   Input: {x.shape} → Output: {y.shape}")
         
         print("\n✅ 모든 모델 정상 작동")
+        
+        # 마이크로 배칭 벤치마크
+        print("\n3. Micro-batching (CPU):")
+        for row in benchmark_batched_inference():
+            single, batched = row["single"], row["batched"]
+            print(
+                f"   c={row['concurrency']:>3}  single {single['throughput_rps']:>8} rps "
+                f"p99 {single['p99_ms']:>8}ms | batched {batched['throughput_rps']:>8} rps "
+                f"p99 {batched['p99_ms']:>8}ms (avg batch {batched['avg_batch']}) ×{row['speedup']}"
+            )
     else:
         print("\n❌ PyTorch 미설치 - 테스트 건너뜀")
@@ -19,6 +19,7 @@ V = (Motions - Threats) × (1 + InteractionExponent × Relations)^t × Base
 - 상수 조정 (나이, 위치)
 - 지수 가속 (네트워크 밀도)
 - 라플라스 예측 (미래 시뮬레이션)
+- 배치 계산 (NumPy 브로드캐스팅) / Monte Carlo 백분위 구간
 
 ═══════════════════════════════════════════════════════════════════════════════
 """
@@ -29,6 +30,14 @@ import math
 import json
 from datetime import datetime, timedelta
 
+NUMPY_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    pass
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 타입 정의
@@ -161,21 +170,33 @@ class VEngine:
     def __init__(self):
         self.history: List[Tuple[datetime, VInput, VResult]] = []
     
-    def calculate(self, input: VInput) -> VResult:
-        """V 계산 실행 (v2.3: 용어 통일)"""
-        
+    @staticmethod
+    def _factors(
+        user_type: UserType,
+        constants: UserConstants,
+        network: NetworkState,
+    ) -> Tuple[float, float, float]:
+        """(타입 승수, 상수 조정, 네트워크 성장 기여분)"""
         # 1. 타입 승수
-        type_factor = TYPE_MULTIPLIERS.get(input.user_type, 1.0)
+        type_factor = TYPE_MULTIPLIERS.get(user_type, 1.0)
         
         # 2. 상수 조정 (나이, 위치)
-        age_factor = 1 - (input.constants.age / 100)  # 나이가 많을수록 감소
-        constant_adj = age_factor * input.constants.location_factor
+        age_factor = 1 - (constants.age / 100)  # 나이가 많을수록 감소
+        constant_adj = age_factor * constants.location_factor
         
-        # 3. 네트워크 밀도 계산
-        network_density = input.network.calculate_density()
+        # 3. 네트워크 밀도 → 성장 기여분
+        growth_contribution = network.growth_rate * network.calculate_density()
+        return type_factor, constant_adj, growth_contribution
+    
+    def calculate(self, input: VInput) -> VResult:
+        """V 계산 실행 (v2.3: 용어 통일)"""
+        
+        # 1~3. 타입 승수 / 상수 조정 / 네트워크 성장 기여분
+        type_factor, constant_adj, growth_contribution = self._factors(
+            input.user_type, input.constants, input.network
+        )
         
         # 4. Relations 조정 (지수 가속 적용) - v2.3: synergy → relations
-        growth_contribution = input.network.growth_rate * network_density
         adjusted_relations = min(1.0, input.relations + growth_contribution)
         
         # 5. 기본 계산 - v2.3: M/T → motions/threats
@@ -204,9 +225,9 @@ class VEngine:
         
         result = VResult(
             V=V,
-            base_value=base_value,
+            base_value=net_value,
             raw_V=raw_V,
-            adjusted_s=adjusted_s,
+            adjusted_s=adjusted_relations,
             type_factor=type_factor,
             constant_adj=constant_adj,
             growth_contribution=growth_contribution,
@@ -219,6 +240,36 @@ class VEngine:
         
         return result
     
+    def calculate_batch(
+        self,
+        M,
+        T,
+        s,
+        t,
+        base=1.0,
+        interaction_exponent=0.10,
+        user_type: UserType = UserType.BALANCED,
+        constants: Optional[UserConstants] = None,
+        network: Optional[NetworkState] = None,
+    ) -> "np.ndarray":
+        """
+        V 일괄 계산 (NumPy 브로드캐스팅, 식 1회)
+        
+        M, T, s, t, base, interaction_exponent 는 스칼라 또는 서로 브로드캐스트
+        가능한 배열 — 예: s[:, None], t[None, :] → (s 개수 × t 개수) 격자.
+        calculate() 와 같은 공식이며 history 에는 기록하지 않는다.
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy 미설치 - calculate_batch 사용 불가")
+        
+        type_factor, constant_adj, growth_contribution = self._factors(
+            user_type, constants or UserConstants(), network or NetworkState()
+        )
+        M, T, s, t = (np.asarray(x, dtype=np.float64) for x in (M, T, s, t))
+        adjusted_relations = np.minimum(1.0, s + growth_contribution)
+        rate = 1 + np.asarray(interaction_exponent, dtype=np.float64) * adjusted_relations
+        return (M - T) * rate ** t * base * (type_factor * constant_adj)
+    
     def simulate_scenarios(
         self, 
         base_input: VInput,
@@ -232,40 +283,39 @@ class VEngine:
             "by_time": []
         }
         
+        s_values = [max(0, min(1, base_input.s + delta_s)) for delta_s in s_variations]
+        common = dict(
+            base=base_input.base,
+            interaction_exponent=base_input.interaction_exponent,
+            user_type=base_input.user_type,
+            constants=base_input.constants,
+            network=base_input.network,
+        )
+        
+        if NUMPY_AVAILABLE:
+            # 시나리오 전체를 식 1회로
+            by_s = self.calculate_batch(base_input.M, base_input.T, s_values, base_input.t, **common).tolist()
+            by_t = self.calculate_batch(base_input.M, base_input.T, base_input.s, t_variations, **common).tolist()
+        else:
+            def _v(s: float, t: int) -> float:
+                return self.calculate(VInput(M=base_input.M, T=base_input.T, s=s, t=t, **common)).V
+            by_s = [_v(s, base_input.t) for s in s_values]
+            by_t = [_v(base_input.s, t) for t in t_variations]
+        
         # Synergy 변화에 따른 시뮬레이션
-        for delta_s in s_variations:
-            modified_input = VInput(
-                M=base_input.M,
-                T=base_input.T,
-                s=max(0, min(1, base_input.s + delta_s)),
-                t=base_input.t,
-                user_type=base_input.user_type,
-                constants=base_input.constants,
-                network=base_input.network
-            )
-            result = self.calculate(modified_input)
+        for delta_s, s, V in zip(s_variations, s_values, by_s):
             results["by_synergy"].append({
-                "s": modified_input.s,
+                "s": s,
                 "delta": delta_s,
-                "V": result.V,
-                "label": f"s={modified_input.s:.2f}"
+                "V": V,
+                "label": f"s={s:.2f}"
             })
         
         # 시간 변화에 따른 시뮬레이션
-        for t in t_variations:
-            modified_input = VInput(
-                M=base_input.M,
-                T=base_input.T,
-                s=base_input.s,
-                t=t,
-                user_type=base_input.user_type,
-                constants=base_input.constants,
-                network=base_input.network
-            )
-            result = self.calculate(modified_input)
+        for t, V in zip(t_variations, by_t):
             results["by_time"].append({
                 "t": t,
-                "V": result.V,
+                "V": V,
                 "label": f"{t}개월"
             })
         
@@ -327,7 +377,8 @@ class LaplaceSimulator:
         self,
         input: VInput,
         periods: int = 12,
-        uncertainty: float = 0.1
+        uncertainty: float = 0.1,
+        paths: int = 0,
     ) -> Dict[str, any]:
         """
         미래 V 곡선 예측
@@ -336,6 +387,7 @@ class LaplaceSimulator:
             input: 현재 상태
             periods: 예측 기간 (월)
             uncertainty: 불확실성 계수 (0~1)
+            paths: > 0 이면 Monte Carlo 백분위 구간 추가 (s 표준편차 = uncertainty)
         
         Returns:
             예측 결과 (중앙값 + 신뢰구간)
@@ -348,50 +400,33 @@ class LaplaceSimulator:
             "confidence": 1 - uncertainty
         }
         
-        for month in range(periods + 1):
-            # 중앙 예측
-            central_input = VInput(
-                M=input.M, T=input.T, s=input.s, t=month,
-                user_type=input.user_type,
-                constants=input.constants,
-                network=input.network
-            )
-            central_result = self.engine.calculate(central_input)
-            
-            # 낙관 시나리오 (s + uncertainty)
-            optimistic_input = VInput(
-                M=input.M, T=input.T, 
-                s=min(1, input.s + uncertainty),
-                t=month,
-                user_type=input.user_type,
-                constants=input.constants,
-                network=input.network
+        # 중앙 / 낙관 (s + uncertainty) / 비관 (s - uncertainty)
+        s_values = [input.s, min(1, input.s + uncertainty), max(0, input.s - uncertainty)]
+        common = dict(
+            base=input.base,
+            interaction_exponent=input.interaction_exponent,
+            user_type=input.user_type,
+            constants=input.constants,
+            network=input.network,
+        )
+        
+        if NUMPY_AVAILABLE:
+            # (시나리오 3 × 월) 격자를 식 1회로
+            grid = self.engine.calculate_batch(
+                input.M, input.T, np.array(s_values)[:, None], np.arange(periods + 1), **common
             )
-            optimistic_result = self.engine.calculate(optimistic_input)
-            
-            # 비관 시나리오 (s - uncertainty)
-            pessimistic_input = VInput(
-                M=input.M, T=input.T,
-                s=max(0, input.s - uncertainty),
-                t=month,
-                user_type=input.user_type,
-                constants=input.constants,
-                network=input.network
+            central, upper, lower = grid.tolist()
+        else:
+            central, upper, lower = (
+                [self.engine.calculate(VInput(M=input.M, T=input.T, s=s, t=month, **common)).V
+                 for month in range(periods + 1)]
+                for s in s_values
             )
-            pessimistic_result = self.engine.calculate(pessimistic_input)
-            
-            predictions["central"].append({
-                "month": month,
-                "V": central_result.V
-            })
-            predictions["upper_bound"].append({
-                "month": month,
-                "V": optimistic_result.V
-            })
-            predictions["lower_bound"].append({
-                "month": month,
-                "V": pessimistic_result.V
-            })
+        
+        for month in range(periods + 1):
+            predictions["central"].append({"month": month, "V": central[month]})
+            predictions["upper_bound"].append({"month": month, "V": upper[month]})
+            predictions["lower_bound"].append({"month": month, "V": lower[month]})
         
         # 핵심 인사이트
         final_central = predictions["central"][-1]["V"]
@@ -406,8 +441,66 @@ class LaplaceSimulator:
             "growth_factor": round(final_central / (input.M - input.T), 2) if input.M > input.T else 0
         }
         
+        if paths > 0 and NUMPY_AVAILABLE:
+            predictions["monte_carlo"] = self.monte_carlo(input, periods, paths, s_std=uncertainty)
+        
         return predictions
     
+    def monte_carlo(
+        self,
+        input: VInput,
+        periods: int = 12,
+        paths: int = 10000,
+        s_std: float = 0.1,
+        M_std: float = 0.1,
+        T_std: float = 0.1,
+        percentiles: Tuple[float, ...] = (5, 25, 50, 75, 95),
+        seed: Optional[int] = None,
+    ) -> Dict[str, any]:
+        """
+        Monte Carlo 예측 구간
+        
+        경로마다 s ~ N(s, s_std) (0~1 절단), M/T ~ 현재값 × (1 + N(0, 상대 표준편차))
+        (0 이상 절단)을 뽑아 (경로 × 월) 격자를 calculate_batch 1회로 계산하고
+        월별 백분위를 구한다. 고정 ±uncertainty 대신 실제 분포의 구간.
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy 미설치 - Monte Carlo 사용 불가")
+        
+        rng = np.random.default_rng(seed)
+        s = np.clip(rng.normal(input.s, s_std, paths), 0, 1)
+        M = np.maximum(0, input.M * (1 + rng.normal(0, M_std, paths)))
+        T = np.maximum(0, input.T * (1 + rng.normal(0, T_std, paths)))
+        months = np.arange(periods + 1)
+        
+        V = self.engine.calculate_batch(
+            M[:, None], T[:, None], s[:, None], months[None, :],
+            base=input.base,
+            interaction_exponent=input.interaction_exponent,
+            user_type=input.user_type,
+            constants=input.constants,
+            network=input.network,
+        )  # (paths, periods + 1)
+        
+        bands = np.percentile(V, percentiles, axis=0)
+        labels = [f"p{p:g}" for p in percentiles]
+        final = V[:, -1]
+        
+        return {
+            "paths": paths,
+            "bands": [
+                {"month": int(month), **{label: round(float(bands[k, month]), 2) for k, label in enumerate(labels)}}
+                for month in months
+            ],
+            "insights": {
+                "mean_V": round(float(final.mean()), 2),
+                "std_V": round(float(final.std()), 2),
+                **{label: round(float(bands[k, -1]), 2) for k, label in enumerate(labels)},
+                "prob_negative": round(float((final < 0).mean()), 4),
+                "prob_below_start": round(float((final < V[:, 0]).mean()), 4),
+            },
+        }
+    
     def what_if(
         self,
         input: VInput,
@@ -529,7 +622,8 @@ def predict_v(
     T: float,
     s: float,
     t: int = 12,
-    uncertainty: float = 0.1
+    uncertainty: float = 0.1,
+    paths: int = 0
 ) -> dict:
     """
     간편 V 예측 함수
@@ -537,12 +631,15 @@ def predict_v(
     Example:
         prediction = predict_v(M=100, T=40, s=0.3, t=12)
         print(prediction["insights"]["expected_V"])
+        
+        prediction = predict_v(M=100, T=40, s=0.3, t=12, paths=10000)
+        print(prediction["monte_carlo"]["insights"]["p5"])
     """
     simulator = get_laplace_simulator()
     
     input = VInput(M=M, T=T, s=s, t=t)
     
-    return simulator.predict_future(input, periods=t, uncertainty=uncertainty)
+    return simulator.predict_future(input, periods=t, uncertainty=uncertainty, paths=paths)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
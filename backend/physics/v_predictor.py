@@ -18,6 +18,7 @@ AI 통합:
 - 로그 변환으로 복리 선형화
 - 연속 학습 (Continual Learning)
 - 앙상블 예측
+- 다수 사용자 배치 로그 선형 학습 (충분 통계량 누적)
 
 로컬 (Zero-Cloud) 환경에서 실행
 ═══════════════════════════════════════════════════════════════════════════════
@@ -240,6 +241,182 @@ class LogLinearPredictor:
         return [self.predict(t) for t in range(start_t, end_t + 1)]
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# 배치 로그 선형 학습 (다수 사용자)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class LogLinearStats:
+    """
+    사용자별 로그 선형 회귀 충분 통계량 (n, Σt, Σy, Σt·y, Σt², Σy²), y = log(V)
+    
+    LogLinearPredictor.fit 과 같은 최소제곱 해를 전체 사용자에 대해 벡터 연산 1회로 계산.
+    t 는 사용자별 포인트 순번 (0, 1, 2, ...) — 새 포인트는 append 로 누적 (재학습 없음).
+    Σy² 는 R² 를 통계량만으로 계산하기 위해 추가로 보관.
+    """
+    
+    FIELDS = ("n", "sum_t", "sum_y", "sum_ty", "sum_tt", "sum_yy")
+    
+    def __init__(self, num_users: int = 0):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy 미설치 - 배치 학습 불가")
+        self.n = np.zeros(num_users, dtype=np.int64)
+        for name in self.FIELDS[1:]:
+            setattr(self, name, np.zeros(num_users))
+    
+    def __len__(self) -> int:
+        return len(self.n)
+    
+    @classmethod
+    def from_padded(cls, values, lengths=None) -> "LogLinearStats":
+        """(사용자 × 최대 길이) 패딩 배열 + 사용자별 길이 (생략 시 전부 유효)"""
+        values = np.asarray(values, dtype=float)
+        users, width = values.shape
+        lengths = np.full(users, width) if lengths is None else np.asarray(lengths)
+        
+        t = np.arange(width, dtype=float)
+        mask = t[None, :] < lengths[:, None]
+        y = np.where(mask, np.log(np.clip(values, 0.01, None)), 0.0)
+        tm = np.where(mask, t[None, :], 0.0)
+        
+        stats = cls(users)
+        stats.n = mask.sum(axis=1)
+        stats.sum_t = tm.sum(axis=1)
+        stats.sum_y = y.sum(axis=1)
+        stats.sum_ty = (tm * y).sum(axis=1)
+        stats.sum_tt = (tm * tm).sum(axis=1)
+        stats.sum_yy = (y * y).sum(axis=1)
+        return stats
+    
+    @classmethod
+    def from_csr(cls, data, indptr) -> "LogLinearStats":
+        """CSR 레이아웃: 사용자 i 의 V = data[indptr[i]:indptr[i+1]]"""
+        data = np.asarray(data, dtype=float)
+        indptr = np.asarray(indptr)
+        counts = np.diff(indptr)
+        users = np.repeat(np.arange(len(counts)), counts)
+        t = np.arange(len(data)) - np.repeat(indptr[:-1], counts)
+        
+        stats = cls(len(counts))
+        stats._accumulate(users, t, np.log(np.clip(data, 0.01, None)))
+        return stats
+    
+    def _accumulate(self, users, t, y):
+        size = len(self)
+        t = np.asarray(t, dtype=float)
+        self.n += np.bincount(users, minlength=size)
+        self.sum_t += np.bincount(users, t, minlength=size)
+        self.sum_y += np.bincount(users, y, minlength=size)
+        self.sum_ty += np.bincount(users, t * y, minlength=size)
+        self.sum_tt += np.bincount(users, t * t, minlength=size)
+        self.sum_yy += np.bincount(users, y * y, minlength=size)
+    
+    def grow(self, num_users: int):
+        """사용자 수 확장 (새 사용자는 빈 통계량)"""
+        extra = num_users - len(self)
+        if extra <= 0:
+            return
+        for name in self.FIELDS:
+            current = getattr(self, name)
+            setattr(self, name, np.concatenate([current, np.zeros(extra, dtype=current.dtype)]))
+    
+    def append(self, users, V):
+        """
+        새 포인트 누적 (증분 학습)
+        
+        users[k] 사용자의 다음 순번에 V[k] 추가. 같은 사용자가 여러 번 나오면 입력 순서대로.
+        """
+        users = np.asarray(users, dtype=np.int64)
+        if not len(users):
+            return
+        self.grow(int(users.max()) + 1)
+        
+        # 배치 내 사용자별 순번
+        order = np.argsort(users, kind="stable")
+        ordered = users[order]
+        starts = np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]])
+        rank = np.empty(len(users), dtype=np.int64)
+        rank[order] = np.arange(len(users)) - np.repeat(starts, np.diff(np.r_[starts, len(users)]))
+        
+        t = self.n[users] + rank
+        self._accumulate(users, t, np.log(np.clip(np.asarray(V, dtype=float), 0.01, None)))
+    
+    def merge(self, other: "LogLinearStats"):
+        """같은 사용자 인덱스의 다른 샤드 통계량 합산 (t 구간이 겹치지 않아야 함)"""
+        self.grow(len(other))
+        for name in self.FIELDS:
+            getattr(self, name)[:len(other)] += getattr(other, name)
+    
+    def solve(self, min_points: int = 3) -> Dict[str, "np.ndarray"]:
+        """
+        전체 사용자 (a, b, R²) 계산
+        
+        Returns:
+            열 단위 결과 테이블 {"n", "a", "b", "r_squared", "estimated_relations", "valid"}
+            valid=False (포인트 < min_points 또는 분모 0) 인 행은 0
+        """
+        n = self.n.astype(float)
+        denominator = n * self.sum_tt - self.sum_t ** 2
+        valid = (self.n >= min_points) & (denominator > 0)
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            b = np.where(valid, (n * self.sum_ty - self.sum_t * self.sum_y) / denominator, 0.0)
+            a = np.where(valid, (self.sum_y - b * self.sum_t) / n, 0.0)
+            
+            # SS_tot = Σy² - (Σy)²/n, SS_res = Σy² - aΣy - bΣty (최소제곱 해에서)
+            ss_tot = self.sum_yy - self.sum_y ** 2 / n
+            ss_res = np.maximum(0.0, self.sum_yy - a * self.sum_y - b * self.sum_ty)
+            constant = ss_tot <= 1e-12 * np.maximum(1.0, self.sum_yy)
+            r_squared = np.where(valid & ~constant, 1 - ss_res / ss_tot, 0.0)
+        
+        estimated_relations = np.where(valid & (b > -1), np.expm1(b), 0.0)
+        
+        return {
+            "n": self.n.copy(),
+            "a": a,
+            "b": b,
+            "r_squared": r_squared,
+            "estimated_relations": estimated_relations,
+            "valid": valid,
+        }
+    
+    def save(self, path: str):
+        """통계량 저장 (.npz) — 다음 배치에서 load 후 append"""
+        np.savez(path, **{name: getattr(self, name) for name in self.FIELDS})
+    
+    @classmethod
+    def load(cls, path: str) -> "LogLinearStats":
+        with np.load(path) as data:
+            stats = cls(len(data["n"]))
+            for name in cls.FIELDS:
+                setattr(stats, name, data[name].copy())
+        return stats
+
+
+def fit_loglinear_batch(
+    values,
+    lengths=None,
+    indptr=None,
+    min_points: int = 3
+) -> Dict[str, "np.ndarray"]:
+    """
+    다수 사용자 V 히스토리를 한 번에 로그 선형 학습
+    
+    Args:
+        values: 패딩 배열 (사용자 × 최대 길이) 또는 indptr 와 함께 CSR data
+        lengths: 패딩 배열의 사용자별 유효 길이
+        indptr: CSR 사용자 경계 (len = 사용자 수 + 1)
+    
+    Example:
+        table = fit_loglinear_batch([[100, 110, 121, 0], [50, 52, 55, 58]], lengths=[3, 4])
+        table["b"]  # 사용자별 로그 성장률
+    """
+    if indptr is not None:
+        stats = LogLinearStats.from_csr(values, indptr)
+    else:
+        stats = LogLinearStats.from_padded(values, lengths)
+    return stats.solve(min_points)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # LSTM 예측기 (PyTorch 기반)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -305,13 +482,18 @@ class LSTMPredictor:
         if TORCH_AVAILABLE:
             self.model = VLSTMModel()
     
+    CHECKPOINT_NAME = "v_lstm"
+    
     def fit(
         self,
         history: VHistory,
         epochs: int = 100,
-        lr: float = 0.001
+        lr: float = 0.001,
+        batch_size: int = 32,
+        val_fraction: float = 0.2,
+        patience: int = 10,
     ) -> Dict[str, any]:
-        """LSTM 학습"""
+        """LSTM 학습 (미니배치, 시간순 holdout 조기 종료)"""
         
         if not TORCH_AVAILABLE:
             return {"error": "PyTorch 미설치"}
@@ -319,43 +501,38 @@ class LSTMPredictor:
         if len(history.points) < self.window_size + 1:
             return {"error": f"데이터 부족 (최소 {self.window_size + 1}개 필요)"}
         
-        # 데이터 준비
-        features = history.to_features()
-        targets = history.to_targets()
-        
-        # 시퀀스 생성
-        X, y = [], []
-        for i in range(len(features) - self.window_size):
-            X.append(features[i:i + self.window_size])
-            y.append(targets[i + self.window_size])
-        
-        X = torch.tensor(X, dtype=torch.float32)
-        y = torch.tensor(y, dtype=torch.float32).unsqueeze(1)
+        from .v_training import WindowDataset, fit_model, holdout_loaders
         
-        # 학습
-        optimizer = torch.optim.Adam(self.model.parameters(), lr=lr)
-        criterion = nn.MSELoss()
-        
-        self.model.train()
-        self.loss_history = []
-        
-        for epoch in range(epochs):
-            optimizer.zero_grad()
-            output, _ = self.model(X)
-            loss = criterion(output, y)
-            loss.backward()
-            optimizer.step()
-            
-            self.loss_history.append(loss.item())
+        dataset = WindowDataset(history.to_features(), history.to_targets(), self.window_size)
+        train_loader, val_loader = holdout_loaders(dataset, batch_size, val_fraction)
+        result = fit_model(
+            self.model, lambda model, X: model(X)[0], train_loader, val_loader,
+            epochs=epochs, lr=lr, patience=patience,
+        )
         
+        self.loss_history = [h["train"] for h in result["loss_history"]]
         self.trained = True
         
         return {
-            "final_loss": round(self.loss_history[-1], 6),
-            "epochs": epochs,
-            "data_points": len(X)
+            "final_loss": result["train_loss"],
+            "val_loss": result["val_loss"],
+            "epochs": result["epochs_run"],
+            "best_epoch": result["best_epoch"],
+            "stopped_early": result["stopped_early"],
+            "data_points": len(dataset)
         }
     
+    def state(self) -> Tuple[Dict, Optional[Dict]]:
+        """체크포인트용 (메타데이터, state_dict)"""
+        return {"window_size": self.window_size}, self.model.state_dict() if self.trained else None
+    
+    def restore(self, meta: Dict, state: Optional[Dict]):
+        self.window_size = meta.get("window_size", self.window_size)
+        if state is not None and self.model is not None:
+            self.model.load_state_dict(state)
+            self.model.eval()
+            self.trained = True
+    
     def predict(self, recent_history: List[List[float]]) -> Dict[str, float]:
         """미래 V 예측"""
         
@@ -394,10 +571,13 @@ class EnsemblePredictor:
     가중 평균으로 최종 예측
     """
     
+    CHECKPOINT_NAME = "v_ensemble"
+    
     def __init__(self):
         self.log_linear = LogLinearPredictor()
         self.lstm = LSTMPredictor() if TORCH_AVAILABLE else None
         self.weights = {"log_linear": 0.5, "lstm": 0.5}
+        self.checkpoint_version: Optional[int] = None
     
     def fit(self, history: VHistory) -> Dict[str, any]:
         """앙상블 학습"""
@@ -422,6 +602,48 @@ class EnsemblePredictor:
         results["weights"] = self.weights
         return results
     
+    def save(self, store=None) -> int:
+        """
+        체크포인트 저장 (LogLinear 계수 / 가중치는 메타데이터, LSTM 은 state_dict)
+        """
+        from .v_training import get_checkpoint_store
+        
+        store = store or get_checkpoint_store()
+        meta = {
+            "log_linear": {
+                "a": self.log_linear.a,
+                "b": self.log_linear.b,
+                "r_squared": self.log_linear.r_squared,
+                "trained": self.log_linear.trained,
+            },
+            "weights": self.weights,
+        }
+        state = None
+        if self.lstm is not None:
+            meta["lstm"], state = self.lstm.state()
+        self.checkpoint_version = store.save(self.CHECKPOINT_NAME, meta, state)
+        return self.checkpoint_version
+    
+    def load_latest(self, store=None) -> bool:
+        """최신 체크포인트 로드 (없으면 False)"""
+        from .v_training import get_checkpoint_store
+        
+        store = store or get_checkpoint_store()
+        loaded = store.load(self.CHECKPOINT_NAME)
+        if loaded is None:
+            return False
+        meta, state = loaded
+        ll = meta.get("log_linear", {})
+        self.log_linear.a = ll.get("a", 0.0)
+        self.log_linear.b = ll.get("b", 0.0)
+        self.log_linear.r_squared = ll.get("r_squared", 0.0)
+        self.log_linear.trained = ll.get("trained", False)
+        self.weights = meta.get("weights", self.weights)
+        if self.lstm is not None and "lstm" in meta:
+            self.lstm.restore(meta["lstm"], state)
+        self.checkpoint_version = meta["version"]
+        return True
+    
     def predict(self, future_t: int, recent_features: List[List[float]] = None) -> Dict[str, any]:
         """앙상블 예측"""
         
@@ -467,10 +689,15 @@ _ensemble_instance: Optional[EnsemblePredictor] = None
 
 
 def get_ensemble_predictor() -> EnsemblePredictor:
-    """앙상블 예측기 싱글톤"""
+    """앙상블 예측기 싱글톤 (최신 체크포인트가 있으면 로드 — 재학습 없음)"""
     global _ensemble_instance
     if _ensemble_instance is None:
         _ensemble_instance = EnsemblePredictor()
+        try:
+            if _ensemble_instance.load_latest():
+                print(f"✅ V 예측기 체크포인트 로드 (v{_ensemble_instance.checkpoint_version})")
+        except Exception as e:
+            print(f"⚠️ V 예측기 체크포인트 로드 실패 - 학습 필요: {e}")
     return _ensemble_instance
 
 
@@ -503,7 +730,15 @@ def train_predictor(v_history: List[Dict]) -> Dict:
         ))
     
     predictor = get_ensemble_predictor()
-    return predictor.fit(history)
+    result = predictor.fit(history)
+    try:
+        result["checkpoint_version"] = predictor.save()
+    except Exception as e:
+        # 학습 결과는 반환하되 저장 실패를 결과에 명시 (재시작 시 재학습 필요)
+        print(f"⚠️ V 예측기 체크포인트 저장 실패: {e}")
+        result["checkpoint_version"] = None
+        result["checkpoint_error"] = str(e)
+    return result
 
 
 def predict_future_v(future_months: int, recent_data: List[Dict] = None) -> Dict:
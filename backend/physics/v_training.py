@@ -0,0 +1,277 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+🏋️ AUTUS V Training — 미니배치 학습 / 조기 종료 / 체크포인트
+═══════════════════════════════════════════════════════════════════════════════
+
+V 예측기(LSTM, Transformer) 공용 학습 파이프라인:
+- VHistory 특징 시계열 → 슬라이딩 윈도우 Dataset (샘플 복제 없이 인덱스로 절단)
+- 시간순 holdout 분할 (뒤쪽 val_fraction 을 검증용 — 미래 누수 방지)
+- 미니배치 Adam + 검증 손실 기반 조기 종료 (최고 가중치 복원)
+- 버전 체크포인트: {root}/{name}/v0001.pt (state_dict) + v0001.json (메타데이터)
+  → 서빙은 최신 체크포인트를 로드 (재시작 시 재학습 없음)
+
+환경변수:
+  V_CHECKPOINT_DIR   체크포인트 루트 (기본 data/checkpoints)
+  V_CHECKPOINT_KEEP  이름별 보관 버전 수 (기본 5)
+═══════════════════════════════════════════════════════════════════════════════
+"""
+import copy
+import json
+import os
+import re
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+TORCH_AVAILABLE = False
+
+try:
+    import torch
+    import torch.nn as nn
+    from torch.utils.data import DataLoader, Dataset, Subset, TensorDataset
+    TORCH_AVAILABLE = True
+except ImportError:
+    pass
+
+
+DEFAULT_CHECKPOINT_DIR = os.getenv("V_CHECKPOINT_DIR", "data/checkpoints")
+DEFAULT_KEEP = int(os.getenv("V_CHECKPOINT_KEEP", "5"))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 데이터셋
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def window_count(length: int, window: int, horizon: int = 1) -> int:
+    return max(0, length - window - horizon + 1)
+
+
+if TORCH_AVAILABLE:
+    class WindowDataset(Dataset):
+        """
+        슬라이딩 윈도우 Dataset
+
+        i 번째 샘플: X = features[i : i+window], y = targets[i+window : i+window+horizon]
+        """
+
+        def __init__(self, features: Sequence, targets: Sequence, window: int, horizon: int = 1):
+            self.features = torch.as_tensor(features, dtype=torch.float32)
+            self.targets = torch.as_tensor(targets, dtype=torch.float32)
+            self.window = window
+            self.horizon = horizon
+
+        def __len__(self) -> int:
+            return window_count(len(self.features), self.window, self.horizon)
+
+        def __getitem__(self, i: int):
+            w = self.window
+            return self.features[i:i + w], self.targets[i + w:i + w + self.horizon]
+
+
+    def sample_dataset(X: Sequence, y: Sequence) -> "Dataset":
+        """이미 윈도우된 (samples, ...) 입력/타깃"""
+        return TensorDataset(torch.as_tensor(X, dtype=torch.float32), torch.as_tensor(y, dtype=torch.float32))
+
+
+    def holdout_loaders(
+        dataset: "Dataset",
+        batch_size: int = 32,
+        val_fraction: float = 0.2,
+    ) -> Tuple["DataLoader", Optional["DataLoader"]]:
+        """시간순 분할: 앞쪽 학습 (셔플), 뒤쪽 검증. 검증 샘플이 0개면 None"""
+        n = len(dataset)
+        n_val = int(n * val_fraction)
+        if n - n_val < 1:
+            n_val = 0
+        train = Subset(dataset, range(0, n - n_val))
+        train_loader = DataLoader(train, batch_size=batch_size, shuffle=True)
+        if not n_val:
+            return train_loader, None
+        val = Subset(dataset, range(n - n_val, n))
+        return train_loader, DataLoader(val, batch_size=batch_size)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 학습 루프
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def fit_model(
+    model,
+    forward: Callable[[Any, Any], Any],
+    train_loader,
+    val_loader=None,
+    epochs: int = 100,
+    lr: float = 0.001,
+    patience: int = 10,
+    min_delta: float = 0.0,
+) -> Dict[str, Any]:
+    """
+    미니배치 학습 + 조기 종료
+
+    forward(model, X) → 타깃과 같은 모양의 예측.
+    검증 손실이 patience 에폭 동안 min_delta 이상 개선되지 않으면 중단하고
+    최고 검증 손실 시점의 가중치를 복원한다 (검증셋이 없으면 학습 손실 기준).
+    """
+    optimizer = torch.optim.Adam(model.parameters(), lr=lr)
+    criterion = nn.MSELoss()
+
+    best_loss = float("inf")
+    best_state = None
+    best_epoch = 0
+    history: List[Dict[str, float]] = []
+    epoch = 0
+
+    for epoch in range(1, epochs + 1):
+        model.train()
+        total, count = 0.0, 0
+        for X, y in train_loader:
+            optimizer.zero_grad()
+            loss = criterion(forward(model, X), y)
+            loss.backward()
+            optimizer.step()
+            total += loss.item() * len(X)
+            count += len(X)
+        train_loss = total / max(1, count)
+
+        val_loss = evaluate(model, forward, val_loader) if val_loader is not None else train_loss
+        history.append({"train": train_loss, "val": val_loss})
+
+        if val_loss < best_loss - min_delta:
+            best_loss, best_epoch = val_loss, epoch
+            best_state = copy.deepcopy(model.state_dict())
+        elif epoch - best_epoch >= patience:
+            break
+
+    if best_state is not None:
+        model.load_state_dict(best_state)
+    model.eval()
+
+    return {
+        "epochs_run": epoch,
+        "best_epoch": best_epoch,
+        "stopped_early": epoch < epochs,
+        "train_loss": round(history[best_epoch - 1]["train"], 6) if best_epoch else None,
+        "val_loss": round(best_loss, 6) if val_loader is not None else None,
+        "loss_history": history,
+    }
+
+
+def evaluate(model, forward: Callable[[Any, Any], Any], loader) -> float:
+    criterion = nn.MSELoss(reduction="sum")
+    model.eval()
+    total, count = 0.0, 0
+    with torch.inference_mode():
+        for X, y in loader:
+            pred = forward(model, X)
+            total += criterion(pred, y).item() / max(1, y[0].numel())
+            count += len(X)
+    return total / max(1, count)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 체크포인트
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_VERSION_RE = re.compile(r"^v(\d+)\.json$")
+
+
+class CheckpointStore:
+    """
+    버전 체크포인트 저장소
+
+    메타데이터 JSON 을 마지막에 원자적으로 기록 → JSON 이 있는 버전만 유효
+    (state_dict 쓰기 도중 종료돼도 반쪽 체크포인트를 로드하지 않음).
+    state_dict 가 없는 체크포인트(메타데이터만, 예: LogLinear 계수)도 허용.
+    """
+
+    def __init__(self, root: Optional[str] = None, keep: int = DEFAULT_KEEP):
+        self.root = root or DEFAULT_CHECKPOINT_DIR
+        self.keep = keep
+
+    def _dir(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    def versions(self, name: str) -> List[int]:
+        try:
+            files = os.listdir(self._dir(name))
+        except FileNotFoundError:
+            return []
+        return sorted(int(m.group(1)) for m in map(_VERSION_RE.match, files) if m)
+
+    def latest_version(self, name: str) -> Optional[int]:
+        versions = self.versions(name)
+        return versions[-1] if versions else None
+
+    def save(self, name: str, metadata: Dict[str, Any], state_dict: Optional[Dict] = None) -> int:
+        """새 버전 저장, 버전 번호 반환"""
+        directory = self._dir(name)
+        os.makedirs(directory, exist_ok=True)
+        version = (self.latest_version(name) or 0) + 1
+        stem = os.path.join(directory, f"v{version:04d}")
+
+        if state_dict is not None:
+            if not TORCH_AVAILABLE:
+                raise RuntimeError("PyTorch 미설치 - state_dict 저장 불가")
+            torch.save(state_dict, stem + ".pt.tmp")
+            os.replace(stem + ".pt.tmp", stem + ".pt")
+
+        meta = {
+            **metadata,
+            "name": name,
+            "version": version,
+            "created_at": datetime.now().isoformat(),
+            "has_state": state_dict is not None,
+        }
+        with open(stem + ".json.tmp", "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2, default=str)
+        os.replace(stem + ".json.tmp", stem + ".json")
+
+        self.prune(name)
+        return version
+
+    def load(self, name: str, version: Optional[int] = None) -> Optional[Tuple[Dict[str, Any], Optional[Dict]]]:
+        """(메타데이터, state_dict) — 없으면 None. state_dict 는 CPU 로 로드"""
+        if version is None:
+            version = self.latest_version(name)
+            if version is None:
+                return None
+        stem = os.path.join(self._dir(name), f"v{version:04d}")
+        try:
+            with open(stem + ".json", encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return None
+        state = None
+        if meta.get("has_state"):
+            if not TORCH_AVAILABLE:
+                raise RuntimeError("PyTorch 미설치 - state_dict 로드 불가")
+            state = torch.load(stem + ".pt", map_location="cpu", weights_only=True)
+        return meta, state
+
+    def prune(self, name: str):
+        """최근 keep 개만 보관"""
+        if self.keep <= 0:
+            return
+        for version in self.versions(name)[:-self.keep]:
+            stem = os.path.join(self._dir(name), f"v{version:04d}")
+            for suffix in (".json", ".pt"):
+                try:
+                    os.remove(stem + suffix)
+                except FileNotFoundError:
+                    pass
+
+
+_store: Optional[CheckpointStore] = None
+
+
+def get_checkpoint_store() -> CheckpointStore:
+    """체크포인트 저장소 싱글톤"""
+    global _store
+    if _store is None:
+        _store = CheckpointStore()
+    return _store
+
+
+def set_checkpoint_store(store: Optional[CheckpointStore]):
+    """저장소 교체 (테스트 / 설정용)"""
+    global _store
+    _store = store
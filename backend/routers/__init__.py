@@ -13,11 +13,25 @@ v4.1.0:
 
 v5.0.0:
   - task_570_router: 8그룹 570개 업무 + K/I/Ω 물리 엔진 API
+
+v15.x:
+  - 라우터는 registry.py 에서 지연 로드 (패키지 임포트 시 서브모듈을 읽지 않음)
 """
 
-from .ki_router import router as ki_router
-from .oauth_router import router as oauth_router
-from .task_router import router as task_router
-from .task_570_router import router as task_570_router
+import importlib
+
+_ROUTER_EXPORTS = {
+    "ki_router": ".ki_router",
+    "oauth_router": ".oauth_router",
+    "task_router": ".task_router",
+    "task_570_router": ".task_570_router",
+}
+
+__all__ = list(_ROUTER_EXPORTS)
+
 
-__all__ = ["ki_router", "oauth_router", "task_router", "task_570_router"]
+def __getattr__(name: str):
+    """라우터 객체 지연 임포트"""
+    if name in _ROUTER_EXPORTS:
+        return importlib.import_module(_ROUTER_EXPORTS[name], __name__).router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -156,19 +156,21 @@ async def disconnect_provider(request: ConnectRequest):
 # ============================================
 
 @router.post("/sync")
-async def sync_all_data(user_id: str = "default"):
+async def sync_all_data(user_id: str = "default", full: bool = False):
     """
-    모든 연동 서비스에서 데이터 동기화
+    모든 연동 서비스에서 데이터 동기화 (기본 증분, full=true 면 전체)
     """
     hub = get_data_hub()
     
     try:
-        data = await hub.collect_all(user_id)
+        delta = await hub.sync(user_id, full=full)
+        data = hub.get_cached(user_id)
         summary = hub.get_summary(user_id)
         
         return {
             "success": True,
             "synced_count": len(data),
+            "delta": delta.to_dict(),
             "summary": summary,
             "message": f"{len(data)}개 데이터 동기화 완료"
         }
@@ -211,14 +213,14 @@ async def get_data(
     수집된 데이터 조회
     """
     hub = get_data_hub()
-    data = hub.get_cached(user_id)
     
+    dt = None
     if data_type:
         try:
             dt = DataType(data_type)
-            data = [d for d in data if d.type == dt]
         except ValueError:
             pass
+    data = hub.get_cached(user_id, dt)
     
     return {
         "total": len(data),
@@ -0,0 +1,327 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+AUTUS Lazy Router Registry
+═══════════════════════════════════════════════════════════════════════════════
+
+라우터를 (모듈 경로, prefix) 로 선언만 해두고,
+해당 prefix 로 첫 요청이 들어올 때 (또는 서버 준비 후 백그라운드 warm-up 시)
+모듈을 임포트해 앱에 등록한다.
+
+- 지연 로드된 라우트는 선언 순서 위치에 삽입 → 즉시 로드와 동일한 매칭 우선순위
+- 모듈별 임포트 시간 기록 → /startup/profile, CLI 로 확인
+
+CLI:
+    cd backend && python -m routers.registry          # 선언된 모듈 임포트 시간
+    cd backend && python -m routers.registry --json
+"""
+
+import asyncio
+import importlib
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("autus.routers")
+
+# 요청 시 전체 라우터가 필요한 경로 (OpenAPI 스키마)
+SCHEMA_PATHS = ("/openapi.json",)
+
+
+@dataclass
+class LazyRouter:
+    """지연 로드 라우터 선언"""
+    name: str
+    module: str
+    prefixes: Tuple[str, ...]
+    attrs: Tuple[str, ...] = ("router",)
+    on_load: Optional[str] = None   # 로드 직후 호출할 모듈 함수 이름
+
+    # 런타임 상태
+    loaded: bool = False
+    failed: Optional[str] = None
+    import_ms: float = 0.0
+    routes: List[Any] = field(default_factory=list, repr=False)
+
+    @property
+    def pending(self) -> bool:
+        return not self.loaded and self.failed is None
+
+    def matches(self, path: str) -> bool:
+        return any(path == p or path.startswith(p.rstrip("/") + "/") for p in self.prefixes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "module": self.module,
+            "prefixes": list(self.prefixes),
+            "loaded": self.loaded,
+            "failed": self.failed,
+            "import_ms": round(self.import_ms, 2),
+        }
+
+
+class LazyRouterRegistry:
+    """
+    지연 라우터 레지스트리
+
+    attach(app) 시점의 라우트 위치를 기준으로, 로드된 라우터를
+    선언 순서대로 그 위치에 끼워 넣는다.
+    """
+
+    def __init__(self):
+        self.entries: List[LazyRouter] = []
+        self._app = None
+        self._anchor = 0
+        self._lock: Optional[asyncio.Lock] = None
+
+    def declare(
+        self,
+        name: str,
+        module: str,
+        prefixes: Sequence[str],
+        attrs: Sequence[str] = ("router",),
+        on_load: Optional[str] = None,
+    ) -> LazyRouter:
+        entry = LazyRouter(
+            name=name,
+            module=module,
+            prefixes=tuple(prefixes),
+            attrs=tuple(attrs),
+            on_load=on_load,
+        )
+        self.entries.append(entry)
+        return entry
+
+    def attach(self, app: Any):
+        """앱 연결 - 현재 라우트 끝이 지연 라우터 삽입 기준점"""
+        self._app = app
+        self._anchor = len(app.router.routes)
+
+    @property
+    def pending(self) -> List[LazyRouter]:
+        return [e for e in self.entries if e.pending]
+
+    # ─────────────────────────────────────────────────────────────
+    # 로드
+    # ─────────────────────────────────────────────────────────────
+
+    def _import(self, entry: LazyRouter) -> Optional[Any]:
+        start = time.perf_counter()
+        try:
+            module = importlib.import_module(entry.module)
+        except Exception as e:
+            entry.failed = f"{type(e).__name__}: {e}"
+            logger.debug(f"  ⏭️ {entry.name}: {e}")
+            return None
+        finally:
+            entry.import_ms = (time.perf_counter() - start) * 1000
+        return module
+
+    def _register(self, entry: LazyRouter, module: Any):
+        """라우터 등록 + 선언 순서 위치로 이동"""
+        routes = self._app.router.routes
+        before = len(routes)
+        for attr in entry.attrs:
+            router = getattr(module, attr, None)
+            if router is not None:
+                self._app.include_router(router)
+        entry.routes = routes[before:]
+        del routes[before:]
+
+        offset = self._anchor
+        for other in self.entries:
+            if other is entry:
+                break
+            if other.loaded:
+                offset += len(other.routes)
+        routes[offset:offset] = entry.routes
+
+        mark_changed = getattr(self._app.router, "_mark_routes_changed", None)
+        if callable(mark_changed):
+            mark_changed()
+        self._app.openapi_schema = None
+
+        if entry.on_load and hasattr(module, entry.on_load):
+            try:
+                getattr(module, entry.on_load)()
+            except Exception as e:
+                logger.warning(f"  ⚠️ {entry.name}.{entry.on_load} 실패: {e}")
+
+        entry.loaded = True
+        logger.info(f"  ✅ {entry.name} ({entry.import_ms:.0f}ms)")
+
+    def load(self, entry: LazyRouter) -> bool:
+        """동기 로드 (즉시 로드 모드 / 테스트)"""
+        if entry.pending:
+            module = self._import(entry)
+            if module is not None:
+                self._register(entry, module)
+        return entry.loaded
+
+    def load_all(self):
+        for entry in self.entries:
+            self.load(entry)
+
+    async def load_async(self, entry: LazyRouter) -> bool:
+        """임포트는 스레드에서, 등록은 이벤트 루프에서"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if entry.pending:
+                module = await asyncio.to_thread(self._import, entry)
+                if module is not None:
+                    self._register(entry, module)
+        return entry.loaded
+
+    async def load_for_path(self, path: str):
+        if path in SCHEMA_PATHS:
+            targets = self.pending
+        else:
+            targets = [e for e in self.pending if e.matches(path)]
+        for entry in targets:
+            await self.load_async(entry)
+
+    async def warm_up(self, delay: float = 0.0):
+        """서버 준비 후 남은 라우터를 하나씩 백그라운드 로드"""
+        if delay:
+            await asyncio.sleep(delay)
+        start = time.perf_counter()
+        for entry in self.pending:
+            await self.load_async(entry)
+        logger.info(f"🔥 라우터 warm-up 완료 ({(time.perf_counter() - start) * 1000:.0f}ms)")
+
+    # ─────────────────────────────────────────────────────────────
+    # 프로파일
+    # ─────────────────────────────────────────────────────────────
+
+    def profile(self) -> Dict[str, Any]:
+        entries = sorted(self.entries, key=lambda e: e.import_ms, reverse=True)
+        return {
+            "declared": len(self.entries),
+            "loaded": sum(1 for e in self.entries if e.loaded),
+            "failed": sum(1 for e in self.entries if e.failed),
+            "pending": len(self.pending),
+            "total_import_ms": round(sum(e.import_ms for e in self.entries), 2),
+            "modules": [e.to_dict() for e in entries],
+        }
+
+
+class LazyRouterMiddleware:
+    """요청 경로에 해당하는 미로드 라우터를 라우팅 전에 로드하는 ASGI 미들웨어"""
+
+    def __init__(self, app: Callable, registry: LazyRouterRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket") and self.registry.pending:
+            await self.registry.load_for_path(scope.get("path", ""))
+        await self.app(scope, receive, send)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 라우터 선언 (등록 순서 = 매칭 우선순위)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def declare_autus_routers(registry: LazyRouterRegistry) -> LazyRouterRegistry:
+    d = registry.declare
+
+    # Core Routers (v1.x ~ v3.x)
+    d("auth_router", "auth", ["/auth"])
+    d("audit_api", "api.audit_api", ["/api/audit"])
+    d("autus_api", "api.autus_api", ["/api/autus"])
+    d("edge_api", "api.edge_api", ["/api/edge"])
+    d("efficiency_api", "api.efficiency_api", ["/api/efficiency"])
+    d("flow_api", "api.flow_api", ["/api/flow"])
+    d("keyman_api", "api.keyman_api", ["/api/keyman"])
+    d("notification_api", "api.notification_api", ["/api/notifications"])
+    d("ontology_api", "api.ontology_api", ["/ontology/engine"])
+    d("person_score_api", "api.person_score_api", ["/api/score"])
+    d("scale_api", "api.scale_api", ["/api/scale"])
+    d("strategy_api", "api.strategy_api", ["/api/strategy"])
+    d("unified_api", "api.unified_api", ["/api/unified"])
+    d("viewport_api", "api.viewport_api", ["/api/viewport"])
+    d("reliance_api", "api.reliance_api", ["/reliance"])
+    d("collection_api", "api.collection_api", ["/collection"])
+
+    # Extended APIs
+    d("sovereign_api", "api.sovereign_api", ["/api/sovereign"])
+    d("injection_api", "api.injection_api", ["/injection"])
+    d("pipeline_api", "api.pipeline_api", ["/pipeline"])
+    d("autus_unified_api", "api.autus_unified_api", ["/autus"])
+
+    # AUTUS 2.0 Views API (11개 뷰)
+    d("views_api", "routers.views_api", ["/api/v1"])
+
+    # K/I Physics Routers (v4.x)
+    d("ki_api", "api.ki_api", ["/ki"])
+    d("automation_api", "api.automation_api", ["/automation", "/alerts"])
+    d("ki_router", "routers.ki_router", ["/api/ki"])
+    d("oauth_router", "routers.oauth_router", ["/api/oauth"])
+    d("task_router", "routers.task_router", ["/api/tasks"])
+    d("task_570_router", "routers.task_570_router", ["/v2/tasks"], on_load="load_570_tasks")
+    d("turnkey_router", "routers.turnkey_router", ["/turnkey"])
+
+    # v7.0 ~ v13.0
+    d("langgraph_router", "routers.langgraph_router", ["/api/langgraph"])
+    d("setup_router", "routers.setup_router", ["/setup"])
+    d("task_1000_router", "routers.task_1000_router", ["/tasks-1000"])
+    d("self_running_router", "routers.self_running_router", ["/self-run"])
+    d("stream_router", "routers.stream_router", ["/stream"])
+    d("feedback_router", "routers.feedback_router", ["/feedback"])
+    d("kernel_router", "routers.kernel_router", ["/kernel"])
+
+    # v14.0 ~ v15.0
+    d("provision_router", "routers.provision_router", ["/provision"])
+    d("integration_router", "routers.integration_router", ["/integration"])
+    d("sync_router", "routers.sync_router", ["/sync"])
+    d("v_router", "routers.v_router", ["/v"])
+    d("monitoring_router", "routers.monitoring_router", ["/monitoring"])
+    d("typedb_router", "routers.typedb_router", ["/api/typedb"])
+    d("automation_router", "routers.automation_router", ["/automation"])
+
+    # Extended API Modules
+    d("solution_api", "api.solution_api", ["/api/solutions"])
+    d("modules_api", "api.modules_api", ["/api/modules"])
+    d("readonly_api", "api.readonly_api", ["/api/v1"])
+    d("portal_api", "api.portal_api", ["/status", "/nodes", "/simulate", "/presets"])
+    d("ui_connectivity_api", "api.ui_connectivity_api", [
+        "/city", "/genome", "/gate", "/simulation", "/afterimage", "/event", "/stream",
+    ])
+
+    # WebSocket Routers
+    d("ki_websocket", "websocket", ["/ws/ki", "/api/ki"], attrs=("ki_ws_router", "ki_http_router"))
+
+    return registry
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLI: 모듈별 임포트 시간
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def profile_imports() -> List[Dict[str, Any]]:
+    """선언된 라우터 모듈을 순서대로 임포트하며 시간 측정 (공유 의존성은 먼저 임포트한 쪽에 계상)"""
+    registry = declare_autus_routers(LazyRouterRegistry())
+    for entry in registry.entries:
+        registry._import(entry)
+    return registry.profile()["modules"]
+
+
+if __name__ == "__main__":
+    import json
+    import os
+    import sys
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    logging.basicConfig(level=logging.WARNING)
+
+    modules = profile_imports()
+    if "--json" in sys.argv:
+        print(json.dumps(modules, ensure_ascii=False, indent=2))
+    else:
+        print(f"{'module':<32}{'import ms':>12}  status")
+        for m in modules:
+            status = "ok" if not m["failed"] else m["failed"][:60]
+            print(f"{m['module']:<32}{m['import_ms']:>12.1f}  {status}")
+        print(f"{'total':<32}{sum(m['import_ms'] for m in modules):>12.1f}")
@@ -14,8 +14,9 @@
 import asyncio
 import json
 import logging
+import os
 from datetime import datetime
-from typing import AsyncGenerator, List, Dict, Any
+from typing import AsyncGenerator, List, Dict, Any, Optional
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from collections import deque
@@ -23,6 +24,8 @@ from collections import deque
 from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
 
+from core.pubsub import Envelope, PubSubBus, get_pubsub_bus
+
 logger = logging.getLogger("autus.stream")
 
 router = APIRouter(prefix="/stream", tags=["Streaming"])
@@ -47,41 +50,194 @@ class StreamEvent:
     message: str
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     data: Dict[str, Any] = field(default_factory=dict)
+    seq: int = 0  # 버스 토픽 순번 (워커 간 공통, 누락 감지용)
+
+
+# 구독자별 큐 크기 (가득 차면 가장 오래된 이벤트 폐기)
+STREAM_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", "256"))
+
+
+class EventRingBuffer:
+    """
+    고정 크기 이벤트 링 버퍼 (seq 오름차순)
+    
+    since(seq) 는 이진 탐색으로 시작 위치를 찾으므로
+    Last-Event-ID 재접속이 버퍼 전체를 훑지 않는다.
+    """
+    
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self._buf: List[Optional[StreamEvent]] = [None] * self.capacity
+        self._start = 0
+        self._len = 0
+    
+    def __len__(self) -> int:
+        return self._len
+    
+    def __iter__(self):
+        for i in range(self._len):
+            yield self._buf[(self._start + i) % self.capacity]
+    
+    def _at(self, i: int) -> StreamEvent:
+        return self._buf[(self._start + i) % self.capacity]
+    
+    def append(self, event: StreamEvent):
+        if self._len < self.capacity:
+            self._buf[(self._start + self._len) % self.capacity] = event
+            self._len += 1
+        else:
+            self._buf[self._start] = event
+            self._start = (self._start + 1) % self.capacity
+    
+    @property
+    def first_seq(self) -> Optional[int]:
+        return self._at(0).seq if self._len else None
+    
+    @property
+    def last_seq(self) -> Optional[int]:
+        return self._at(self._len - 1).seq if self._len else None
+    
+    def since(self, seq: int) -> List[StreamEvent]:
+        """seq 이후 이벤트 (seq 는 제외)"""
+        lo, hi = 0, self._len
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._at(mid).seq <= seq:
+                lo = mid + 1
+            else:
+                hi = mid
+        return [self._at(i) for i in range(lo, self._len)]
+    
+    def tail(self, limit: int) -> List[StreamEvent]:
+        return [self._at(i) for i in range(max(0, self._len - limit), self._len)]
+
+
+class StreamSubscriber:
+    """
+    SSE 구독자 1명의 bounded 큐
+    
+    - progress 이벤트: 같은 작업(message)의 대기 중 이벤트를 최신값으로 교체 (coalesce)
+    - 가득 참: 가장 오래된 이벤트 폐기 (drop-oldest) → 버려진 탭이 메모리를 잡지 않음
+    """
+    
+    def __init__(self, maxsize: int = STREAM_QUEUE_SIZE):
+        self.maxsize = maxsize
+        self._events: deque = deque()
+        self._ready = asyncio.Event()
+        self.dropped = 0
+        self.coalesced = 0
+    
+    def qsize(self) -> int:
+        return len(self._events)
+    
+    def offer(self, event: StreamEvent):
+        if event.type == "progress":
+            for i, queued in enumerate(self._events):
+                if queued.type == "progress" and queued.message == event.message:
+                    del self._events[i]
+                    self.coalesced += 1
+                    break
+        if len(self._events) >= self.maxsize:
+            self._events.popleft()
+            self.dropped += 1
+        self._events.append(event)
+        self._ready.set()
+    
+    async def get(self) -> StreamEvent:
+        while not self._events:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._events.popleft()
 
 
 class StreamManager:
-    """실시간 스트림 관리자"""
+    """
+    실시간 스트림 관리자
+    
+    broadcast 는 pub/sub 버스로 모든 워커에 전달되고,
+    각 워커가 자기 이력(링 버퍼)과 구독자 큐에 넣는다.
+    구독자 큐는 bounded — 전달은 큐 적재만 하고 반환 (느린 구독자를 기다리지 않음).
+    """
     
-    def __init__(self, max_history: int = 100):
-        self.subscribers: List[asyncio.Queue] = []
-        self.history: deque = deque(maxlen=max_history)
+    TOPIC = "stream.events"
+    
+    def __init__(
+        self,
+        max_history: int = 100,
+        bus: Optional[PubSubBus] = None,
+        queue_size: int = STREAM_QUEUE_SIZE,
+    ):
+        self.subscribers: List[StreamSubscriber] = []
+        self.history = EventRingBuffer(max_history)
+        self.queue_size = queue_size
         self.event_counter = 0
+        self.bus = bus or get_pubsub_bus()
+        self.bus.subscribe(self.TOPIC, self._deliver)
+        
+        self.resumed = 0
+        self.resume_misses = 0   # Last-Event-ID 가 버퍼 밖 → 보관분 전체 재전송
+        self.dropped = 0         # 해제된 구독자 누적 (현재 구독자는 stats 에서 합산)
+        self.coalesced = 0
         
-    async def subscribe(self) -> asyncio.Queue:
-        """새 구독자 등록"""
-        queue = asyncio.Queue()
-        self.subscribers.append(queue)
+    async def subscribe(self, last_event_id: Optional[int] = None) -> StreamSubscriber:
+        """
+        새 구독자 등록
         
-        # 최근 이력 전송
-        for event in self.history:
-            await queue.put(event)
+        last_event_id 가 있으면 그 이후 이벤트만, 없으면 보관 중인 최근 이력을 재전송.
+        """
+        subscriber = StreamSubscriber(self.queue_size)
+        self.subscribers.append(subscriber)
+        
+        history = self.history
+        if last_event_id is None:
+            backlog = history.tail(self.queue_size)
+        else:
+            self.resumed += 1
+            first, last = history.first_seq, history.last_seq
+            if first is not None and (last_event_id < first - 1 or last_event_id > last):
+                # 버퍼에서 밀려났거나 (오래된 id) 서버 재시작으로 seq 가 초기화됨
+                self.resume_misses += 1
+                backlog = history.tail(self.queue_size)
+            else:
+                backlog = history.since(last_event_id)
+        for event in backlog:
+            subscriber.offer(event)
             
-        return queue
+        return subscriber
     
-    def unsubscribe(self, queue: asyncio.Queue):
+    def unsubscribe(self, subscriber: StreamSubscriber):
         """구독 해제"""
-        if queue in self.subscribers:
-            self.subscribers.remove(queue)
+        if subscriber in self.subscribers:
+            self.subscribers.remove(subscriber)
+            self.dropped += subscriber.dropped
+            self.coalesced += subscriber.coalesced
     
     async def broadcast(self, event: StreamEvent):
-        """모든 구독자에게 이벤트 전송"""
+        """모든 워커의 구독자에게 이벤트 전송"""
+        await self.bus.publish(self.TOPIC, asdict(event))
+    
+    def _deliver(self, envelope: Envelope):
+        event = StreamEvent(**{**envelope.payload, "seq": envelope.seq})
         self.history.append(event)
         
-        for queue in self.subscribers:
-            try:
-                await queue.put(event)
-            except Exception as e:
-                logger.warning(f"Failed to send to subscriber: {e}")
+        for subscriber in self.subscribers:
+            subscriber.offer(event)
+    
+    def stats(self) -> Dict[str, Any]:
+        depths = [s.qsize() for s in self.subscribers]
+        return {
+            "subscribers": len(self.subscribers),
+            "queue_size": self.queue_size,
+            "queued": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "dropped": self.dropped + sum(s.dropped for s in self.subscribers),
+            "coalesced": self.coalesced + sum(s.coalesced for s in self.subscribers),
+            "history": len(self.history),
+            "first_seq": self.history.first_seq,
+            "last_seq": self.history.last_seq,
+            "resumed": self.resumed,
+            "resume_misses": self.resume_misses,
+        }
     
     async def emit_log(
         self, 
@@ -141,9 +297,18 @@ class StreamManager:
 stream_manager = StreamManager()
 
 
+def _last_event_id(request: Request) -> Optional[int]:
+    """Last-Event-ID 헤더 (EventSource 자동 재접속) 또는 last_event_id 쿼리"""
+    value = request.headers.get("last-event-id") or request.query_params.get("last_event_id")
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
 async def event_generator(request: Request) -> AsyncGenerator[str, None]:
     """SSE 이벤트 제너레이터"""
-    queue = await stream_manager.subscribe()
+    queue = await stream_manager.subscribe(_last_event_id(request))
     
     try:
         while True:
@@ -157,7 +322,7 @@ async def event_generator(request: Request) -> AsyncGenerator[str, None]:
                 
                 # SSE 형식으로 전송
                 data = json.dumps(asdict(event), ensure_ascii=False)
-                yield f"event: {event.type}\ndata: {data}\n\n"
+                yield f"id: {event.seq}\nevent: {event.type}\ndata: {data}\n\n"
                 
             except asyncio.TimeoutError:
                 # 연결 유지를 위한 ping
@@ -178,6 +343,8 @@ async def stream_events(request: Request):
     - progress: 진행 상황
     - result: 작업 결과
     - ping: 연결 유지
+    
+    각 이벤트의 id 는 seq — 재접속 시 Last-Event-ID 이후 이벤트만 받는다.
     """
     return StreamingResponse(
         event_generator(request),
@@ -225,13 +392,21 @@ async def get_history(limit: int = 50):
     """
     최근 이벤트 이력 조회
     """
-    history = list(stream_manager.history)[-limit:]
+    history = stream_manager.history.tail(limit)
     return {
         "count": len(history),
         "events": [asdict(e) for e in history]
     }
 
 
+@router.get("/stats")
+async def get_stream_stats():
+    """
+    구독자 큐 깊이 / 폐기 / 재접속 메트릭
+    """
+    return stream_manager.stats()
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # AI Chain of Thought 헬퍼 함수
 # ═══════════════════════════════════════════════════════════════════════════════
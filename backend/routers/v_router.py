@@ -87,6 +87,7 @@ class VPredictRequest(BaseModel):
     # Common
     t: int = Field(12, ge=1, le=60, description="예측 기간 (월)")
     uncertainty: float = Field(0.1, ge=0, le=0.5, description="불확실성 계수")
+    monte_carlo_paths: int = Field(0, ge=0, le=50000, description="Monte Carlo 경로 수 (0 = 끔)")
     
     def get_motions(self) -> float:
         return self.motions if self.motions is not None else (self.M or 0)
@@ -170,6 +171,22 @@ class WhatIfRequest(BaseModel):
         return self.current_relations if self.current_relations is not None else (self.current_s or 0)
 
 
+class DemonProfile(BaseModel):
+    user_type: str = "balanced"
+    age: int = Field(30, ge=0, le=100)
+    location_factor: float = 0.8
+    growth_rate: float = 0.05
+    core_12: int = Field(5, ge=0, le=12)
+    extended_144: int = Field(20, ge=0, le=144)
+    decisions: Optional[List[Dict[str, Any]]] = None
+    uncertainty: Optional[float] = Field(None, ge=0, le=1)
+
+
+class DemonBatchRequest(BaseModel):
+    profiles: List[DemonProfile] = Field(..., min_length=1, max_length=10000)
+    uncertainty: float = Field(0.15, ge=0, le=1, description="프로필에 없을 때 기본 불확정성")
+
+
 class TrainRequest(BaseModel):
     history: List[Dict[str, float]] = Field(
         ...,
@@ -241,7 +258,8 @@ async def predict_v(req: VPredictRequest):
             T=req.T,
             s=req.s,
             t=req.t,
-            uncertainty=req.uncertainty
+            uncertainty=req.uncertainty,
+            paths=req.monte_carlo_paths
         )
         
         return {
@@ -438,6 +456,30 @@ async def summon_laplace_demon(
         raise HTTPException(500, str(e))
 
 
+@router.post("/demon/batch")
+async def summon_laplace_demon_batch(req: DemonBatchRequest):
+    """
+    😈 라플라스 악마 벌크 소환
+    
+    여러 사용자 프로필의 결정을 한 번에 예측 (Relations 는 사전 계산 테이블 조회)
+    """
+    try:
+        from physics.laplace_demon import summon_many
+        
+        profiles = [p.model_dump(exclude_none=True) for p in req.profiles]
+        results = summon_many(profiles, uncertainty=req.uncertainty)
+        
+        return {
+            "success": True,
+            "count": len(results),
+            "results": results
+        }
+        
+    except Exception as e:
+        logger.error(f"라플라스 악마 벌크 소환 실패: {e}")
+        raise HTTPException(500, str(e))
+
+
 @router.post("/transformer/train")
 async def train_transformer(
     model_type: str = "patchtst",
@@ -464,6 +506,8 @@ async def train_transformer(
         y = [d["target"] for d in training_data]
         
         result = predictor.fit(X, y, epochs=epochs)
+        if "error" not in result:
+            result["checkpoint_version"] = predictor.save()
         
         return {
             "success": True,
@@ -503,7 +547,7 @@ async def transformer_predict(
                 "error": "recent_sequence 필요 (형식: [[M,T,s,nd], ...])"
             }
         
-        result = predictor.predict(recent_sequence)
+        result = await predictor.predict_async(recent_sequence)
         
         return {
             "success": True,
@@ -24,6 +24,7 @@ try:
         CollectedData,
         NodeContribution,
     )
+    from integrations.http_pool import close_http_pool
 except ImportError as e:
     pytestmark = pytest.mark.skip(reason=f"Collectors not available: {e}")
 
@@ -171,6 +172,134 @@ class TestGmailCollector:
         assert isinstance(slots["candidates"], list)
 
 
+class _GmailStub:
+    """지연을 흉내내는 Gmail API 스텁 서버"""
+    
+    def __init__(self, count: int = 40, latency: float = 0.05, throttle: int = 0):
+        self.count = count
+        self.latency = latency
+        self.throttle = throttle
+        self.detail_calls = 0
+        self.history_calls = 0
+    
+    def app(self):
+        from aiohttp import web
+        import asyncio
+        
+        async def profile(request):
+            return web.json_response({"historyId": "100"})
+        
+        async def messages(request):
+            return web.json_response({"messages": [{"id": f"m{i}"} for i in range(self.count)]})
+        
+        async def message(request):
+            if self.throttle > 0:
+                self.throttle -= 1
+                return web.json_response({}, status=429, headers={"Retry-After": "0"})
+            self.detail_calls += 1
+            await asyncio.sleep(self.latency)
+            msg_id = request.match_info["id"]
+            return web.json_response({
+                "id": msg_id, "threadId": "t", "labelIds": ["INBOX"],
+                "payload": {"headers": [{"name": "Subject", "value": msg_id}]},
+            })
+        
+        async def history(request):
+            self.history_calls += 1
+            if request.query.get("startHistoryId") == "expired":
+                return web.json_response({}, status=404)
+            return web.json_response({
+                "historyId": "105",
+                "history": [
+                    {"messagesAdded": [{"message": {"id": "new1"}}]},
+                    {"messagesAdded": [{"message": {"id": "new2"}}, {"message": {"id": "new1"}}]},
+                ],
+            })
+        
+        app = web.Application()
+        app.router.add_get("/users/me/profile", profile)
+        app.router.add_get("/users/me/messages", messages)
+        app.router.add_get("/users/me/messages/{id}", message)
+        app.router.add_get("/users/me/history", history)
+        return app
+
+
+def _run_gmail(stub, history_id=None, max_concurrency=None, max_messages=None, pending_message_ids=None):
+    """스텁 서버를 띄워 GmailCollector.fetch_data 실행 → (메시지, 소요시간, 수집기)"""
+    import asyncio
+    import time
+    from aiohttp.test_utils import TestServer
+    
+    async def run():
+        server = TestServer(stub.app())
+        await server.start_server()
+        collector = GmailCollector(
+            "id", "secret", "http://localhost/cb",
+            tokens=OAuthTokens(access_token="t", expires_at=datetime.now() + timedelta(hours=1)),
+            max_concurrency=max_concurrency,
+            max_messages=max_messages,
+            history_id=history_id,
+            pending_message_ids=pending_message_ids,
+        )
+        collector.GMAIL_API_BASE = str(server.make_url("")).rstrip("/")
+        try:
+            start = time.perf_counter()
+            messages = await collector.fetch_data()
+            return messages, time.perf_counter() - start, collector
+        finally:
+            await collector.close()
+            await close_http_pool()
+            await server.close()
+    
+    return asyncio.run(run())
+
+
+class TestGmailConcurrentFetch:
+    """Gmail 동시 상세 조회 / 429 백오프 / 증분 동기화"""
+    
+    def test_concurrent_faster_than_serial(self):
+        serial, serial_time, _ = _run_gmail(_GmailStub(), max_concurrency=1)
+        concurrent, concurrent_time, _ = _run_gmail(_GmailStub(), max_concurrency=10)
+        assert [m["id"] for m in concurrent] == [m["id"] for m in serial]
+        assert serial_time / concurrent_time > 3
+    
+    def test_retries_on_429(self):
+        stub = _GmailStub(count=5, latency=0, throttle=3)
+        messages, _, _ = _run_gmail(stub)
+        assert len(messages) == 5
+        assert stub.detail_calls == 5
+    
+    def test_full_sync_records_history_id(self):
+        _, _, collector = _run_gmail(_GmailStub(count=3, latency=0))
+        assert collector.history_id == "100"
+    
+    def test_incremental_sync(self):
+        stub = _GmailStub(latency=0)
+        messages, _, collector = _run_gmail(stub, history_id="100")
+        assert [m["id"] for m in messages] == ["new1", "new2"]
+        assert collector.history_id == "105"
+    
+    def test_incremental_sync_carries_ids_over_cap(self):
+        stub = _GmailStub(latency=0)
+        messages, _, collector = _run_gmail(stub, history_id="100", max_messages=1, pending_message_ids=["old1"])
+        assert [m["id"] for m in messages] == ["old1"]
+        assert collector.pending_message_ids == ["new1", "new2"]
+        assert collector.history_id == "105"
+        
+        messages, _, collector = _run_gmail(
+            stub, history_id=collector.history_id, max_messages=2,
+            pending_message_ids=collector.pending_message_ids,
+        )
+        assert [m["id"] for m in messages] == ["new1", "new2"]
+        assert collector.pending_message_ids == []
+    
+    def test_expired_history_falls_back_to_full_sync(self):
+        stub = _GmailStub(count=4, latency=0)
+        messages, _, collector = _run_gmail(stub, history_id="expired")
+        assert len(messages) == 4
+        assert collector.history_id == "100"
+
+
 class TestCalendarCollector:
     """Calendar 수집기 테스트"""
     
@@ -293,6 +422,141 @@ class TestSlackCollector:
         assert any(n in node_ids for n in ["NET_A", "NET_D", "TEAM_A"])
 
 
+class _SlackStub:
+    """채널/메시지 커서 페이지네이션을 흉내내는 Slack Web API 스텁"""
+    
+    def __init__(self, channels: int = 30, per_channel: int = 25, page_size: int = 10,
+                 latency: float = 0.0, throttle: int = 0):
+        self.channels = [{"id": f"C{i}", "name": f"ch{i}"} for i in range(channels)]
+        self.dms = [{"id": "D0", "user": "U1"}]
+        self.messages = {
+            c["id"]: [{"ts": f"{1700000000 + n}.000100", "user": f"U{n % 3}", "text": "hi"}
+                      for n in range(per_channel)]
+            for c in self.channels + self.dms
+        }
+        self.page_size = page_size
+        self.latency = latency
+        self.throttle = throttle
+        self.history_calls = 0
+    
+    def add_message(self, channel_id: str, ts: float):
+        self.messages[channel_id].append({"ts": f"{ts:.6f}", "user": "U2", "text": "new"})
+    
+    def _page(self, items, request):
+        start = int(request.query.get("cursor") or 0)
+        page = items[start:start + self.page_size]
+        next_cursor = str(start + self.page_size) if start + self.page_size < len(items) else ""
+        return page, {"next_cursor": next_cursor}
+    
+    def app(self):
+        from aiohttp import web
+        import asyncio
+        
+        async def users(request):
+            members = [{"id": f"U{i}", "name": f"user{i}"} for i in range(3)]
+            page, meta = self._page(members, request)
+            return web.json_response({"ok": True, "members": page, "response_metadata": meta})
+        
+        async def conversations(request):
+            items = self.dms if request.query["types"] == "im" else self.channels
+            page, meta = self._page(items, request)
+            return web.json_response({"ok": True, "channels": page, "response_metadata": meta})
+        
+        async def history(request):
+            if self.throttle > 0:
+                self.throttle -= 1
+                return web.json_response({"ok": False, "error": "ratelimited"},
+                                         status=429, headers={"Retry-After": "0"})
+            self.history_calls += 1
+            await asyncio.sleep(self.latency)
+            oldest = float(request.query.get("oldest", 0))
+            # Slack 은 최신순 반환, oldest 는 배타적
+            items = sorted((m for m in self.messages[request.query["channel"]] if float(m["ts"]) > oldest),
+                           key=lambda m: float(m["ts"]), reverse=True)
+            page, meta = self._page([dict(m) for m in items], request)
+            return web.json_response({"ok": True, "messages": page, "response_metadata": meta})
+        
+        app = web.Application()
+        app.router.add_get("/users.list", users)
+        app.router.add_get("/conversations.list", conversations)
+        app.router.add_get("/conversations.history", history)
+        return app
+
+
+def _run_slack(stub, collect=False, **kwargs):
+    """스텁 서버에 대해 SlackCollector 실행 → (결과, 수집기)"""
+    import asyncio
+    from aiohttp.test_utils import TestServer
+    
+    async def run():
+        server = TestServer(stub.app())
+        await server.start_server()
+        collector = SlackCollector(
+            "id", "secret", "http://localhost/cb",
+            tokens=OAuthTokens(access_token="t", expires_at=datetime.now() + timedelta(hours=1)),
+            tier_rates={2: 6000, 3: 6000},
+            **kwargs,
+        )
+        collector.SLACK_API_BASE = str(server.make_url("")).rstrip("/")
+        since = datetime.fromtimestamp(1600000000)
+        try:
+            if collect:
+                return await collector.collect(since=since), collector
+            return await collector.fetch_data(since=since), collector
+        finally:
+            await collector.close()
+            await close_http_pool()
+            await server.close()
+    
+    return asyncio.run(run())
+
+
+class TestSlackParallelFetch:
+    """Slack 전체 페이지 수집 / 워터마크 / 스트리밍"""
+    
+    def test_collects_all_channels_and_pages(self):
+        stub = _SlackStub(channels=30, per_channel=25, page_size=10)
+        data, _ = _run_slack(stub)
+        messages = data[0]["messages"]
+        assert len(data[0]["channels"]) == 30
+        assert len(messages) == 31 * 25
+        assert sum(1 for m in messages if m.get("channel_type") == "dm") == 25
+    
+    def test_watermarks_make_next_run_incremental(self, tmp_path):
+        path = str(tmp_path / "slack_watermarks.json")
+        stub = _SlackStub(channels=3, per_channel=5)
+        _run_slack(stub, watermark_path=path)
+        assert os.path.exists(path)
+        
+        stub.add_message("C1", 1800000000.5)
+        data, collector = _run_slack(stub, watermark_path=path)
+        assert [m["text"] for m in data[0]["messages"]] == ["new"]
+        assert collector.watermarks["C1"] == "1800000000.500000"
+    
+    def test_channels_read_in_parallel(self):
+        import time
+        stub = _SlackStub(channels=16, per_channel=5, latency=0.05)
+        start = time.perf_counter()
+        _run_slack(stub, max_concurrency=1)
+        serial = time.perf_counter() - start
+        start = time.perf_counter()
+        _run_slack(stub, max_concurrency=16)
+        parallel = time.perf_counter() - start
+        assert serial / parallel > 3
+    
+    def test_retries_on_429(self):
+        stub = _SlackStub(channels=2, per_channel=3, throttle=2)
+        data, _ = _run_slack(stub)
+        assert len(data[0]["messages"]) == 9
+    
+    def test_streaming_collect_matches_batch_mapping(self):
+        stub = _SlackStub(channels=5, per_channel=12)
+        collected, _ = _run_slack(stub, collect=True)
+        data, collector = _run_slack(_SlackStub(channels=5, per_channel=12))
+        assert collected.metadata["collected_count"] == len(data[0]["messages"])
+        assert collected.slot_mappings == collector.map_to_slots(data)
+
+
 class TestDataSourceType:
     """데이터 소스 타입 테스트"""
     
@@ -0,0 +1,770 @@
+# backend/webhooks/ingest_queue.py
+# 웹훅 비동기 수신 큐 - 즉시 202 응답 + 백그라운드 배치 그래프 쓰기
+"""
+Webhook Ingest Queue
+====================
+
+요청 경로에서는 검증 → 로컬 큐 append → 202 만 수행하고,
+정제 / 그래프 쓰기 / 브로드캐스트는 백그라운드 컨슈머가 배치로 처리한다.
+
+- DurableWebhookQueue : SQLite(WAL) 기반 영속 큐. 프로세스 재시작 후에도 유실 없음
+                        (lease 만료 시 재전달 → at-least-once)
+- GraphBatch          : 배치 내 노드 중복 제거 + 모션 누적 + 브로드캐스트 병합
+- GraphBatchWriter    : execute(query, params) 클라이언트면 UNWIND 쿼리 2회,
+                        아니면 upsert_node/create_motion 을 제한 병렬로 호출
+- WebhookIngestor     : lease → plan → write → ack 루프
+
+환경변수:
+    WEBHOOK_QUEUE_PATH       큐 DB 경로 (기본 data/webhook_queue.db)
+    WEBHOOK_QUEUE_SYNC       SQLite synchronous (NORMAL | FULL, 기본 NORMAL)
+    WEBHOOK_BATCH_SIZE       배치 크기 (기본 500)
+    WEBHOOK_BATCH_LINGER_MS  배치 채우기 대기 (기본 20)
+
+부하 테스트:
+    python -m webhooks.ingest_queue --events 20000 --concurrency 200
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+
+from core.idempotency import IdempotencyGuard, event_key
+from core.microbatch import MicroBatcher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_PATH = "data/webhook_queue.db"
+
+
+# ============================================
+# 영속 큐
+# ============================================
+
+@dataclass
+class QueuedWebhook:
+    """큐에서 lease 된 웹훅 1건"""
+    id: int
+    source: str
+    payload: bytes
+    headers: Dict[str, Any]
+    received_at: float
+    attempts: int
+
+
+class DurableWebhookQueue:
+    """
+    SQLite(WAL) 기반 웹훅 큐
+
+    append 는 INSERT 1회 (autocommit) 이므로 요청 경로에서 호출해도 수십 µs 수준.
+    lease 된 행은 ack 전까지 다른 컨슈머에 보이지 않으며,
+    lease 가 만료되면 (컨슈머 크래시 등) 다시 전달된다.
+    max_attempts 를 넘긴 행은 dead 로 표시되어 더 이상 전달되지 않는다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_attempts: int = 5,
+        synchronous: Optional[str] = None,
+    ):
+        self.path = path or os.getenv("WEBHOOK_QUEUE_PATH", DEFAULT_QUEUE_PATH)
+        self.max_attempts = max_attempts
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self.conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        sync = (synchronous or os.getenv("WEBHOOK_QUEUE_SYNC", "NORMAL")).upper()
+        self.conn.execute(f"PRAGMA synchronous={'FULL' if sync == 'FULL' else 'NORMAL'}")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS webhook_queue (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                headers TEXT,
+                received_at REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                leased_until REAL NOT NULL DEFAULT 0,
+                dead INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT
+            )
+        """)
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_webhook_queue_ready "
+            "ON webhook_queue (dead, leased_until, id)"
+        )
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[], None]] = []
+
+        self.appended = 0
+        self.acked = 0
+        self.retried = 0
+        self.dead_lettered = 0
+
+    def add_listener(self, callback: Callable[[], None]):
+        """append 시 호출될 콜백 (컨슈머 깨우기)"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[], None]):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    # ─────────────────────────────────────────
+    # 생산자
+    # ─────────────────────────────────────────
+
+    def append(self, source: str, payload: bytes, headers: Optional[Dict[str, Any]] = None) -> int:
+        """웹훅 1건 추가 → 큐 id"""
+        with self._lock:
+            cur = self.conn.execute(
+                "INSERT INTO webhook_queue (source, payload, headers, received_at) VALUES (?, ?, ?, ?)",
+                (source, payload, json.dumps(headers or {}), time.time()),
+            )
+            self.appended += 1
+        for callback in self._listeners:
+            callback()
+        return cur.lastrowid
+
+    def append_many(self, rows: List[Tuple[str, bytes, Optional[Dict[str, Any]]]]) -> List[int]:
+        """(source, payload, headers) 여러 건을 트랜잭션 1회로 추가 → 큐 id 목록"""
+        if not rows:
+            return []
+        now = time.time()
+        with self._lock:
+            self.conn.execute("BEGIN")
+            try:
+                ids = [
+                    self.conn.execute(
+                        "INSERT INTO webhook_queue (source, payload, headers, received_at) VALUES (?, ?, ?, ?)",
+                        (source, payload, json.dumps(headers or {}), now),
+                    ).lastrowid
+                    for source, payload, headers in rows
+                ]
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.appended += len(ids)
+        for callback in self._listeners:
+            callback()
+        return ids
+
+    # ─────────────────────────────────────────
+    # 소비자
+    # ─────────────────────────────────────────
+
+    def lease(self, limit: int, lease_seconds: float = 30.0) -> List[QueuedWebhook]:
+        """처리 가능한 행을 최대 limit 개 lease"""
+        now = time.time()
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self.conn.execute(
+                    "SELECT id, source, payload, headers, received_at, attempts FROM webhook_queue "
+                    "WHERE dead = 0 AND leased_until <= ? ORDER BY id LIMIT ?",
+                    (now, limit),
+                ).fetchall()
+                if rows:
+                    self.conn.executemany(
+                        "UPDATE webhook_queue SET leased_until = ? WHERE id = ?",
+                        [(now + lease_seconds, row[0]) for row in rows],
+                    )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+        return [
+            QueuedWebhook(
+                id=row[0], source=row[1], payload=row[2],
+                headers=json.loads(row[3] or "{}"), received_at=row[4], attempts=row[5],
+            )
+            for row in rows
+        ]
+
+    def ack(self, ids: List[int]):
+        """처리 완료 → 삭제"""
+        if not ids:
+            return
+        with self._lock:
+            self.conn.execute("BEGIN")
+            self.conn.executemany("DELETE FROM webhook_queue WHERE id = ?", [(i,) for i in ids])
+            self.conn.execute("COMMIT")
+            self.acked += len(ids)
+
+    def nack(self, ids: List[int], error: str = "", retry_after: float = 1.0, dead: bool = False):
+        """
+        처리 실패 → attempts 증가 후 retry_after 뒤 재전달.
+        max_attempts 초과 또는 dead=True (파싱 불가 등) 면 dead-letter.
+        """
+        if not ids:
+            return
+        retry_at = time.time() + retry_after
+        with self._lock:
+            self.conn.execute("BEGIN")
+            self.conn.executemany(
+                "UPDATE webhook_queue SET attempts = attempts + 1, leased_until = ?, last_error = ?, "
+                "dead = CASE WHEN ? OR attempts + 1 >= ? THEN 1 ELSE 0 END WHERE id = ?",
+                [(retry_at, error[:500], int(dead), self.max_attempts, i) for i in ids],
+            )
+            self.conn.execute("COMMIT")
+            newly_dead = self.conn.execute(
+                f"SELECT COUNT(*) FROM webhook_queue WHERE dead = 1 AND id IN ({','.join('?' * len(ids))})",
+                ids,
+            ).fetchone()[0]
+        self.dead_lettered += newly_dead
+        self.retried += len(ids) - newly_dead
+
+    # ─────────────────────────────────────────
+    # 상태
+    # ─────────────────────────────────────────
+
+    def depth(self) -> int:
+        """처리 대기 중인 행 수 (lease 중 포함, dead 제외)"""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM webhook_queue WHERE dead = 0").fetchone()[0]
+
+    def dead_letters(self, limit: int = 100) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT id, source, attempts, last_error, received_at FROM webhook_queue "
+                "WHERE dead = 1 ORDER BY id LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [
+            {"id": r[0], "source": r[1], "attempts": r[2], "error": r[3], "received_at": r[4]}
+            for r in rows
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending, dead = self.conn.execute(
+                "SELECT COALESCE(SUM(dead = 0), 0), COALESCE(SUM(dead = 1), 0) FROM webhook_queue"
+            ).fetchone()
+        return {
+            "path": self.path,
+            "pending": pending,
+            "dead": dead,
+            "appended": self.appended,
+            "acked": self.acked,
+            "retried": self.retried,
+            "dead_lettered": self.dead_lettered,
+        }
+
+    def close(self):
+        batcher = getattr(self, "_append_batcher", None)
+        if batcher is not None:
+            batcher.close()
+        with self._lock:
+            self.conn.close()
+
+
+# ============================================
+# 배치 계획
+# ============================================
+
+@dataclass
+class GraphBatch:
+    """
+    한 배치에서 수행할 그래프 쓰기 + 브로드캐스트
+
+    노드는 external_id 로 중복 제거, 모션은 모두 보존.
+    브로드캐스트는 키별로 합산해 배치당 1회만 전송한다.
+    """
+    nodes: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    motions: List[Dict[str, Any]] = field(default_factory=list)
+    node_updates: Dict[str, Tuple[float, str]] = field(default_factory=dict)
+    motion_updates: Dict[Tuple[str, str], float] = field(default_factory=dict)
+    received: Dict[Tuple[str, str], Tuple[int, float]] = field(default_factory=dict)
+
+    def upsert_node(self, external_id: str, source: str):
+        self.nodes[external_id] = {"external_id": external_id, "source": source}
+
+    def create_motion(self, source_id: str, target_id: str, amount: float, direction: str):
+        self.motions.append({
+            "source_id": source_id,
+            "target_id": target_id,
+            "amount": float(amount),
+            "direction": direction,
+        })
+
+    def node_update(self, node_id: str, value: float, source: str):
+        prev, _ = self.node_updates.get(node_id, (0.0, source))
+        self.node_updates[node_id] = (prev + float(value), source)
+
+    def motion_update(self, source_id: str, target_id: str, amount: float):
+        key = (source_id, target_id)
+        self.motion_updates[key] = self.motion_updates.get(key, 0.0) + float(amount)
+
+    def webhook_received(self, source: str, flow_type: str, value: float):
+        count, total = self.received.get((source, flow_type), (0, 0.0))
+        self.received[(source, flow_type)] = (count + 1, total + float(value))
+
+    @property
+    def broadcast_count(self) -> int:
+        return len(self.node_updates) + len(self.motion_updates) + len(self.received)
+
+
+# 웹훅 1건을 배치에 반영하는 함수: (source, data, headers, batch) -> None
+PlanFn = Callable[[str, Dict[str, Any], Dict[str, Any], GraphBatch], None]
+BroadcastFn = Callable[[GraphBatch], Awaitable[None]]
+
+
+# ============================================
+# 그래프 배치 쓰기
+# ============================================
+
+UPSERT_NODES_CYPHER = """
+UNWIND $nodes AS n
+MERGE (x:Node {external_id: n.external_id})
+ON CREATE SET x.source = n.source, x.created_at = timestamp()
+SET x.updated_at = timestamp()
+"""
+
+CREATE_MOTIONS_CYPHER = """
+UNWIND $motions AS m
+MERGE (a:Node {external_id: m.source_id})
+MERGE (b:Node {external_id: m.target_id})
+CREATE (a)-[:MOTION {amount: m.amount, direction: m.direction, created_at: timestamp()}]->(b)
+"""
+
+
+class GraphBatchWriter:
+    """
+    GraphBatch → 그래프 DB
+
+    - execute(query, params) 를 가진 클라이언트 (db.neo4j_client.Neo4jClient):
+      UNWIND 쿼리 2회 (동기 드라이버면 스레드에서 실행)
+    - 그 외 (async upsert_node / create_motion): 항목별 호출을 concurrency 만큼 병렬로
+    """
+
+    def __init__(self, client: Any, concurrency: int = 16):
+        self.client = client
+        self.concurrency = concurrency
+        self.batches = 0
+        self.nodes_written = 0
+        self.motions_written = 0
+
+    async def write(self, batch: GraphBatch):
+        nodes = list(batch.nodes.values())
+        execute = getattr(self.client, "execute", None)
+        if callable(execute):
+            if nodes:
+                await self._execute(execute, UPSERT_NODES_CYPHER, {"nodes": nodes})
+            if batch.motions:
+                await self._execute(execute, CREATE_MOTIONS_CYPHER, {"motions": batch.motions})
+        else:
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def bounded(coro):
+                async with semaphore:
+                    return await coro
+
+            # 노드를 먼저 만들어야 모션이 참조 가능
+            await asyncio.gather(*(bounded(self.client.upsert_node(**n)) for n in nodes))
+            await asyncio.gather(*(bounded(self.client.create_motion(**m)) for m in batch.motions))
+
+        self.batches += 1
+        self.nodes_written += len(nodes)
+        self.motions_written += len(batch.motions)
+
+    @staticmethod
+    async def _execute(execute: Callable, query: str, params: Dict[str, Any]):
+        if asyncio.iscoroutinefunction(execute):
+            return await execute(query, params)
+        return await asyncio.to_thread(execute, query, params)
+
+
+# ============================================
+# 컨슈머
+# ============================================
+
+class WebhookIngestor:
+    """
+    큐 컨슈머
+
+    lease(batch_size) → plan 으로 GraphBatch 구성 → writer.write → ack → broadcast.
+    쓰기 실패 시 배치 전체를 nack (지수 백오프 재시도), plan 실패 건은 즉시 dead-letter.
+    """
+
+    def __init__(
+        self,
+        queue: DurableWebhookQueue,
+        plan: PlanFn,
+        writer: GraphBatchWriter,
+        broadcast: Optional[BroadcastFn] = None,
+        batch_size: Optional[int] = None,
+        linger: Optional[float] = None,
+        lease_seconds: float = 30.0,
+    ):
+        self.queue = queue
+        self.plan = plan
+        self.writer = writer
+        self.broadcast = broadcast
+        self.batch_size = batch_size or int(os.getenv("WEBHOOK_BATCH_SIZE", "500"))
+        self.linger = linger if linger is not None else int(os.getenv("WEBHOOK_BATCH_LINGER_MS", "20")) / 1000
+        self.lease_seconds = lease_seconds
+
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.running = False
+
+        self.processed = 0
+        self.failed_batches = 0
+        self.broadcasts_sent = 0
+        self.broadcasts_coalesced = 0
+        self.lag_ms: List[float] = []
+
+    # ─────────────────────────────────────────
+    # 수명주기
+    # ─────────────────────────────────────────
+
+    async def start(self):
+        if self.running:
+            return
+        self.running = True
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self.queue.add_listener(self._notify)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self, drain: bool = True, timeout: float = 10.0):
+        """정지. drain=True 면 남은 큐를 처리한 뒤 정지"""
+        if drain:
+            await self.drain(timeout)
+        self.running = False
+        self.queue.remove_listener(self._notify)
+        if self._task:
+            self._wakeup.set()
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def drain(self, timeout: float = 10.0) -> bool:
+        """큐가 빌 때까지 대기"""
+        deadline = time.monotonic() + timeout
+        while self.queue.depth() > 0:
+            if time.monotonic() > deadline:
+                return False
+            await asyncio.sleep(0.01)
+        return True
+
+    def _notify(self):
+        if self._wakeup is None or self._loop is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._wakeup.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    # ─────────────────────────────────────────
+    # 처리 루프
+    # ─────────────────────────────────────────
+
+    async def _run(self):
+        while self.running:
+            rows = self.queue.lease(self.batch_size, self.lease_seconds)
+            if not rows:
+                self._wakeup.clear()
+                try:
+                    # lease 만료 / 재시도 대상을 위해 주기적으로도 확인
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+                if self.linger:
+                    await asyncio.sleep(self.linger)
+                continue
+            try:
+                await self.process(rows)
+            except Exception as e:
+                logger.exception("webhook batch failed: %s", e)
+
+    async def process(self, rows: List[QueuedWebhook]):
+        """lease 된 행 배치 처리"""
+        batch = GraphBatch()
+        ok_ids: List[int] = []
+        bad_ids: List[int] = []
+
+        for row in rows:
+            try:
+                data = json.loads(row.payload)
+                self.plan(row.source, data, row.headers, batch)
+                ok_ids.append(row.id)
+            except Exception as e:
+                logger.warning("webhook %s plan failed: %s", row.id, e)
+                bad_ids.append(row.id)
+        self.queue.nack(bad_ids, error="plan failed", dead=True)
+
+        try:
+            await self.writer.write(batch)
+        except Exception as e:
+            self.failed_batches += 1
+            attempts = max((r.attempts for r in rows), default=0)
+            self.queue.nack(ok_ids, error=str(e), retry_after=min(2 ** attempts, 60))
+            logger.warning("webhook batch write failed (%d rows): %s", len(ok_ids), e)
+            return
+
+        self.queue.ack(ok_ids)
+        self.processed += len(ok_ids)
+        now = time.time()
+        ok = set(ok_ids)
+        self.lag_ms.extend((now - r.received_at) * 1000 for r in rows if r.id in ok)
+        if len(self.lag_ms) > 10000:
+            del self.lag_ms[:-10000]
+
+        if self.broadcast and batch.broadcast_count:
+            try:
+                await self.broadcast(batch)
+                self.broadcasts_sent += batch.broadcast_count
+            except Exception as e:
+                logger.warning("webhook broadcast failed: %s", e)
+        # 건별 전송이었다면 웹훅당 최대 3회
+        self.broadcasts_coalesced += max(0, 3 * len(ok_ids) - batch.broadcast_count)
+
+    def stats(self) -> Dict[str, Any]:
+        lag = sorted(self.lag_ms)
+        return {
+            "running": self.running,
+            "batch_size": self.batch_size,
+            "processed": self.processed,
+            "failed_batches": self.failed_batches,
+            "graph_batches": self.writer.batches,
+            "broadcasts_sent": self.broadcasts_sent,
+            "broadcasts_coalesced": self.broadcasts_coalesced,
+            "lag_p50_ms": round(_percentile(lag, 0.5), 2),
+            "lag_p99_ms": round(_percentile(lag, 0.99), 2),
+            "queue": self.queue.stats(),
+        }
+
+
+# ============================================
+# 요청 경로 (acknowledge-fast)
+# ============================================
+
+async def accept_webhook(
+    queue: DurableWebhookQueue,
+    payload: bytes,
+    headers: Dict[str, Any],
+    detect_source: Callable[[Dict[str, Any], Dict[str, Any]], str],
+    idempotency: Optional[IdempotencyGuard] = None,
+    event_id: Optional[Callable[[str, Dict[str, Any], Dict[str, Any]], Optional[str]]] = None,
+) -> JSONResponse:
+    """
+    검증 → (중복 확인) → 큐 append → 202
+
+    JSON 객체가 아니면 400 (재전송해도 성공할 수 없으므로 큐에 넣지 않음).
+    중복이면 큐에 넣지 않고 200 (공급자가 재시도를 멈추도록 2xx).
+    중복 확인과 append 는 블로킹 SQLite 호출이라 큐 전용 쓰기 스레드에서 실행
+    (이벤트 루프 비차단). 동시에 들어온 요청은 트랜잭션 1회로 묶인다 (group commit).
+    """
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="Payload must be a JSON object")
+
+    source = detect_source(headers, data)
+    key = None
+    if idempotency is not None:
+        key = event_key(source, event_id(source, headers, data) if event_id else None, data)
+
+    headers = {k: v for k, v in headers.items() if v is not None}
+    queue_id = await _append_batcher(queue).submit((idempotency, key, source, payload, headers))
+    if queue_id is None:
+        return JSONResponse(status_code=200, content={"accepted": False, "duplicate": True, "source": source})
+    return JSONResponse(status_code=202, content={"accepted": True, "id": queue_id, "source": source})
+
+
+def _append_batcher(queue: DurableWebhookQueue) -> MicroBatcher:
+    """큐별 쓰기 스레드 1개 — 유휴 시 즉시 실행, 바쁠 때 쌓인 요청을 한 트랜잭션으로"""
+    batcher = getattr(queue, "_append_batcher", None)
+    if batcher is None:
+        batcher = MicroBatcher(
+            lambda items: _claim_and_append(queue, items),
+            max_batch=256, max_wait_ms=0, workers=1, name="webhook-append",
+        )
+        queue._append_batcher = batcher
+    return batcher
+
+
+def _claim_and_append(queue: DurableWebhookQueue, items: List[Tuple]) -> List[Optional[int]]:
+    """중복 확인 → 새 이벤트만 append_many. 중복은 None"""
+    fresh = [
+        i for i, (idempotency, key, *_) in enumerate(items)
+        if key is None or idempotency.claim(key)
+    ]
+    try:
+        ids = queue.append_many([items[i][2:] for i in fresh])
+    except Exception:
+        for i in fresh:
+            idempotency, key = items[i][:2]
+            if key is not None:
+                idempotency.release(key)
+        raise
+    results: List[Optional[int]] = [None] * len(items)
+    for i, queue_id in zip(fresh, ids):
+        results[i] = queue_id
+    return results
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+# ============================================
+# Singleton
+# ============================================
+
+_webhook_queue: Optional[DurableWebhookQueue] = None
+
+def get_webhook_queue() -> DurableWebhookQueue:
+    global _webhook_queue
+    if _webhook_queue is None:
+        _webhook_queue = DurableWebhookQueue()
+    return _webhook_queue
+
+
+# ============================================
+# 부하 테스트
+# ============================================
+
+class _MemoryGraph:
+    """부하 테스트용 그래프 클라이언트 (execute 경로)"""
+
+    def __init__(self, write_latency: float = 0.005):
+        self.write_latency = write_latency
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.motions: List[Dict[str, Any]] = []
+        self.calls = 0
+
+    def execute(self, query: str, params: Dict[str, Any]):
+        # 왕복 1회 비용
+        time.sleep(self.write_latency)
+        self.calls += 1
+        for node in params.get("nodes", ()):
+            self.nodes[node["external_id"]] = node
+        self.motions.extend(params.get("motions", ()))
+
+
+def _load_test_plan(source: str, data: Dict[str, Any], headers: Dict[str, Any], batch: GraphBatch):
+    node_id = data["customer"]
+    value = float(data["amount"])
+    batch.upsert_node(node_id, source)
+    batch.create_motion(node_id, "owner", value, "inflow")
+    batch.node_update(node_id, value, source)
+    batch.motion_update(node_id, "owner", value)
+    batch.webhook_received(source, "inflow", value)
+
+
+async def run_load_test(
+    events: int = 5000,
+    concurrency: int = 100,
+    customers: int = 200,
+    path: str = ":memory:",
+    write_latency: float = 0.005,
+) -> Dict[str, Any]:
+    """
+    ASGI 인프로세스 부하 테스트
+
+    concurrency 개의 클라이언트가 events 건을 전송하는 동안 컨슈머가 배치 처리.
+    ack 지연 (요청 → 202) 과 전송 처리량, 큐 소진까지의 전체 처리량을 측정한다.
+    """
+    import httpx
+    from fastapi import FastAPI, Request
+
+    queue = DurableWebhookQueue(path)
+    graph = _MemoryGraph(write_latency)
+    broadcasts: List[int] = []
+
+    async def broadcast(batch: GraphBatch):
+        broadcasts.append(batch.broadcast_count)
+
+    ingestor = WebhookIngestor(queue, _load_test_plan, GraphBatchWriter(graph), broadcast, linger=0.005)
+
+    app = FastAPI()
+
+    @app.post("/webhook")
+    async def webhook(request: Request):
+        return await accept_webhook(queue, await request.body(), dict(request.headers), lambda h, d: "stripe")
+
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    counter = iter(range(events))
+
+    async def client_worker(client):
+        for i in counter:
+            body = json.dumps({
+                "type": "payment_intent.succeeded",
+                "customer": f"cus_{i % customers}",
+                "amount": 100 + i % 7,
+            })
+            t = time.perf_counter()
+            resp = await client.post("/webhook", content=body)
+            latencies.append((time.perf_counter() - t) * 1000)
+            statuses[resp.status_code] = statuses.get(resp.status_code, 0) + 1
+
+    await ingestor.start()
+    transport = httpx.ASGITransport(app=app)
+    started = time.perf_counter()
+    async with httpx.AsyncClient(transport=transport, base_url="http://load") as client:
+        await asyncio.gather(*(client_worker(client) for _ in range(concurrency)))
+    ack_elapsed = time.perf_counter() - started
+    drained = await ingestor.drain(timeout=60)
+    total_elapsed = time.perf_counter() - started
+    await ingestor.stop(drain=False)
+
+    latencies.sort()
+    result = {
+        "events": events,
+        "concurrency": concurrency,
+        "statuses": statuses,
+        "ack_per_sec": round(events / ack_elapsed, 1),
+        "ack_p50_ms": round(_percentile(latencies, 0.5), 3),
+        "ack_p99_ms": round(_percentile(latencies, 0.99), 3),
+        "sustained_per_sec": round(events / total_elapsed, 1),
+        "drained": drained,
+        "graph_round_trips": graph.calls,
+        "nodes": len(graph.nodes),
+        "motions": len(graph.motions),
+        "broadcasts": sum(broadcasts),
+        "ingestor": ingestor.stats(),
+    }
+    queue.close()
+    return result
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="웹훅 ingest 부하 테스트")
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--customers", type=int, default=500)
+    parser.add_argument("--path", default=":memory:")
+    parser.add_argument("--write-latency", type=float, default=0.005)
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load_test(
+        args.events, args.concurrency, args.customers, args.path, args.write_latency,
+    ))
+    print(json.dumps(report, indent=2, ensure_ascii=False))
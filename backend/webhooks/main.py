@@ -5,14 +5,27 @@ from fastapi import FastAPI, Request, HTTPException, Header
 from fastapi.middleware.cors import CORSMiddleware
 import hmac
 import hashlib
+from contextlib import asynccontextmanager
 from typing import Optional
 
 from .stripe_webhook import router as stripe_router
 from .shopify_webhook import router as shopify_router
 from .toss_webhook import router as toss_router
-from .universal_webhook import router as universal_router
+from .universal_webhook import router as universal_router, get_ingestor
+from core.idempotency import flush_idempotency, idempotency_stats
 
-app = FastAPI(title="AUTUS Integration Hub", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # acknowledge-fast 큐 컨슈머 (재시작 시 남은 큐부터 처리)
+    ingestor = get_ingestor()
+    await ingestor.start()
+    yield
+    await ingestor.stop(drain=True)
+    flush_idempotency()
+
+
+app = FastAPI(title="AUTUS Integration Hub", version="1.0.0", lifespan=lifespan)
 
 # CORS
 app.add_middleware(
@@ -32,6 +45,11 @@ app.include_router(universal_router, prefix="/webhook/universal", tags=["Univers
 async def health():
     return {"status": "ok", "service": "AUTUS Integration Hub"}
 
+@app.get("/idempotency")
+async def idempotency():
+    """웹훅 중복 제거 적중률 (공급자별)"""
+    return idempotency_stats()
+
 @app.get("/")
 async def root():
     return {
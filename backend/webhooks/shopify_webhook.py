@@ -9,10 +9,12 @@ import os
 from typing import Optional
 from integrations.zero_meaning import ZeroMeaningCleaner
 from integrations.neo4j_client import Neo4jClient
+from core.idempotency import event_key, get_idempotency_guard
 
 router = APIRouter()
 cleaner = ZeroMeaningCleaner()
 neo4j = Neo4jClient()
+idempotency = get_idempotency_guard("shopify")
 
 SHOPIFY_API_SECRET = os.getenv("SHOPIFY_API_SECRET", "shpss_xxx")
 
@@ -31,7 +33,8 @@ async def shopify_webhook(
     request: Request,
     x_shopify_hmac_sha256: Optional[str] = Header(None),
     x_shopify_topic: Optional[str] = Header(None),
-    x_shopify_shop_domain: Optional[str] = Header(None)
+    x_shopify_shop_domain: Optional[str] = Header(None),
+    x_shopify_webhook_id: Optional[str] = Header(None)
 ):
     """
     Shopify 웹훅 엔드포인트
@@ -54,68 +57,77 @@ async def shopify_webhook(
     data = json.loads(payload)
     
     topic = x_shopify_topic or ""
-    
-    # Zero Meaning 정제
-    cleaned = cleaner.cleanse(data, source="shopify")
-    
-    result = {"topic": topic, "processed": False}
-    
-    if topic in ["orders/create", "orders/paid"]:
-        # 주문 생성/결제 → inflow
-        # 고객 노드 (없으면 게스트)
-        customer_id = cleaned.get("node_id") or f"guest_{data.get('id', 'unknown')}"
-        
-        node = await neo4j.upsert_node(
-            external_id=customer_id,
-            source="shopify"
-        )
-        
-        motion = await neo4j.create_motion(
-            source_id=customer_id,
-            target_id="owner",
-            amount=cleaned["value"],
-            direction="inflow"
-        )
-        
-        result = {"topic": topic, "node": node, "motion": motion, "processed": True}
-    
-    elif topic == "orders/cancelled":
-        # 주문 취소 → outflow (환불)
-        customer_id = cleaned.get("node_id") or f"guest_{data.get('id', 'unknown')}"
-        
-        motion = await neo4j.create_motion(
-            source_id="owner",
-            target_id=customer_id,
-            amount=cleaned["value"],
-            direction="outflow"
-        )
-        
-        result = {"topic": topic, "motion": motion, "processed": True}
-    
-    elif topic == "refunds/create":
-        # 환불 → outflow
-        customer_id = cleaned.get("node_id") or "unknown"
-        refund_amount = sum(
-            float(item.get("subtotal", 0)) 
-            for item in data.get("refund_line_items", [])
-        )
-        
-        motion = await neo4j.create_motion(
-            source_id="owner",
-            target_id=customer_id,
-            amount=refund_amount,
-            direction="outflow"
-        )
-        
-        result = {"topic": topic, "motion": motion, "processed": True}
-    
-    elif topic == "customers/create":
-        # 고객 생성 → 노드 생성
-        node = await neo4j.upsert_node(
-            external_id=cleaned["node_id"],
-            source="shopify"
-        )
-        
-        result = {"topic": topic, "node": node, "processed": True}
+
+    # 재전송 중복 차단 (X-Shopify-Webhook-Id 는 재시도 간 동일)
+    key = event_key("shopify", x_shopify_webhook_id, {"topic": topic, "body": data})
+    if not idempotency.claim(key):
+        return {"topic": topic, "duplicate": True, "processed": False}
+
+    try:
+        # Zero Meaning 정제
+        cleaned = cleaner.cleanse(data, source="shopify")
+
+        result = {"topic": topic, "processed": False}
+
+        if topic in ["orders/create", "orders/paid"]:
+            # 주문 생성/결제 → inflow
+            # 고객 노드 (없으면 게스트)
+            customer_id = cleaned.get("node_id") or f"guest_{data.get('id', 'unknown')}"
+
+            node = await neo4j.upsert_node(
+                external_id=customer_id,
+                source="shopify"
+            )
+
+            motion = await neo4j.create_motion(
+                source_id=customer_id,
+                target_id="owner",
+                amount=cleaned["value"],
+                direction="inflow"
+            )
+
+            result = {"topic": topic, "node": node, "motion": motion, "processed": True}
+
+        elif topic == "orders/cancelled":
+            # 주문 취소 → outflow (환불)
+            customer_id = cleaned.get("node_id") or f"guest_{data.get('id', 'unknown')}"
+
+            motion = await neo4j.create_motion(
+                source_id="owner",
+                target_id=customer_id,
+                amount=cleaned["value"],
+                direction="outflow"
+            )
+
+            result = {"topic": topic, "motion": motion, "processed": True}
+
+        elif topic == "refunds/create":
+            # 환불 → outflow
+            customer_id = cleaned.get("node_id") or "unknown"
+            refund_amount = sum(
+                float(item.get("subtotal", 0)) 
+                for item in data.get("refund_line_items", [])
+            )
+
+            motion = await neo4j.create_motion(
+                source_id="owner",
+                target_id=customer_id,
+                amount=refund_amount,
+                direction="outflow"
+            )
+
+            result = {"topic": topic, "motion": motion, "processed": True}
+
+        elif topic == "customers/create":
+            # 고객 생성 → 노드 생성
+            node = await neo4j.upsert_node(
+                external_id=cleaned["node_id"],
+                source="shopify"
+            )
+
+            result = {"topic": topic, "node": node, "processed": True}
+    except Exception:
+        idempotency.release(key)
+        raise
     
     return result
@@ -8,10 +8,12 @@ import os
 from typing import Optional
 from integrations.zero_meaning import ZeroMeaningCleaner
 from integrations.neo4j_client import Neo4jClient
+from core.idempotency import event_key, get_idempotency_guard
 
 router = APIRouter()
 cleaner = ZeroMeaningCleaner()
 neo4j = Neo4jClient()
+idempotency = get_idempotency_guard("stripe")
 
 STRIPE_WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET", "whsec_xxx")
 
@@ -63,53 +65,62 @@ async def stripe_webhook(
     
     event_type = data.get("type", "")
     event_data = data.get("data", {}).get("object", {})
-    
-    # Zero Meaning 정제
-    cleaned = cleaner.cleanse(event_data, source="stripe")
-    
-    # 이벤트별 처리
-    result = {"event": event_type, "processed": False}
-    
-    if event_type == "payment_intent.succeeded":
-        # 결제 성공 → inflow 모션 생성
-        node = await neo4j.upsert_node(
-            external_id=cleaned["node_id"],
-            source="stripe"
-        )
-        motion = await neo4j.create_motion(
-            source_id=cleaned["node_id"],
-            target_id="owner",
-            amount=cleaned["value"],
-            direction="inflow"
-        )
-        result = {"event": event_type, "node": node, "motion": motion, "processed": True}
-    
-    elif event_type == "charge.refunded":
-        # 환불 → outflow 모션 생성
-        motion = await neo4j.create_motion(
-            source_id="owner",
-            target_id=cleaned["node_id"],
-            amount=cleaned["value"],
-            direction="outflow"
-        )
-        result = {"event": event_type, "motion": motion, "processed": True}
-    
-    elif event_type == "customer.created":
-        # 고객 생성 → 노드 생성
-        node = await neo4j.upsert_node(
-            external_id=cleaned["node_id"],
-            source="stripe"
-        )
-        result = {"event": event_type, "node": node, "processed": True}
-    
-    elif event_type == "invoice.paid":
-        # 인보이스 결제 → inflow
-        motion = await neo4j.create_motion(
-            source_id=cleaned["node_id"],
-            target_id="owner",
-            amount=cleaned["value"],
-            direction="inflow"
-        )
-        result = {"event": event_type, "motion": motion, "processed": True}
+
+    # 재전송 중복 차단 (Stripe 이벤트 id evt_…)
+    key = event_key("stripe", data.get("id"), data)
+    if not idempotency.claim(key):
+        return {"event": event_type, "duplicate": True, "processed": False}
+
+    try:
+        # Zero Meaning 정제
+        cleaned = cleaner.cleanse(event_data, source="stripe")
+
+        # 이벤트별 처리
+        result = {"event": event_type, "processed": False}
+
+        if event_type == "payment_intent.succeeded":
+            # 결제 성공 → inflow 모션 생성
+            node = await neo4j.upsert_node(
+                external_id=cleaned["node_id"],
+                source="stripe"
+            )
+            motion = await neo4j.create_motion(
+                source_id=cleaned["node_id"],
+                target_id="owner",
+                amount=cleaned["value"],
+                direction="inflow"
+            )
+            result = {"event": event_type, "node": node, "motion": motion, "processed": True}
+
+        elif event_type == "charge.refunded":
+            # 환불 → outflow 모션 생성
+            motion = await neo4j.create_motion(
+                source_id="owner",
+                target_id=cleaned["node_id"],
+                amount=cleaned["value"],
+                direction="outflow"
+            )
+            result = {"event": event_type, "motion": motion, "processed": True}
+
+        elif event_type == "customer.created":
+            # 고객 생성 → 노드 생성
+            node = await neo4j.upsert_node(
+                external_id=cleaned["node_id"],
+                source="stripe"
+            )
+            result = {"event": event_type, "node": node, "processed": True}
+
+        elif event_type == "invoice.paid":
+            # 인보이스 결제 → inflow
+            motion = await neo4j.create_motion(
+                source_id=cleaned["node_id"],
+                target_id="owner",
+                amount=cleaned["value"],
+                direction="inflow"
+            )
+            result = {"event": event_type, "motion": motion, "processed": True}
+    except Exception:
+        idempotency.release(key)
+        raise
     
     return result
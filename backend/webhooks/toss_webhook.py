@@ -6,13 +6,22 @@ import os
 from typing import Optional
 from integrations.zero_meaning import ZeroMeaningCleaner
 from integrations.neo4j_client import Neo4jClient
+from core.idempotency import event_key, get_idempotency_guard
 
 router = APIRouter()
 cleaner = ZeroMeaningCleaner()
 neo4j = Neo4jClient()
+idempotency = get_idempotency_guard("toss")
 
 TOSS_SECRET_KEY = os.getenv("TOSS_SECRET_KEY", "test_sk_xxx")
 
+def toss_event_id(data: dict) -> Optional[str]:
+    """토스 웹훅 이벤트 식별자 (paymentKey 없으면 None → payload 해시)"""
+    payment_key = data.get("paymentKey")
+    if not payment_key:
+        return None
+    return f"{payment_key}:{data.get('status', '')}:{data.get('lastTransactionKey', '')}"
+
 @router.post("")
 async def toss_webhook(request: Request):
     """
@@ -27,55 +36,64 @@ async def toss_webhook(request: Request):
     data = await request.json()
     
     event_type = data.get("status", "")
-    
-    # Zero Meaning 정제
-    cleaned = {
-        "node_id": data.get("orderId", "").split("_")[0] if "_" in data.get("orderId", "") else data.get("orderId"),
-        "value": float(data.get("totalAmount", 0)),
-        "timestamp": data.get("approvedAt") or data.get("requestedAt")
-    }
-    
-    result = {"status": event_type, "processed": False}
-    
-    if event_type == "DONE":
-        # 결제 완료 → inflow
-        node = await neo4j.upsert_node(
-            external_id=cleaned["node_id"],
-            source="toss"
-        )
-        
-        motion = await neo4j.create_motion(
-            source_id=cleaned["node_id"],
-            target_id="owner",
-            amount=cleaned["value"],
-            direction="inflow"
-        )
-        
-        result = {
-            "status": event_type,
-            "node": node,
-            "motion": motion,
-            "amount": cleaned["value"],
-            "processed": True
-        }
-    
-    elif event_type in ["CANCELED", "PARTIAL_CANCELED"]:
-        # 취소 → outflow
-        cancel_amount = float(data.get("cancels", [{}])[0].get("cancelAmount", 0)) if data.get("cancels") else cleaned["value"]
-        
-        motion = await neo4j.create_motion(
-            source_id="owner",
-            target_id=cleaned["node_id"],
-            amount=cancel_amount,
-            direction="outflow"
-        )
-        
-        result = {
-            "status": event_type,
-            "motion": motion,
-            "amount": cancel_amount,
-            "processed": True
+
+    # 재전송 중복 차단 (결제 상태 변경 = paymentKey + status + 마지막 거래 키)
+    key = event_key("toss", toss_event_id(data), data)
+    if not idempotency.claim(key):
+        return {"status": event_type, "duplicate": True, "processed": False}
+
+    try:
+        # Zero Meaning 정제
+        cleaned = {
+            "node_id": data.get("orderId", "").split("_")[0] if "_" in data.get("orderId", "") else data.get("orderId"),
+            "value": float(data.get("totalAmount", 0)),
+            "timestamp": data.get("approvedAt") or data.get("requestedAt")
         }
+
+        result = {"status": event_type, "processed": False}
+
+        if event_type == "DONE":
+            # 결제 완료 → inflow
+            node = await neo4j.upsert_node(
+                external_id=cleaned["node_id"],
+                source="toss"
+            )
+
+            motion = await neo4j.create_motion(
+                source_id=cleaned["node_id"],
+                target_id="owner",
+                amount=cleaned["value"],
+                direction="inflow"
+            )
+
+            result = {
+                "status": event_type,
+                "node": node,
+                "motion": motion,
+                "amount": cleaned["value"],
+                "processed": True
+            }
+
+        elif event_type in ["CANCELED", "PARTIAL_CANCELED"]:
+            # 취소 → outflow
+            cancel_amount = float(data.get("cancels", [{}])[0].get("cancelAmount", 0)) if data.get("cancels") else cleaned["value"]
+
+            motion = await neo4j.create_motion(
+                source_id="owner",
+                target_id=cleaned["node_id"],
+                amount=cancel_amount,
+                direction="outflow"
+            )
+
+            result = {
+                "status": event_type,
+                "motion": motion,
+                "amount": cancel_amount,
+                "processed": True
+            }
+    except Exception:
+        idempotency.release(key)
+        raise
     
     return result
 
@@ -92,28 +110,37 @@ async def toss_virtual_account_webhook(request: Request):
     # 입금 완료 확인
     if data.get("status") != "DONE":
         return {"processed": False, "reason": "Not completed"}
-    
-    # Zero Meaning 정제
-    cleaned = {
-        "node_id": data.get("orderId", "").split("_")[0],
-        "value": float(data.get("totalAmount", 0)),
-        "method": "virtual_account",
-        "fee": 0  # 수수료 0%
-    }
-    
-    # 노드 생성/업데이트
-    node = await neo4j.upsert_node(
-        external_id=cleaned["node_id"],
-        source="toss_va"
-    )
-    
-    # inflow 모션 생성
-    motion = await neo4j.create_motion(
-        source_id=cleaned["node_id"],
-        target_id="owner",
-        amount=cleaned["value"],
-        direction="inflow"
-    )
+
+    # 재전송 중복 차단 (가상계좌 입금 알림은 payload 해시)
+    key = event_key("toss_va", None, data)
+    if not idempotency.claim(key):
+        return {"status": "DONE", "duplicate": True, "processed": False}
+
+    try:
+        # Zero Meaning 정제
+        cleaned = {
+            "node_id": data.get("orderId", "").split("_")[0],
+            "value": float(data.get("totalAmount", 0)),
+            "method": "virtual_account",
+            "fee": 0  # 수수료 0%
+        }
+
+        # 노드 생성/업데이트
+        node = await neo4j.upsert_node(
+            external_id=cleaned["node_id"],
+            source="toss_va"
+        )
+
+        # inflow 모션 생성
+        motion = await neo4j.create_motion(
+            source_id=cleaned["node_id"],
+            target_id="owner",
+            amount=cleaned["value"],
+            direction="inflow"
+        )
+    except Exception:
+        idempotency.release(key)
+        raise
     
     return {
         "status": "DONE",
@@ -1,7 +1,8 @@
 # backend/webhooks/universal_webhook.py
 # 범용 웹훅 - 자동 소스 감지 + WebSocket 실시간 전송
 
-from fastapi import APIRouter, Request, Header
+import os
+from fastapi import APIRouter, Request, Header, Query
 from typing import Optional
 from integrations.zero_meaning import ZeroMeaningCleaner
 from integrations.neo4j_client import Neo4jClient
@@ -10,10 +11,22 @@ from websocket import (
     broadcast_motion_update,
     broadcast_webhook_received
 )
+from .ingest_queue import (
+    GraphBatch,
+    GraphBatchWriter,
+    WebhookIngestor,
+    accept_webhook,
+    get_webhook_queue,
+)
+from core.idempotency import event_key, get_idempotency_guard
 
 router = APIRouter()
 cleaner = ZeroMeaningCleaner()
 neo4j = Neo4jClient()
+idempotency = get_idempotency_guard("universal")
+
+# acknowledge-fast 기본값 (요청별로 ?ack=fast|sync 로 덮어쓰기 가능)
+WEBHOOK_ACK_FAST = os.getenv("WEBHOOK_ACK_FAST", "false").lower() == "true"
 
 def detect_source(headers: dict, data: dict) -> str:
     """웹훅 소스 자동 감지"""
@@ -63,12 +76,70 @@ def detect_flow_type(data: dict, source: str) -> str:
     
     return "unknown"
 
+def universal_event_id(source: str, headers: dict, data: dict) -> Optional[str]:
+    """공급자 이벤트 id (없으면 None → payload 해시)"""
+    if source == "stripe" and str(data.get("id", "")).startswith("evt_"):
+        return data["id"]
+    if source == "shopify" and headers.get("x-shopify-webhook-id"):
+        return headers["x-shopify-webhook-id"]
+    return None
+
+def plan_webhook(source: str, data: dict, headers: dict, batch: GraphBatch):
+    """큐 컨슈머용: 웹훅 1건을 배치에 반영 (동기 경로와 동일한 정제/흐름 판단)"""
+    cleaned = cleaner.cleanse(data, source=source)
+    flow_type = detect_flow_type(data, source)
+
+    if flow_type == "inflow":
+        batch.upsert_node(cleaned["node_id"], source)
+        batch.create_motion(cleaned["node_id"], "owner", cleaned["value"], "inflow")
+        batch.node_update(cleaned["node_id"], cleaned["value"], source)
+        batch.motion_update(cleaned["node_id"], "owner", cleaned["value"])
+        batch.webhook_received(source, "inflow", cleaned["value"])
+
+    elif flow_type == "outflow":
+        batch.create_motion("owner", cleaned["node_id"], cleaned["value"], "outflow")
+        batch.motion_update("owner", cleaned["node_id"], cleaned["value"])
+        batch.webhook_received(source, "outflow", cleaned["value"])
+
+
+async def broadcast_batch(batch: GraphBatch):
+    """배치 단위로 병합된 WebSocket 전송 (노드/모션/소스별 1회)"""
+    for node_id, (value, source) in batch.node_updates.items():
+        await broadcast_node_update(node_id, value, source)
+    for (source_id, target_id), amount in batch.motion_updates.items():
+        await broadcast_motion_update(source_id, target_id, amount)
+    for (source, flow_type), (_, total) in batch.received.items():
+        await broadcast_webhook_received(source, flow_type, total)
+
+
+_ingestor: Optional[WebhookIngestor] = None
+
+def get_ingestor() -> WebhookIngestor:
+    global _ingestor
+    if _ingestor is None:
+        _ingestor = WebhookIngestor(
+            get_webhook_queue(),
+            plan_webhook,
+            GraphBatchWriter(neo4j),
+            broadcast_batch,
+        )
+    return _ingestor
+
+
+@router.get("/queue")
+async def queue_status():
+    """acknowledge-fast 큐 / 컨슈머 상태"""
+    return get_ingestor().stats()
+
+
 @router.post("")
 async def universal_webhook(
     request: Request,
     stripe_signature: Optional[str] = Header(None, alias="stripe-signature"),
     x_shopify_hmac: Optional[str] = Header(None, alias="x-shopify-hmac-sha256"),
-    x_shopify_topic: Optional[str] = Header(None, alias="x-shopify-topic")
+    x_shopify_topic: Optional[str] = Header(None, alias="x-shopify-topic"),
+    x_shopify_webhook_id: Optional[str] = Header(None, alias="x-shopify-webhook-id"),
+    ack: Optional[str] = Query(None, description="fast: 큐 적재 후 202 / sync: 즉시 처리")
 ):
     """
     범용 웹훅 엔드포인트
@@ -78,74 +149,95 @@ async def universal_webhook(
     2. Zero Meaning 정제
     3. Flow 타입 감지 (inflow/outflow)
     4. 노드/모션 자동 생성
+
+    acknowledge-fast (WEBHOOK_ACK_FAST=true 또는 ?ack=fast):
+    JSON 검증 후 로컬 큐에 적재하고 202 반환. 2~4 는 백그라운드 컨슈머가 배치 처리.
     """
     import json
     
     payload = await request.body()
-    data = json.loads(payload)
     
     # 헤더 수집
     headers = {
         "stripe-signature": stripe_signature,
         "x-shopify-hmac-sha256": x_shopify_hmac,
-        "x-shopify-topic": x_shopify_topic
+        "x-shopify-topic": x_shopify_topic,
+        "x-shopify-webhook-id": x_shopify_webhook_id
     }
+
+    ack_fast = WEBHOOK_ACK_FAST if ack is None else ack == "fast"
+    if ack_fast:
+        return await accept_webhook(
+            get_webhook_queue(), payload, headers, detect_source,
+            idempotency=idempotency, event_id=universal_event_id,
+        )
+
+    data = json.loads(payload)
     
     # 1. 소스 감지
     source = detect_source(headers, data)
-    
-    # 2. Zero Meaning 정제
-    cleaned = cleaner.cleanse(data, source=source)
-    
-    # 3. Flow 타입 감지
-    flow_type = detect_flow_type(data, source)
-    
-    # 4. 처리
-    result = {
-        "source": source,
-        "flow_type": flow_type,
-        "cleaned": cleaned,
-        "processed": False
-    }
-    
-    if flow_type == "inflow":
-        # 노드 생성/업데이트
-        node = await neo4j.upsert_node(
-            external_id=cleaned["node_id"],
-            source=source
-        )
-        
-        # inflow 모션
-        motion = await neo4j.create_motion(
-            source_id=cleaned["node_id"],
-            target_id="owner",
-            amount=cleaned["value"],
-            direction="inflow"
-        )
-        
-        result["node"] = node
-        result["motion"] = motion
-        result["processed"] = True
-        
-        # 🔴 WebSocket 실시간 전송
-        await broadcast_node_update(cleaned["node_id"], cleaned["value"], source)
-        await broadcast_motion_update(cleaned["node_id"], "owner", cleaned["value"])
-        await broadcast_webhook_received(source, "inflow", cleaned["value"])
-    
-    elif flow_type == "outflow":
-        # outflow 모션
-        motion = await neo4j.create_motion(
-            source_id="owner",
-            target_id=cleaned["node_id"],
-            amount=cleaned["value"],
-            direction="outflow"
-        )
-        
-        result["motion"] = motion
-        result["processed"] = True
-        
-        # 🔴 WebSocket 실시간 전송
-        await broadcast_motion_update("owner", cleaned["node_id"], cleaned["value"])
-        await broadcast_webhook_received(source, "outflow", cleaned["value"])
+
+    # 재전송 중복 차단 (그래프 쓰기 전)
+    key = event_key(source, universal_event_id(source, headers, data), data)
+    if not idempotency.claim(key):
+        return {"source": source, "duplicate": True, "processed": False}
+
+    try:
+        # 2. Zero Meaning 정제
+        cleaned = cleaner.cleanse(data, source=source)
+
+        # 3. Flow 타입 감지
+        flow_type = detect_flow_type(data, source)
+
+        # 4. 처리
+        result = {
+            "source": source,
+            "flow_type": flow_type,
+            "cleaned": cleaned,
+            "processed": False
+        }
+
+        if flow_type == "inflow":
+            # 노드 생성/업데이트
+            node = await neo4j.upsert_node(
+                external_id=cleaned["node_id"],
+                source=source
+            )
+
+            # inflow 모션
+            motion = await neo4j.create_motion(
+                source_id=cleaned["node_id"],
+                target_id="owner",
+                amount=cleaned["value"],
+                direction="inflow"
+            )
+
+            result["node"] = node
+            result["motion"] = motion
+            result["processed"] = True
+
+            # 🔴 WebSocket 실시간 전송
+            await broadcast_node_update(cleaned["node_id"], cleaned["value"], source)
+            await broadcast_motion_update(cleaned["node_id"], "owner", cleaned["value"])
+            await broadcast_webhook_received(source, "inflow", cleaned["value"])
+
+        elif flow_type == "outflow":
+            # outflow 모션
+            motion = await neo4j.create_motion(
+                source_id="owner",
+                target_id=cleaned["node_id"],
+                amount=cleaned["value"],
+                direction="outflow"
+            )
+
+            result["motion"] = motion
+            result["processed"] = True
+
+            # 🔴 WebSocket 실시간 전송
+            await broadcast_motion_update("owner", cleaned["node_id"], cleaned["value"])
+            await broadcast_webhook_received(source, "outflow", cleaned["value"])
+    except Exception:
+        idempotency.release(key)
+        raise
     
     return result
@@ -12,6 +12,7 @@ from .ki_server import (
     ki_ws_router,
     ki_http_router,
     ki_manager,
+    ki_publisher,
     ki_store,
     ki_heartbeat_task,
     init_ki_demo_data
@@ -25,6 +26,7 @@ __all__ = [
     "ki_ws_router",
     "ki_http_router",
     "ki_manager",
+    "ki_publisher",
     "ki_store",
     "ki_heartbeat_task",
     "init_ki_demo_data",
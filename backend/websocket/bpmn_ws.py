@@ -20,6 +20,8 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect
 
+from core.pubsub import Envelope, PubSubBus, get_pubsub_bus
+
 logger = logging.getLogger(__name__)
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -68,14 +70,23 @@ class SystemStats:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class BPMNConnectionManager:
-    """BPMN WebSocket 연결 관리자"""
+    """
+    BPMN WebSocket 연결 관리자
+    
+    broadcast 는 pub/sub 버스로 모든 워커에 전달 (메시지에 토픽 순번 "seq").
+    시뮬레이션은 워커마다 돌므로 자기 소켓에만 보낸다.
+    """
     
-    def __init__(self):
+    TOPIC = "ws.bpmn"
+    
+    def __init__(self, bus: Optional[PubSubBus] = None):
         self.active_connections: Set[WebSocket] = set()
         self._metrics: Dict[str, RealtimeMetric] = {}
         self._loop_progress: Dict[str, LoopProgress] = {}
         self._system_stats = SystemStats()
         self._running = False
+        self.bus = bus or get_pubsub_bus()
+        self.bus.subscribe(self.TOPIC, self._deliver)
     
     async def connect(self, websocket: WebSocket):
         """클라이언트 연결"""
@@ -108,8 +119,17 @@ class BPMNConnectionManager:
                 "timestamp": int(datetime.now().timestamp() * 1000),
             })
     
-    async def broadcast(self, message: dict):
-        """모든 클라이언트에게 브로드캐스트"""
+    async def broadcast(self, message: dict, local: bool = False):
+        """모든 워커의 클라이언트에게 브로드캐스트 (local=True 면 이 워커만)"""
+        if local:
+            await self._send_local(message)
+        else:
+            await self.bus.publish(self.TOPIC, message)
+    
+    async def _deliver(self, envelope: Envelope):
+        await self._send_local({**envelope.payload, "seq": envelope.seq})
+    
+    async def _send_local(self, message: dict):
         disconnected = set()
         
         for connection in self.active_connections:
@@ -132,7 +152,7 @@ class BPMNConnectionManager:
     # 데이터 업데이트
     # ═══════════════════════════════════════════════════════════════════════════
     
-    async def update_metric(self, metric: RealtimeMetric):
+    async def update_metric(self, metric: RealtimeMetric, local: bool = False):
         """메트릭 업데이트 및 브로드캐스트"""
         self._metrics[metric.elementId] = metric
         
@@ -140,9 +160,9 @@ class BPMNConnectionManager:
             "type": "metric_update",
             "payload": asdict(metric),
             "timestamp": int(datetime.now().timestamp() * 1000),
-        })
+        }, local=local)
     
-    async def update_loop_progress(self, progress: LoopProgress):
+    async def update_loop_progress(self, progress: LoopProgress, local: bool = False):
         """학습 루프 진척도 업데이트"""
         self._loop_progress[progress.loopId] = progress
         
@@ -150,9 +170,9 @@ class BPMNConnectionManager:
             "type": "loop_progress",
             "payload": asdict(progress),
             "timestamp": int(datetime.now().timestamp() * 1000),
-        })
+        }, local=local)
     
-    async def update_system_stats(self, stats: SystemStats):
+    async def update_system_stats(self, stats: SystemStats, local: bool = False):
         """시스템 통계 업데이트"""
         self._system_stats = stats
         
@@ -160,7 +180,7 @@ class BPMNConnectionManager:
             "type": "system_stats",
             "payload": asdict(stats),
             "timestamp": int(datetime.now().timestamp() * 1000),
-        })
+        }, local=local)
     
     async def trigger_delete(self, element_ids: List[str]):
         """삭제 이벤트 트리거"""
@@ -224,17 +244,17 @@ class BPMNConnectionManager:
                     metric.automationLevel = min(1.0, metric.automationLevel + random.uniform(-0.02, 0.05))
                     metric.kValue = max(0.5, min(1.5, metric.kValue + random.uniform(-0.05, 0.05)))
                     metric.timestamp = int(datetime.now().timestamp() * 1000)
-                    await self.update_metric(metric)
+                    await self.update_metric(metric, local=True)
                 
                 # 루프 진척도 업데이트
                 for loop in self._loop_progress.values():
                     loop.progress = min(100, loop.progress + random.uniform(0, 1))
-                    await self.update_loop_progress(loop)
+                    await self.update_loop_progress(loop, local=True)
                 
                 # 시스템 통계 업데이트
                 self._system_stats.requestsPerMinute += int(random.uniform(-50, 100))
                 self._system_stats.avgAutomation = min(1.0, self._system_stats.avgAutomation + random.uniform(-0.005, 0.01))
-                await self.update_system_stats(self._system_stats)
+                await self.update_system_stats(self._system_stats, local=True)
                 
                 await asyncio.sleep(2)
             except Exception as e:
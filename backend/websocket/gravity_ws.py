@@ -13,6 +13,8 @@ from fastapi import WebSocket, WebSocketDisconnect
 from dataclasses import dataclass, field, asdict
 import logging
 
+from core.pubsub import Envelope, PubSubBus, get_pubsub_bus
+
 logger = logging.getLogger(__name__)
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -20,12 +22,21 @@ logger = logging.getLogger(__name__)
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class GravityConnectionManager:
-    """Gravity WebSocket 연결 관리자"""
+    """
+    Gravity WebSocket 연결 관리자
+    
+    broadcast 는 pub/sub 버스로 모든 워커에 전달 (메시지에 토픽 순번 "seq").
+    다른 워커에서 발생한 gravity_event 는 이 워커의 상태에도 반영한다.
+    """
+    
+    TOPIC = "ws.gravity"
     
-    def __init__(self):
+    def __init__(self, bus: Optional[PubSubBus] = None):
         self.active_connections: Set[WebSocket] = set()
         self._state = GravityState()
         self._broadcast_task: Optional[asyncio.Task] = None
+        self.bus = bus or get_pubsub_bus()
+        self.bus.subscribe(self.TOPIC, self._deliver)
     
     async def connect(self, websocket: WebSocket):
         """클라이언트 연결"""
@@ -52,8 +63,23 @@ class GravityConnectionManager:
         except Exception as e:
             logger.error(f"[GravityWS] Send error: {e}")
     
-    async def broadcast(self, message: Dict[str, Any]):
-        """모든 클라이언트에 브로드캐스트"""
+    async def broadcast(self, message: Dict[str, Any], local: bool = False):
+        """모든 워커의 클라이언트에 브로드캐스트 (local=True 면 이 워커만)"""
+        if local:
+            await self._send_local(message)
+        else:
+            await self.bus.publish(self.TOPIC, message)
+    
+    async def _deliver(self, envelope: Envelope):
+        message = envelope.payload
+        if message.get("type") == "gravity_event" and envelope.origin != self.bus.worker_id:
+            try:
+                self._state.add_event(GravityEvent(**message["data"]))
+            except (KeyError, TypeError) as e:
+                logger.warning(f"[GravityWS] Invalid remote event: {e}")
+        await self._send_local({**message, "seq": envelope.seq})
+    
+    async def _send_local(self, message: Dict[str, Any]):
         if not self.active_connections:
             return
         
@@ -106,7 +132,11 @@ class GravityConnectionManager:
             while True:
                 await asyncio.sleep(interval)
                 if self.active_connections:
-                    await self.broadcast_state()
+                    await self.broadcast({
+                        "type": "gravity_state",
+                        "data": self._state.to_dict(),
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                    }, local=True)  # 워커마다 도는 루프 → 자기 소켓에만
         
         self._broadcast_task = asyncio.create_task(_broadcast_loop())
         logger.info(f"[GravityWS] Periodic broadcast started (interval: {interval}s)")
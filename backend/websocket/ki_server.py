@@ -6,19 +6,31 @@
     실시간 K/I 지수 변화 브로드캐스트
     - k_update: K-지수 변화
     - i_update: I-지수 변화
+    - ki_batch: tick 동안 바뀐 K/I 최신값 묶음 (KI_CONFLATE_TICK_MS > 0)
     - phase_change: 임계점 전환
-    - anomaly: 이상 징후 감지
+    - anomaly: 이상 징후 감지 (conflation 없이 즉시)
     
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Query
 from pydantic import BaseModel
-from typing import Dict, List, Set, Optional
+from typing import Any, Dict, Hashable, Iterable, List, Set, Optional
 from datetime import datetime
 from enum import Enum
 import asyncio
 import json
+import os
+
+from core.efficiency import BinaryDeltaStream
+from core.fanout import FanoutHub, TickConflator
+from core.pubsub import Envelope, PubSubBus, get_pubsub_bus
+
+from .ki_subscriptions import KISubscriptionIndex, Subscription, filter_snapshot
+
+
+# K/I 갱신 conflation tick (0 이면 변경마다 k_update / i_update 개별 전송)
+KI_CONFLATE_TICK_MS = float(os.getenv("KI_CONFLATE_TICK_MS", "100"))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -26,47 +38,153 @@ import json
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class KIConnectionManager:
-    """K/I WebSocket 연결 관리"""
+    """
+    K/I WebSocket 연결 관리
     
-    def __init__(self):
+    클라이언트별 송신 큐(FanoutHub)로 전송 → 느린 클라이언트가
+    broadcast 호출자(KIStore.set_k 등)를 막지 않는다.
+    큐 크기 / 느린 클라이언트 정책은 WS_SEND_QUEUE_SIZE / WS_SLOW_CONSUMER_POLICY.
+    구독(노드/쌍/phase)을 등록한 클라이언트는 역인덱스로 일치하는 갱신만 받는다.
+    
+    broadcast 는 pub/sub 버스(PUBSUB_BACKEND)를 거쳐 모든 워커에 전달되고,
+    각 워커는 자기 소켓에만 보낸다. 메시지에는 토픽 순번 "seq" 가 붙는다.
+    """
+    
+    TOPIC = "ws.ki"
+    
+    def __init__(self, hub: Optional[FanoutHub] = None, bus: Optional[PubSubBus] = None):
         self.active_connections: Set[WebSocket] = set()
+        self.binary_connections: Set[WebSocket] = set()  # ki_batch 를 바이너리로 받는 클라이언트
+        self.subscriptions = KISubscriptionIndex()
         self._lock = asyncio.Lock()
+        self.hub = hub or FanoutHub()
+        self.hub.on_evict = self._evicted
+        self.bus = bus or get_pubsub_bus()
+        self.bus.subscribe(self.TOPIC, self._deliver)
     
-    async def connect(self, websocket: WebSocket):
+    async def connect(self, websocket: WebSocket, encoding: str = "json"):
         await websocket.accept()
         async with self._lock:
             self.active_connections.add(websocket)
+            if encoding == "binary":
+                self.binary_connections.add(websocket)
+            self.subscriptions.add_client(websocket)
+            self.hub.add(websocket, self._sender(websocket))
         print(f"[K/I WS] Client connected. Total: {len(self.active_connections)}")
     
+    @staticmethod
+    def _sender(websocket: WebSocket):
+        async def send(frame):
+            if isinstance(frame, bytes):
+                await websocket.send_bytes(frame)
+            else:
+                await websocket.send_text(frame)
+        return send
+    
     async def disconnect(self, websocket: WebSocket):
         async with self._lock:
             self.active_connections.discard(websocket)
+            self.binary_connections.discard(websocket)
+            self.subscriptions.remove_client(websocket)
+            self.hub.remove(websocket)
         print(f"[K/I WS] Client disconnected. Total: {len(self.active_connections)}")
     
-    async def broadcast(self, message: dict):
-        """모든 클라이언트에 브로드캐스트"""
-        if not self.active_connections:
-            return
-        
-        data = json.dumps(message, default=str)
-        disconnected = set()
-        
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(data)
-            except Exception:
-                disconnected.add(connection)
-        
-        # 끊긴 연결 제거
-        async with self._lock:
-            self.active_connections -= disconnected
+    def _evicted(self, websocket: WebSocket, reason: str):
+        """느린 클라이언트 / 전송 실패 → 연결 정리 (재접속 시 스냅샷 재수신)"""
+        self.active_connections.discard(websocket)
+        self.binary_connections.discard(websocket)
+        self.subscriptions.remove_client(websocket)
+        print(f"[K/I WS] Client evicted ({reason}). Total: {len(self.active_connections)}")
+        # 모든 축출 사유에서 소켓을 닫아 클라이언트가 재접속하도록 함
+        code = 1013 if reason == "slow_consumer" else 1011  # Try Again Later / Internal Error
+        try:
+            asyncio.get_running_loop().create_task(self._close(websocket, code))
+        except RuntimeError:
+            pass
     
-    async def send_to(self, websocket: WebSocket, message: dict):
-        """특정 클라이언트에 전송"""
+    @staticmethod
+    async def _close(websocket: WebSocket, code: int = 1013):
         try:
-            await websocket.send_text(json.dumps(message, default=str))
+            await websocket.close(code=code)
         except Exception:
+            pass
+    
+    async def broadcast(
+        self,
+        message: dict,
+        conflate_key: Optional[Hashable] = None,
+        target: Any = None,
+        phase: Optional[str] = None,
+        local: bool = False,
+    ):
+        """
+        브로드캐스트 (버스 발행 → 워커별 직렬화 1회, 큐 적재만 하고 반환)
+        
+        target(노드 id 또는 [a, b])이 있으면 전체 수신 클라이언트 + 일치 구독자에게만.
+        local=True 면 버스를 거치지 않고 이 워커의 소켓에만 (heartbeat 등).
+        """
+        if local:
+            self._publish_local(message, conflate_key, target, phase)
+            return
+        await self.bus.publish(self.TOPIC, {
+            "message": message,
+            "conflate_key": conflate_key,
+            "target": target,
+            "phase": phase,
+        })
+    
+    def _deliver(self, envelope: Envelope):
+        payload = envelope.payload
+        conflate_key = payload.get("conflate_key")
+        if isinstance(conflate_key, list):  # JSON 왕복 시 tuple → list
+            conflate_key = tuple(conflate_key)
+        self._publish_local(
+            {**payload["message"], "seq": envelope.seq},
+            conflate_key, payload.get("target"), payload.get("phase"),
+        )
+    
+    def _publish_local(
+        self,
+        message: dict,
+        conflate_key: Optional[Hashable] = None,
+        target: Any = None,
+        phase: Optional[str] = None,
+    ):
+        keys = None
+        if target is not None and self.subscriptions.filtered:
+            keys = self.subscriptions.unfiltered | self.subscriptions.match_target(target, phase)
+        self.hub.publish(message, keys=keys, conflate_key=conflate_key)
+    
+    def broadcast_batch(
+        self,
+        message: dict,
+        binary: Optional[bytes] = None,
+        keys: Optional[Set[WebSocket]] = None,
+    ):
+        """배치 프레임: 바이너리 구독자에겐 binary, 나머지는 JSON (keys 없으면 전체)"""
+        if binary is None or not self.binary_connections:
+            self.hub.publish(message, keys=keys)
+            return
+        targets = self.active_connections if keys is None else keys
+        self.hub.publish(binary, keys=[c for c in targets if c in self.binary_connections])
+        self.hub.publish(message, keys=[c for c in targets if c not in self.binary_connections])
+    
+    def wants_binary(self, keys: Optional[Iterable[WebSocket]] = None) -> bool:
+        if not self.binary_connections:
+            return False
+        return keys is None or any(c in self.binary_connections for c in keys)
+    
+    async def send_to(self, websocket: WebSocket, message: dict):
+        """특정 클라이언트에 전송 (브로드캐스트와 같은 큐 → 순서 유지)"""
+        if not self.hub.send_to(websocket, message):
             await self.disconnect(websocket)
+    
+    def stats(self) -> dict:
+        return {
+            **self.hub.stats(),
+            "subscriptions": self.subscriptions.stats(),
+            "bus": self.bus.stats(),
+        }
 
 
 ki_manager = KIConnectionManager()
@@ -83,6 +201,7 @@ class MessageType(str, Enum):
     ANOMALY = "anomaly"
     HEARTBEAT = "heartbeat"
     SNAPSHOT = "snapshot"
+    KI_BATCH = "ki_batch"
 
 
 def create_message(msg_type: MessageType, data: dict) -> dict:
@@ -93,6 +212,136 @@ def create_message(msg_type: MessageType, data: dict) -> dict:
     }
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# K/I 갱신 발행기 (tick conflation)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _merge_update(old: dict, new: dict) -> dict:
+    """같은 tick 안의 연속 갱신: 최초 before 유지, 나머지는 최신값"""
+    merged = dict(new)
+    if "k_before" in old:
+        merged["k_before"] = old["k_before"]
+        merged["delta_k"] = merged["k_after"] - merged["k_before"]
+    else:
+        merged["i_before"] = old["i_before"]
+        merged["delta_i"] = merged["i_after"] - merged["i_before"]
+    return merged
+
+
+class KIUpdatePublisher:
+    """
+    K/I 갱신 conflation 발행기
+    
+    tick 동안 노드/쌍별 최신값만 유지하고 tick 마다 ki_batch 1프레임 발행.
+    일괄 재계산 시 수만 개의 k_update/i_update 대신 tick 당 1프레임.
+    anomaly / phase_change 는 여기를 거치지 않는다 (즉시 전송).
+    tick_ms=0 이면 기존처럼 변경마다 개별 메시지.
+    배치는 버스로 발행되고, 구독별 분할은 각 워커가 자기 구독 인덱스로 한다.
+    배치의 seq 는 버스 토픽 순번 (워커 간 공통).
+    """
+    
+    TOPIC = "ws.ki.batch"
+    
+    def __init__(
+        self,
+        manager: KIConnectionManager,
+        tick_ms: float = KI_CONFLATE_TICK_MS,
+        delta_stream: Optional[BinaryDeltaStream] = None,
+    ):
+        self.manager = manager
+        self.tick_ms = tick_ms
+        self.delta_stream = delta_stream or BinaryDeltaStream()
+        self.conflator = TickConflator(tick_ms / 1000, self._emit, merge=_merge_update)
+        self.sequence = 0
+        self.manager.bus.subscribe(self.TOPIC, self._deliver)
+    
+    @property
+    def enabled(self) -> bool:
+        return self.tick_ms > 0
+    
+    async def publish_k(self, node_id: str, update: dict):
+        if self.enabled:
+            self.conflator.offer(("k", node_id), update)
+        else:
+            await self.manager.broadcast(
+                create_message(MessageType.K_UPDATE, update), conflate_key=("k", node_id),
+                target=node_id, phase=update.get("phase"),
+            )
+    
+    async def publish_i(self, pair_key: str, update: dict):
+        if self.enabled:
+            self.conflator.offer(("i", pair_key), update)
+        else:
+            await self.manager.broadcast(
+                create_message(MessageType.I_UPDATE, update), conflate_key=("i", pair_key),
+                target=[update["node_a"], update["node_b"]], phase=update.get("phase"),
+            )
+    
+    def flush(self) -> int:
+        return self.conflator.flush()
+    
+    def _emit(self, batch: Dict[Any, dict]):
+        k_updates, i_updates = [], []
+        for (kind, _), update in batch.items():
+            (k_updates if kind == "k" else i_updates).append(update)
+        self.manager.bus.publish_nowait(self.TOPIC, {"k": k_updates, "i": i_updates})
+    
+    def _deliver(self, envelope: Envelope):
+        k_updates, i_updates = envelope.payload["k"], envelope.payload["i"]
+        self.sequence = envelope.seq
+        
+        index = self.manager.subscriptions
+        if not index.filtered:
+            self._send(k_updates, i_updates)
+            return
+        
+        # 전체 수신 클라이언트는 전체 배치 공유
+        if index.unfiltered:
+            self._send(k_updates, i_updates, set(index.unfiltered))
+        
+        # 구독 클라이언트: 항목별 역인덱스 매칭 → 같은 부분집합끼리 프레임 공유
+        picks: Dict[Hashable, List[int]] = {}
+        for pos, u in enumerate(k_updates):
+            for client in index.match_k(u["node_id"], u.get("phase")):
+                picks.setdefault(client, []).append(pos)
+        offset = len(k_updates)
+        for pos, u in enumerate(i_updates):
+            for client in index.match_i(u["node_a"], u["node_b"], u.get("phase")):
+                picks.setdefault(client, []).append(offset + pos)
+        
+        groups: Dict[tuple, Set[Hashable]] = {}
+        for client, positions in picks.items():
+            groups.setdefault(tuple(positions), set()).add(client)
+        for positions, clients in groups.items():
+            self._send(
+                [k_updates[p] for p in positions if p < offset],
+                [i_updates[p - offset] for p in positions if p >= offset],
+                clients,
+            )
+    
+    def _send(self, k_updates: List[dict], i_updates: List[dict], keys: Optional[Set[Hashable]] = None):
+        message = create_message(MessageType.KI_BATCH, {
+            "seq": self.sequence,
+            "tick_ms": self.tick_ms,
+            "k": k_updates,
+            "i": i_updates,
+        })
+        binary = None
+        if self.manager.wants_binary(keys):
+            binary = self.delta_stream.encode_ki_batch(
+                [(u["node_id"], u["k_after"], u["delta_k"]) for u in k_updates],
+                [(u["node_a"], u["node_b"], u["i_after"], u["delta_i"]) for u in i_updates],
+                sequence=self.sequence,
+            )
+        self.manager.broadcast_batch(message, binary, keys)
+    
+    def stats(self) -> dict:
+        return {"enabled": self.enabled, "sequence": self.sequence, **self.conflator.stats()}
+
+
+ki_publisher = KIUpdatePublisher(ki_manager)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # K/I 상태 저장소 (인메모리)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -104,6 +353,7 @@ class KIStore:
         self.nodes: Dict[str, dict] = {}
         self.interactions: Dict[str, dict] = {}  # key: "nodeA-nodeB" (sorted)
         self.anomalies: List[dict] = []
+        self.pairs_by_node: Dict[str, Set[str]] = {}  # node id → 쌍 키 (구독 스냅샷용)
     
     def _pair_key(self, a: str, b: str) -> str:
         return "-".join(sorted([a, b]))
@@ -123,15 +373,15 @@ class KIStore:
             "updated_at": datetime.now()
         }
         
-        # 브로드캐스트
-        await ki_manager.broadcast(create_message(MessageType.K_UPDATE, {
+        # 발행 (tick conflation → ki_batch)
+        await ki_publisher.publish_k(node_id, {
             "node_id": node_id,
             "k_before": old,
             "k_after": k_index,
             "delta_k": k_index - old,
             "phase": phase,
             "action": action
-        }))
+        })
         
         # 임계점 체크
         await self._check_k_phase(node_id, k_index, phase)
@@ -156,13 +406,15 @@ class KIStore:
         
         if anomaly:
             self.anomalies.append(anomaly)
-            await ki_manager.broadcast(create_message(MessageType.ANOMALY, anomaly))
+            await ki_manager.broadcast(
+                create_message(MessageType.ANOMALY, anomaly), target=node_id, phase=phase
+            )
             await ki_manager.broadcast(create_message(MessageType.PHASE_CHANGE, {
                 "index_type": "K",
                 "target": node_id,
                 "phase": phase,
                 "value": k
-            }))
+            }), target=node_id, phase=phase)
     
     # I-지수
     def get_i(self, node_a: str, node_b: str) -> Optional[dict]:
@@ -180,9 +432,11 @@ class KIStore:
             "last_interaction": interaction,
             "updated_at": datetime.now()
         }
+        self.pairs_by_node.setdefault(node_a, set()).add(key)
+        self.pairs_by_node.setdefault(node_b, set()).add(key)
         
-        # 브로드캐스트
-        await ki_manager.broadcast(create_message(MessageType.I_UPDATE, {
+        # 발행 (tick conflation → ki_batch)
+        await ki_publisher.publish_i(key, {
             "node_a": node_a,
             "node_b": node_b,
             "i_before": old,
@@ -190,7 +444,7 @@ class KIStore:
             "delta_i": i_index - old,
             "phase": phase,
             "interaction": interaction
-        }))
+        })
         
         # 임계점 체크
         await self._check_i_phase(node_a, node_b, i_index, phase)
@@ -215,21 +469,22 @@ class KIStore:
         
         if anomaly:
             self.anomalies.append(anomaly)
-            await ki_manager.broadcast(create_message(MessageType.ANOMALY, anomaly))
+            await ki_manager.broadcast(
+                create_message(MessageType.ANOMALY, anomaly), target=[a, b], phase=phase
+            )
             await ki_manager.broadcast(create_message(MessageType.PHASE_CHANGE, {
                 "index_type": "I",
                 "target": [a, b],
                 "phase": phase,
                 "value": i
-            }))
+            }), target=[a, b], phase=phase)
     
     # 스냅샷
-    def get_snapshot(self) -> dict:
-        return {
-            "nodes": list(self.nodes.values()),
-            "interactions": list(self.interactions.values()),
-            "anomalies": self.anomalies[-20:]  # 최근 20개
-        }
+    def get_snapshot(self, subscription: Optional[Subscription] = None) -> dict:
+        """전체 또는 구독 범위 스냅샷 (이상 징후는 최근 20개)"""
+        return filter_snapshot(
+            subscription, self.nodes, self.interactions, self.pairs_by_node, self.anomalies
+        )
 
 
 ki_store = KIStore()
@@ -243,9 +498,14 @@ ki_ws_router = APIRouter(tags=["K/I WebSocket"])
 
 
 @ki_ws_router.websocket("/ws/ki")
-async def websocket_ki(websocket: WebSocket):
-    """K/I 실시간 WebSocket"""
-    await ki_manager.connect(websocket)
+async def websocket_ki(websocket: WebSocket, encoding: str = Query("json")):
+    """
+    K/I 실시간 WebSocket
+    
+    ?encoding=binary 이면 ki_batch 를 BinaryDeltaStream 바이너리 프레임으로 수신
+    (나머지 메시지는 JSON 텍스트).
+    """
+    await ki_manager.connect(websocket, encoding=encoding)
     
     try:
         # 연결 시 현재 상태 스냅샷 전송
@@ -256,16 +516,37 @@ async def websocket_ki(websocket: WebSocket):
         while True:
             data = await websocket.receive_text()
             msg = json.loads(data)
+            action = msg.get("action")
+            subscriptions = ki_manager.subscriptions
             
             # 클라이언트 요청 처리
-            if msg.get("action") == "get_snapshot":
+            if action == "get_snapshot":
                 await ki_manager.send_to(websocket, create_message(
-                    MessageType.SNAPSHOT, ki_store.get_snapshot()
+                    MessageType.SNAPSHOT, ki_store.get_snapshot(subscriptions.subscription(websocket))
                 ))
             
-            elif msg.get("action") == "subscribe_node":
-                # 특정 노드 구독 (확장용)
-                pass
+            elif action in ("subscribe", "unsubscribe", "subscribe_node", "subscribe_all"):
+                # 구독 범위 변경: {"nodes": [...], "pairs": [["A", "B"], ["A", "*"]], "phases": [...]}
+                try:
+                    if action == "subscribe_all":
+                        subscriptions.clear(websocket)
+                    elif action == "subscribe_node":
+                        subscriptions.subscribe(websocket, nodes=[msg.get("node_id")])
+                    else:
+                        update = subscriptions.subscribe if action == "subscribe" else subscriptions.unsubscribe
+                        update(
+                            websocket,
+                            nodes=msg.get("nodes") or [],
+                            pairs=msg.get("pairs") or [],
+                            phases=msg.get("phases") or [],
+                        )
+                except (TypeError, ValueError) as e:
+                    await ki_manager.send_to(websocket, {"type": "error", "message": str(e)})
+                    continue
+                # 새 범위 기준 스냅샷
+                await ki_manager.send_to(websocket, create_message(
+                    MessageType.SNAPSHOT, ki_store.get_snapshot(subscriptions.subscription(websocket))
+                ))
     
     except WebSocketDisconnect:
         await ki_manager.disconnect(websocket)
@@ -286,7 +567,7 @@ async def ki_heartbeat_task():
             "active_connections": len(ki_manager.active_connections),
             "nodes_count": len(ki_store.nodes),
             "interactions_count": len(ki_store.interactions)
-        }))
+        }), local=True)  # 워커별 연결 수 → 자기 소켓에만
 
 
 async def init_ki_demo_data():
@@ -439,5 +720,7 @@ async def get_ki_stats():
         "active_connections": len(ki_manager.active_connections),
         "nodes_count": len(ki_store.nodes),
         "interactions_count": len(ki_store.interactions),
-        "anomalies_count": len(ki_store.anomalies)
+        "anomalies_count": len(ki_store.anomalies),
+        "fanout": ki_manager.stats(),
+        "conflation": ki_publisher.stats()
     }
@@ -0,0 +1,293 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+
+                    AUTUS K/I WebSocket 구독 인덱스
+
+    클라이언트별 관심 범위 (노드 집합 / 쌍 패턴 / phase 필터)를 역인덱스로 보관해
+    갱신 1건이 관심 있는 소켓만 건드리게 한다.
+
+    - nodes  : 해당 노드의 K 갱신 + 양 끝이 모두 집합 안인 I 갱신
+    - pairs  : ("A", "B") 특정 쌍, ("A", "*") A 가 포함된 모든 쌍
+    - phases : phase 가 일치하는 갱신만 (nodes/pairs 없으면 phase 만으로 구독)
+    구독을 한 번도 등록하지 않은 클라이언트는 전체 수신 (기존 동작).
+
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+
+WILDCARD = "*"
+
+
+def pair_key(a: str, b: str) -> str:
+    """KIStore 와 같은 쌍 키 (정렬 후 '-' 결합)"""
+    return "-".join(sorted([a, b]))
+
+
+def _parse_pair(pattern: Any) -> Tuple[str, str]:
+    """["A", "B"] / ("A", "*") / "A-B" → (a, b)"""
+    if isinstance(pattern, str):
+        a, sep, b = pattern.partition("-")
+        if not sep:
+            raise ValueError(f"Invalid pair pattern: {pattern!r}")
+        return a, b
+    a, b = pattern
+    return str(a), str(b)
+
+
+@dataclass
+class Subscription:
+    """클라이언트 1개의 구독 범위"""
+    nodes: Set[str] = field(default_factory=set)
+    pairs: Set[str] = field(default_factory=set)       # 정확한 쌍 키
+    wildcards: Set[str] = field(default_factory=set)   # ("A", "*") 의 A
+    phases: Set[str] = field(default_factory=set)
+
+    @property
+    def has_targets(self) -> bool:
+        return bool(self.nodes or self.pairs or self.wildcards)
+
+    def phase_ok(self, phase: Optional[str]) -> bool:
+        return not self.phases or phase is None or phase in self.phases
+
+    def wants_k(self, node_id: str, phase: Optional[str] = None) -> bool:
+        if self.has_targets and node_id not in self.nodes:
+            return False
+        return self.phase_ok(phase) if self.has_targets else (phase in self.phases)
+
+    def wants_i(self, a: str, b: str, phase: Optional[str] = None) -> bool:
+        if self.has_targets:
+            matched = (
+                pair_key(a, b) in self.pairs
+                or a in self.wildcards or b in self.wildcards
+                or (a in self.nodes and b in self.nodes)
+            )
+            return matched and self.phase_ok(phase)
+        return phase in self.phases
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "nodes": sorted(self.nodes),
+            "pairs": sorted(self.pairs) + sorted(f"{n}-{WILDCARD}" for n in self.wildcards),
+            "phases": sorted(self.phases),
+        }
+
+
+class KISubscriptionIndex:
+    """
+    구독 역인덱스
+
+    node id → 구독자, 쌍 키 → 구독자, 와일드카드 노드 → 구독자, phase → (phase 전용) 구독자.
+    match_* 는 구독을 등록한 클라이언트 중 일치하는 것만 반환 — 전체 수신 클라이언트는
+    unfiltered 로 따로 관리 (브로드캐스트 프레임 공유용).
+    """
+
+    def __init__(self):
+        self.subscriptions: Dict[Hashable, Subscription] = {}
+        self.unfiltered: Set[Hashable] = set()
+        self._by_node: Dict[str, Set[Hashable]] = defaultdict(set)
+        self._by_pair: Dict[str, Set[Hashable]] = defaultdict(set)
+        self._by_wildcard: Dict[str, Set[Hashable]] = defaultdict(set)
+        self._by_phase: Dict[str, Set[Hashable]] = defaultdict(set)  # 대상 없이 phase 만 구독
+
+    def __len__(self) -> int:
+        return len(self.subscriptions)
+
+    @property
+    def filtered(self) -> bool:
+        """구독 범위를 가진 클라이언트가 하나라도 있는지"""
+        return bool(self.subscriptions)
+
+    # ─────────────────────────────────────────
+    # 등록 / 해제
+    # ─────────────────────────────────────────
+
+    def add_client(self, client: Hashable):
+        if client not in self.subscriptions:
+            self.unfiltered.add(client)
+
+    def remove_client(self, client: Hashable):
+        self.unfiltered.discard(client)
+        sub = self.subscriptions.pop(client, None)
+        if sub is not None:
+            self._unindex(client, sub)
+
+    def subscription(self, client: Hashable) -> Optional[Subscription]:
+        return self.subscriptions.get(client)
+
+    def subscribe(
+        self,
+        client: Hashable,
+        nodes: Iterable[str] = (),
+        pairs: Iterable[Any] = (),
+        phases: Iterable[str] = (),
+    ) -> Subscription:
+        """구독 범위 추가 (기존 범위와 합집합)"""
+        sub = self.subscriptions.get(client)
+        if sub is None:
+            sub = self.subscriptions[client] = Subscription()
+            self.unfiltered.discard(client)
+        self._unindex(client, sub)
+        sub.nodes.update(str(n) for n in nodes)
+        for pattern in pairs:
+            a, b = _parse_pair(pattern)
+            if b == WILDCARD or a == WILDCARD:
+                sub.wildcards.add(a if b == WILDCARD else b)
+            else:
+                sub.pairs.add(pair_key(a, b))
+        sub.phases.update(phases)
+        self._index(client, sub)
+        return sub
+
+    def unsubscribe(
+        self,
+        client: Hashable,
+        nodes: Iterable[str] = (),
+        pairs: Iterable[Any] = (),
+        phases: Iterable[str] = (),
+    ) -> Optional[Subscription]:
+        """구독 범위 제거 (전부 제거해도 전체 수신으로 돌아가지 않음 → clear 사용)"""
+        sub = self.subscriptions.get(client)
+        if sub is None:
+            return None
+        self._unindex(client, sub)
+        sub.nodes.difference_update(str(n) for n in nodes)
+        for pattern in pairs:
+            a, b = _parse_pair(pattern)
+            if b == WILDCARD or a == WILDCARD:
+                sub.wildcards.discard(a if b == WILDCARD else b)
+            else:
+                sub.pairs.discard(pair_key(a, b))
+        sub.phases.difference_update(phases)
+        self._index(client, sub)
+        return sub
+
+    def clear(self, client: Hashable):
+        """구독 해제 → 전체 수신"""
+        sub = self.subscriptions.pop(client, None)
+        if sub is not None:
+            self._unindex(client, sub)
+            self.unfiltered.add(client)
+
+    def _index(self, client: Hashable, sub: Subscription):
+        for node in sub.nodes:
+            self._by_node[node].add(client)
+        for key in sub.pairs:
+            self._by_pair[key].add(client)
+        for node in sub.wildcards:
+            self._by_wildcard[node].add(client)
+        if not sub.has_targets:
+            for phase in sub.phases:
+                self._by_phase[phase].add(client)
+
+    def _unindex(self, client: Hashable, sub: Subscription):
+        def _drop(index: Dict[str, Set[Hashable]], keys: Iterable[str]):
+            for key in keys:
+                clients = index.get(key)
+                if clients is not None:
+                    clients.discard(client)
+                    if not clients:
+                        del index[key]
+
+        _drop(self._by_node, sub.nodes)
+        _drop(self._by_pair, sub.pairs)
+        _drop(self._by_wildcard, sub.wildcards)
+        _drop(self._by_phase, sub.phases)
+
+    # ─────────────────────────────────────────
+    # 매칭 (구독 등록 클라이언트만)
+    # ─────────────────────────────────────────
+
+    def match_k(self, node_id: str, phase: Optional[str] = None) -> Set[Hashable]:
+        subs = self.subscriptions
+        matched = {c for c in self._by_node.get(node_id, ()) if subs[c].phase_ok(phase)}
+        if phase is not None and phase in self._by_phase:
+            matched.update(self._by_phase[phase])
+        return matched
+
+    def match_i(self, a: str, b: str, phase: Optional[str] = None) -> Set[Hashable]:
+        subs = self.subscriptions
+        candidates: Set[Hashable] = set(self._by_pair.get(pair_key(a, b), ()))
+        candidates.update(self._by_wildcard.get(a, ()))
+        candidates.update(self._by_wildcard.get(b, ()))
+        # 양 끝이 모두 구독 노드 집합 안 → 작은 쪽을 순회
+        left, right = self._by_node.get(a, ()), self._by_node.get(b, ())
+        if left and right:
+            small, large = (left, right) if len(left) <= len(right) else (right, left)
+            candidates.update(c for c in small if c in large)
+        matched = {c for c in candidates if subs[c].phase_ok(phase)}
+        if phase is not None and phase in self._by_phase:
+            matched.update(self._by_phase[phase])
+        return matched
+
+    def match_target(self, target: Any, phase: Optional[str] = None) -> Set[Hashable]:
+        """anomaly / phase_change 의 target (노드 id 또는 [a, b])"""
+        if isinstance(target, (list, tuple)) and len(target) == 2:
+            return self.match_i(target[0], target[1], phase)
+        return self.match_k(str(target), phase)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "filtered_clients": len(self.subscriptions),
+            "unfiltered_clients": len(self.unfiltered),
+            "indexed_nodes": len(self._by_node),
+            "indexed_pairs": len(self._by_pair),
+            "indexed_wildcards": len(self._by_wildcard),
+            "indexed_phases": len(self._by_phase),
+        }
+
+
+def filter_snapshot(
+    sub: Optional[Subscription],
+    nodes: Dict[str, dict],
+    interactions: Dict[str, dict],
+    pairs_by_node: Dict[str, Set[str]],
+    anomalies: List[dict],
+    anomaly_limit: int = 20,
+) -> dict:
+    """구독 범위의 스냅샷 (구독 노드/쌍 수에 비례, 전체 순회 없음)"""
+    if sub is None:
+        return {
+            "nodes": list(nodes.values()),
+            "interactions": list(interactions.values()),
+            "anomalies": anomalies[-anomaly_limit:],
+        }
+
+    if sub.has_targets:
+        node_list = [nodes[n] for n in sub.nodes if n in nodes and sub.phase_ok(nodes[n].get("phase"))]
+        keys: Set[str] = {k for k in sub.pairs if k in interactions}
+        for node in sub.wildcards:
+            keys.update(pairs_by_node.get(node, ()))
+        for node in sub.nodes:
+            for key in pairs_by_node.get(node, ()):
+                pair = interactions[key]
+                if pair["node_a"] in sub.nodes and pair["node_b"] in sub.nodes:
+                    keys.add(key)
+        pair_list = [interactions[k] for k in keys if sub.phase_ok(interactions[k].get("phase"))]
+    else:
+        node_list = [n for n in nodes.values() if n.get("phase") in sub.phases]
+        pair_list = [p for p in interactions.values() if p.get("phase") in sub.phases]
+
+    def _wants(anomaly: dict) -> bool:
+        target = anomaly.get("target")
+        if isinstance(target, (list, tuple)) and len(target) == 2:
+            return sub.wants_i(target[0], target[1]) if sub.has_targets else True
+        return sub.wants_k(str(target)) if sub.has_targets else True
+
+    picked: List[dict] = []
+    for anomaly in reversed(anomalies):
+        if _wants(anomaly):
+            picked.append(anomaly)
+            if len(picked) >= anomaly_limit:
+                break
+    picked.reverse()
+
+    return {
+        "nodes": node_list,
+        "interactions": pair_list,
+        "anomalies": picked,
+        "subscription": sub.to_dict(),
+    }
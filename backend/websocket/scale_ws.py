@@ -3,33 +3,57 @@ AUTUS Scale WebSocket - 실시간 데이터 스트리밍
 """
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import Dict, Set, List, Any
+from typing import Dict, Set, List, Any, Optional
 import asyncio
 import json
 import random
 from datetime import datetime, timezone
 
+from core.fanout import FanoutHub
+from core.pubsub import Envelope, PubSubBus, get_pubsub_bus
+
 router = APIRouter()
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Connection Manager
 # ═══════════════════════════════════════════════════════════════════════════
 
+def _dumps_compact(message: Any) -> str:
+    # WebSocket.send_json 과 같은 직렬화
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
 class ScaleConnectionManager:
-    """Multi-Scale WebSocket 연결 관리자"""
+    """
+    Multi-Scale WebSocket 연결 관리자
+    
+    전송은 클라이언트별 송신 큐(FanoutHub) 경유 — 느린 클라이언트가
+    시뮬레이션 루프와 다른 구독자를 막지 않는다.
+    broadcast / broadcast_to_channel 은 pub/sub 버스로 모든 워커에 전달되고,
+    채널 구독자 매칭은 각 워커가 자기 구독 테이블로 한다.
+    시뮬레이션 데이터는 워커마다 생성되므로 자기 소켓에만 보낸다.
+    """
+    
+    TOPIC = "ws.scale"
     
-    def __init__(self):
+    def __init__(self, bus: Optional[PubSubBus] = None):
         # 활성 연결
         self.active_connections: Dict[str, WebSocket] = {}
         # 채널별 구독자
         self.subscriptions: Dict[str, Set[str]] = {}
+        # 클라이언트별 송신 큐
+        self.hub = FanoutHub(dumps=_dumps_compact, on_evict=self._evicted)
         # 시뮬레이션 태스크
         self._simulation_task: asyncio.Task | None = None
+        # 워커 간 브로드캐스트
+        self.bus = bus or get_pubsub_bus()
+        self.bus.subscribe(self.TOPIC, self._deliver)
     
     async def connect(self, websocket: WebSocket, client_id: str):
         """클라이언트 연결"""
         await websocket.accept()
         self.active_connections[client_id] = websocket
+        self.hub.add(client_id, websocket.send_text)
         print(f"🔌 Client connected: {client_id}")
         
         # 시뮬레이션 시작 (첫 연결 시)
@@ -38,6 +62,7 @@ class ScaleConnectionManager:
     
     def disconnect(self, client_id: str):
         """클라이언트 연결 해제"""
+        self.hub.remove(client_id)
         if client_id in self.active_connections:
             del self.active_connections[client_id]
             
@@ -47,6 +72,20 @@ class ScaleConnectionManager:
             
             print(f"🔌 Client disconnected: {client_id}")
     
+    def _evicted(self, client_id: str, reason: str):
+        """느린 클라이언트 / 전송 실패 → 연결 정리"""
+        websocket = self.active_connections.get(client_id)
+        self.disconnect(client_id)
+        if websocket is not None and reason == "slow_consumer":
+            asyncio.get_running_loop().create_task(self._close(websocket))
+    
+    @staticmethod
+    async def _close(websocket: WebSocket):
+        try:
+            await websocket.close(code=1013)  # Try Again Later
+        except Exception:
+            pass
+    
     def subscribe(self, client_id: str, channel: str):
         """채널 구독"""
         if channel not in self.subscriptions:
@@ -62,40 +101,35 @@ class ScaleConnectionManager:
     
     async def send_personal(self, client_id: str, message: dict):
         """특정 클라이언트에게 전송"""
-        if client_id in self.active_connections:
-            try:
-                await self.active_connections[client_id].send_json(message)
-            except Exception as e:
-                print(f"Failed to send to {client_id}: {e}")
-                self.disconnect(client_id)
-    
-    async def broadcast(self, message: dict):
-        """모든 클라이언트에게 전송"""
-        disconnected = []
-        for client_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_json(message)
-            except Exception:
-                disconnected.append(client_id)
-        
-        for client_id in disconnected:
+        if client_id in self.active_connections and not self.hub.send_to(client_id, message):
+            print(f"Failed to send to {client_id}: queue closed")
             self.disconnect(client_id)
     
-    async def broadcast_to_channel(self, channel: str, message: dict):
+    async def broadcast(self, message: dict, local: bool = False):
+        """모든 클라이언트에게 전송 (워커별 직렬화 1회, 큐 적재만 하고 반환)"""
+        if local:
+            self._publish_local(None, message)
+        else:
+            await self.bus.publish(self.TOPIC, {"channel": None, "message": message})
+    
+    async def broadcast_to_channel(self, channel: str, message: dict, local: bool = False):
         """채널 구독자에게 전송"""
-        if channel not in self.subscriptions:
+        if local:
+            self._publish_local(channel, message)
+        else:
+            await self.bus.publish(self.TOPIC, {"channel": channel, "message": message})
+    
+    def _deliver(self, envelope: Envelope):
+        payload = envelope.payload
+        self._publish_local(payload.get("channel"), {**payload["message"], "seq": envelope.seq})
+    
+    def _publish_local(self, channel: Optional[str], message: dict):
+        if channel is None:
+            self.hub.publish(message)
             return
-        
-        disconnected = []
-        for client_id in self.subscriptions[channel]:
-            if client_id in self.active_connections:
-                try:
-                    await self.active_connections[client_id].send_json(message)
-                except Exception:
-                    disconnected.append(client_id)
-        
-        for client_id in disconnected:
-            self.disconnect(client_id)
+        subscribers = self.subscriptions.get(channel)
+        if subscribers:
+            self.hub.publish(message, keys=subscribers)
     
     async def _run_simulation(self):
         """실시간 데이터 시뮬레이션"""
@@ -140,7 +174,7 @@ class ScaleConnectionManager:
                 "payload": kpi,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
-            await self.broadcast(message)
+            await self.broadcast(message, local=True)
     
     async def _send_random_alert(self):
         """랜덤 알림 전송"""
@@ -162,8 +196,8 @@ class ScaleConnectionManager:
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
         
-        await self.broadcast_to_channel("alerts", message)
-        await self.broadcast(message)
+        await self.broadcast_to_channel("alerts", message, local=True)
+        await self.broadcast(message, local=True)
     
     async def _send_node_status(self):
         """노드 상태 업데이트"""
@@ -182,8 +216,8 @@ class ScaleConnectionManager:
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
         
-        await self.broadcast_to_channel(f"node:{node_id}", message)
-        await self.broadcast_to_channel("scale:city", message)
+        await self.broadcast_to_channel(f"node:{node_id}", message, local=True)
+        await self.broadcast_to_channel("scale:city", message, local=True)
     
     async def _send_flow_update(self):
         """Flow 업데이트 - 향상된 실시간 Flow 애니메이션 지원"""
@@ -233,9 +267,9 @@ class ScaleConnectionManager:
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
         
-        await self.broadcast_to_channel("scale:city", message)
-        await self.broadcast_to_channel("flows", message)
-        await self.broadcast(message)  # 모든 클라이언트에게도 전송
+        await self.broadcast_to_channel("scale:city", message, local=True)
+        await self.broadcast_to_channel("flows", message, local=True)
+        await self.broadcast(message, local=True)  # 모든 클라이언트에게도 전송
     
     async def _send_global_flow(self):
         """글로벌 레벨 Flow"""
@@ -263,8 +297,8 @@ class ScaleConnectionManager:
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
         
-        await self.broadcast_to_channel("scale:global", message)
-        await self.broadcast(message)
+        await self.broadcast_to_channel("scale:global", message, local=True)
+        await self.broadcast(message, local=True)
 
 
 # 전역 매니저
@@ -284,7 +318,7 @@ async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket, client_id)
     
     # 연결 확인 메시지
-    await websocket.send_json({
+    await manager.send_personal(client_id, {
         "type": "system",
         "payload": {
             "message": "Connected to AUTUS Scale WebSocket",
@@ -303,7 +337,7 @@ async def websocket_endpoint(websocket: WebSocket):
                 channel = data.get("channel")
                 if channel:
                     manager.subscribe(client_id, channel)
-                    await websocket.send_json({
+                    await manager.send_personal(client_id, {
                         "type": "system",
                         "payload": {"message": f"Subscribed to {channel}"},
                         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -313,14 +347,14 @@ async def websocket_endpoint(websocket: WebSocket):
                 channel = data.get("channel")
                 if channel:
                     manager.unsubscribe(client_id, channel)
-                    await websocket.send_json({
+                    await manager.send_personal(client_id, {
                         "type": "system",
                         "payload": {"message": f"Unsubscribed from {channel}"},
                         "timestamp": datetime.now(timezone.utc).isoformat(),
                     })
             
             elif msg_type == "ping":
-                await websocket.send_json({
+                await manager.send_personal(client_id, {
                     "type": "pong",
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                 })
@@ -0,0 +1,43 @@
+"""
+backend 모듈 직접 로드 (테스트 헬퍼)
+
+일부 패키지 __init__ 이 저장소에 없는 모듈을 임포트해 패키지 전체 임포트가 깨져 있다
+(websocket/__init__ → api → websocket.manager, physics/__init__ → physics.galactic_ki).
+그 경우 backend/<package>/<name>.py 를 __init__ 없이 파일 경로로 로드해
+대상 모듈 자체는 테스트되도록 한다. 상대 임포트는 별칭 패키지 `_direct_<package>` 에서 해석.
+"""
+
+import importlib
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+BACKEND = Path(__file__).parent.parent / "backend"
+
+
+def load_module(package: str, name: str):
+    """정상 임포트 우선, 패키지 __init__ 이 깨져 있으면 파일 경로로 로드"""
+    try:
+        return importlib.import_module(f"{package}.{name}")
+    except ImportError:
+        pass
+
+    alias = f"_direct_{package}"
+    if alias not in sys.modules:
+        pkg = types.ModuleType(alias)
+        pkg.__path__ = [str(BACKEND / package)]
+        sys.modules[alias] = pkg
+
+    qualified = f"{alias}.{name}"
+    module = sys.modules.get(qualified)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(qualified, BACKEND / package / f"{name}.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[qualified] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(qualified, None)
+            raise
+    return module
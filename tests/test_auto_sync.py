@@ -0,0 +1,193 @@
+"""
+AUTUS Auto-Sync 스케줄러 테스트
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+pytest.importorskip("aiohttp")
+from integrations.auto_sync import AutoSyncEngine, SyncJob, SyncPriority, _SimulatedHub, _benchmark
+from integrations.oauth_manager import OAuthProvider
+
+
+class RecordingHub(_SimulatedHub):
+    """실행 순서 기록"""
+
+    def __init__(self, delays=None, fail=()):
+        super().__init__(0, 0)
+        self.delays = delays or {}
+        self.fail = set(fail)
+        self.order = []
+        self.finished = {}
+
+    async def collect_by_provider(self, user_id, provider):
+        self.order.append(user_id)
+        self.active[provider] += 1
+        self.peak[provider] = max(self.peak[provider], self.active[provider])
+        try:
+            await asyncio.sleep(self.delays.get(provider, 0))
+            if user_id in self.fail:
+                raise RuntimeError("boom")
+            return [1]
+        finally:
+            self.active[provider] -= 1
+            self.finished[user_id] = asyncio.get_running_loop().time()
+
+
+def make_engine(hub, **kwargs):
+    engine = AutoSyncEngine(jitter=0, **kwargs)
+    engine.data_hub = hub
+    return engine
+
+
+def due_in(seconds: float) -> datetime:
+    return datetime.utcnow() + timedelta(seconds=seconds)
+
+
+async def run_until(engine, count, timeout=5.0):
+    await engine.start()
+    deadline = asyncio.get_running_loop().time() + timeout
+    while len(engine.results) < count and asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(0.01)
+    await engine.stop()
+
+
+def is_scheduled(engine, job):
+    return any(entry[3] is job and engine._is_current(job, entry[4]) for entry in engine._heap)
+
+
+class TestHeapScheduler:
+    """next_sync 힙 스케줄링"""
+
+    def test_runs_in_due_order_then_priority(self):
+        hub = RecordingHub()
+        engine = make_engine(hub)
+        engine.schedule_job(SyncJob("late", OAuthProvider.GITHUB, next_sync=due_in(0.15)))
+        engine.schedule_job(SyncJob("low", OAuthProvider.GITHUB, SyncPriority.LOW, next_sync=due_in(-1)))
+        engine.schedule_job(SyncJob("critical", OAuthProvider.GITHUB, SyncPriority.CRITICAL, next_sync=due_in(-1)))
+
+        asyncio.run(run_until(engine, 3))
+        assert hub.order == ["critical", "low", "late"]
+
+    def test_completed_job_is_rescheduled_by_interval(self):
+        engine = make_engine(RecordingHub())
+        job = SyncJob("u", OAuthProvider.SLACK, next_sync=due_in(-1))
+        engine.schedule_job(job)
+
+        asyncio.run(run_until(engine, 1))
+        assert job.last_sync is not None
+        assert job.next_sync - job.last_sync == timedelta(minutes=5)
+        assert engine.get_status()["scheduler"]["heap_size"] >= 1
+
+    def test_unregistered_job_is_skipped(self):
+        hub = RecordingHub()
+        engine = make_engine(hub)
+        engine.schedule_job(SyncJob("gone", OAuthProvider.GITHUB, next_sync=due_in(0.05)))
+        engine.schedule_job(SyncJob("kept", OAuthProvider.GITHUB, next_sync=due_in(0.05)))
+        engine.unregister_user("gone")
+
+        asyncio.run(run_until(engine, 1))
+        assert hub.order == ["kept"]
+
+    def test_failure_backs_off(self):
+        engine = make_engine(RecordingHub(fail={"u"}))
+        job = SyncJob("u", OAuthProvider.GITHUB, next_sync=due_in(-1))
+        engine.schedule_job(job)
+
+        asyncio.run(run_until(engine, 1))
+        assert job.retry_count == 1
+        assert job.next_sync > datetime.utcnow() + timedelta(seconds=100)
+
+
+    def test_job_in_flight_at_stop_runs_after_restart(self):
+        hub = RecordingHub(delays={OAuthProvider.GITHUB: 0.2})
+        engine = make_engine(hub)
+        job = SyncJob("u", OAuthProvider.GITHUB, next_sync=due_in(-1))
+        engine.schedule_job(job)
+
+        async def scenario():
+            await engine.start()
+            while not hub.order:
+                await asyncio.sleep(0.01)
+            await engine.stop()
+            assert is_scheduled(engine, job)
+            hub.delays = {}
+            await run_until(engine, 1)
+
+        asyncio.run(scenario())
+        assert hub.order == ["u", "u"]
+        assert job.last_sync is not None and is_scheduled(engine, job)
+
+    def test_manual_process_keeps_jobs_scheduled(self):
+        engine = make_engine(RecordingHub())
+        job = SyncJob("u", OAuthProvider.SLACK, next_sync=due_in(-1))
+        engine.schedule_job(job)
+
+        asyncio.run(engine._process_jobs())
+        assert len(engine.results) == 1
+        assert is_scheduled(engine, job)
+        assert engine.get_status()["scheduler"]["next_due"] is not None
+
+
+class TestConcurrencyLimits:
+    """전역 워커 / 서비스별 동시성·속도 제한"""
+
+    def test_provider_concurrency_cap(self):
+        hub = RecordingHub(delays={OAuthProvider.GITHUB: 0.02})
+        engine = make_engine(hub, provider_limits={OAuthProvider.GITHUB: (3, 1000)})
+        for i in range(12):
+            engine.schedule_job(SyncJob(f"u{i}", OAuthProvider.GITHUB, next_sync=due_in(-1)))
+
+        asyncio.run(run_until(engine, 12))
+        assert len(engine.results) == 12
+        assert hub.peak[OAuthProvider.GITHUB] == 3
+
+    def test_slow_provider_does_not_block_others(self):
+        hub = RecordingHub(delays={OAuthProvider.NOTION: 0.5, OAuthProvider.SLACK: 0.01})
+        engine = make_engine(hub, max_workers=5, provider_limits={
+            OAuthProvider.NOTION: (5, 1000), OAuthProvider.SLACK: (5, 1000),
+        })
+        for i in range(5):
+            engine.schedule_job(SyncJob(f"slow{i}", OAuthProvider.NOTION, next_sync=due_in(-1)))
+        for i in range(20):
+            engine.schedule_job(SyncJob(f"fast{i}", OAuthProvider.SLACK, next_sync=due_in(-1)))
+
+        asyncio.run(run_until(engine, 20, timeout=0.45))
+        # 라운드로빈으로 NOTION 이 전역 슬롯을 독점하지 않고, SLACK 작업은 계속 진행
+        assert sum(1 for r in engine.results if r.provider == OAuthProvider.SLACK) == 20
+
+    def test_provider_rate_cap(self):
+        hub = RecordingHub()
+        engine = make_engine(hub, provider_limits={OAuthProvider.GITHUB: (10, 20.0)})
+        for i in range(30):
+            engine.schedule_job(SyncJob(f"u{i}", OAuthProvider.GITHUB, next_sync=due_in(-1)))
+
+        async def run():
+            await engine.start()
+            await asyncio.sleep(0.5)
+            await engine.stop()
+
+        asyncio.run(run())
+        # 버킷 20 + 0.5초 × 20/s ≈ 30 이하
+        assert 20 <= len(engine.results) <= 31
+
+    def test_jitter_spreads_intervals(self):
+        engine = AutoSyncEngine(jitter=0.1)
+        values = {engine._jittered(timedelta(minutes=10)) for _ in range(50)}
+        assert len(values) > 1
+        assert all(timedelta(minutes=9) <= v <= timedelta(minutes=11) for v in values)
+
+
+class TestSimulation:
+    """합성 작업 시뮬레이션"""
+
+    def test_benchmark_small(self):
+        result = _benchmark(n_jobs=2_000, workers=50, spread_s=0.2, legacy_sample=200)
+        assert result["executed"] == 2_000
+        assert all(result["peak_concurrency"][p] <= result["provider_caps"][p] for p in result["provider_caps"])
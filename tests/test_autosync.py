@@ -8,8 +8,9 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
 from autosync.detector import AutoSyncDetector
-from autosync.transformer import UniversalTransformer, FlowTypeDetector
+from autosync.transformer import UniversalTransformer, FlowTypeDetector, CompiledExtractor
 from autosync.registry import SaaSRegistry, SystemType
+from autosync.automaton import AhoCorasick, PrefixTrie, DomainSuffixIndex
 
 
 class TestSaaSRegistry:
@@ -120,6 +121,68 @@ class TestAutoSyncDetector:
         assert result["detected"] == []
 
 
+class TestDetectionAutomaton:
+    """감지 인덱스 (Aho–Corasick / 트라이 / 도메인 접미사)"""
+    
+    def test_aho_corasick_matches_naive(self):
+        """오토마톤 결과 = 전수 부분 문자열 검사"""
+        import random
+        rnd = random.Random(1)
+        patterns = ["".join(rnd.choice("abc") for _ in range(rnd.randint(1, 4))) for _ in range(40)]
+        ac = AhoCorasick((p, p) for p in patterns)
+        for _ in range(200):
+            text = "".join(rnd.choice("abcd") for _ in range(rnd.randint(0, 30)))
+            assert ac.search(text) == {p for p in patterns if p in text}
+    
+    def test_overlapping_patterns(self):
+        """겹치는 패턴 / 접미사 패턴 모두 검출"""
+        ac = AhoCorasick([("he", "a"), ("she", "b"), ("hers", "c"), ("s", "d")])
+        assert ac.search("ushers") == {"a", "b", "c", "d"}
+    
+    def test_prefix_trie_priority(self):
+        """여러 접두사 매칭 시 우선순위 (레지스트리 순서) 가 앞선 값"""
+        trie = PrefixTrie([("sk_live_", "late", 5), ("sk_", "early", 1), ("pk_", "other", 0)])
+        assert trie.match("sk_live_123") == "early"
+        assert trie.match("xx") is None
+    
+    def test_domain_suffix_boundaries(self):
+        """라벨 경계 접미사 + 경로 패턴"""
+        index = DomainSuffixIndex([("stripe.com", "stripe"), ("toss.im/pos", "toss_pos")])
+        assert index.match("js.stripe.com") == {"stripe"}
+        assert index.match("https://API.Stripe.com:443/v1") == {"stripe"}
+        assert index.match("notstripe.com") == set()
+        assert index.match("stripe.com.evil.io") == set()
+        assert index.match("toss.im/pos/orders") == {"toss_pos"}
+        assert index.match("toss.im") == set()
+    
+    def test_register_rebuilds_index(self):
+        """레지스트리 변경 시 인덱스 재빌드"""
+        detector = AutoSyncDetector()
+        detector.detect_from_cookies("x=1")
+        try:
+            SaaSRegistry.register("test_saas", {
+                "name": "Test", "type": SystemType.CRM,
+                "detection": {"cookies": ["_tsaas_"], "domains": ["tsaas.dev"], "api_patterns": ["tsk_"]},
+            })
+            assert detector.detect_from_cookies("_TSAAS_id=1") == ["test_saas"]
+            assert detector.detect_from_domains(["app.tsaas.dev"]) == ["test_saas"]
+            assert detector.detect_from_api_key("tsk_1") == "test_saas"
+        finally:
+            SaaSRegistry.SYSTEMS.pop("test_saas", None)
+            SaaSRegistry.version += 1
+    
+    def test_benchmark_matches_linear_scan(self):
+        """합성 레지스트리: 인덱스 결과 = 전수 비교 결과"""
+        from autosync.detector import _SyntheticRegistry, _linear_detect, _benchmark
+        registry = _SyntheticRegistry(300)
+        detector = AutoSyncDetector(registry)
+        cookies = "_s12_sid=a; s250tk=b; other=c"
+        domains = ["app.saas7.com", "api.saas99.io"]
+        result = detector.detect_all(cookies=cookies, domains=domains, api_key="s42_test_x")
+        assert set(result["detected"]) == _linear_detect(registry.SYSTEMS, cookies, domains, "s42_test_x")
+        assert _benchmark(300, requests=20)["systems"] == 300
+
+
 class TestUniversalTransformer:
     """Universal Transformer 테스트"""
     
@@ -192,6 +255,77 @@ class TestUniversalTransformer:
         assert result["value"] == 25000.0
 
 
+class TestCompiledExtractor:
+    """컴파일된 추출기 / 배치 변환 테스트"""
+    
+    def setup_method(self):
+        self.transformer = UniversalTransformer()
+    
+    def test_mapping_is_compiled_once(self):
+        """시스템별 추출기 캐시"""
+        ext = self.transformer.extractor("shopify")
+        assert ext is self.transformer.extractor("shopify")
+        assert ext.id_paths == (("customer", "id"), ("id",))
+        assert ext.divisor == 1.0
+    
+    def test_unknown_ids_share_generic_extractor(self):
+        """URL 경로에서 오는 미등록 id 는 캐시를 늘리지 않음"""
+        generic = self.transformer.extractor(None)
+        for n in range(100):
+            assert self.transformer.extractor(f"unknown-{n}") is generic
+        assert list(self.transformer._extractors) == [None]
+    
+    def test_multiple_value_paths(self):
+        """값 경로 여러 개 + 제수 없음 (HubSpot)"""
+        ext = CompiledExtractor(SaaSRegistry.get_mapping("hubspot"), "hubspot")
+        assert ext.value_paths == (("properties", "hs_deal_amount"), ("amount",))
+        assert ext.value({"amount": "12.5"}) == 12.5
+    
+    def test_unparseable_value_falls_back(self):
+        """변환 불가 값은 다음 후보로"""
+        data = {"customer": "cus_1", "amount": "n/a", "total": 300}
+        assert self.transformer.transform(data, "stripe")["value"] == 3.0
+    
+    def test_batch_list_matches_single(self):
+        """리스트 배치 = 단건 변환"""
+        records = [
+            {"customer": {"id": 7}, "total_price": "19.90", "created_at": "2026-01-01"},
+            {"id": 8, "total_price": "5", "created_at": "2026-01-02"},
+        ]
+        batch = self.transformer.transform_batch(records, "shopify")
+        assert batch == [self.transformer.transform(r, "shopify") for r in records]
+        assert [r["node_id"] for r in batch] == ["7", "8"]
+    
+    def test_batch_columns(self):
+        """컬럼 배치: 중첩 dict 컬럼 / 평탄화 컬럼 / null"""
+        columns = {
+            "customer": [{"id": 7}, None, {"id": None}],
+            "id": [1, 2, 3],
+            "total_price": ["19.90", None, "3"],
+            "created_at": ["2026-01-01", "2026-01-02", "2026-01-03"],
+        }
+        out = self.transformer.transform_batch(columns, "shopify")
+        assert out["node_id"] == ["7", "2", "3"]
+        assert out["value"] == [19.9, 0.0, 3.0]
+        assert out["source"] == ["shopify"] * 3
+        
+        flat = self.transformer.transform_batch({"customer.id": ["a"], "total_price": [1]}, "shopify")
+        assert flat["node_id"] == ["a"]
+    
+    def test_batch_columns_matches_rows(self):
+        """컬럼 배치 = 행 배치 (Stripe)"""
+        records = [
+            {"customer": f"cus_{i}", "amount": 100 * i, "created": 1700000000 + i}
+            for i in range(1, 50)
+        ]
+        columns = {k: [r[k] for r in records] for k in records[0]}
+        out = self.transformer.transform_batch(columns, "stripe")
+        rows = self.transformer.transform_batch(records, "stripe")
+        assert out["node_id"] == [r["node_id"] for r in rows]
+        assert out["value"] == [r["value"] for r in rows]
+        assert out["timestamp"] == [r["timestamp"] for r in rows]
+
+
 class TestFlowTypeDetector:
     """Flow Type Detector 테스트"""
     
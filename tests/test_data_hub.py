@@ -0,0 +1,253 @@
+"""
+AUTUS DataHub 증분 동기화 / 인덱스 테스트
+"""
+
+import asyncio
+import os
+import random
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+pytest.importorskip("aiohttp")
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from integrations.data_hub import (
+    BaseCollector,
+    DataHub,
+    DataType,
+    SlackCollector,
+    UnifiedData,
+    UserDataIndex,
+)
+from integrations.http_pool import HTTPSessionPool
+from integrations.oauth_manager import OAuthProvider, OAuthToken
+
+
+def item(item_id, title="", content="", data_type=DataType.DOCUMENT, source=OAuthProvider.NOTION):
+    return UnifiedData(id=item_id, type=data_type, source=source, title=title, content=content)
+
+
+class TestUserDataIndex:
+    """id 병합 / 타입 인덱스 / bigram 역색인"""
+
+    def test_merge_by_id(self):
+        index = UserDataIndex()
+        delta = index.merge([item("a", "회의록"), item("b", "예산")])
+        assert len(delta.added) == 2
+
+        delta = index.merge([item("a", "회의록"), item("b", "예산 수정"), item("c", "new")])
+        assert delta.to_dict() == {"added": 1, "updated": 1, "removed": 0, "unchanged": 1}
+        assert len(index) == 3
+        assert [d.id for d in index.all()] == ["a", "b", "c"]
+
+    def test_update_and_remove_maintain_postings(self):
+        index = UserDataIndex()
+        index.merge([item("a", "quarterly report")])
+        index.merge([item("a", "weekly memo")])
+        assert index.search("report") == []
+        assert [d.id for d in index.search("memo")] == ["a"]
+
+        index.remove(item("a").key)
+        assert index.search("memo") == []
+        assert not index.postings
+
+    def test_search_matches_substring_scan(self):
+        random.seed(7)
+        words = ["회의", "회의록", "예산", "Budget", "report", "weekly", "팀", "계약서", "launch"]
+        items = [
+            item(
+                f"i{n}",
+                " ".join(random.sample(words, 2)),
+                " ".join(random.sample(words, 3)),
+                random.choice([DataType.EMAIL, DataType.DOCUMENT]),
+            )
+            for n in range(300)
+        ]
+        index = UserDataIndex()
+        index.merge(items)
+
+        for query in ["회의", "의록", "budget", "REP", "eekly 팀", "x", "", "없는말"]:
+            for data_type in (None, DataType.EMAIL):
+                q = query.lower()
+                expected = [
+                    d.id for d in items
+                    if (data_type is None or d.type == data_type)
+                    and (q in d.title.lower() or q in d.content.lower())
+                ]
+                assert [d.id for d in index.search(query, data_type)] == expected, query
+
+    def test_type_index(self):
+        index = UserDataIndex()
+        index.merge([item("a", data_type=DataType.EMAIL), item("b"), item("c", data_type=DataType.EMAIL)])
+        assert [d.id for d in index.of_type(DataType.EMAIL)] == ["a", "c"]
+
+
+class FakeOAuth:
+    def __init__(self, providers):
+        self.providers = providers
+
+    def get_connected_providers(self, user_id):
+        return list(self.providers)
+
+    async def get_token(self, user_id, provider):
+        return OAuthToken(provider=provider, access_token="t")
+
+
+class FakeNotionCollector(BaseCollector):
+    """sync_token 이후 항목만 돌려주는 수집기"""
+
+    SOURCE = OAuthProvider.NOTION
+    DATA_TYPE = DataType.DOCUMENT
+    remote = {}
+    calls = []
+
+    async def collect(self):
+        since = (self.sync_token or {}).get("version", 0)
+        FakeNotionCollector.calls.append(since)
+        items = [item(i, title) for i, (title, version) in self.remote.items() if version > since]
+        self.next_sync_token = {"version": max([v for _, v in self.remote.values()] + [since])}
+        return items
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    FakeNotionCollector.remote = {"p1": ("alpha", 1), "p2": ("beta", 1)}
+    FakeNotionCollector.calls = []
+    monkeypatch.setattr(DataHub, "COLLECTORS", {OAuthProvider.NOTION: [FakeNotionCollector]})
+    return DataHub(FakeOAuth([OAuthProvider.NOTION]), http_pool=HTTPSessionPool())
+
+
+class TestIncrementalSync:
+    """sync_token 기반 증분 병합"""
+
+    def test_second_sync_fetches_only_changes(self, hub):
+        async def run():
+            first = await hub.sync("u")
+            FakeNotionCollector.remote["p3"] = ("gamma", 2)
+            FakeNotionCollector.remote["p1"] = ("alpha v2", 2)
+            second = await hub.sync("u")
+            await hub.http_pool.close()
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert FakeNotionCollector.calls == [0, 1]
+        assert first.to_dict()["added"] == 2
+        assert second.to_dict() == {"added": 1, "updated": 1, "removed": 0, "unchanged": 0}
+        assert [d.title for d in hub.get_cached("u")] == ["alpha v2", "beta", "gamma"]
+        assert [d.id for d in hub.search("u", "alp")] == ["p1"]
+
+    def test_full_sync_removes_missing_items(self, hub):
+        async def run():
+            await hub.sync("u")
+            del FakeNotionCollector.remote["p2"]
+            delta = await hub.sync("u", full=True)
+            await hub.http_pool.close()
+            return delta
+
+        delta = asyncio.run(run())
+        assert [key[2] for key in delta.removed] == ["p2"]
+        assert [d.id for d in hub.get_cached("u")] == ["p1"]
+
+    def test_collect_by_type_uses_index(self, hub):
+        async def run():
+            docs = await hub.collect_by_type("u", DataType.DOCUMENT)
+            again = await hub.collect_by_type("u", DataType.DOCUMENT)
+            await hub.http_pool.close()
+            return docs, again
+
+        docs, again = asyncio.run(run())
+        assert len(docs) == len(again) == 2
+        assert FakeNotionCollector.calls == [0]  # 두 번째는 동기화 없이 인덱스에서
+
+
+class TestSlackWatermark:
+    """Slack 채널별 oldest 워터마크"""
+
+    def test_oldest_is_sent_and_advanced(self):
+        seen = []
+
+        async def conversations(request):
+            return web.json_response({"channels": [{"id": "C1", "name": "general"}]})
+
+        async def history(request):
+            seen.append(request.query.get("oldest"))
+            oldest = float(request.query.get("oldest", 0))
+            messages = [{"ts": ts, "text": f"m{ts}"} for ts in ("3.0", "2.0", "1.0") if float(ts) > oldest]
+            return web.json_response({"messages": messages})
+
+        app = web.Application()
+        app.router.add_get("/conversations.list", conversations)
+        app.router.add_get("/conversations.history", history)
+
+        async def run():
+            server = TestServer(app)
+            await server.start_server()
+            pool = HTTPSessionPool()
+            session = await pool.session()
+            token = OAuthToken(provider=OAuthProvider.SLACK, access_token="t")
+            try:
+                collector = SlackCollector(token, session=session, sync_token={"channels": {"C1": "1.0"}})
+                collector.BASE_URL = str(server.make_url("")).rstrip("/")
+                items = await collector.collect()
+                return items, collector.next_sync_token
+            finally:
+                await pool.close()
+                await server.close()
+
+        items, next_token = asyncio.run(run())
+        assert seen == ["1.0"]
+        assert [d.id for d in items] == ["C1:3.0", "C1:2.0"]
+        assert next_token == {"channels": {"C1": "3.0"}}
+        assert items[0].timestamp == datetime.fromtimestamp(3.0)
+        assert items[0].raw == {"ts": "3.0", "text": "m3.0"}
+
+
+class TestFullSyncWindow:
+    """전체 수집은 실제로 조회한 범위 안의 누락만 삭제"""
+
+    def test_items_beyond_the_limit_are_kept(self, monkeypatch):
+        remote = {"C1": [str(float(n)) for n in range(30, 0, -1)]}  # 최신순 30개
+
+        async def conversations(request):
+            return web.json_response({"channels": [{"id": "C1", "name": "general"}, {"id": "C2", "name": "random"}]})
+
+        async def history(request):
+            channel = request.query["channel"]
+            limit = int(request.query["limit"])
+            messages = [{"ts": ts, "text": ts} for ts in remote.get(channel, [])[:limit]]
+            return web.json_response({"messages": messages, "has_more": len(remote.get(channel, [])) > limit})
+
+        app = web.Application()
+        app.router.add_get("/conversations.list", conversations)
+        app.router.add_get("/conversations.history", history)
+
+        async def run():
+            server = TestServer(app)
+            await server.start_server()
+            monkeypatch.setattr(SlackCollector, "BASE_URL", str(server.make_url("")).rstrip("/"))
+            monkeypatch.setattr(DataHub, "COLLECTORS", {OAuthProvider.SLACK: [SlackCollector]})
+            hub = DataHub(FakeOAuth([OAuthProvider.SLACK]), http_pool=HTTPSessionPool())
+            index = hub._index("u")
+            # 이전에 받아 둔 오래된 메시지 (조회 범위 밖) + 다른 채널
+            index.merge([
+                item("C1:1.0", data_type=DataType.MESSAGE, source=OAuthProvider.SLACK),
+                item("C9:5.0", data_type=DataType.MESSAGE, source=OAuthProvider.SLACK),
+            ])
+            for key in list(index.items):
+                index.items[key].metadata = {"channel_id": key[2].split(":")[0], "ts": key[2].split(":")[1]}
+            await hub.sync("u", full=True)
+            remote["C1"].remove("25.0")  # 범위 안에서 삭제
+            delta = await hub.sync("u", full=True)
+            await hub.http_pool.close()
+            await server.close()
+            return hub, delta
+
+        hub, delta = asyncio.run(run())
+        assert [key[2] for key in delta.removed] == ["C1:25.0"]
+        ids = {d.id for d in hub.get_cached("u")}
+        assert {"C1:1.0", "C9:5.0"} <= ids
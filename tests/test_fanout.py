@@ -0,0 +1,299 @@
+"""
+AUTUS WebSocket fan-out (클라이언트별 송신 큐) 테스트
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from core.efficiency import BinaryDeltaStream
+from core.fanout import FanoutHub, SlowConsumerPolicy, TickConflator, run_fanout_load_test
+from core.pubsub import InProcessPubSubBus
+from tests.direct_import import load_module
+
+
+class _Client:
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.frames = []
+        self.gate = asyncio.Event()
+
+    async def send_text(self, data):
+        if self.fail:
+            raise ConnectionError("gone")
+        if self.delay is None:
+            await self.gate.wait()  # 막힌 클라이언트
+        elif self.delay:
+            await asyncio.sleep(self.delay)
+        self.frames.append(json.loads(data))
+
+
+class TestFanoutHub:
+    """정책별 느린 클라이언트 처리"""
+
+    def test_serialises_once_and_preserves_order(self):
+        calls = []
+
+        def dumps(message):
+            calls.append(message)
+            return json.dumps(message)
+
+        async def scenario():
+            hub = FanoutHub(dumps=dumps)
+            clients = [_Client() for _ in range(3)]
+            for i, c in enumerate(clients):
+                hub.add(i, c.send_text)
+            hub.send_to(0, {"seq": "snapshot"})
+            for seq in range(5):
+                hub.publish({"seq": seq})
+            hub.publish({"seq": "only-1"}, keys=[1, 99])
+            await hub.flush()
+            hub.close()
+            return clients
+
+        clients = asyncio.run(scenario())
+        assert len(calls) == 7
+        assert [f["seq"] for f in clients[0].frames] == ["snapshot", 0, 1, 2, 3, 4]
+        assert [f["seq"] for f in clients[1].frames] == [0, 1, 2, 3, 4, "only-1"]
+
+    def test_drop_oldest_bounds_queue(self):
+        async def scenario():
+            hub = FanoutHub(maxsize=3, policy=SlowConsumerPolicy.DROP_OLDEST)
+            stuck, fast = _Client(delay=None), _Client()
+            hub.add("stuck", stuck.send_text)
+            hub.add("fast", fast.send_text)
+            await asyncio.sleep(0.001)
+            for seq in range(10):
+                hub.publish({"seq": seq})
+                await asyncio.sleep(0.001)
+            depth = hub.channels["stuck"].depth
+            stuck.gate.set()
+            await hub.flush()
+            return hub.stats(), depth, stuck, fast
+
+        stats, depth, stuck, fast = asyncio.run(scenario())
+        assert depth == 3
+        assert len(fast.frames) == 10
+        # writer 가 들고 있던 첫 프레임 + 마지막 3개
+        assert [f["seq"] for f in stuck.frames] == [0, 7, 8, 9]
+        assert stats["dropped"] == 6
+
+    def test_conflate_keeps_latest_per_key(self):
+        async def scenario():
+            hub = FanoutHub(maxsize=100, policy=SlowConsumerPolicy.CONFLATE)
+            stuck = _Client(delay=None)
+            hub.add("stuck", stuck.send_text)
+            await asyncio.sleep(0.001)
+            hub.publish({"node": "first"})
+            await asyncio.sleep(0.001)
+            for k in range(20):
+                hub.publish({"node": "A", "k": k}, conflate_key=("k", "A"))
+                hub.publish({"node": "B", "k": k}, conflate_key=("k", "B"))
+            hub.publish({"type": "anomaly"})
+            stuck.gate.set()
+            await hub.flush()
+            return hub.stats(), stuck
+
+        stats, stuck = asyncio.run(scenario())
+        assert stuck.frames == [
+            {"node": "first"}, {"node": "A", "k": 19}, {"node": "B", "k": 19}, {"type": "anomaly"},
+        ]
+        assert stats["conflated"] == 38
+
+    def test_disconnect_evicts_slow_and_failed_clients(self):
+        evicted = []
+
+        async def scenario():
+            hub = FanoutHub(maxsize=2, policy=SlowConsumerPolicy.DISCONNECT,
+                            on_evict=lambda key, reason: evicted.append((key, reason)))
+            hub.add("stuck", _Client(delay=None).send_text)
+            hub.add("broken", _Client(fail=True).send_text)
+            hub.add("fast", _Client().send_text)
+            await asyncio.sleep(0.001)
+            for seq in range(5):
+                hub.publish({"seq": seq})
+                await asyncio.sleep(0.001)
+            return hub
+
+        hub = asyncio.run(scenario())
+        assert sorted(evicted) == [("broken", "send_error"), ("stuck", "slow_consumer")]
+        assert list(hub.channels) == ["fast"]
+        assert hub.stats()["evicted"] == {"send_error": 1, "slow_consumer": 1}
+
+    def test_send_timeout_evicts(self):
+        evicted = []
+
+        async def scenario():
+            hub = FanoutHub(send_timeout=0.01, on_evict=lambda key, reason: evicted.append(reason))
+            hub.add("stuck", _Client(delay=None).send_text)
+            hub.publish({"seq": 0})
+            await asyncio.sleep(0.05)
+
+        asyncio.run(scenario())
+        assert evicted == ["send_timeout"]
+
+
+class TestTickConflator:
+    """tick 동안 키별 최신값만 → 배치 1회"""
+
+    def test_latest_value_per_tick(self):
+        batches = []
+
+        async def scenario():
+            conflator = TickConflator(0.02, batches.append, merge=lambda old, new: (old[0], new[1]))
+            for v in range(100):
+                conflator.offer(("k", f"n{v % 5}"), (v, v))
+            await asyncio.sleep(0.05)
+            conflator.offer(("k", "n0"), (-1, -1))
+            conflator.close()
+            return conflator.stats()
+
+        stats = asyncio.run(scenario())
+        assert batches[0] == {("k", f"n{i}"): (i, 95 + i) for i in range(5)}
+        assert batches[1] == {("k", "n0"): (-1, -1)}
+        assert stats["superseded"] == 95 and stats["batches"] == 2
+
+    def test_binary_ki_batch_roundtrip(self):
+        stream = BinaryDeltaStream()
+        data = stream.encode_ki_batch([("User_A", 0.5, 0.25)], [("User_A", "팀_B", -0.75, -0.5)])
+        decoded = stream.decode(data)
+        assert decoded["type"] == "KI_BATCH" and decoded["sequence"] == 1
+        assert decoded["k"] == [{"node_id": "User_A", "k_after": 0.5, "delta_k": 0.25}]
+        assert decoded["i"] == [{"node_a": "User_A", "node_b": "팀_B", "i_after": -0.75, "delta_i": -0.5}]
+        assert len(data) < len(json.dumps(decoded))
+
+    def test_binary_ki_batch_over_uint16_counts(self):
+        stream = BinaryDeltaStream()
+        k_updates = [(f"n{idx}", 0.5, 0.25) for idx in range(70000)]
+        decoded = stream.decode(stream.encode_ki_batch(k_updates, [("a", "b", 0.0, 0.0)] * 3))
+        assert len(decoded["k"]) == 70000 and len(decoded["i"]) == 3
+        assert decoded["k"][-1]["node_id"] == "n69999"
+
+
+class TestKIConnectionManager:
+    """K/I 브로드캐스트는 느린 클라이언트를 기다리지 않음"""
+
+    def test_broadcast_does_not_wait(self):
+        pytest.importorskip("fastapi")
+        ki_server = load_module("websocket", "ki_server")
+
+        class _WS(_Client):
+            async def accept(self):
+                pass
+
+        async def scenario():
+            manager = ki_server.KIConnectionManager(FanoutHub(maxsize=8), InProcessPubSubBus())
+            stuck, fast = _WS(delay=None), _WS()
+            await manager.connect(stuck)
+            await manager.connect(fast)
+            await asyncio.wait_for(manager.broadcast({"type": "k_update"}), 0.1)
+            await manager.hub.channels[fast].flush()
+            return fast
+
+        assert asyncio.run(scenario()).frames == [{"type": "k_update", "seq": 1}]
+
+    def test_send_failure_closes_socket(self):
+        pytest.importorskip("fastapi")
+        ki_server = load_module("websocket", "ki_server")
+
+        class _WS(_Client):
+            closed = None
+
+            async def accept(self):
+                pass
+
+            async def close(self, code=1000):
+                self.closed = code
+
+        async def scenario():
+            manager = ki_server.KIConnectionManager(FanoutHub(), InProcessPubSubBus())
+            broken = _WS(fail=True)
+            await manager.connect(broken)
+            await manager.broadcast({"type": "k_update"})
+            await asyncio.sleep(0.01)
+            return manager, broken
+
+        manager, broken = asyncio.run(scenario())
+        assert broken not in manager.active_connections
+        assert broken.closed == 1011
+
+    def test_bulk_updates_conflate_into_batches(self):
+        pytest.importorskip("fastapi")
+        ki_server = load_module("websocket", "ki_server")
+
+        class _WS(_Client):
+            async def accept(self):
+                pass
+
+        async def scenario():
+            manager = ki_server.KIConnectionManager(FanoutHub(), InProcessPubSubBus())
+            publisher = ki_server.KIUpdatePublisher(manager, tick_ms=20)
+            client = _WS()
+            await manager.connect(client)
+            for step in range(500):
+                await publisher.publish_k(f"n{step % 10}", {
+                    "node_id": f"n{step % 10}", "k_before": 0, "k_after": step / 1000, "delta_k": step / 1000,
+                })
+            await asyncio.sleep(0.05)
+            await manager.hub.channels[client].flush()
+            return client
+
+        frames = asyncio.run(scenario()).frames
+        assert [f["type"] for f in frames] == ["ki_batch"]
+        k = {u["node_id"]: u for u in frames[0]["data"]["k"]}
+        assert len(k) == 10
+        assert k["n9"]["k_after"] == 0.499 and k["n9"]["k_before"] == 0
+
+
+    def test_binary_batches_carry_bus_sequence(self):
+        pytest.importorskip("fastapi")
+        ki_server = load_module("websocket", "ki_server")
+
+        class _WS(_Client):
+            async def accept(self):
+                pass
+
+            async def send_bytes(self, data):
+                self.frames.append(BinaryDeltaStream().decode(data))
+
+        async def scenario():
+            manager = ki_server.KIConnectionManager(FanoutHub(), InProcessPubSubBus())
+            publisher = ki_server.KIUpdatePublisher(manager, tick_ms=10)
+            clients = [_WS(), _WS()]
+            for client, node in zip(clients, ("n1", "n2")):
+                await manager.connect(client, encoding="binary")
+                manager.subscriptions.subscribe(client, nodes=[node])
+            for tick in range(2):
+                for node in ("n1", "n2"):
+                    await publisher.publish_k(node, {"node_id": node, "k_before": 0, "k_after": 0.5, "delta_k": 0.5})
+                await asyncio.sleep(0.05)
+            for client in clients:
+                await manager.hub.channels[client].flush()
+            return clients
+
+        for client in asyncio.run(scenario()):
+            # 그룹별로 따로 인코딩돼도 같은 틱은 같은 버스 seq
+            assert [f["sequence"] for f in client.frames] == [1, 2]
+
+
+class TestLoad:
+    """5,000 클라이언트 (일부 느림) 생산자 지연"""
+
+    @pytest.mark.parametrize("policy", list(SlowConsumerPolicy))
+    def test_producer_latency_independent_of_slow_clients(self, policy):
+        report = asyncio.run(run_fanout_load_test(
+            clients=5000, slow_clients=50, messages=20, slow_delay=0.05, policy=policy,
+        ))
+        print(json.dumps(report))
+        assert report["fast_min_received"] == 20
+        assert report["slow_max_received"] < 20
+        # 순차 await 는 느린 클라이언트 50 × 50ms 이상
+        assert report["baseline_sequential_ms"] >= 2500
+        assert report["publish_p50_ms"] < report["baseline_sequential_ms"] / 20
+        assert report["publish_max_ms"] < report["baseline_sequential_ms"] / 2
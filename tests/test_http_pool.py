@@ -0,0 +1,119 @@
+"""
+AUTUS 공용 HTTP 커넥션 풀 테스트
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from integrations.http_pool import HTTPPoolConfig, HTTPSessionPool
+from integrations.data_hub import BaseCollector
+from integrations.oauth_manager import OAuthProvider, OAuthToken
+
+
+def _app():
+    async def ping(request):
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/ping", ping)
+    return app
+
+
+def _with_server(coro_fn):
+    async def run():
+        server = TestServer(_app())
+        await server.start_server()
+        try:
+            return await coro_fn(str(server.make_url("/ping")))
+        finally:
+            await server.close()
+
+    return asyncio.run(run())
+
+
+class TestHTTPSessionPool:
+    """keep-alive 재사용 / 주입 / 메트릭"""
+
+    def test_connections_are_reused(self):
+        pool = HTTPSessionPool(HTTPPoolConfig(limit_per_host=4))
+
+        async def run(url):
+            session = await pool.session()
+            for _ in range(20):
+                async with session.get(url) as resp:
+                    await resp.json()
+            metrics = pool.metrics()
+            await pool.close()
+            return metrics
+
+        metrics = _with_server(run)
+        assert metrics["requests"] == 20
+        assert metrics["connections_created"] == 1
+        assert metrics["connections_reused"] == 19
+        assert metrics["idle_connections"] == 1
+        assert metrics["in_flight"] == 0
+
+    def test_concurrency_capped_per_host(self):
+        pool = HTTPSessionPool(HTTPPoolConfig(limit_per_host=3))
+
+        async def run(url):
+            session = await pool.session()
+
+            async def get():
+                async with session.get(url) as resp:
+                    return await resp.json()
+
+            await asyncio.gather(*[get() for _ in range(12)])
+            metrics = pool.metrics()
+            await pool.close()
+            return metrics
+
+        metrics = _with_server(run)
+        assert metrics["connections_created"] <= 3
+        assert metrics["queued"] > 0
+
+    def test_session_is_per_event_loop(self):
+        pool = HTTPSessionPool()
+
+        async def get():
+            return await pool.session()
+
+        first = asyncio.run(get())
+        second = asyncio.run(get())
+        assert first is not second
+
+    def test_data_hub_collector_uses_injected_session(self):
+        pool = HTTPSessionPool()
+        token = OAuthToken(provider=OAuthProvider.GITHUB, access_token="t")
+
+        async def run(url):
+            session = await pool.session()
+            collectors = [BaseCollector(token, session=session) for _ in range(5)]
+            for collector in collectors:
+                assert await collector._get(url) == {"ok": True}
+            metrics = pool.metrics()
+            await pool.close()
+            return metrics
+
+        metrics = _with_server(run)
+        assert metrics["requests"] == 5
+        assert metrics["connections_created"] == 1
+
+    def test_metrics_endpoint(self):
+        pytest.importorskip("fastapi")
+        from fastapi.testclient import TestClient
+        from main import app
+
+        with TestClient(app) as client:
+            data = client.get("/metrics/http-pool").json()
+            assert "reuse_ratio" in data and "active_connections" in data
+            assert "http_pool" in client.get("/metrics").json()
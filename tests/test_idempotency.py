@@ -0,0 +1,173 @@
+"""
+AUTUS 웹훅 / AutoSync 중복 제거 테스트
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from core.idempotency import (
+    BloomFilter,
+    RotatingBloomFilter,
+    IdempotencyGuard,
+    MemoryIdempotencyBackend,
+    SQLiteIdempotencyBackend,
+    RedisIdempotencyBackend,
+    content_hash,
+    event_key,
+)
+
+
+class TestKeys:
+    """이벤트 키"""
+
+    def test_event_id_preferred(self):
+        assert event_key("stripe", "evt_1", {"a": 1}) == "stripe:evt_1"
+
+    def test_content_hash_ignores_order_and_whitespace(self):
+        assert content_hash({"a": 1, "b": [1, 2]}) == content_hash(b'{ "b": [1,2], "a": 1 }')
+        assert event_key("toss", None, {"a": 1}) != event_key("toss", None, {"a": 2})
+
+
+class TestBloom:
+    """블룸 필터"""
+
+    def test_no_false_negatives_and_low_fp(self):
+        bloom = BloomFilter(10000, 0.01)
+        for i in range(10000):
+            bloom.add(f"k{i}")
+        assert all(f"k{i}" in bloom for i in range(10000))
+        false_positives = sum(f"x{i}" in bloom for i in range(10000))
+        assert false_positives < 300
+
+    def test_rotation_keeps_previous_generation(self):
+        bloom = RotatingBloomFilter(capacity=2, window=3600)
+        bloom.add("a")
+        bloom.add("b")
+        bloom.add("c")  # 용량 초과 → 회전
+        assert bloom.rotations == 1
+        assert "a" in bloom and "c" in bloom
+        assert bloom.authoritative  # 아직 버린 세대 없음
+
+    def test_count_rotation_falls_back_to_backend(self):
+        backend = MemoryIdempotencyBackend()
+        guard = IdempotencyGuard("ns", backend, window=3600, bloom=RotatingBloomFilter(capacity=4, window=3600))
+        keys = [f"k{i}" for i in range(20)]  # 세대 여러 개를 채워 앞쪽 키가 블룸에서 빠짐
+        assert all(guard.claim(k) for k in keys)
+        guard.flush()
+        assert "ns:k0" not in guard.bloom and not guard.bloom.authoritative
+        assert not guard.claim("k0")  # 블룸 음성이지만 저장소가 중복 판정
+        assert guard.claim("fresh")
+        assert guard.stats()["bloom_unreliable"] >= 2
+
+
+def _backends(tmp_path):
+    fakeredis = pytest.importorskip("fakeredis")
+    return [
+        MemoryIdempotencyBackend(),
+        SQLiteIdempotencyBackend(str(tmp_path / "idem.db")),
+        SQLiteIdempotencyBackend(str(tmp_path / "shared.db"), shared=True),
+        RedisIdempotencyBackend(fakeredis.FakeRedis()),
+    ]
+
+
+class TestIdempotencyGuard:
+    """Guard: claim / release / 시간 창 / 메트릭"""
+
+    def test_duplicates_rejected_on_every_backend(self, tmp_path):
+        for backend in _backends(tmp_path):
+            guard = IdempotencyGuard("stripe", backend, window=60, bloom_capacity=1000)
+            assert guard.claim("evt_1")
+            assert not guard.claim("evt_1")
+            assert not guard.claim("stripe:evt_1")
+            assert guard.claim("evt_2")
+            stats = guard.stats()
+            assert stats["checks"] == 4 and stats["duplicates"] == 2
+            assert stats["hit_rate"] == 0.5
+            assert stats["bloom"] == (not backend.shared)
+
+    def test_release_allows_retry(self, tmp_path):
+        for backend in _backends(tmp_path):
+            guard = IdempotencyGuard("toss", backend, window=60, bloom_capacity=1000)
+            assert guard.claim("pay_1")
+            guard.flush()
+            guard.release("pay_1")
+            # 블룸은 양성이지만 저장소에 없음 → 오탐으로 통과
+            assert guard.claim("pay_1")
+
+    def test_window_expiry(self, tmp_path):
+        backend = SQLiteIdempotencyBackend(str(tmp_path / "idem.db"), shared=True)
+        guard = IdempotencyGuard("shopify", backend, window=0.05)
+        assert guard.claim("wh_1")
+        assert not guard.claim("wh_1")
+        time.sleep(0.1)
+        assert guard.claim("wh_1")
+        assert backend.purge() == 0
+
+    def test_bloom_path_batches_writes(self, tmp_path):
+        backend = SQLiteIdempotencyBackend(str(tmp_path / "idem.db"))
+        guard = IdempotencyGuard("stripe", backend, window=60, bloom_capacity=10000)
+        for i in range(100):
+            assert guard.claim(f"evt_{i}")
+        assert guard.stats()["bloom_negatives"] == 100
+        assert backend.live_keys() == []  # 아직 지연 쓰기 대기
+        assert not guard.claim("evt_5")   # _pending 에서 중복 판정
+        guard.flush()
+        assert len(backend.live_keys()) == 100
+
+    def test_survives_restart(self, tmp_path):
+        path = str(tmp_path / "idem.db")
+        guard = IdempotencyGuard("stripe", SQLiteIdempotencyBackend(path), window=60)
+        guard.claim("evt_1")
+        guard.flush()
+
+        # 재시작: 저장소의 살아있는 키로 블룸 워밍
+        restarted = IdempotencyGuard("stripe", SQLiteIdempotencyBackend(path), window=60)
+        assert not restarted.claim("evt_1")
+        assert restarted.claim("evt_2")
+
+    def test_backend_error_fails_open(self):
+        class Broken(MemoryIdempotencyBackend):
+            shared = True
+
+            def claim(self, key, ttl):
+                raise ConnectionError("down")
+
+        guard = IdempotencyGuard("stripe", Broken())
+        assert guard.claim("evt_1")
+        assert guard.stats()["errors"] == 1
+
+
+class TestTransformOnce:
+    """UniversalTransformer 중복 제거"""
+
+    def test_duplicate_returns_none(self):
+        from autosync.transformer import UniversalTransformer
+        guard = IdempotencyGuard("autosync", MemoryIdempotencyBackend(), window=60, bloom_capacity=1000)
+        transformer = UniversalTransformer(idempotency=guard)
+        data = {"customer": "cus_1", "amount": 1000, "created": 1}
+        assert transformer.transform_once(data, "stripe")["node_id"] == "cus_1"
+        assert transformer.transform_once(dict(data), "stripe") is None
+        assert transformer.transform_once(data, "stripe", event_id="evt_9") is not None
+        assert guard.stats()["duplicates"] == 1
+
+
+class TestAcceptWebhookDedup:
+    """acknowledge-fast 경로: 큐 적재 전 중복 차단"""
+
+    def test_duplicate_not_enqueued(self, tmp_path):
+        pytest.importorskip("fastapi")
+        from webhooks.ingest_queue import DurableWebhookQueue, accept_webhook
+        queue = DurableWebhookQueue(str(tmp_path / "q.db"))
+        guard = IdempotencyGuard("universal", MemoryIdempotencyBackend(), window=60, bloom_capacity=1000)
+        payload = b'{"id": "evt_1", "amount": 10}'
+        first = asyncio.run(accept_webhook(queue, payload, {}, lambda h, d: "stripe", guard, lambda s, h, d: d["id"]))
+        again = asyncio.run(accept_webhook(queue, payload, {}, lambda h, d: "stripe", guard, lambda s, h, d: d["id"]))
+        assert first.status_code == 202
+        assert again.status_code == 200
+        assert queue.depth() == 1
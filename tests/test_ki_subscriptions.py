@@ -0,0 +1,142 @@
+"""
+AUTUS K/I WebSocket 구독 (역인덱스) 테스트
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from tests.direct_import import load_module
+
+ki_subscriptions = load_module("websocket", "ki_subscriptions")
+KISubscriptionIndex = ki_subscriptions.KISubscriptionIndex
+filter_snapshot = ki_subscriptions.filter_snapshot
+
+PHASES = ["정상", "임계점 접근", "위험 상태"]
+
+
+def _random_index(rng, clients=200, nodes=100):
+    index = KISubscriptionIndex()
+    for c in range(clients):
+        index.add_client(c)
+        kind = c % 4
+        if kind == 0:
+            continue  # 전체 수신
+        if kind == 1:
+            index.subscribe(c, nodes=[f"n{rng.randrange(nodes)}" for _ in range(5)])
+        elif kind == 2:
+            index.subscribe(c, pairs=[[f"n{rng.randrange(nodes)}", "*"], [f"n{rng.randrange(nodes)}", f"n{rng.randrange(nodes)}"]],
+                            phases=[rng.choice(PHASES)])
+        else:
+            index.subscribe(c, phases=[rng.choice(PHASES)])
+    return index
+
+
+class TestSubscriptionIndex:
+    """역인덱스 매칭 = 구독별 전수 검사"""
+
+    def test_matches_brute_force(self):
+        rng = random.Random(3)
+        index = _random_index(rng)
+        for _ in range(300):
+            a, b = f"n{rng.randrange(100)}", f"n{rng.randrange(100)}"
+            phase = rng.choice(PHASES)
+            subs = index.subscriptions
+            assert index.match_k(a, phase) == {c for c, s in subs.items() if s.wants_k(a, phase)}
+            assert index.match_i(a, b, phase) == {c for c, s in subs.items() if s.wants_i(a, b, phase)}
+
+    def test_node_set_covers_internal_pairs_only(self):
+        index = KISubscriptionIndex()
+        index.add_client("team")
+        index.subscribe("team", nodes=["A", "B"])
+        assert index.match_k("A") == {"team"}
+        assert index.match_i("B", "A") == {"team"}
+        assert index.match_i("A", "X") == set()
+
+    def test_unsubscribe_and_clear(self):
+        index = KISubscriptionIndex()
+        index.add_client("c")
+        index.subscribe("c", nodes=["A"], pairs=["A-*"])
+        index.unsubscribe("c", nodes=["A"], pairs=[["A", "*"]])
+        assert index.match_k("A") == set() and index.match_i("A", "B") == set()
+        assert "c" not in index.unfiltered
+        index.clear("c")
+        assert "c" in index.unfiltered and not index.filtered
+        index.remove_client("c")
+        assert index.stats()["unfiltered_clients"] == 0
+
+
+class TestFilteredSnapshot:
+    """구독 범위 스냅샷"""
+
+    def test_snapshot_subset(self):
+        nodes = {n: {"id": n, "phase": "정상"} for n in ("A", "B", "C")}
+        interactions = {
+            "A-B": {"node_a": "A", "node_b": "B", "phase": "정상"},
+            "A-C": {"node_a": "A", "node_b": "C", "phase": "정상"},
+        }
+        pairs_by_node = {"A": {"A-B", "A-C"}, "B": {"A-B"}, "C": {"A-C"}}
+        anomalies = [{"target": "C"}, {"target": ["A", "B"]}, {"target": "A"}]
+
+        index = KISubscriptionIndex()
+        index.subscribe("c", nodes=["A", "B"])
+        snap = filter_snapshot(index.subscription("c"), nodes, interactions, pairs_by_node, anomalies)
+        assert sorted(n["id"] for n in snap["nodes"]) == ["A", "B"]
+        assert snap["interactions"] == [interactions["A-B"]]
+        assert snap["anomalies"] == [{"target": ["A", "B"]}, {"target": "A"}]
+
+        full = filter_snapshot(None, nodes, interactions, pairs_by_node, anomalies)
+        assert len(full["nodes"]) == 3 and "subscription" not in full
+
+
+class TestFilteredDelivery:
+    """K/I 서버: 구독 클라이언트는 일치 항목만 수신"""
+
+    def test_batches_are_filtered_per_subscription(self):
+        pytest.importorskip("fastapi")
+        ki_server = load_module("websocket", "ki_server")
+        from core.fanout import FanoutHub
+        from core.pubsub import InProcessPubSubBus
+
+        class _WS:
+            def __init__(self):
+                self.frames = []
+
+            async def accept(self):
+                pass
+
+            async def send_text(self, data):
+                self.frames.append(json.loads(data))
+
+        async def scenario():
+            manager = ki_server.KIConnectionManager(FanoutHub(), InProcessPubSubBus())
+            publisher = ki_server.KIUpdatePublisher(manager, tick_ms=10)
+            everyone, team, team2, pairs = _WS(), _WS(), _WS(), _WS()
+            for ws in (everyone, team, team2, pairs):
+                await manager.connect(ws)
+            manager.subscriptions.subscribe(team, nodes=["n1", "n2"])
+            manager.subscriptions.subscribe(team2, nodes=["n2", "n1"])
+            manager.subscriptions.subscribe(pairs, pairs=[["n3", "*"]])
+            for n in range(10):
+                await publisher.publish_k(f"n{n}", {"node_id": f"n{n}", "k_before": 0, "k_after": 0.1, "delta_k": 0.1})
+            await publisher.publish_i("n1-n2", {"node_a": "n1", "node_b": "n2", "i_before": 0, "i_after": 0.2, "delta_i": 0.2})
+            await publisher.publish_i("n3-n9", {"node_a": "n3", "node_b": "n9", "i_before": 0, "i_after": 0.2, "delta_i": 0.2})
+            publisher.flush()
+            await manager.hub.flush()
+            return everyone, team, team2, pairs, manager
+
+        everyone, team, team2, pairs, manager = asyncio.run(scenario())
+        assert len(everyone.frames[0]["data"]["k"]) == 10
+        assert [u["node_id"] for u in team.frames[0]["data"]["k"]] == ["n1", "n2"]
+        assert [u["node_a"] for u in team.frames[0]["data"]["i"]] == ["n1"]
+        assert team2.frames == team.frames
+        assert pairs.frames[0]["data"]["k"] == []
+        assert [u["node_b"] for u in pairs.frames[0]["data"]["i"]] == ["n9"]
+        # 같은 부분집합은 직렬화 1회: 전체 1 + team 1 + pairs 1
+        assert manager.hub.published == 3
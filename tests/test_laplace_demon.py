@@ -0,0 +1,67 @@
+"""
+AUTUS 라플라스 악마 테스트 (Relations 테이블 / 벌크 소환)
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from tests.direct_import import load_module
+
+laplace_demon = load_module("physics", "laplace_demon")
+
+RELATIONS_TABLE = laplace_demon.RELATIONS_TABLE
+Network1_12_144 = laplace_demon.Network1_12_144
+network_relations = laplace_demon.network_relations
+summon_demon = laplace_demon.summon_demon
+summon_many = laplace_demon.summon_many
+
+
+class TestRelationsTable:
+    """그래프 없이 결정론적 Relations"""
+
+    def test_matches_networkx_on_built_graph(self):
+        nx = pytest.importorskip("networkx")
+        for core in range(13):
+            for extended in range(0, 145, 7):
+                network = Network1_12_144(core_12=core, extended_144=extended)
+                connectivity = nx.average_degree_connectivity(network.build_graph())
+                expected = connectivity[1] / 144 if 1 in connectivity else min(1.0, extended / 156 * 0.5)
+                assert network.calculate_relations() == pytest.approx(expected), (core, extended)
+
+    def test_shape_and_clamping(self):
+        assert len(RELATIONS_TABLE) == 13 and all(len(row) == 145 for row in RELATIONS_TABLE)
+        assert network_relations(20, 500) == RELATIONS_TABLE[12][144]
+        assert network_relations(-1, -1) == RELATIONS_TABLE[0][0]
+        assert Network1_12_144(core_12=5, extended_144=20).calculate_relations() == network_relations(5, 20)
+
+
+class TestSummonMany:
+    """벌크 소환 == 사용자별 summon_demon"""
+
+    def test_matches_summon_demon(self):
+        profiles = [
+            {"user_type": "ambitious", "age": 25, "core_12": 3, "extended_144": 40,
+             "decisions": [{"M": 100, "T": 40, "t": 12, "label": "A"}, {"motions": 150, "threats": 60, "t": 6}]},
+            {"user_type": "unknown", "location_factor": 1.2, "growth_rate": 0.1, "uncertainty": 0.05},
+            {"user_type": "collaborative", "core_12": 12, "extended_144": 144,
+             "decisions": [{"M": 40, "T": 40, "t": 3}]},
+        ]
+        results = summon_many(profiles)
+        assert [len(r) for r in results] == [2, 1, 1]
+        for profile, predictions in zip(profiles, results):
+            single = summon_demon(**profile)["predictions"]
+            assert predictions == single
+        assert results[2][0]["uncertainty"] == "N/A"  # V == 0
+
+    def test_thousands_of_users(self):
+        profiles = [
+            {"core_12": n % 13, "extended_144": n % 145, "decisions": [{"M": 100 + n, "T": 40, "t": 12}]}
+            for n in range(5000)
+        ]
+        results = summon_many(profiles)
+        assert len(results) == 5000
+        assert results[1234][0]["V"] == summon_demon(**profiles[1234])["predictions"][0]["V"]
@@ -0,0 +1,98 @@
+"""
+AUTUS 배치 로그 선형 학습 테스트
+"""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from tests.direct_import import load_module
+
+np = pytest.importorskip("numpy")
+v_predictor = load_module("physics", "v_predictor")
+
+LogLinearPredictor = v_predictor.LogLinearPredictor
+LogLinearStats = v_predictor.LogLinearStats
+VHistory = v_predictor.VHistory
+VTimePoint = v_predictor.VTimePoint
+fit_loglinear_batch = v_predictor.fit_loglinear_batch
+
+
+def _histories(seed=0, users=50):
+    rng = np.random.default_rng(seed)
+    return [
+        list(100 * np.exp(0.05 * np.arange(n)) * rng.lognormal(0, 0.1, n))
+        for n in rng.integers(1, 30, users)
+    ]
+
+
+def _scalar_fit(values):
+    history = VHistory()
+    for v in values:
+        history.add(VTimePoint(timestamp=datetime.now(), V=v))
+    predictor = LogLinearPredictor()
+    predictor.fit(history)
+    return predictor
+
+
+class TestBatchFit:
+    """배치 결과 == 사용자별 LogLinearPredictor.fit"""
+
+    def test_padded_and_csr_match_scalar(self):
+        histories = _histories()
+        width = max(len(h) for h in histories)
+        padded = np.array([h + [0.0] * (width - len(h)) for h in histories])
+        lengths = [len(h) for h in histories]
+        indptr = np.cumsum([0] + lengths)
+
+        by_padding = fit_loglinear_batch(padded, lengths=lengths)
+        by_csr = fit_loglinear_batch(np.concatenate(histories), indptr=indptr)
+
+        for key in ("a", "b", "r_squared"):
+            np.testing.assert_allclose(by_padding[key], by_csr[key], atol=1e-9)
+        for i, h in enumerate(histories):
+            assert by_padding["valid"][i] == (len(h) >= 3)
+            if len(h) < 3:
+                continue
+            scalar = _scalar_fit(h)
+            assert by_padding["a"][i] == pytest.approx(scalar.a)
+            assert by_padding["b"][i] == pytest.approx(scalar.b)
+            assert by_padding["r_squared"][i] == pytest.approx(scalar.r_squared, abs=1e-9)
+
+    def test_constant_history_has_zero_r_squared(self):
+        table = fit_loglinear_batch([[5.0, 5.0, 5.0, 5.0]])
+        assert table["b"][0] == pytest.approx(0.0)
+        assert table["r_squared"][0] == 0.0
+
+
+class TestIncremental:
+    """새 포인트만 누적해도 전체 재학습과 같은 결과"""
+
+    def test_append_equals_refit(self, tmp_path):
+        histories = _histories(seed=1, users=20)
+        split = [len(h) // 2 for h in histories]
+        stats = LogLinearStats.from_csr(
+            np.concatenate([h[:k] for h, k in zip(histories, split)]),
+            np.cumsum([0] + split),
+        )
+        path = str(tmp_path / "stats.npz")
+        stats.save(path)
+        stats = LogLinearStats.load(path)
+
+        # 사용자가 섞인 순서로 도착 (사용자별 순서는 유지)
+        arrivals = [(j, u, v) for u, (h, k) in enumerate(zip(histories, split)) for j, v in enumerate(h[k:])]
+        arrivals.sort(key=lambda item: item[0])
+        for chunk in (arrivals[:len(arrivals) // 3], arrivals[len(arrivals) // 3:]):
+            stats.append([u for _, u, _ in chunk], [v for _, _, v in chunk])
+        stats.append([len(histories)], [10.0])  # 새 사용자
+
+        full = LogLinearStats.from_csr(np.concatenate(histories), np.cumsum([0] + [len(h) for h in histories]))
+        incremental, refit = stats.solve(), full.solve()
+        assert len(stats) == len(histories) + 1
+        np.testing.assert_allclose(incremental["b"][:-1], refit["b"], atol=1e-9)
+        np.testing.assert_allclose(incremental["r_squared"][:-1], refit["r_squared"], atol=1e-9)
+        assert incremental["n"][-1] == 1 and not incremental["valid"][-1]
@@ -0,0 +1,146 @@
+"""
+AUTUS 마이크로 배칭 테스트
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from core.microbatch import MicroBatcher, run_batching_benchmark
+from tests.direct_import import load_module
+
+
+def _slow_batch_fn(calls):
+    """호출당 고정 오버헤드 2ms + 항목당 0.05ms (forward 1회 흉내)"""
+    def fn(items):
+        calls.append((len(items), threading.current_thread().name))
+        time.sleep(0.002 + 0.00005 * len(items))
+        return [x * 2 for x in items]
+    return fn
+
+
+class TestMicroBatcher:
+    """동시 요청 → 배치 1회, 결과는 요청별로"""
+
+    def test_concurrent_requests_share_a_batch(self):
+        calls = []
+
+        async def scenario():
+            batcher = MicroBatcher(_slow_batch_fn(calls), max_batch=8, max_wait_ms=20, name="infer")
+            results = await asyncio.gather(*(batcher.submit(n) for n in range(20)))
+            stats = batcher.stats()
+            batcher.close()
+            return results, stats
+
+        results, stats = asyncio.run(scenario())
+        assert results == [n * 2 for n in range(20)]
+        assert [size for size, _ in calls] == [8, 8, 4]
+        assert all(name.startswith("infer") for _, name in calls)
+        assert stats["batches"] == 3 and stats["max_batch_seen"] == 8
+
+    def test_single_request_waits_at_most_max_wait(self):
+        async def scenario():
+            batcher = MicroBatcher(lambda items: items, max_batch=64, max_wait_ms=10)
+            start = time.perf_counter()
+            result = await batcher.submit("x")
+            elapsed = time.perf_counter() - start
+            batcher.close()
+            return result, elapsed
+
+        result, elapsed = asyncio.run(scenario())
+        assert result == "x"
+        assert 0.009 <= elapsed < 0.5
+
+    def test_errors_propagate_to_every_request_in_batch(self):
+        def broken(items):
+            raise ValueError("bad input")
+
+        async def scenario():
+            batcher = MicroBatcher(broken, max_batch=4, max_wait_ms=1)
+            results = await asyncio.gather(*(batcher.submit(n) for n in range(4)), return_exceptions=True)
+            ok = MicroBatcher(lambda items: items[:-1], max_batch=2, max_wait_ms=1)
+            mismatch = await asyncio.gather(ok.submit(1), ok.submit(2), return_exceptions=True)
+            batcher.close()
+            ok.close()
+            return results, mismatch
+
+        results, mismatch = asyncio.run(scenario())
+        assert all(isinstance(r, ValueError) for r in results)
+        assert all(isinstance(r, ValueError) for r in mismatch)
+
+    def test_batches_grow_while_worker_is_busy(self):
+        calls = []
+
+        async def scenario():
+            batcher = MicroBatcher(_slow_batch_fn(calls), max_batch=256, max_wait_ms=0)
+            await asyncio.gather(*(batcher.submit(n) for n in range(64)))
+            batcher.close()
+
+        asyncio.run(scenario())
+        assert sum(size for size, _ in calls) == 64
+        assert max(size for size, _ in calls) > 1
+
+
+class TestBenchmark:
+    """per-call 오버헤드가 있으면 동시성이 높을수록 배치가 유리"""
+
+    def test_batched_throughput_beats_single_at_high_concurrency(self):
+        report = asyncio.run(run_batching_benchmark(
+            _slow_batch_fn([]), lambda n: n, concurrency_levels=(1, 64), requests=128, max_wait_ms=2,
+        ))
+        low, high = report
+        assert low["batched"]["avg_batch"] == 1
+        assert high["batched"]["avg_batch"] > 4
+        assert high["speedup"] > 2
+
+
+class TestTransformerPredictor:
+    """배치 결과 == 단건 결과"""
+
+    def test_predict_batch_matches_predict(self):
+        torch = pytest.importorskip("torch")
+        VTransformerPredictor = load_module("physics", "transformer_predictor").VTransformerPredictor
+
+        torch.manual_seed(0)
+        predictor = VTransformerPredictor(model_type="patchtst")
+        predictor.trained = True
+        sequences = [[[float(i + t), float(t), 0.1, 0.5] for t in range(24)] for i in range(5)]
+        batched = predictor.predict_batch(sequences)
+        for seq, result in zip(sequences, batched):
+            single = predictor.predict(seq)
+            assert single["V_trajectory"] == pytest.approx(result["V_trajectory"], abs=0.02)
+
+        async def scenario():
+            results = await asyncio.gather(*(predictor.predict_async(seq) for seq in sequences))
+            predictor.batcher.close()
+            return results
+
+        assert [r["V_trajectory"] for r in asyncio.run(scenario())] == [r["V_trajectory"] for r in batched]
+
+    def test_bad_item_does_not_fail_batch(self):
+        torch = pytest.importorskip("torch")
+        VTransformerPredictor = load_module("physics", "transformer_predictor").VTransformerPredictor
+
+        torch.manual_seed(0)
+        predictor = VTransformerPredictor(model_type="patchtst")
+        predictor.trained = True
+        good = [[float(t), 1.0, 0.1, 0.5] for t in range(24)]
+        ragged = [row[:] for row in good]
+        ragged[5] = [1.0, 2.0]
+        batch = [good, ragged, good[:10], [], good]
+        results = predictor.predict_batch(batch)
+        assert "V_trajectory" in results[0] and results[0] == results[4]
+        assert all("error" in r for r in results[1:4])
+
+        async def scenario():
+            results = await asyncio.gather(*(predictor.predict_async(seq) for seq in batch))
+            predictor.batcher.close()
+            return results
+
+        assert [("error" in r) for r in asyncio.run(scenario())] == [False, True, True, True, False]
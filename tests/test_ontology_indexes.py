@@ -0,0 +1,148 @@
+"""
+AUTUS SMB 온톨로지 보조 인덱스 / 증분 집계 테스트
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from ontology.smb_ontology import Industry, ObjectType, OntologyEngine
+
+
+def _scan(engine, object_type, filters):
+    return [
+        o for o in engine.objects.values()
+        if o.object_type == object_type
+        and all(o.properties.get(k) == v for k, v in filters.items())
+    ]
+
+
+def _students(engine, n=250, seed=7):
+    rng = random.Random(seed)
+    for i in range(n):
+        engine.create_object(ObjectType.STUDENT, {
+            "name": f"s{i}",
+            "status": rng.choice(["active", "paused", "left"]),
+            "payment_status": rng.choice(["paid", "unpaid"]),
+            "monthly_fee": rng.randint(1, 50) * 10000,
+            "attendance_rate": rng.randint(50, 100),
+        })
+    return rng
+
+
+class TestSecondaryIndexes:
+    """인덱스 조회 = 전체 스캔 결과"""
+
+    def test_query_matches_scan(self):
+        engine = OntologyEngine()
+        rng = _students(engine)
+        ids = list(engine.objects)
+        for obj_id in rng.sample(ids, 60):
+            engine.update_object(obj_id, {"status": rng.choice(["active", "left"])})
+        for obj_id in rng.sample(ids, 30):
+            engine.delete_object(obj_id)
+
+        for filters in (
+            {"status": "active"},
+            {"status": "left", "payment_status": "paid"},
+            {"payment_status": "unpaid", "name": "s3"},
+            {"monthly_fee": 100000},
+        ):
+            got = engine.query(ObjectType.STUDENT, filters, limit=None)
+            assert got == _scan(engine, ObjectType.STUDENT, filters)
+        # 기본 limit 유지
+        assert len(engine.query(ObjectType.STUDENT)) == 100
+
+    def test_range_query(self):
+        engine = OntologyEngine()
+        for q in [5, 1, 9, 3, 7]:
+            engine.create_object(ObjectType.INVENTORY, {"item_name": f"i{q}", "quantity": q})
+        values = [o.properties["quantity"] for o in engine.range_query(ObjectType.INVENTORY, "quantity", 3, 7)]
+        assert values == [3, 5, 7]
+        low = engine.range_query(ObjectType.INVENTORY, "quantity", hi=3)
+        assert [o.properties["quantity"] for o in low] == [1, 3]
+        # 인덱스 없는 속성은 스캔으로 동일 의미
+        engine.create_index(ObjectType.INVENTORY, "item_name", "sorted")
+        names = engine.range_query(ObjectType.INVENTORY, "item_name", "i3", "i7")
+        assert [o.properties["item_name"] for o in names] == ["i3", "i5", "i7"]
+
+
+class TestIncrementalAggregates:
+    """create / update / delete 후 집계 = 재계산"""
+
+    def _brute(self, engine, group_by, field, func):
+        groups = {}
+        for o in _scan(engine, ObjectType.ORDER, {}):
+            groups.setdefault(o.properties.get(group_by, "unknown"), []).append(float(o.properties[field]))
+        fn = {"sum": sum, "count": len, "max": max, "min": min, "avg": lambda v: sum(v) / len(v)}[func]
+        return {k: fn(v) for k, v in groups.items()}
+
+    def test_aggregate_tracks_mutations(self):
+        engine = OntologyEngine()
+        rng = random.Random(1)
+        for i in range(300):  # limit=100 을 넘는 규모
+            engine.create_object(ObjectType.ORDER, {
+                "order_time": i, "total": rng.randint(1, 100) * 1000,
+                "payment_method": rng.choice(["card", "cash"]),
+            })
+        ids = list(engine.objects)
+        for obj_id in rng.sample(ids, 50):
+            engine.update_object(obj_id, {"total": rng.randint(1, 100) * 1000})
+        for obj_id in rng.sample(ids, 50):
+            engine.update_object(obj_id, {"payment_method": rng.choice(["card", "cash", "point"])})
+
+        # 최대/최소값 보유 객체 삭제
+        card = _scan(engine, ObjectType.ORDER, {"payment_method": "card"})
+        engine.delete_object(max(card, key=lambda o: o.properties["total"]).id)
+        engine.delete_object(min(card, key=lambda o: o.properties["total"]).id)
+
+        for func in ("sum", "count", "avg", "max", "min"):
+            assert engine.aggregate(ObjectType.ORDER, "payment_method", "total", func) == \
+                self._brute(engine, "payment_method", "total", func)
+
+    def test_lazy_aggregate_is_materialized(self):
+        engine = OntologyEngine()
+        engine.create_object(ObjectType.ORDER, {"order_time": 1, "total": 10, "status": "open"})
+        assert engine.aggregate(ObjectType.ORDER, "status", "total") == {"open": 10.0}
+        engine.create_object(ObjectType.ORDER, {"order_time": 2, "total": 5, "status": "open"})
+        assert engine.aggregate(ObjectType.ORDER, "status", "total") == {"open": 15.0}
+
+
+class TestKPIs:
+    """KPI 는 집계에서 O(그룹 수)로, 결과는 원래 정의와 동일"""
+
+    def test_education_kpis(self):
+        engine = OntologyEngine()
+        _students(engine)
+        engine.create_object(ObjectType.COURSE, {"name": "math"})
+        active = _scan(engine, ObjectType.STUDENT, {"status": "active"})
+        kpis = engine.calculate_kpis(Industry.EDUCATION)
+        assert kpis["total_students"] == 250
+        assert kpis["active_students"] == len(active)
+        assert kpis["monthly_revenue"] == sum(
+            s.properties["monthly_fee"] for s in active if s.properties["payment_status"] == "paid"
+        )
+        assert kpis["avg_attendance"] == round(
+            sum(s.properties["attendance_rate"] for s in active) / len(active), 1
+        )
+        assert kpis["course_count"] == 1
+
+    def test_restaurant_and_sauna_kpis(self):
+        engine = OntologyEngine()
+        for i in range(120):
+            engine.create_object(ObjectType.ORDER, {"order_time": i, "total": 1000 + i})
+        engine.create_object(ObjectType.TABLE, {"table_number": 1, "daily_turnover": 3})
+        engine.create_object(ObjectType.TABLE, {"table_number": 2})
+        kpis = engine.calculate_kpis(Industry.RESTAURANT)
+        assert kpis["order_count"] == 120
+        assert kpis["total_sales"] == sum(1000 + i for i in range(120))
+        assert kpis["avg_turnover"] == 1.5
+
+        engine.create_object(ObjectType.BOOKING, {"date": "d", "total": 30000, "guest_count": 2})
+        engine.create_object(ObjectType.UTILITY, {"type": "gas", "amount": 500})
+        engine.create_object(ObjectType.UTILITY, {"type": "water", "amount": 700})
+        sauna = engine.calculate_kpis(Industry.SAUNA)
+        assert sauna["total_revenue"] == 30000 and sauna["total_guests"] == 2
+        assert sauna["utility_cost"] == 1200
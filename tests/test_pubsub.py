@@ -0,0 +1,166 @@
+"""
+AUTUS 워커 간 Pub/Sub 버스 테스트
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from core.pubsub import Envelope, InProcessPubSubBus, RedisPubSubBus
+
+
+async def _wait_for(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("timed out")
+        await asyncio.sleep(0.01)
+
+
+class TestInProcessBus:
+    """단일 워커: publish 가 곧바로 핸들러 호출"""
+
+    def test_sequence_per_topic(self):
+        async def scenario():
+            bus = InProcessPubSubBus()
+            got = []
+            bus.subscribe("a", lambda env: got.append((env.topic, env.seq, env.payload)))
+
+            async def on_b(env):
+                got.append((env.topic, env.seq, env.payload))
+
+            bus.subscribe("b", on_b)
+            assert await bus.publish("a", 1) == 1
+            assert await bus.publish("a", 2) == 2
+            assert await bus.publish("b", 3) == 1
+            return got, bus.stats()
+
+        got, stats = asyncio.run(scenario())
+        assert got == [("a", 1, 1), ("a", 2, 2), ("b", 1, 3)]
+        assert stats["published"] == 3 and stats["gaps"] == 0
+
+    def test_publish_nowait_delivers_sync_handlers_immediately(self):
+        async def scenario():
+            bus = InProcessPubSubBus()
+            got = []
+            unsubscribe = bus.subscribe("t", lambda env: got.append(env.seq))
+            bus.publish_nowait("t", {})
+            delivered = list(got)
+            unsubscribe()
+            await bus.publish("t", {})
+            return delivered, got
+
+        assert asyncio.run(scenario()) == ([1], [1])
+
+    def test_gap_detection_and_handler_errors(self):
+        async def scenario():
+            bus = InProcessPubSubBus()
+
+            def broken(env):
+                raise RuntimeError("boom")
+
+            bus.subscribe("t", broken)
+            await bus._dispatch(Envelope("t", 1, "w", None))
+            await bus._dispatch(Envelope("t", 4, "w", None))
+            return bus.stats()
+
+        stats = asyncio.run(scenario())
+        assert stats["gaps"] == 2 and stats["errors"] == 2
+        assert stats["last_seq"] == {"t": 4}
+
+
+class TestRedisBus:
+    """두 워커가 같은 Redis 를 공유"""
+
+    def test_each_worker_delivers_every_message_in_order(self):
+        fakeredis = pytest.importorskip("fakeredis")
+
+        async def scenario():
+            server = fakeredis.FakeServer()
+            workers = [
+                RedisPubSubBus(fakeredis.aioredis.FakeRedis(server=server), worker_id=f"w{i}")
+                for i in range(2)
+            ]
+            received = {bus.worker_id: [] for bus in workers}
+            for bus in workers:
+                bus.subscribe("ws.ki", lambda env, w=bus.worker_id: received[w].append((env.seq, env.origin, env.payload)))
+                await bus.start()
+            for n in range(3):
+                await workers[0].publish("ws.ki", {"n": n})
+                await workers[1].publish("ws.ki", {"n": n + 3})
+            await _wait_for(lambda: all(len(r) == 6 for r in received.values()))
+            stats = [bus.stats() for bus in workers]
+            for bus in workers:
+                await bus.close()
+            return received, stats
+
+        received, stats = asyncio.run(scenario())
+        assert received["w0"] == received["w1"]
+        assert [seq for seq, _, _ in received["w0"]] == [1, 2, 3, 4, 5, 6]
+        assert [origin for _, origin, _ in received["w0"]] == ["w0", "w1"] * 3
+        assert all(s["gaps"] == 0 for s in stats)
+
+    def test_subscribe_only_worker_receives(self):
+        fakeredis = pytest.importorskip("fakeredis")
+
+        async def scenario():
+            server = fakeredis.FakeServer()
+            publisher = RedisPubSubBus(fakeredis.aioredis.FakeRedis(server=server), worker_id="w0")
+            listener = RedisPubSubBus(fakeredis.aioredis.FakeRedis(server=server), worker_id="w1")
+            got = []
+            listener.subscribe("ws.ki", lambda env: got.append((env.origin, env.payload)))  # start() 호출 없음
+            await _wait_for(lambda: listener.stats()["listening"])
+            await publisher.publish("ws.ki", {"n": 1})
+            await _wait_for(lambda: got)
+            for bus in (publisher, listener):
+                await bus.close()
+            return got
+
+        assert asyncio.run(scenario()) == [("w0", {"n": 1})]
+
+    def test_redis_failure_delivers_locally(self):
+        class _Down:
+            def pubsub(self):
+                raise ConnectionError("down")
+
+        async def scenario():
+            bus = RedisPubSubBus(_Down(), worker_id="w0")
+            got = []
+            bus.subscribe("t", lambda env: got.append(env.payload))
+            await bus.publish("t", {"x": 1})
+            return got, bus.stats()
+
+        got, stats = asyncio.run(scenario())
+        assert got == [{"x": 1}]
+        assert stats["fallbacks"] == 1
+
+
+class TestStreamManagerOverBus:
+    """SSE 스트림: 다른 워커에서 발생한 이벤트도 구독자 큐에 도착"""
+
+    def test_events_cross_workers(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("fastapi")
+        from routers.stream_router import LogLevel, StreamManager
+
+        async def scenario():
+            server = fakeredis.FakeServer()
+            managers = [
+                StreamManager(bus=RedisPubSubBus(fakeredis.aioredis.FakeRedis(server=server), worker_id=f"w{i}"))
+                for i in range(2)
+            ]
+            for m in managers:
+                await m.bus.start()
+            queue = await managers[1].subscribe()
+            await managers[0].emit_log(LogLevel.INFO, "hello")
+            event = await asyncio.wait_for(queue.get(), 2.0)
+            for m in managers:
+                await m.bus.close()
+            return event
+
+        event = asyncio.run(scenario())
+        assert event.message == "hello" and event.seq == 1
@@ -0,0 +1,131 @@
+"""
+AUTUS 콜드 스타트 / 지연 라우터 테스트
+"""
+
+import os
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+BACKEND = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(BACKEND))
+
+fastapi = pytest.importorskip("fastapi")
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from routers.registry import LazyRouterRegistry, LazyRouterMiddleware
+
+# main 콜드 임포트 예산 (ms)
+IMPORT_BUDGET_MS = float(os.environ.get("AUTUS_IMPORT_BUDGET_MS", "1500"))
+
+
+def _fake_module(name: str, path: str, body: str):
+    module = types.ModuleType(name)
+    module.router = APIRouter()
+
+    @module.router.get(path)
+    def endpoint():
+        return {"from": body}
+
+    sys.modules[name] = module
+    return module
+
+
+@pytest.fixture
+def lazy_app():
+    _fake_module("_lazy_a", "/shared", "a")
+    _fake_module("_lazy_b", "/b/x", "b")
+    _fake_module("_lazy_c", "/shared", "c")
+
+    app = FastAPI()
+    registry = LazyRouterRegistry()
+    registry.declare("a", "_lazy_a", ["/shared"])
+    registry.declare("b", "_lazy_b", ["/b"])
+    registry.declare("missing", "_lazy_does_not_exist", ["/missing"])
+    registry.declare("c", "_lazy_c", ["/shared"])
+    registry.attach(app)
+
+    @app.get("/shared")
+    def own():
+        return {"from": "app"}
+
+    app.add_middleware(LazyRouterMiddleware, registry=registry)
+    yield app, registry
+    for name in ("_lazy_a", "_lazy_b", "_lazy_c"):
+        sys.modules.pop(name, None)
+
+
+class TestLazyRouterRegistry:
+    """지연 라우터 레지스트리"""
+
+    def test_loads_only_on_matching_request(self, lazy_app):
+        app, registry = lazy_app
+        client = TestClient(app)
+        assert client.get("/b/x").json() == {"from": "b"}
+        loaded = [e.name for e in registry.entries if e.loaded]
+        assert loaded == ["b"]
+
+    def test_declaration_order_precedes_app_routes(self, lazy_app):
+        app, registry = lazy_app
+        client = TestClient(app)
+        # 즉시 로드와 동일하게 선언된 라우터가 앱 자체 라우트보다 먼저 매칭
+        assert client.get("/shared").json() == {"from": "a"}
+
+    def test_late_load_is_inserted_before_later_declarations(self, lazy_app):
+        app, registry = lazy_app
+        later = next(e for e in registry.entries if e.name == "c")
+        assert registry.load(later)
+        client = TestClient(app)
+        # c 가 먼저 로드됐어도 a 는 선언 순서대로 c 앞에 삽입
+        assert client.get("/shared").json() == {"from": "a"}
+        assert [e.name for e in registry.entries if e.loaded] == ["a", "c"]
+
+    def test_failed_import_is_recorded(self, lazy_app):
+        app, registry = lazy_app
+        client = TestClient(app)
+        assert client.get("/missing").status_code == 404
+        entry = registry.entries[2]
+        assert entry.failed and not entry.pending
+
+    def test_openapi_loads_everything(self, lazy_app):
+        app, registry = lazy_app
+        client = TestClient(app)
+        paths = client.get("/openapi.json").json()["paths"]
+        assert "/b/x" in paths
+        assert registry.pending == []
+
+    def test_warm_up(self, lazy_app):
+        import asyncio
+        app, registry = lazy_app
+        asyncio.run(registry.warm_up())
+        assert registry.profile()["loaded"] == 3
+
+
+class TestColdStart:
+    """main 콜드 임포트 예산"""
+
+    def test_cold_import_within_budget(self):
+        code = (
+            "import time; t = time.perf_counter(); import main; "
+            "print((time.perf_counter() - t) * 1000)"
+        )
+        env = dict(os.environ, AUTUS_LAZY_ROUTERS="true")
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=BACKEND, env=env, capture_output=True, text=True, timeout=120,
+        )
+        assert result.returncode == 0, result.stderr[-2000:]
+        elapsed_ms = float(result.stdout.strip().splitlines()[-1])
+        assert elapsed_ms < IMPORT_BUDGET_MS, f"cold import {elapsed_ms:.0f}ms > {IMPORT_BUDGET_MS:.0f}ms"
+
+    def test_startup_profile_endpoint(self):
+        from main import app
+        client = TestClient(app)
+        data = client.get("/startup/profile").json()
+        assert data["declared"] > 0
+        assert "main_import_ms" in data
+        assert all("import_ms" in m for m in data["modules"])
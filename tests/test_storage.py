@@ -0,0 +1,155 @@
+"""
+AUTUS Storage 테스트
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from core.storage import (
+    UserState,
+    MemoryUserStorage,
+    SQLiteUserStorage,
+    PostgresUserStorage,
+    NODE_IDS,
+    pack_nodes,
+    unpack_nodes,
+)
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "")
+
+
+def make_states(n: int, prefix: str = "user"):
+    nodes = {f"n{i:02d}": float(i) for i in range(1, 37)}
+    return [UserState(user_id=f"{prefix}_{i}", nodes=dict(nodes)) for i in range(n)]
+
+
+class TestPackedFormat:
+    """바이너리 packed 코덱"""
+
+    def test_roundtrip_float64(self):
+        state = make_states(1)[0]
+        restored = UserState.from_packed(state.user_id, state.to_packed())
+        assert restored == state
+
+    def test_float32_is_smaller(self):
+        state = make_states(1)[0]
+        assert len(state.to_packed("f")) < len(state.to_packed("d")) < len(state.to_json())
+
+    def test_missing_nodes_are_omitted(self):
+        nodes, rest = unpack_nodes(pack_nodes({"n01": 1.0, "n36": 2.0}))
+        assert nodes == {"n01": 1.0, "n36": 2.0}
+        assert rest == b""
+
+    def test_unknown_node_rejected(self):
+        with pytest.raises(ValueError):
+            pack_nodes({"custom": 1.0})
+
+    def test_canonical_order(self):
+        assert len(NODE_IDS) == 36
+        assert NODE_IDS[0] == "n01" and NODE_IDS[-1] == "n36"
+
+
+class TestUserStorageBatch:
+    """배치 저장/조회 API"""
+
+    def test_save_many_default(self):
+        storage = MemoryUserStorage()
+        assert storage.save_many(make_states(50)) == 50
+        assert storage.count() == 50
+
+    @pytest.mark.parametrize("packed", [False, True])
+    def test_memory_load_many(self, packed):
+        storage = MemoryUserStorage(packed=packed)
+        states = make_states(20)
+        storage.save_many(states)
+        loaded = storage.load_many([s.user_id for s in states] + ["missing"])
+        assert len(loaded) == 20
+        assert loaded["user_3"] == states[3]
+
+    def test_memory_packed_falls_back_to_json(self):
+        storage = MemoryUserStorage(packed=True)
+        storage.save(UserState(user_id="u", nodes={"custom": 1.0}))
+        assert storage.load("u").nodes == {"custom": 1.0}
+
+    @pytest.mark.parametrize("packed", [False, True])
+    def test_sqlite_save_many_load_many(self, tmp_path, packed):
+        storage = SQLiteUserStorage(str(tmp_path / "users.db"), packed=packed)
+        states = make_states(1200)
+        assert storage.save_many(states, batch_size=500) == 1200
+        assert storage.count() == 1200
+        loaded = storage.load_many([s.user_id for s in states])
+        assert len(loaded) == 1200
+        assert loaded["user_1199"] == states[1199]
+        assert storage.load("user_0") == states[0]
+
+    def test_sqlite_reads_mixed_formats(self, tmp_path):
+        path = str(tmp_path / "users.db")
+        SQLiteUserStorage(path).save_many(make_states(5, prefix="json"))
+        storage = SQLiteUserStorage(path, packed=True)
+        storage.save_many(make_states(5, prefix="packed"))
+        loaded = storage.load_many(["json_0", "packed_0"])
+        assert loaded["json_0"].nodes == loaded["packed_0"].nodes
+
+    def test_sqlite_wal_mode(self, tmp_path):
+        storage = SQLiteUserStorage(str(tmp_path / "users.db"))
+        mode = storage.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set")
+class TestPostgresUserStorage:
+    """PostgreSQL 배치 저장 (로컬 postgres 필요)"""
+
+    @pytest.fixture
+    def storage(self):
+        storage = PostgresUserStorage(TEST_DATABASE_URL, batch_size=100)
+        yield storage
+        with storage._connection() as conn, conn.cursor() as cur:
+            cur.execute("DELETE FROM users WHERE user_id LIKE 'pgtest_%'")
+        storage.close()
+
+    @pytest.mark.parametrize("use_copy", [False, True])
+    def test_save_many(self, storage, use_copy):
+        states = make_states(250, prefix="pgtest")
+        states.append(UserState(user_id="pgtest_0", nodes={"n01": 42.0}))
+        assert storage.save_many(states, use_copy=use_copy) == 251
+        assert storage.load("pgtest_0").nodes == {"n01": 42.0}
+        assert storage.load("pgtest_249") is not None
+
+
+class TestPostgresClientBulk:
+    """PostgresClient 배치 upsert (sqlite 방언으로 검증)"""
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        pytest.importorskip("sqlalchemy")
+        from db.postgres_client import PostgresClient
+        client = PostgresClient(f"sqlite:///{tmp_path / 'bulk.db'}")
+        assert client.init_tables()
+        return client
+
+    def test_bulk_create_persons(self, client):
+        persons = [{"id": f"p{i}", "name": f"person {i}", "ki_score": float(i)} for i in range(250)]
+        assert client.bulk_create_persons(persons, batch_size=100) == 250
+        assert client.get_stats()["person_count"] == 250
+
+    def test_bulk_upsert_updates_existing(self, client):
+        client.bulk_create_persons([{"id": "p1", "name": "old"}])
+        client.bulk_create_persons([{"id": "p1", "name": "new", "level": "L1"}])
+        person = client.get_person("p1")
+        assert person["name"] == "new"
+        assert person["level"] == "L1"
+
+    def test_bulk_create_flows_and_scale_nodes(self, client):
+        flows = [{"id": f"f{i}", "source_id": "a", "target_id": "b", "amount": 1.0} for i in range(10)]
+        assert client.bulk_create_flows(flows) == 10
+        assert client.bulk_create_scale_nodes([
+            {"id": "s1", "name": "Seoul", "level": "L2", "bounds": [1, 2, 3, 4]},
+        ]) == 1
+        node = client.get_scale_nodes_by_level("L2")[0]
+        assert node["bounds"] == [1, 2, 3, 4]
@@ -0,0 +1,81 @@
+"""
+AUTUS SSE 스트림 테스트 (bounded 큐 / Last-Event-ID 재접속)
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+pytest.importorskip("fastapi")
+
+from core.pubsub import InProcessPubSubBus
+from routers.stream_router import EventRingBuffer, LogLevel, StreamEvent, StreamManager
+
+
+def _event(seq, type="log", message="m"):
+    return StreamEvent(id=f"e{seq}", type=type, level="info", message=message, seq=seq)
+
+
+class TestRingBuffer:
+    """seq 인덱스 링 버퍼"""
+
+    def test_wraps_and_resumes_after_seq(self):
+        ring = EventRingBuffer(5)
+        for seq in (1, 2, 3, 5, 8, 9, 10):  # 누락된 seq 포함
+            ring.append(_event(seq))
+        assert [e.seq for e in ring] == [3, 5, 8, 9, 10]
+        assert (ring.first_seq, ring.last_seq) == (3, 10)
+        assert [e.seq for e in ring.since(5)] == [8, 9, 10]
+        assert [e.seq for e in ring.since(6)] == [8, 9, 10]
+        assert ring.since(10) == []
+        assert [e.seq for e in ring.tail(2)] == [9, 10]
+
+
+class TestStreamManager:
+    """구독자 큐는 bounded, 전달은 기다리지 않음"""
+
+    def test_slow_subscriber_drops_oldest(self):
+        async def scenario():
+            manager = StreamManager(bus=InProcessPubSubBus(), queue_size=10)
+            queue = await manager.subscribe()
+            for n in range(50):
+                await manager.emit_log(LogLevel.INFO, f"msg {n}")
+            stats = manager.stats()
+            return stats, await queue.get()
+
+        stats, first = asyncio.run(scenario())
+        assert stats["max_queue_depth"] == 10
+        assert stats["dropped"] == 40
+        assert first.message == "msg 40"
+
+    def test_progress_events_coalesce(self):
+        async def scenario():
+            manager = StreamManager(bus=InProcessPubSubBus())
+            queue = await manager.subscribe()
+            for p in (10, 20, 30):
+                await manager.emit_progress("upload", p)
+            await manager.emit_log(LogLevel.INFO, "done")
+            return [await queue.get() for _ in range(queue.qsize())], manager.stats()
+
+        events, stats = asyncio.run(scenario())
+        assert [(e.type, e.data.get("progress")) for e in events] == [("progress", 30), ("log", None)]
+        assert stats["coalesced"] == 2
+
+    def test_resume_from_last_event_id(self):
+        async def scenario():
+            manager = StreamManager(max_history=20, bus=InProcessPubSubBus())
+            for n in range(30):
+                await manager.emit_log(LogLevel.INFO, f"msg {n}")
+            resumed = await manager.subscribe(last_event_id=25)
+            stale = await manager.subscribe(last_event_id=3)
+            return resumed, stale, manager.stats()
+
+        resumed, stale, stats = asyncio.run(scenario())
+        assert resumed.qsize() == 5
+        assert stale.qsize() == 20  # 버퍼 밖 → 보관분 전체
+        assert stats["resumed"] == 2 and stats["resume_misses"] == 1
+        assert (stats["first_seq"], stats["last_seq"]) == (11, 30)
@@ -0,0 +1,204 @@
+"""
+AUTUS TypeDB 캐시 클라이언트 테스트
+"""
+
+import asyncio
+import threading
+import time
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from db import typedb_cache
+from db.typedb_cache import TypeDBCacheClient, InMemoryCache
+
+
+class FakeTypeDBClient(TypeDBCacheClient):
+    """드라이버 대신 지연 + 호출 횟수만 기록하는 클라이언트"""
+
+    def __init__(self, delay: float = 0.05, **kwargs):
+        super().__init__(**kwargs)
+        self._connected = True
+        self.delay = delay
+        self.calls = 0
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def _run_query_sync(self, final_query):
+        with self._lock:
+            self.calls += 1
+            n = self.calls
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        return [{"query": final_query.strip(), "n": n}]
+
+
+@pytest.fixture(autouse=True)
+def memory_cache(monkeypatch):
+    cache = InMemoryCache()
+    monkeypatch.setattr(typedb_cache, "_redis_client", cache)
+    return cache
+
+
+class TestTypeDBCacheClient:
+    """비차단 실행 / single-flight / stale-while-revalidate"""
+
+    def test_driver_runs_off_event_loop(self):
+        client = FakeTypeDBClient(delay=0.1)
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            t = asyncio.ensure_future(ticker())
+            await client.fetch("match $x;", skip_cache=True)
+            t.cancel()
+            await client.close()
+            return ticks
+
+        ticks = asyncio.run(run())
+        assert ticks >= 5
+        assert all(name.startswith("typedb") for name in client.threads)
+
+    def test_concurrent_identical_queries_coalesce(self):
+        client = FakeTypeDBClient(delay=0.05)
+
+        async def run():
+            results = await asyncio.gather(*[client.fetch("match $x;") for _ in range(20)])
+            await client.close()
+            return results
+
+        results = asyncio.run(run())
+        assert client.calls == 1
+        assert all(r.data == results[0].data for r in results)
+
+    def test_cache_hit_after_load(self):
+        client = FakeTypeDBClient(delay=0)
+
+        async def run():
+            first = await client.fetch("match $x;")
+            second = await client.fetch("match $x;")
+            await client.close()
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert not first.from_cache
+        assert second.from_cache and not second.stale
+        assert client.calls == 1
+
+    def test_stale_while_revalidate(self):
+        client = FakeTypeDBClient(delay=0.05, stale_ttl=30)
+
+        async def run():
+            await client.fetch("match $x;", cache_ttl=0)
+            stale = await asyncio.gather(*[client.fetch("match $x;", cache_ttl=60) for _ in range(5)])
+            await asyncio.sleep(0.15)
+            fresh = await client.fetch("match $x;", cache_ttl=60)
+            await client.close()
+            return stale, fresh
+
+        stale, fresh = asyncio.run(run())
+        assert all(r.from_cache and r.stale for r in stale)
+        assert all(r.data[0]["n"] == 1 for r in stale)
+        assert client.calls == 2
+        assert fresh.from_cache and not fresh.stale
+        assert fresh.data[0]["n"] == 2
+
+
+class TestInMemoryCache:
+    """크기 제한 / 만료 힙 / SCAN·UNLINK"""
+
+    def test_bounded_lru(self):
+        cache = InMemoryCache(max_entries=3)
+
+        async def run():
+            for i in range(3):
+                await cache.set(f"k{i}", str(i))
+            await cache.get("k0")  # k0 최근 사용
+            await cache.set("k3", "3")
+            return await cache.mget(["k0", "k1", "k2", "k3"])
+
+        assert asyncio.run(run()) == ["0", None, "2", "3"]
+        assert len(cache) == 3
+        assert cache.evictions == 1
+
+    def test_unread_expired_entries_are_purged(self):
+        cache = InMemoryCache()
+
+        async def run():
+            for i in range(100):
+                await cache.set(f"old{i}", "x", ex=0)
+            await cache.set("new", "y", ex=60)
+
+        asyncio.run(run())
+        assert len(cache) == 1
+        assert cache.expirations == 100
+
+    def test_scan_and_unlink(self):
+        cache = InMemoryCache()
+
+        async def run():
+            await cache.set("autus:typedb:a", "1")
+            await cache.set("autus:typedb:b", "2")
+            await cache.set("autus:query:c", "3")
+            keys = [k async for k in cache.scan_iter(match="autus:typedb:*")]
+            deleted = await cache.unlink(*keys)
+            return deleted, await cache.get("autus:query:c")
+
+        assert asyncio.run(run()) == (2, "3")
+
+
+class TestCacheInvalidation:
+    """generation 기반 O(1) 무효화"""
+
+    def test_tag_invalidation(self):
+        client = FakeTypeDBClient(delay=0)
+
+        async def run():
+            await client.fetch("match $t isa task;", tags=("task",))
+            await client.fetch("match $p isa person;", tags=("person",))
+            await client.invalidate_tags("task")
+            task = await client.fetch("match $t isa task;", tags=("task",))
+            person = await client.fetch("match $p isa person;", tags=("person",))
+            await client.close()
+            return task, person
+
+        task, person = asyncio.run(run())
+        assert not task.from_cache
+        assert person.from_cache
+        assert client.calls == 3
+
+    def test_global_invalidation(self, memory_cache):
+        client = FakeTypeDBClient(delay=0)
+
+        async def run():
+            await client.fetch("match $x;")
+            removed = await client.invalidate_cache()
+            again = await client.fetch("match $x;")
+            await client.close()
+            return removed, again
+
+        removed, again = asyncio.run(run())
+        assert removed == 0
+        assert not again.from_cache
+        assert client.calls == 2
+
+    def test_pattern_invalidation_uses_scan(self, memory_cache):
+        client = FakeTypeDBClient(delay=0)
+
+        async def run():
+            await client.fetch("match $x;")
+            await client.fetch("match $y;")
+            removed = await client.invalidate_cache("autus:typedb:[0-9a-f]*")
+            return removed
+
+        assert asyncio.run(run()) == 2
+        assert len(memory_cache) == 0
@@ -0,0 +1,75 @@
+"""
+AUTUS V 엔진 벡터화 / Monte Carlo 테스트
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from tests.direct_import import load_module
+
+np = pytest.importorskip("numpy")
+v_engine = load_module("physics", "v_engine")
+
+LaplaceSimulator = v_engine.LaplaceSimulator
+NetworkState = v_engine.NetworkState
+UserConstants = v_engine.UserConstants
+UserType = v_engine.UserType
+VEngine = v_engine.VEngine
+VInput = v_engine.VInput
+
+
+class TestCalculateBatch:
+    """격자 계산 == 단건 calculate"""
+
+    def test_grid_matches_scalar(self):
+        engine = VEngine()
+        constants = UserConstants(age=40, location_factor=1.1)
+        network = NetworkState(connections_12=6, connections_144=40, growth_rate=0.05)
+        M = np.array([100.0, 80.0])[:, None, None]
+        s = np.array([0.0, 0.3, 0.9])[None, :, None]
+        t = np.arange(13)[None, None, :]
+        grid = engine.calculate_batch(M, 30.0, s, t, user_type=UserType.AMBITIOUS, constants=constants, network=network)
+        assert grid.shape == (2, 3, 13)
+        for i, m in enumerate((100.0, 80.0)):
+            for j, r in enumerate((0.0, 0.3, 0.9)):
+                for month in (0, 5, 12):
+                    scalar = engine.calculate(VInput(
+                        motions=m, threats=30.0, relations=r, t=month,
+                        user_type=UserType.AMBITIOUS, constants=constants, network=network,
+                    )).V
+                    assert grid[i, j, month] == pytest.approx(scalar)
+
+    def test_predict_future_keeps_format(self):
+        prediction = LaplaceSimulator(VEngine()).predict_future(VInput(M=100, T=40, s=0.3, t=12), periods=12)
+        engine = VEngine()
+        for key, s in (("central", 0.3), ("upper_bound", 0.4), ("lower_bound", 0.2)):
+            assert [p["month"] for p in prediction[key]] == list(range(13))
+            assert prediction[key][12]["V"] == pytest.approx(engine.calculate(VInput(M=100, T=40, s=s, t=12)).V)
+        assert "monte_carlo" not in prediction
+
+
+class TestMonteCarlo:
+    """분포 샘플링 → 월별 백분위 구간"""
+
+    def test_bands_are_ordered_and_seeded(self):
+        simulator = LaplaceSimulator(VEngine())
+        state = VInput(M=100, T=40, s=0.3, t=12)
+        a = simulator.monte_carlo(state, periods=12, paths=10000, seed=7)
+        b = simulator.monte_carlo(state, periods=12, paths=10000, seed=7)
+        assert a == b
+        assert len(a["bands"]) == 13
+        for band in a["bands"]:
+            assert band["p5"] <= band["p25"] <= band["p50"] <= band["p75"] <= band["p95"]
+        # 중앙값은 결정론적 중앙 예측 근처
+        central = VEngine().calculate(VInput(M=100, T=40, s=0.3, t=12)).V
+        assert a["insights"]["p50"] == pytest.approx(central, rel=0.1)
+        assert 0 <= a["insights"]["prob_negative"] <= 1
+
+    def test_predict_future_attaches_monte_carlo(self):
+        prediction = LaplaceSimulator(VEngine()).predict_future(VInput(M=100, T=40, s=0.3, t=6), periods=6, paths=2000)
+        assert prediction["monte_carlo"]["paths"] == 2000
+        assert len(prediction["monte_carlo"]["bands"]) == 7
@@ -0,0 +1,105 @@
+"""
+AUTUS V 예측기 학습 파이프라인 / 체크포인트 테스트
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from tests.direct_import import load_module
+
+v_training = load_module("physics", "v_training")
+v_predictor = load_module("physics", "v_predictor")
+
+
+def _history(n=40):
+    return [
+        {"M": 100 + t * 5, "T": 40 + t * 2, "s": 0.3, "V": 60 * 1.1 ** t, "network_density": min(1, 0.1 + t * 0.02)}
+        for t in range(n)
+    ]
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = v_training.CheckpointStore(str(tmp_path), keep=2)
+    monkeypatch.setattr(v_training, "_store", store)
+    monkeypatch.setattr(v_predictor, "_ensemble_instance", None)
+    return store
+
+
+class TestCheckpointStore:
+    """버전 / 보관 개수 / 미완성 버전"""
+
+    def test_versions_and_prune(self, store):
+        for n in range(3):
+            assert store.save("m", {"n": n}) == n + 1
+        assert store.versions("m") == [2, 3]
+        meta, state = store.load("m")
+        assert meta["n"] == 2 and meta["version"] == 3 and state is None
+        assert store.load("m", version=1) is None
+        assert store.load("missing") is None
+
+    def test_incomplete_version_is_invisible(self, store, tmp_path):
+        store.save("m", {"n": 0})
+        (tmp_path / "m" / "v0002.pt").write_bytes(b"partial")  # JSON 기록 전 종료
+        assert store.latest_version("m") == 1
+        assert store.save("m", {"n": 1}) == 2
+
+
+class TestEnsembleCheckpoint:
+    """재시작 시 재학습 대신 체크포인트 로드"""
+
+    def test_restart_loads_latest_checkpoint(self, store, monkeypatch):
+        result = v_predictor.train_predictor(_history())
+        assert result["checkpoint_version"] == 1
+        before = v_predictor.predict_future_v(24, _history()[-7:])
+
+        monkeypatch.setattr(v_predictor, "_ensemble_instance", None)  # 프로세스 재시작
+        restored = v_predictor.get_ensemble_predictor()
+        assert restored.checkpoint_version == 1 and restored.log_linear.trained
+        assert v_predictor.predict_future_v(24, _history()[-7:]) == before
+
+
+    def test_failed_save_is_reported(self, store, monkeypatch):
+        def broken(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(store, "save", broken)
+        result = v_predictor.train_predictor(_history())
+        assert result["checkpoint_version"] is None
+        assert "disk full" in result["checkpoint_error"]
+
+
+class TestTorchTraining:
+    """미니배치 / 조기 종료 (PyTorch)"""
+
+    def test_lstm_early_stopping_restores_best(self, store):
+        torch = pytest.importorskip("torch")
+        torch.manual_seed(0)
+        history = v_predictor.VHistory()
+        for point in _history(60):
+            history.add(v_predictor.VTimePoint(
+                timestamp=None, motions=point["M"], threats=point["T"], relations=point["s"],
+                V=point["V"] / 100, network_density=point["network_density"],
+            ))
+        lstm = v_predictor.LSTMPredictor()
+        result = lstm.fit(history, epochs=300, lr=0.01, batch_size=8, patience=5)
+        assert result["best_epoch"] <= result["epochs"] <= 300
+        assert result["val_loss"] is not None
+        if result["stopped_early"]:
+            assert result["epochs"] - result["best_epoch"] == 5
+
+    def test_transformer_checkpoint_round_trip(self, store):
+        pytest.importorskip("torch")
+        tp = load_module("physics", "transformer_predictor")
+        predictor = tp.VTransformerPredictor(model_type="vanilla", seq_len=12, pred_len=4)
+        X = [[[float(i + t), 1.0, 0.1, 0.2] for t in range(12)] for i in range(20)]
+        y = [[[float(i + 12 + t), 1.0, 0.1, 0.2] for t in range(4)] for i in range(20)]
+        predictor.fit(X, y, epochs=3, batch_size=4)
+        predictor.save(store)
+        loaded = tp.VTransformerPredictor.from_checkpoint("vanilla", store)
+        assert loaded.trained and loaded.pred_len == 4
+        assert loaded.predict(X[0])["V_trajectory"] == predictor.predict(X[0])["V_trajectory"]
@@ -0,0 +1,222 @@
+"""
+AUTUS 웹훅 acknowledge-fast 큐 테스트
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+pytest.importorskip("fastapi")
+from fastapi import HTTPException
+
+from webhooks.ingest_queue import (
+    DurableWebhookQueue,
+    GraphBatch,
+    GraphBatchWriter,
+    WebhookIngestor,
+    accept_webhook,
+    run_load_test,
+)
+
+
+def _plan(source, data, headers, batch: GraphBatch):
+    if data.get("bad"):
+        raise ValueError("unplannable")
+    batch.upsert_node(data["customer"], source)
+    batch.create_motion(data["customer"], "owner", data["amount"], "inflow")
+    batch.node_update(data["customer"], data["amount"], source)
+    batch.motion_update(data["customer"], "owner", data["amount"])
+    batch.webhook_received(source, "inflow", data["amount"])
+
+
+def _event(customer="cus_1", amount=10, **extra):
+    return json.dumps({"customer": customer, "amount": amount, **extra}).encode()
+
+
+class _ExecGraph:
+    def __init__(self, fail=0):
+        self.calls = []
+        self.fail = fail
+
+    def execute(self, query, params):
+        if self.fail:
+            self.fail -= 1
+            raise ConnectionError("neo4j down")
+        self.calls.append((query, params))
+
+
+class _AsyncGraph:
+    def __init__(self):
+        self.nodes, self.motions = [], []
+
+    async def upsert_node(self, external_id, source):
+        self.nodes.append(external_id)
+
+    async def create_motion(self, source_id, target_id, amount, direction):
+        self.motions.append((source_id, target_id, amount, direction))
+
+
+class TestDurableWebhookQueue:
+    """SQLite 영속 큐"""
+
+    def test_append_lease_ack(self, tmp_path):
+        queue = DurableWebhookQueue(str(tmp_path / "q.db"))
+        ids = [queue.append("stripe", _event(amount=i)) for i in range(5)]
+        leased = queue.lease(3)
+        assert [r.id for r in leased] == ids[:3]
+        # lease 중인 행은 다시 나오지 않음
+        assert [r.id for r in queue.lease(10)] == ids[3:]
+        queue.ack(ids)
+        assert queue.depth() == 0
+
+    def test_survives_restart(self, tmp_path):
+        path = str(tmp_path / "q.db")
+        queue = DurableWebhookQueue(path)
+        queue.append("shopify", _event(), {"x-shopify-topic": "orders/create"})
+        queue.lease(10, lease_seconds=0)  # 처리 도중 크래시
+        queue.close()
+
+        reopened = DurableWebhookQueue(path)
+        rows = reopened.lease(10)
+        assert len(rows) == 1
+        assert rows[0].headers == {"x-shopify-topic": "orders/create"}
+
+    def test_nack_dead_letters_after_max_attempts(self, tmp_path):
+        queue = DurableWebhookQueue(str(tmp_path / "q.db"), max_attempts=2)
+        qid = queue.append("stripe", _event())
+        queue.nack([r.id for r in queue.lease(1)], "boom", retry_after=0)
+        assert queue.stats()["retried"] == 1
+        queue.nack([r.id for r in queue.lease(1)], "boom", retry_after=0)
+        assert queue.lease(1) == []
+        assert queue.dead_letters()[0]["id"] == qid
+        assert queue.stats()["dead"] == 1
+
+
+class TestAcceptWebhook:
+    """요청 경로: 검증 → append → 202"""
+
+    def test_returns_202(self, tmp_path):
+        queue = DurableWebhookQueue(str(tmp_path / "q.db"))
+        resp = asyncio.run(accept_webhook(queue, _event(), {"stripe-signature": "sig", "x": None}, lambda h, d: "stripe"))
+        assert resp.status_code == 202
+        assert json.loads(resp.body)["source"] == "stripe"
+        assert queue.lease(1)[0].headers == {"stripe-signature": "sig"}
+
+    def test_append_runs_off_the_event_loop(self, tmp_path):
+        import threading
+        queue = DurableWebhookQueue(str(tmp_path / "q.db"))
+        threads = []
+        append_many = queue.append_many
+        queue.append_many = lambda rows: threads.append(threading.current_thread()) or append_many(rows)
+
+        resp = asyncio.run(accept_webhook(queue, _event(), {}, lambda h, d: "stripe"))
+        assert resp.status_code == 202
+        assert threads and threads[0] is not threading.main_thread()
+
+    @pytest.mark.parametrize("payload", [b"not json", b"[1, 2]"])
+    def test_rejects_invalid_payload(self, tmp_path, payload):
+        queue = DurableWebhookQueue(str(tmp_path / "q.db"))
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(accept_webhook(queue, payload, {}, lambda h, d: "unknown"))
+        assert exc.value.status_code == 400
+        assert queue.depth() == 0
+
+
+class TestWebhookIngestor:
+    """배치 컨슈머"""
+
+    def test_batches_unwind_and_coalesces(self, tmp_path):
+        queue = DurableWebhookQueue(str(tmp_path / "q.db"))
+        for i in range(30):
+            queue.append("stripe", _event(customer=f"cus_{i % 3}", amount=1))
+        graph = _ExecGraph()
+        sent = []
+
+        async def broadcast(batch):
+            sent.append(batch)
+
+        ingestor = WebhookIngestor(queue, _plan, GraphBatchWriter(graph), broadcast, batch_size=100)
+        asyncio.run(ingestor.process(queue.lease(100)))
+
+        # UNWIND 2회 (노드 3개 중복 제거, 모션 30개)
+        assert len(graph.calls) == 2
+        assert len(graph.calls[0][1]["nodes"]) == 3
+        assert len(graph.calls[1][1]["motions"]) == 30
+        batch = sent[0]
+        assert batch.node_updates["cus_0"] == (10.0, "stripe")
+        assert batch.received[("stripe", "inflow")] == (30, 30.0)
+        assert batch.broadcast_count == 7
+        assert ingestor.broadcasts_coalesced == 90 - 7
+        assert queue.depth() == 0
+
+    def test_async_client_fallback(self, tmp_path):
+        queue = DurableWebhookQueue(str(tmp_path / "q.db"))
+        queue.append("stripe", _event("a"))
+        queue.append("stripe", _event("a"))
+        graph = _AsyncGraph()
+        ingestor = WebhookIngestor(queue, _plan, GraphBatchWriter(graph))
+        asyncio.run(ingestor.process(queue.lease(10)))
+        assert graph.nodes == ["a"]
+        assert len(graph.motions) == 2
+
+    def test_write_failure_is_retried(self, tmp_path):
+        queue = DurableWebhookQueue(str(tmp_path / "q.db"))
+        queue.append("stripe", _event())
+        queue.append("stripe", _event(bad=True))
+        graph = _ExecGraph(fail=1)
+        ingestor = WebhookIngestor(queue, _plan, GraphBatchWriter(graph))
+
+        asyncio.run(ingestor.process(queue.lease(10)))
+        assert ingestor.failed_batches == 1
+        stats = queue.stats()
+        assert stats["dead"] == 1 and stats["pending"] == 1
+
+        queue.conn.execute("UPDATE webhook_queue SET leased_until = 0")
+        asyncio.run(ingestor.process(queue.lease(10)))
+        assert ingestor.processed == 1
+        assert queue.depth() == 0
+
+    def test_background_consumer_wakes_on_append(self, tmp_path):
+        queue = DurableWebhookQueue(str(tmp_path / "q.db"))
+        graph = _ExecGraph()
+
+        async def scenario():
+            ingestor = WebhookIngestor(queue, _plan, GraphBatchWriter(graph), linger=0.001)
+            await ingestor.start()
+            for i in range(50):
+                queue.append("stripe", _event(f"cus_{i}"))
+            drained = await ingestor.drain(timeout=5)
+            await ingestor.stop()
+            return drained, ingestor
+
+        drained, ingestor = asyncio.run(scenario())
+        assert drained
+        assert ingestor.processed == 50
+        assert not ingestor.running
+
+
+class TestLoad:
+    """ASGI 부하 테스트: 처리량 / p99 ack 지연"""
+
+    def test_sustained_throughput_and_ack_latency(self, tmp_path):
+        pytest.importorskip("httpx")
+        report = asyncio.run(run_load_test(
+            events=2000, concurrency=50, customers=100, path=str(tmp_path / "load.db"),
+        ))
+        print(json.dumps({k: v for k, v in report.items() if k != "ingestor"}))
+        assert report["statuses"] == {202: 2000}
+        assert report["drained"]
+        assert report["motions"] == 2000 and report["nodes"] == 100
+        # 건별 쓰기였다면 4000 왕복
+        assert report["graph_round_trips"] < 200
+        # append 가 루프 밖에서 실행되므로 닫힌 루프 클라이언트 50개의 지연 ≈ 동시성 / 처리량
+        # (p99 는 전체 스위트 실행 시 GC / 스레드 경합으로 흔들려 느슨한 상한만)
+        assert report["ack_per_sec"] > 500
+        assert report["ack_p50_ms"] < 100
+        assert report["ack_p99_ms"] < 1000
+        assert report["sustained_per_sec"] > 200